@@ -3,4 +3,7 @@ from pacfish.core import *
 from pacfish.api import *
 from pacfish.iohandler import *
 from pacfish.qualitycontrol import *
+from pacfish.reconstruction import *
+from pacfish.processing import *
+from pacfish.simulation import *
 from .visualize_device import visualize_device
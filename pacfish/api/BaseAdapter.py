@@ -3,12 +3,34 @@
 # SPDX-FileCopyrightText: 2021 Lina Hacker
 # SPDX-License-Identifier: BSD 3-Clause License
 
+import functools
 from abc import ABC, abstractmethod
 from pacfish.core.PAData import PAData
 from pacfish.core.Metadata import MetadataAcquisitionTags, MetaDatum
+from pacfish import profile
+from pacfish.iohandler.progress import ProgressTracker
 import numpy as np
 
 
+def _trace_init(init):
+    """
+    Wraps an adapter constructor in a "<Adapter>.__init__" span, so that the loading and reshaping that adapters
+    do before calling `BaseAdapter.__init__` is measured as well. Only the outermost constructor of a chain of
+    `super().__init__()` calls opens the span.
+    """
+    @functools.wraps(init)
+    def wrapper(self, *args, **kwargs):
+        if not profile.is_enabled() or self.__dict__.get("_init_span_open", False):
+            return init(self, *args, **kwargs)
+        self._init_span_open = True
+        try:
+            with profile.span(type(self).__name__ + ".__init__"):
+                return init(self, *args, **kwargs)
+        finally:
+            del self._init_span_open
+    return wrapper
+
+
 class BaseAdapter(ABC):
     """
     The purpose of the BaseAdapter class is to provide the framework to convert from any
@@ -33,20 +55,68 @@ class BaseAdapter(ABC):
 
             def set_metadata_value(self, metadatum: MetaDatum):
                 # TODO
+
+    Adapters that accept `progress` and `cancellation` arguments can pass them on to `BaseAdapter.__init__`.
+    The conversion then reports its progress after the binary data was generated and can be cancelled between
+    the conversion steps. During `generate_binary_data`, `self.progress_tracker` can be used to report finer
+    progress and to check for cancellation, e.g. once per converted frame.
+
+    When instrumentation is enabled, the complete constructor of every adapter is recorded as a
+    "<Adapter>.__init__" span.
     """
 
-    def __init__(self):
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        if "__init__" in cls.__dict__:
+            cls.__init__ = _trace_init(cls.__init__)
+
+    @_trace_init
+    def __init__(self, progress=None, cancellation=None):
+        """
+        Parameters
+        ----------
+        progress: callable
+            If given, it is called with a `Progress` instance during the conversion.
+        cancellation: CancellationToken
+            If given, it is checked between the conversion steps.
+
+        Raises
+        ------
+        OperationCancelled:
+            if the conversion was cancelled.
+        """
+        adapter = type(self).__name__
+        self.progress_tracker = ProgressTracker(adapter, 0, 0, progress, cancellation)
         self.pa_data = PAData()
 
-        binary_data = self.generate_binary_data()
+        self.progress_tracker.check_cancellation()
+        with profile.span(adapter + ".generate_binary_data") as binary_span:
+            binary_data = self.generate_binary_data()
+            binary_span.count(profile.BYTES_READ, getattr(binary_data, "nbytes", 0))
         self.pa_data.binary_time_series_data = binary_data
+        self._report_binary_data_progress(binary_data)
 
-        meta_data = self.generate_acquisition_meta_data()
+        self.progress_tracker.check_cancellation()
+        with profile.span(adapter + ".generate_acquisition_meta_data"):
+            meta_data = self.generate_acquisition_meta_data()
         self.pa_data.meta_data_acquisition = meta_data
 
-        meta_data_device = self.generate_device_meta_data()
+        self.progress_tracker.check_cancellation()
+        with profile.span(adapter + ".generate_device_meta_data"):
+            meta_data_device = self.generate_device_meta_data()
         self.pa_data.meta_data_device = meta_data_device
 
+    def _report_binary_data_progress(self, binary_data):
+        """
+        Completes the progress of the binary data, unless the adapter already reported all of it.
+        """
+        shape = np.shape(binary_data) if binary_data is not None else ()
+        tracker = self.progress_tracker
+        tracker.bytes_total = max(tracker.bytes_total, int(getattr(binary_data, "nbytes", 0)))
+        tracker.frames_total = max(tracker.frames_total, shape[3] if len(shape) == 4 else int(len(shape) > 0))
+        if tracker.bytes_done < tracker.bytes_total or tracker.frames_done < tracker.frames_total:
+            tracker.update(tracker.bytes_total - tracker.bytes_done, tracker.frames_total - tracker.frames_done)
+
 
     @abstractmethod
     def generate_binary_data(self) -> np.ndarray:
@@ -20,7 +20,7 @@ class CyberdyneConverter(BaseAdapter):
        - "Nt" with the number of time samples
     """
 
-    def __init__(self, file_path):
+    def __init__(self, file_path, progress=None, cancellation=None):
         self.file_path = file_path
         data = loadmat(file_path)
 
@@ -28,10 +28,10 @@ class CyberdyneConverter(BaseAdapter):
         self.pitch = data["Pitch"].item()
         self.n_elements = data["Ns"].item()
         self.n_samples = data["Nt"].item()
-        self.data = np.swapaxes(data["Sinogram"], 0, 1).astype(float)
+        self.data = np.swapaxes(data["Sinogram"], 0, 1).astype(float, copy=False)
         self.data = np.reshape(self.data, (self.n_elements, -1,  1, 1))
 
-        super().__init__()
+        super().__init__(progress=progress, cancellation=cancellation)
 
     def generate_binary_data(self) -> np.ndarray:
         return self.data
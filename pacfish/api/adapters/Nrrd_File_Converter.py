@@ -16,7 +16,7 @@ class NrrdFileConverter(BaseAdapter):
     It assumes that the NRRD file metadata contains a 'sizes', 'type' and 'space directions' field.
     """
 
-    def __init__(self, nrrd_file_path):
+    def __init__(self, nrrd_file_path, progress=None, cancellation=None):
         self.nrrd_file_path = nrrd_file_path
         [data, meta] = nrrd.read(nrrd_file_path)
         self.data = data
@@ -25,7 +25,7 @@ class NrrdFileConverter(BaseAdapter):
         print(np.shape(data))
         print(meta)
 
-        super().__init__()
+        super().__init__(progress=progress, cancellation=cancellation)
 
     def generate_binary_data(self) -> np.ndarray:
         data = np.reshape(self.data, (self.meta['sizes'][0], self.meta['sizes'][1], 1, self.meta['sizes'][2]))
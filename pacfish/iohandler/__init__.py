@@ -1,2 +1,10 @@
-from pacfish.iohandler.file_reader import load_data
-from pacfish.iohandler.file_writer import write_data
+from pacfish.iohandler.file_reader import load_data, load_device_from_library
+from pacfish.iohandler.file_writer import write_data, add_device_to_library, update_metadata, update_metadata_of_files
+from pacfish.iohandler.file_integrity import verify_file_integrity
+from pacfish.iohandler.file_catalogue import FileCatalogue
+from pacfish.iohandler.lazy_data import LazyTimeSeriesData, iterate_measurement_chunks
+from pacfish.iohandler.progress import CancellationToken, OperationCancelled, Progress
+from pacfish.iohandler.async_io import aload_data, awrite_data, aiter_measurement_chunks, AsyncExecutor
+from pacfish.iohandler.frame_server import FrameServer, FrameClient, RemoteTimeSeriesData
+from pacfish.iohandler.block_cache import BlockCachedFile
+from pacfish.iohandler.handle_pool import FileHandlePool, PooledTimeSeriesData
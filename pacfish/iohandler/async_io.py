@@ -0,0 +1,197 @@
+# SPDX-FileCopyrightText: 2026 International Photoacoustics Standardisation Consortium (IPASC)
+# SPDX-License-Identifier: BSD 3-Clause License
+
+"""
+Asynchronous counterparts of `load_data` and `write_data` for services that run on an asyncio event loop.
+
+The blocking HDF5 work runs on a bounded thread pool, so the event loop keeps serving other requests while
+files are read and written. Each `AsyncExecutor` only accepts a limited number of pending calls; further calls
+wait asynchronously until a slot is free, which applies backpressure to producers that submit files faster
+than they can be processed::
+
+    async def ingest(file_paths):
+        for pa_data in asyncio.as_completed([aload_data(file_path) for file_path in file_paths]):
+            pa_data = await pa_data
+            ...
+
+h5py serialises all calls into the HDF5 library, so concurrent reads and writes do not run in parallel.
+"""
+
+import asyncio
+import functools
+import threading
+import weakref
+from concurrent.futures import ThreadPoolExecutor
+
+import numpy as np
+
+from pacfish import PAData
+from pacfish.iohandler.file_reader import load_data
+from pacfish.iohandler.file_writer import write_data
+from pacfish.iohandler.lazy_data import iterate_measurement_chunks
+from pacfish.iohandler.progress import CancellationToken
+
+
+class AsyncExecutor:
+    """
+    A thread pool for blocking I/O that can be awaited from any event loop and that limits the number of
+    pending calls.
+    """
+
+    def __init__(self, max_workers: int = 4, max_pending: int = None):
+        """
+        Parameters
+        ----------
+        max_workers: int
+            The number of threads.
+        max_pending: int
+            The maximum number of calls that are running or queued in the thread pool. Further calls wait
+            until a slot is free. Defaults to twice the number of threads.
+        """
+        self.max_workers = max_workers
+        self.max_pending = max_pending or 2 * max_workers
+        self._executor = None
+        self._lock = threading.Lock()
+        # asyncio semaphores are bound to the event loop that first uses them, so there is one per loop
+        self._semaphores = weakref.WeakKeyDictionary()
+
+    def _get_executor(self) -> ThreadPoolExecutor:
+        with self._lock:
+            if self._executor is None:
+                self._executor = ThreadPoolExecutor(max_workers=self.max_workers, thread_name_prefix="pacfish-io")
+            return self._executor
+
+    def _get_semaphore(self, loop) -> asyncio.Semaphore:
+        with self._lock:
+            semaphore = self._semaphores.get(loop)
+            if semaphore is None:
+                semaphore = self._semaphores[loop] = asyncio.Semaphore(self.max_pending)
+            return semaphore
+
+    async def run(self, function, *args, **kwargs):
+        """
+        Runs the function in the thread pool and returns its result, waiting first if the maximum number of
+        pending calls is reached.
+        """
+        loop = asyncio.get_running_loop()
+        async with self._get_semaphore(loop):
+            return await loop.run_in_executor(self._get_executor(), functools.partial(function, *args, **kwargs))
+
+    def shutdown(self, wait: bool = True):
+        """
+        Shuts the thread pool down. It is recreated on the next call of `run`.
+        """
+        with self._lock:
+            executor, self._executor = self._executor, None
+        if executor is not None:
+            executor.shutdown(wait=wait)
+
+
+_DEFAULT_EXECUTOR = AsyncExecutor()
+
+
+def get_default_executor() -> AsyncExecutor:
+    """
+    Returns the executor that is used by `aload_data`, `awrite_data` and `aiter_measurement_chunks` if no other
+    executor is given.
+    """
+    return _DEFAULT_EXECUTOR
+
+
+async def _run_cancellable(executor: AsyncExecutor, function, cancellation: CancellationToken, **kwargs):
+    cancellation = cancellation or CancellationToken()
+    try:
+        return await (executor or _DEFAULT_EXECUTOR).run(function, cancellation=cancellation, **kwargs)
+    except asyncio.CancelledError:
+        # the thread cannot be interrupted, but it stops before its next chunk
+        cancellation.cancel()
+        raise
+
+
+async def aload_data(file_path: str, device_library: str = None, lazy: bool = False, progress=None,
+                     cancellation: CancellationToken = None, executor: AsyncExecutor = None) -> PAData:
+    """
+    Loads a PAData instance from an IPASC-formatted HDF5 file without blocking the event loop.
+    See `load_data` for the parameters. If the awaiting task is cancelled, the read is cancelled as well.
+
+    Parameters
+    ----------
+    executor: AsyncExecutor
+        The executor to run the read on. Defaults to `get_default_executor()`.
+
+    Return
+    ------
+    PAData
+        PAData instance containing all data and metadata read from the HDF5 file.
+    """
+    return await _run_cancellable(executor, load_data, cancellation, file_path=file_path,
+                                  device_library=device_library, lazy=lazy, progress=progress)
+
+
+async def awrite_data(file_path: str, pa_data: PAData, file_compression: str = None, checksums: bool = False,
+                      device_library: str = None, progress=None, cancellation: CancellationToken = None,
+                      executor: AsyncExecutor = None):
+    """
+    Saves a PAData instance into an HDF5 file without blocking the event loop. See `write_data` for the
+    parameters. If the awaiting task is cancelled, the write is cancelled as well and no file is left behind.
+
+    Parameters
+    ----------
+    executor: AsyncExecutor
+        The executor to run the write on. Defaults to `get_default_executor()`.
+    """
+    await _run_cancellable(executor, write_data, cancellation, file_path=file_path, pa_data=pa_data,
+                           file_compression=file_compression, checksums=checksums, device_library=device_library,
+                           progress=progress)
+
+
+async def aiter_measurement_chunks(binary_time_series_data, measurements_per_chunk: int = 1, prefetch: int = 2,
+                                   executor: AsyncExecutor = None):
+    """
+    Iterates asynchronously over the time series data in chunks of measurements, e.g. over the frames of
+    lazily loaded data::
+
+        pa_data = await aload_data("acquisition.hdf5", lazy=True)
+        async for start, stop, chunk in aiter_measurement_chunks(pa_data.binary_time_series_data):
+            await process(chunk)
+
+    The chunks are read on the executor. At most `prefetch` chunks are read ahead of the consumer, so a slow
+    consumer holds back the reads instead of accumulating chunks in memory.
+
+    Parameters
+    ----------
+    binary_time_series_data: np.ndarray or LazyTimeSeriesData
+        The time series data with up to four dimensions.
+    measurements_per_chunk: int
+        The number of measurements per chunk.
+    prefetch: int
+        The number of chunks that are read ahead.
+    executor: AsyncExecutor
+        The executor to read the chunks on. Defaults to `get_default_executor()`.
+
+    Return
+    ------
+    async generator
+        Yields (start, stop, chunk) tuples as `iterate_measurement_chunks`.
+    """
+    executor = executor or _DEFAULT_EXECUTOR
+    shape = tuple(binary_time_series_data.shape)
+    if len(shape) != 4:
+        for chunk in await executor.run(list, iterate_measurement_chunks(binary_time_series_data)):
+            yield chunk
+        return
+
+    step = max(1, measurements_per_chunk)
+    bounds = [(start, min(start + step, shape[3])) for start in range(0, shape[3], step)]
+    pending = []
+    try:
+        for index, (start, stop) in enumerate(bounds):
+            while len(pending) < max(1, prefetch) and index + len(pending) < len(bounds):
+                next_start, next_stop = bounds[index + len(pending)]
+                pending.append(asyncio.ensure_future(executor.run(
+                    binary_time_series_data.__getitem__, np.s_[:, :, :, next_start:next_stop])))
+            chunk = await pending.pop(0)
+            yield start, stop, chunk
+    finally:
+        for future in pending:
+            future.cancel()
@@ -0,0 +1,248 @@
+# SPDX-FileCopyrightText: 2026 International Photoacoustics Standardisation Consortium (IPASC)
+# SPDX-License-Identifier: BSD 3-Clause License
+
+"""
+Reading IPASC files from seekable file-like objects, e.g. files opened with fsspec, members of tar bundles or
+in-memory buffers::
+
+    with fsspec.open("s3://bucket/acquisition.hdf5", "rb") as file_object:
+        pa_data = load_data(file_object)
+
+    with tarfile.open("bundle.tar") as bundle:
+        pa_data = load_data(bundle.extractfile("acquisition.hdf5"))
+
+h5py reads from file-like objects without the sieve buffer of its own file drivers, so reading a single frame
+of contiguously stored data issues one small read per element. `BlockCachedFile` therefore reads the file in
+large aligned blocks and keeps the most recently used blocks in memory. Adjacent missing blocks are fetched
+with a single read, optionally extended by a number of read-ahead blocks. Unless a block size is given, it is
+adapted to the storage layout of the time series dataset once the file was opened.
+"""
+
+import contextlib
+import io
+import os
+import threading
+from collections import OrderedDict
+
+import h5py
+import numpy as np
+
+# The block size that is used to read the file metadata before the block size is adapted to the time series.
+DEFAULT_BLOCK_SIZE = 64 * 2 ** 10
+# The bounds of the block size that is adapted to the storage layout of the time series dataset.
+MIN_BLOCK_SIZE = 64 * 2 ** 10
+MAX_BLOCK_SIZE = 4 * 2 ** 20
+# The default memory limit of the cached blocks.
+DEFAULT_CACHE_BYTES = 64 * 2 ** 20
+
+
+def get_block_size(dataset) -> int:
+    """
+    Determines a block size that suits the storage layout of a dataset.
+
+    A chunked dataset is read chunk by chunk, so the block size is the size of an uncompressed chunk, rounded
+    up to a power of two. A frame of a contiguous dataset is spread over the whole dataset, because the
+    measurements are the last axis of the IPASC shape, so the largest block size is used.
+
+    Parameters
+    ----------
+    dataset: h5py.Dataset
+        The dataset that will be read.
+
+    Return
+    ------
+    int
+        The block size in bytes, between `MIN_BLOCK_SIZE` and `MAX_BLOCK_SIZE`.
+    """
+    if dataset.chunks is None:
+        block_size = MAX_BLOCK_SIZE
+    else:
+        chunk_bytes = int(np.prod(dataset.chunks)) * dataset.dtype.itemsize
+        block_size = 1 << max(0, chunk_bytes - 1).bit_length()
+    return int(min(max(block_size, MIN_BLOCK_SIZE), MAX_BLOCK_SIZE))
+
+
+class BlockCachedFile(io.RawIOBase):
+    """
+    A read-only, seekable file-like object that reads another seekable file-like object in blocks and keeps
+    the most recently used blocks in memory.
+
+    The wrapped file object is not closed when this object is closed. The read position is shared by all
+    users, so concurrent users have to hold `lock` while they seek and read.
+    """
+
+    def __init__(self, file_object, block_size: int = None, cache_bytes: int = DEFAULT_CACHE_BYTES,
+                 read_ahead: int = 1):
+        """
+        Parameters
+        ----------
+        file_object: file-like
+            A binary file object that supports `seek`, `tell` and `read`.
+        block_size: int
+            The block size in bytes. If not given, `DEFAULT_BLOCK_SIZE` is used until `adapt_to_dataset` is
+            called.
+        cache_bytes: int
+            The maximum number of bytes of cached blocks. At least one block is always cached.
+        read_ahead: int
+            The number of blocks that are read in addition to the requested ones.
+
+        Raises
+        ------
+        ValueError:
+            if the file object is not readable or not seekable.
+        """
+        super(BlockCachedFile, self).__init__()
+        for method in ("read", "seek", "tell"):
+            if not callable(getattr(file_object, method, None)):
+                raise ValueError(f"The file object must support {method}(), but {type(file_object)} does not.")
+        if callable(getattr(file_object, "seekable", None)) and not file_object.seekable():
+            raise ValueError(f"The file object {file_object} is not seekable.")
+        self.file_object = file_object
+        self.cache_bytes = cache_bytes
+        self.read_ahead = max(0, read_ahead)
+        self.lock = threading.RLock()
+        self.block_size_is_fixed = block_size is not None
+        self._block_size = block_size or DEFAULT_BLOCK_SIZE
+        self._blocks = OrderedDict()
+        self._position = 0
+        self.num_reads = 0
+        self.bytes_fetched = 0
+        self.hits = 0
+        self.misses = 0
+        file_object.seek(0, os.SEEK_END)
+        self.size = file_object.tell()
+
+    @property
+    def block_size(self) -> int:
+        return self._block_size
+
+    @property
+    def max_blocks(self) -> int:
+        return max(1, self.cache_bytes // self._block_size)
+
+    def set_block_size(self, block_size: int):
+        """
+        Changes the block size and discards all cached blocks.
+        """
+        with self.lock:
+            if block_size != self._block_size:
+                self._block_size = block_size
+                self._blocks.clear()
+
+    def adapt_to_dataset(self, dataset):
+        """
+        Adapts the block size to the storage layout of the dataset with `get_block_size`, unless a block size
+        was given explicitly.
+        """
+        if not self.block_size_is_fixed:
+            self.set_block_size(get_block_size(dataset))
+
+    def clear(self):
+        """
+        Discards all cached blocks.
+        """
+        with self.lock:
+            self._blocks.clear()
+
+    def readable(self) -> bool:
+        return True
+
+    def seekable(self) -> bool:
+        return True
+
+    def tell(self) -> int:
+        return self._position
+
+    def seek(self, offset: int, whence: int = os.SEEK_SET) -> int:
+        if whence == os.SEEK_SET:
+            position = offset
+        elif whence == os.SEEK_CUR:
+            position = self._position + offset
+        elif whence == os.SEEK_END:
+            position = self.size + offset
+        else:
+            raise ValueError(f"Invalid whence ({whence}).")
+        if position < 0:
+            raise ValueError(f"Negative seek position {position}.")
+        self._position = position
+        return position
+
+    def _fetch(self, first_block: int, last_block: int):
+        """
+        Reads the missing blocks of the range with one read per run of adjacent missing blocks.
+        """
+        num_blocks = -(-self.size // self._block_size)
+        block = first_block
+        while block <= last_block:
+            if block in self._blocks:
+                self._blocks.move_to_end(block)
+                self.hits += 1
+                block += 1
+                continue
+            stop = block
+            while stop <= last_block and stop not in self._blocks:
+                stop += 1
+            read_ahead_stop = stop
+            while (read_ahead_stop < min(num_blocks, stop + self.read_ahead) and
+                   read_ahead_stop not in self._blocks):
+                read_ahead_stop += 1
+            self.misses += stop - block
+
+            start_byte = block * self._block_size
+            num_bytes = min(read_ahead_stop * self._block_size, self.size) - start_byte
+            self.file_object.seek(start_byte)
+            data = bytearray()
+            while len(data) < num_bytes:
+                part = self.file_object.read(num_bytes - len(data))
+                if not part:
+                    break
+                data += part
+            self.num_reads += 1
+            self.bytes_fetched += len(data)
+            for index in range(block, read_ahead_stop):
+                offset = (index - block) * self._block_size
+                self._blocks[index] = bytes(data[offset:offset + self._block_size])
+            block = stop
+
+    def readinto(self, buffer) -> int:
+        with self.lock:
+            destination = memoryview(buffer).cast("B")
+            num_bytes = min(len(destination), max(0, self.size - self._position))
+            if num_bytes == 0:
+                return 0
+            first_block = self._position // self._block_size
+            last_block = (self._position + num_bytes - 1) // self._block_size
+            self._fetch(first_block, last_block)
+
+            written = 0
+            for index in range(first_block, last_block + 1):
+                data = self._blocks[index]
+                start = self._position + written - index * self._block_size
+                part = data[start:start + num_bytes - written]
+                destination[written:written + len(part)] = part
+                written += len(part)
+            self._position += written
+            while len(self._blocks) > self.max_blocks:
+                self._blocks.popitem(last=False)
+            return written
+
+
+def as_h5py_source(file_path):
+    """
+    Returns the object that h5py should open for a file path or a file-like object. Paths are returned
+    unchanged, file-like objects are wrapped in a `BlockCachedFile` unless they already are one.
+    """
+    if isinstance(file_path, (str, bytes, os.PathLike, BlockCachedFile)):
+        return file_path
+    return BlockCachedFile(file_path)
+
+
+@contextlib.contextmanager
+def open_h5file(source):
+    """
+    Opens a path or a `BlockCachedFile` read-only with h5py. The lock of a `BlockCachedFile` is held while the
+    file is open, because its read position is shared.
+    """
+    lock = source.lock if isinstance(source, BlockCachedFile) else contextlib.nullcontext()
+    with lock, h5py.File(source, "r") as h5file:
+        yield h5file
@@ -0,0 +1,234 @@
+# SPDX-FileCopyrightText: 2026 International Photoacoustics Standardisation Consortium (IPASC)
+# SPDX-License-Identifier: BSD 3-Clause License
+
+import logging
+import os
+import sqlite3
+import numbers
+
+import h5py
+import numpy as np
+from pacfish import MetadataAcquisitionTags, MetadataDeviceTags
+from pacfish.iohandler.file_reader import read_dataset
+
+IPASC_FILE_EXTENSIONS = (".hdf5", ".h5")
+
+logger = logging.getLogger(__name__)
+
+# Acquisition metadata that is stored element-wise, so that files can be queried for the values they contain.
+MULTI_VALUED_TAGS = [MetadataAcquisitionTags.ACQUISITION_WAVELENGTHS.tag]
+
+DEVICE_GENERAL_TAGS = [MetadataDeviceTags.UNIQUE_IDENTIFIER.tag,
+                       MetadataDeviceTags.NUMBER_OF_DETECTION_ELEMENTS.tag,
+                       MetadataDeviceTags.NUMBER_OF_ILLUMINATION_ELEMENTS.tag]
+
+
+class FileCatalogue:
+    """
+    A local SQLite index over the metadata of many IPASC files.
+
+    All scalar acquisition metadata (e.g. `photoacoustic_imaging_device_reference`, `ad_sampling_rate` or
+    `scanning_method`), the acquisition wavelengths and the general device information are extracted once
+    and can then be queried without opening the files again::
+
+        catalogue = FileCatalogue("catalogue.sqlite")
+        catalogue.update(["/data/archive"])
+        paths = catalogue.query(photoacoustic_imaging_device_reference="my-scanner",
+                                ad_sampling_rate=(40e6, None),
+                                acquisition_wavelengths=[700, 800])
+
+    Calling `update` again only re-reads files whose modification time or size changed.
+
+    Files that cannot be read, e.g. truncated files or HDF5 files without IPASC metadata, do not stop the update.
+    They are logged and recorded with the error message, see `get_errors`, and are not returned by `query`.
+    """
+
+    def __init__(self, database_path: str = ":memory:"):
+        """
+        Parameters
+        ----------
+        database_path: str
+            Path of the SQLite database file. By default, the catalogue is only kept in memory.
+        """
+        self.database_path = database_path
+        self.connection = sqlite3.connect(database_path)
+        with self.connection:
+            self.connection.execute("CREATE TABLE IF NOT EXISTS files "
+                                    "(path TEXT PRIMARY KEY, mtime REAL, size INTEGER, error TEXT)")
+            columns = [row[1] for row in self.connection.execute("PRAGMA table_info(files)")]
+            if "error" not in columns:
+                # catalogues that were created before unreadable files were recorded
+                self.connection.execute("ALTER TABLE files ADD COLUMN error TEXT")
+            self.connection.execute("CREATE TABLE IF NOT EXISTS tags "
+                                    "(path TEXT, tag TEXT, text_value TEXT, numeric_value REAL)")
+            self.connection.execute("CREATE INDEX IF NOT EXISTS tags_numeric ON tags (tag, numeric_value)")
+            self.connection.execute("CREATE INDEX IF NOT EXISTS tags_text ON tags (tag, text_value)")
+            self.connection.execute("CREATE INDEX IF NOT EXISTS tags_path ON tags (path)")
+
+    def close(self):
+        """
+        Closes the connection to the database.
+        """
+        self.connection.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
+
+    def update(self, paths: list) -> int:
+        """
+        Adds the given files, and all IPASC files found below the given directories, to the catalogue.
+        Files that are already indexed are only read again if their modification time or size changed.
+        Indexed files that no longer exist are removed from the catalogue. Files that cannot be read are
+        recorded with the error instead of their metadata.
+
+        Parameters
+        ----------
+        paths: list
+            A list of file and directory paths.
+
+        Return
+        ------
+        int
+            The number of files that were (re-)indexed.
+        """
+        if isinstance(paths, str):
+            paths = [paths]
+
+        indexed = {path: (mtime, size) for path, mtime, size in
+                   self.connection.execute("SELECT path, mtime, size FROM files")}
+
+        num_indexed = 0
+        with self.connection:
+            for file_path in self._find_files(paths):
+                stat = os.stat(file_path)
+                if indexed.get(file_path) == (stat.st_mtime, stat.st_size):
+                    continue
+                error = None
+                try:
+                    rows = self._extract_rows(file_path)
+                except (OSError, KeyError) as exception:
+                    logger.warning("Could not index %s: %s", file_path, exception)
+                    rows = []
+                    error = f"{type(exception).__name__}: {exception}"
+                self.connection.execute("DELETE FROM tags WHERE path = ?", (file_path, ))
+                self.connection.execute("INSERT OR REPLACE INTO files VALUES (?, ?, ?, ?)",
+                                        (file_path, stat.st_mtime, stat.st_size, error))
+                self.connection.executemany("INSERT INTO tags VALUES (?, ?, ?, ?)", rows)
+                num_indexed += 1
+
+            for file_path in indexed:
+                if not os.path.exists(file_path):
+                    self.connection.execute("DELETE FROM tags WHERE path = ?", (file_path, ))
+                    self.connection.execute("DELETE FROM files WHERE path = ?", (file_path, ))
+
+        return num_indexed
+
+    def get_errors(self) -> dict:
+        """
+        Returns the files that could not be indexed.
+
+        Return
+        ------
+        dict
+            The error message of every file that could not be read, by its path.
+        """
+        return dict(self.connection.execute("SELECT path, error FROM files WHERE error IS NOT NULL ORDER BY path"))
+
+    def query(self, **filters) -> list:
+        """
+        Returns the paths of all indexed files that match all given filters. Files that could not be read are
+        never returned.
+        Each keyword is the tag of a metadatum, e.g. `ad_sampling_rate` or `unique_identifier`.
+        The following filter values are supported::
+
+            - a string or number: the metadatum must equal the value
+            - a tuple (minimum, maximum): the metadatum must lie in the inclusive range. Either bound may be None.
+            - a list: the metadatum must contain all of the listed values (e.g. acquisition_wavelengths)
+
+        Return
+        ------
+        list
+            The sorted paths of all matching files.
+        """
+        conditions = []
+        parameters = []
+        for tag, value in filters.items():
+            if isinstance(value, tuple):
+                if len(value) != 2:
+                    raise ValueError("A range filter must be given as a (minimum, maximum) tuple.")
+                sub_query = "SELECT path FROM tags WHERE tag = ?"
+                parameters.append(tag)
+                if value[0] is not None:
+                    sub_query += " AND numeric_value >= ?"
+                    parameters.append(float(value[0]))
+                if value[1] is not None:
+                    sub_query += " AND numeric_value <= ?"
+                    parameters.append(float(value[1]))
+                conditions.append(sub_query)
+            elif isinstance(value, (list, np.ndarray)):
+                for element in value:
+                    conditions.append(self._equality_condition(tag, element, parameters))
+            else:
+                conditions.append(self._equality_condition(tag, value, parameters))
+
+        statement = "SELECT path FROM files WHERE error IS NULL"
+        if conditions:
+            statement += " AND " + " AND ".join("path IN (" + condition + ")" for condition in conditions)
+        statement += " ORDER BY path"
+        return [row[0] for row in self.connection.execute(statement, parameters)]
+
+    @staticmethod
+    def _equality_condition(tag, value, parameters):
+        parameters.append(tag)
+        if isinstance(value, str):
+            parameters.append(value)
+            return "SELECT path FROM tags WHERE tag = ? AND text_value = ?"
+        if not isinstance(value, numbers.Number):
+            raise TypeError(f"Cannot filter {tag} by a value of type {type(value).__name__}.")
+        parameters.append(float(value))
+        return "SELECT path FROM tags WHERE tag = ? AND numeric_value = ?"
+
+    @staticmethod
+    def _find_files(paths):
+        for path in paths:
+            if os.path.isdir(path):
+                for directory, _, file_names in os.walk(path):
+                    for file_name in sorted(file_names):
+                        if file_name.lower().endswith(IPASC_FILE_EXTENSIONS):
+                            yield os.path.abspath(os.path.join(directory, file_name))
+            else:
+                yield os.path.abspath(path)
+
+    @staticmethod
+    def _extract_rows(file_path):
+        rows = []
+
+        def add_row(tag, value):
+            if isinstance(value, np.ndarray) and value.ndim == 0:
+                value = value.item()
+            if isinstance(value, str):
+                rows.append((file_path, tag, value, None))
+            elif isinstance(value, numbers.Number) and not isinstance(value, complex):
+                rows.append((file_path, tag, None, float(value)))
+
+        with h5py.File(file_path, "r") as h5file:
+            if "meta_data" not in h5file:
+                raise KeyError("The file contains no IPASC acquisition metadata.")
+            for tag, item in h5file["meta_data"].items():
+                if not isinstance(item, h5py.Dataset):
+                    continue
+                if tag in MULTI_VALUED_TAGS:
+                    for element in np.reshape(read_dataset(item), (-1, )):
+                        add_row(tag, element.item())
+                elif item.size == 1:
+                    add_row(tag, read_dataset(item))
+            general_path = "meta_data_device/" + MetadataDeviceTags.GENERAL.tag
+            if general_path in h5file:
+                general = h5file[general_path]
+                for tag in DEVICE_GENERAL_TAGS:
+                    if tag in general:
+                        add_row(tag, read_dataset(general[tag]))
+        return rows
@@ -0,0 +1,247 @@
+# SPDX-FileCopyrightText: 2026 International Photoacoustics Standardisation Consortium (IPASC)
+# SPDX-License-Identifier: BSD 3-Clause License
+
+"""
+Integrity information for IPASC files.
+
+When an IPASC file is written with `checksums=True`, the time series dataset is stored in chunks that are
+protected by the HDF5 fletcher32 filter. In addition, a SHA-256 digest of every stored chunk and a digest of
+all metadata are written into the `/integrity` group. These can be checked chunk by chunk with
+`verify_file_integrity` without ever loading the full time series data into memory.
+"""
+
+import argparse
+import hashlib
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+import h5py
+import numpy as np
+
+INTEGRITY_GROUP = "integrity"
+CHUNK_DIGESTS = "chunk_digests"
+CHUNK_OFFSETS = "chunk_offsets"
+META_DATA_DIGEST = "meta_data_digest"
+DIGEST_ALGORITHM = "sha256"
+META_DATA_GROUPS = ("meta_data", "meta_data_device")
+
+
+def _hash_meta_data_group(h5group: h5py.Group, digest):
+    def visit(name, item):
+        digest.update(name.encode("utf-8"))
+        if isinstance(item, h5py.Dataset):
+            value = np.asarray(item[()])
+            digest.update(item.dtype.str.encode("utf-8"))
+            digest.update(str(item.shape).encode("utf-8"))
+            if value.dtype.kind != "O":
+                digest.update(value.tobytes())
+            else:
+                for element in np.reshape(value, (-1, )):
+                    digest.update(element if isinstance(element, bytes) else str(element).encode("utf-8"))
+
+    h5group.visititems(visit)
+
+
+def compute_meta_data_digest(h5file: h5py.File) -> str:
+    """
+    Computes a digest over the names, data types, shapes and values of all metadata datasets in the file.
+
+    Parameters
+    ----------
+    h5file: h5py.File
+        An open IPASC HDF5 file.
+
+    Return
+    ------
+    str
+        The hexadecimal SHA-256 digest of the acquisition and device metadata.
+    """
+    digest = hashlib.new(DIGEST_ALGORITHM)
+    for group_name in META_DATA_GROUPS:
+        digest.update(group_name.encode("utf-8"))
+        if group_name in h5file:
+            _hash_meta_data_group(h5file[group_name], digest)
+    return digest.hexdigest()
+
+
+def _get_chunk_table(dataset: h5py.Dataset) -> list:
+    """
+    Returns a list of (chunk_offset, byte_offset, size) tuples for all allocated chunks of the dataset.
+    """
+    dataset_id = dataset.id
+    chunk_table = []
+    for index in range(dataset_id.get_num_chunks()):
+        info = dataset_id.get_chunk_info(index)
+        chunk_table.append((info.chunk_offset, info.byte_offset, info.size))
+    return chunk_table
+
+
+def write_integrity_information(h5file: h5py.File, dataset_name: str = "binary_time_series_data"):
+    """
+    Stores a digest for every stored chunk of the time series dataset and a digest of all metadata in the
+    `/integrity` group of the given file. Any previously stored integrity information is replaced.
+
+    Parameters
+    ----------
+    h5file: h5py.File
+        An IPASC HDF5 file that is open for writing.
+    dataset_name: str
+        The name of the chunked time series dataset.
+    """
+    dataset = h5file[dataset_name]
+    if dataset.chunks is None:
+        raise ValueError(f"The dataset {dataset_name} must be chunked to store per-chunk digests.")
+
+    chunk_table = _get_chunk_table(dataset)
+    digests = np.zeros((len(chunk_table), hashlib.new(DIGEST_ALGORITHM).digest_size), dtype=np.uint8)
+    offsets = np.zeros((len(chunk_table), len(dataset.shape)), dtype=np.int64)
+    for index, (chunk_offset, _, _) in enumerate(chunk_table):
+        _, raw_chunk = dataset.id.read_direct_chunk(chunk_offset)
+        digests[index] = np.frombuffer(hashlib.new(DIGEST_ALGORITHM, raw_chunk).digest(), dtype=np.uint8)
+        offsets[index] = chunk_offset
+
+    if INTEGRITY_GROUP in h5file:
+        del h5file[INTEGRITY_GROUP]
+    integrity_group = h5file.create_group(INTEGRITY_GROUP)
+    integrity_group.create_dataset(CHUNK_DIGESTS, data=digests)
+    integrity_group.create_dataset(CHUNK_OFFSETS, data=offsets)
+    integrity_group.attrs["algorithm"] = DIGEST_ALGORITHM
+    integrity_group.attrs["dataset"] = dataset_name
+    integrity_group.attrs[META_DATA_DIGEST] = compute_meta_data_digest(h5file)
+
+
+def update_meta_data_digest(h5file: h5py.File):
+    """
+    Recomputes the stored metadata digest after the metadata of a file has been changed on purpose.
+    Files without integrity information are left untouched.
+
+    Parameters
+    ----------
+    h5file: h5py.File
+        An IPASC HDF5 file that is open for writing.
+    """
+    if INTEGRITY_GROUP in h5file:
+        h5file[INTEGRITY_GROUP].attrs[META_DATA_DIGEST] = compute_meta_data_digest(h5file)
+
+
+def verify_file_integrity(file_path: str, workers: int = 1, verbose: bool = False) -> bool:
+    """
+    Verifies an IPASC file that was written with `checksums=True`.
+
+    Every stored chunk of the time series dataset is read as raw bytes directly from disk and compared against
+    its stored digest. The chunks are distributed over `workers` threads, each with its own file handle, and
+    only one chunk per worker is held in memory at any time. Finally, the metadata digest is recomputed.
+
+    If a file only carries the fletcher32 filter but no stored digests, each chunk is instead read through
+    HDF5, which validates the fletcher32 checksum of the chunk.
+
+    Parameters
+    ----------
+    file_path: str
+        Path of the HDF5 file to verify.
+    workers: int
+        Number of threads that verify chunks in parallel.
+    verbose: bool
+        Specifies if a report should be printed to the console.
+
+    Raises
+    ------
+    ValueError:
+        if the file contains neither stored digests nor fletcher32 checksums.
+
+    Return
+    ------
+    bool
+        True if and only if all chunks and the metadata match their stored checksums.
+    """
+    with h5py.File(file_path, "r") as h5file:
+        if INTEGRITY_GROUP in h5file:
+            integrity_group = h5file[INTEGRITY_GROUP]
+            algorithm = integrity_group.attrs["algorithm"]
+            dataset = h5file[integrity_group.attrs["dataset"]]
+            expected_digests = {tuple(offset): bytes(digest) for offset, digest in
+                                zip(integrity_group[CHUNK_OFFSETS][()], integrity_group[CHUNK_DIGESTS][()])}
+            expected_meta_data_digest = integrity_group.attrs[META_DATA_DIGEST]
+            meta_data_consistent = compute_meta_data_digest(h5file) == expected_meta_data_digest
+        elif h5py.h5z.FILTER_FLETCHER32 in _get_filters(h5file["binary_time_series_data"]):
+            dataset = h5file["binary_time_series_data"]
+            expected_digests = None
+            meta_data_consistent = True
+        else:
+            raise ValueError(f"The file {file_path} does not contain any integrity information.")
+
+        chunk_table = _get_chunk_table(dataset)
+        if expected_digests is None:
+            corrupt_chunks = _verify_fletcher32_chunks(dataset, chunk_table)
+
+    if expected_digests is not None:
+        corrupt_chunks = _verify_chunk_digests(file_path, chunk_table, expected_digests, algorithm, workers)
+
+    if verbose:
+        log_message = "#Integrity Report\n\n"
+        log_message += f"Verified {len(chunk_table)} chunks of the time series data.\n"
+        for chunk_offset in corrupt_chunks:
+            log_message += f"* chunk at offset {chunk_offset} is corrupt\n"
+        if not meta_data_consistent:
+            log_message += "* the metadata digest does not match\n"
+        if corrupt_chunks or not meta_data_consistent:
+            log_message += "\nThe file is corrupt!\n"
+        else:
+            log_message += "\nThe file is intact.\n"
+        print(log_message)
+
+    return meta_data_consistent and len(corrupt_chunks) == 0
+
+
+def _get_filters(dataset: h5py.Dataset) -> list:
+    plist = dataset.id.get_create_plist()
+    return [plist.get_filter(index)[0] for index in range(plist.get_nfilters())]
+
+
+def _verify_fletcher32_chunks(dataset: h5py.Dataset, chunk_table: list) -> list:
+    corrupt_chunks = []
+    for chunk_offset, _, _ in chunk_table:
+        selection = tuple(slice(offset, offset + size) for offset, size in zip(chunk_offset, dataset.chunks))
+        try:
+            dataset[selection]
+        except OSError:
+            corrupt_chunks.append(chunk_offset)
+    return corrupt_chunks
+
+
+def _verify_chunk_digests(file_path: str, chunk_table: list, expected_digests: dict, algorithm: str,
+                          workers: int) -> list:
+    local = threading.local()
+    handles = []
+
+    def verify_chunk(chunk):
+        chunk_offset, byte_offset, size = chunk
+        if not hasattr(local, "handle"):
+            local.handle = open(file_path, "rb")
+            handles.append(local.handle)
+        local.handle.seek(byte_offset)
+        digest = hashlib.new(algorithm, local.handle.read(size)).digest()
+        return None if expected_digests.get(tuple(chunk_offset)) == digest else chunk_offset
+
+    try:
+        with ThreadPoolExecutor(max_workers=max(1, workers)) as executor:
+            results = list(executor.map(verify_chunk, chunk_table))
+    finally:
+        for handle in handles:
+            handle.close()
+
+    missing_chunks = set(expected_digests.keys()) - {tuple(chunk[0]) for chunk in chunk_table}
+    return [result for result in results if result is not None] + sorted(missing_chunks)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Verify the integrity of IPASC HDF5 files.")
+    parser.add_argument("file_paths", nargs="+", help="Paths of the files to verify.")
+    parser.add_argument("--workers", type=int, default=1, help="Number of threads that verify chunks in parallel.")
+    arguments = parser.parse_args()
+    all_intact = True
+    for path in arguments.file_paths:
+        intact = verify_file_integrity(path, workers=arguments.workers)
+        print(path, "OK" if intact else "CORRUPT")
+        all_intact = all_intact and intact
+    raise SystemExit(0 if all_intact else 1)
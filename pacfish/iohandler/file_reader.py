@@ -3,19 +3,253 @@
 # SPDX-FileCopyrightText: 2021 Janek Gröhl
 # SPDX-License-Identifier: MIT
 
+import copy
+import os
+import threading
 import h5py
-from pacfish import PAData
+from pacfish import PAData, MetadataDeviceTags, profile
+from pacfish.iohandler.block_cache import BlockCachedFile, as_h5py_source, open_h5file
+from pacfish.iohandler.file_writer import get_device_reference
+from pacfish.iohandler.lazy_data import LazyTimeSeriesData
+from pacfish.iohandler.progress import ProgressTracker, get_measurements_per_chunk
 import numpy as np
 
+# Parsed device descriptions from device libraries, keyed by (library path, device reference).
+_DEVICE_CACHE = dict()
+_DEVICE_CACHE_LOCK = threading.Lock()
 
-def load_data(file_path:str):
+
+def _normalise_value(value):
+    """
+    Fallback conversion for datasets that are not covered by the dispatch tables below.
+    It performs all type normalisation steps that are needed to ensure compatibility with the MATLAB code.
+    """
+    if isinstance(value, np.ndarray):
+        # remove any singleton dimensions
+        value = np.squeeze(value)
+
+    if isinstance(value, np.object_):
+        value = str(value.astype(np.str_))
+
+    # H5PY loads datasets into numpy types by default. However, that is not how they were defined
+    # before writing, so the following two lines convert to the closest built-in type - if possible.
+    if isinstance(value, np.generic):
+        value = value.item()
+
+    if isinstance(value, bytes):
+        value = value.decode("utf-8")
+        if value == "None":
+            value = None
+
+    return value
+
+
+def _read_scalar_number(value: np.ndarray):
+    return value[()].item()
+
+
+def _read_scalar_string(value: np.ndarray):
+    value = value[()]
+    if isinstance(value, np.generic):
+        value = value.item()
+    if isinstance(value, bytes):
+        value = value.decode("utf-8")
+    if value == "None":
+        return None
+    return value
+
+
+def _read_scalar_object(value: np.ndarray):
+    return _normalise_value(value[()])
+
+
+# Maps the numpy dtype kind of a scalar dataset onto the function that converts it into a built-in type.
+_SCALAR_CONVERTERS = {
+    "b": _read_scalar_number,
+    "i": _read_scalar_number,
+    "u": _read_scalar_number,
+    "f": _read_scalar_number,
+    "c": _read_scalar_number,
+    "S": _read_scalar_string,
+}
+
+
+def _read_dataset_id(dataset_id: h5py.h5d.DatasetID) -> object:
+    shape = dataset_id.shape
+    dtype = dataset_id.dtype
+    if shape is None:
+        return h5py.Empty(dtype)
+
+    value = np.empty(shape, dtype=dtype)
+    if value.size > 0:
+        dataset_id.read(h5py.h5s.ALL, h5py.h5s.ALL, value)
+
+    if len(shape) > 0:
+        # remove any singleton dimensions to ensure compatibility with the MATLAB code
+        return np.squeeze(value)
+    if dtype.kind == "O" and h5py.check_string_dtype(dtype) is not None:
+        return _read_scalar_string(value)
+    return _SCALAR_CONVERTERS.get(dtype.kind, _read_scalar_object)(value)
+
+
+def read_dataset(dataset: h5py.Dataset) -> object:
+    """
+    Reads a single metadata dataset and converts it into the closest built-in Python type.
+
+    Parameters
+    ----------
+    dataset: h5py.Dataset
+        The HDF5 dataset to read.
+
+    Return
+    ------
+    object
+        The converted value. Strings that were written as "None" are returned as `None`.
+    """
+    return _read_dataset_id(dataset.id)
+
+
+def read_dictionary(h5group: h5py.Group) -> dict:
+    """
+    Reads all datasets below the given HDF5 group into a nested dictionary.
+
+    The group is traversed in a single pass with the low-level HDF5 object visitor. Every group and dataset is
+    opened relative to its already opened parent group, so no path is resolved from the file root more than once.
+
+    Parameters
+    ----------
+    h5group: h5py.Group
+        The group that corresponds to the top level of the returned dictionary.
+
+    Return
+    ------
+    dict
+        A nested dictionary mirroring the group structure in the HDF5 file.
+    """
+    dictionary = {}
+    containers = {b"": (h5group.id, dictionary)}
+    num_visited = [0]
+
+    def visit(name, info):
+        if name == b".":
+            return
+        num_visited[0] += 1
+        parent_name, _, key = name.rpartition(b"/")
+        parent_id, parent = containers[parent_name]
+        if info.type == h5py.h5o.TYPE_DATASET:
+            parent[key.decode("utf-8")] = _read_dataset_id(h5py.h5d.open(parent_id, key))
+        elif info.type == h5py.h5o.TYPE_GROUP:
+            child = {}
+            parent[key.decode("utf-8")] = child
+            containers[name] = (h5py.h5g.open(parent_id, key), child)
+
+    h5py.h5o.visit(h5group.id, visit, info=True)
+    profile.count(profile.HDF5_OBJECTS_VISITED, num_visited[0])
+    return dictionary
+
+
+def load_device_from_library(library_path: str, reference: str) -> dict:
+    """
+    Loads a device description from a device library file.
+
+    Every device is only parsed once per process. Subsequent calls return a deep copy of the cached
+    dictionary, so every PAData instance can modify its device description without affecting the others.
+    The cache entries of a library are discarded when the library file is changed on disk.
+
+    Parameters
+    ----------
+    library_path: str
+        Path of the device library file.
+    reference: str
+        The reference under which the device was stored.
+
+    Raises
+    ------
+    KeyError:
+        if the library does not contain the referenced device.
+
+    Return
+    ------
+    dict
+        The device metadata dictionary.
+    """
+    key = (os.path.abspath(library_path), reference)
+    modification_time = os.stat(library_path).st_mtime_ns
+    with _DEVICE_CACHE_LOCK:
+        cached = _DEVICE_CACHE.get(key)
+        if cached is not None and cached[0] == modification_time:
+            profile.count(profile.CACHE_HITS)
+            return copy.deepcopy(cached[1])
+    profile.count(profile.CACHE_MISSES)
+
+    with h5py.File(library_path, "r") as library_file:
+        if reference not in library_file:
+            raise KeyError(f"The device {reference} was not found in the device library {library_path}.")
+        meta_data_device = read_dictionary(library_file[reference])
+
+    with _DEVICE_CACHE_LOCK:
+        _DEVICE_CACHE[key] = (modification_time, meta_data_device)
+    return copy.deepcopy(meta_data_device)
+
+
+def clear_device_cache():
+    """
+    Discards all device descriptions that were cached by `load_device_from_library`.
+    """
+    with _DEVICE_CACHE_LOCK:
+        _DEVICE_CACHE.clear()
+
+
+def _read_time_series(dataset: h5py.Dataset, tracker: ProgressTracker) -> np.ndarray:
+    """
+    Reads the full time series dataset. If progress is reported or the read can be cancelled, the data is read
+    in chunks of measurements directly into the result array.
+    """
+    tracker.check_cancellation()
+    if not tracker.is_active or dataset.ndim != 4 or dataset.size == 0:
+        binary_data = dataset[()]
+        tracker.update(binary_data.nbytes, tracker.frames_total)
+        return binary_data
+
+    binary_data = np.empty(dataset.shape, dtype=dataset.dtype)
+    measurements_per_chunk = get_measurements_per_chunk(dataset.shape, dataset.dtype.itemsize)
+    for start in range(0, dataset.shape[3], measurements_per_chunk):
+        tracker.check_cancellation()
+        stop = min(start + measurements_per_chunk, dataset.shape[3])
+        selection = np.s_[:, :, :, start:stop]
+        dataset.read_direct(binary_data, selection, selection)
+        tracker.update(binary_data[selection].nbytes, stop - start)
+    return binary_data
+
+
+def load_data(file_path, device_library: str = None, lazy: bool = False, progress=None,
+              cancellation=None):
     """
     Loads a PAData instance from an IPASC-formatted HDF5 file.
 
     Parameters
     ----------
-    file_path: str
-        Path of the HDF5 file to load the PAData from.
+    file_path: str or file-like
+        Path of the HDF5 file to load the PAData from, or a seekable binary file object, e.g. opened with fsspec.
+        File objects are read through a `BlockCachedFile`, whose block size is adapted to the storage layout of
+        the time series data. Pass a `BlockCachedFile` to configure the block size and the cache.
+    device_library: str
+        Path of a device library file. If given and the file does not embed the detection elements of the
+        device, the device description is resolved from the library by the device reference.
+    lazy: bool
+        If True, the time series data is not read into memory. Instead, `binary_time_series_data` is a
+        `LazyTimeSeriesData` instance that reads the selected parts of the data from the file when indexed.
+    progress: callable
+        If given, it is called with a `Progress` instance after every chunk of measurements that was read.
+        If `lazy` is True, it is called once after the metadata was read, with a single frame and no bytes.
+    cancellation: CancellationToken
+        If given, it is checked before every chunk and the load is stopped if it was cancelled. If `lazy` is
+        True, it is checked once before the metadata is read. Reads of the `LazyTimeSeriesData` are not affected.
+
+    Raises
+    ------
+    OperationCancelled:
+        if the load was cancelled.
 
     Return
     ------
@@ -23,40 +257,33 @@ def load_data(file_path:str):
         PAData instance containing all data and metadata read from the HDF5 file.
     """
 
-    def recursively_load_dictionaries(file, path):
-        dictionary = {}
-        for key, item in h5file[path].items():
-            if isinstance(item, h5py._hl.dataset.Dataset):
-                dictionary[key] = None
-                if item[()] is not None:
-                    dictionary[key] = item[()]
-
-                    # This is introduced to ensure compatibility with the MATLAB code...
-                    if isinstance(dictionary[key], np.ndarray):
-                        # remove any singleton dimensions
-                        dictionary[key] = np.squeeze(dictionary[key])
-
-                    if isinstance(dictionary[key], np.object_):
-                        dictionary[key] = dictionary[key].astype(np.str_)
-                        dictionary[key] = str(dictionary[key])
-
-                    # H5PY loads datasets into numpy types by default. However, that is not how they were defined
-                    # before writing, so the following two lines convert to the closest built-in type - if possible.
-                    if isinstance(dictionary[key], np.generic):
-                        dictionary[key] = dictionary[key].item()
-
-                    if isinstance(dictionary[key], bytes):
-                        dictionary[key] = dictionary[key].decode("utf-8")
-                        if dictionary[key] == "None":
-                            dictionary[key] = None
-
-            elif isinstance(item, h5py._hl.group.Group):
-                    dictionary[key] = recursively_load_dictionaries(file, path + key + "/")
-        return dictionary
-
-    with h5py.File(file_path, "r") as h5file:
-        binary_data = h5file["/binary_time_series_data"][()]
-        pa_data = PAData(binary_data)
-        pa_data.meta_data_acquisition = recursively_load_dictionaries(h5file, "/meta_data/")
-        pa_data.meta_data_device = recursively_load_dictionaries(h5file, "/meta_data_device/")
-        return pa_data
+    source = as_h5py_source(file_path)
+    with profile.span("load_data", file_path=str(file_path), lazy=lazy):
+        with open_h5file(source) as h5file:
+            if isinstance(source, BlockCachedFile):
+                source.adapt_to_dataset(h5file["/binary_time_series_data"])
+            with profile.span("load_data.read_binary_data") as read_span:
+                if lazy:
+                    # only the metadata is read, which is reported as a single step without bytes
+                    tracker = ProgressTracker("load_data", 0, 1, progress, cancellation)
+                    tracker.check_cancellation()
+                    binary_data = LazyTimeSeriesData(source)
+                else:
+                    dataset = h5file["/binary_time_series_data"]
+                    tracker = ProgressTracker("load_data", (dataset.size or 0) * dataset.dtype.itemsize,
+                                              dataset.shape[3] if dataset.ndim == 4 else 1, progress, cancellation)
+                    binary_data = _read_time_series(dataset, tracker)
+                    read_span.count(profile.BYTES_READ, binary_data.nbytes)
+            pa_data = PAData(binary_data)
+            with profile.span("load_data.read_acquisition_meta_data"):
+                pa_data.meta_data_acquisition = read_dictionary(h5file["/meta_data/"])
+            with profile.span("load_data.read_device_meta_data"):
+                pa_data.meta_data_device = read_dictionary(h5file["/meta_data_device/"])
+            if lazy:
+                tracker.update(0, 1)
+
+        if device_library is not None and MetadataDeviceTags.DETECTORS.tag not in pa_data.meta_data_device:
+            reference = get_device_reference(pa_data.meta_data_acquisition, pa_data.meta_data_device)
+            with profile.span("load_data.load_device_from_library", reference=reference):
+                pa_data.meta_data_device = load_device_from_library(device_library, reference)
+    return pa_data
@@ -3,15 +3,162 @@
 # SPDX-FileCopyrightText: 2021 Janek Gröhl
 # SPDX-License-Identifier: MIT
 
+import hashlib
+import os
+import uuid
 import h5py
-from pacfish import PAData
+from pacfish import PAData, MetadataAcquisitionTags, MetadataDeviceTags, profile
 import numpy as np
+from pacfish.iohandler.file_integrity import write_integrity_information, update_meta_data_digest, \
+    DIGEST_ALGORITHM
+from pacfish.iohandler.lazy_data import iterate_measurement_chunks
+from pacfish.iohandler.progress import ProgressTracker, get_measurements_per_chunk
 
+# The attribute of a device group in a device library that holds the digest of the device description.
+DEVICE_DIGEST_ATTRIBUTE = "device_digest"
 
-def write_data(file_path: str, pa_data: PAData, file_compression: str = None):
+
+def recursively_save_dictionaries(h5file: h5py.File, path: str, data_dictionary: dict, compression: str = None):
+    """
+    Saves a (nested) dictionary into the given HDF5 file.
+
+    Parameters
+    ----------
+    h5file: h5py.File
+        The HDF5 file that is open for writing.
+    path: str
+        The path of the group to save the dictionary in, e.g. "/meta_data/".
+    data_dictionary: dict
+        The dictionary to save. Values of `None` are stored as the string "None".
+    compression: str
+        possible compression for the numpy arrays in the dictionary. Possible values are: gzip, lzf and szip.
+    """
+    for key, item in data_dictionary.items():
+        key = str(key)
+        if not isinstance(item, (list, dict, type(None))):
+
+            if isinstance(item, (bytes, int, np.int64, float, str, bool, np.bool_)):
+                    h5file[path + key] = item
+                    profile.count(profile.HDF5_OBJECTS_WRITTEN)
+            else:
+                if isinstance(item, np.ndarray):
+                    h5file.create_dataset(path + key, data=item, compression=compression)
+                    profile.count(profile.HDF5_OBJECTS_WRITTEN)
+                    profile.count(profile.BYTES_WRITTEN, item.nbytes)
+        elif item is None:
+                h5file[path + key] = "None"
+                profile.count(profile.HDF5_OBJECTS_WRITTEN)
+        else:
+            recursively_save_dictionaries(h5file, path + key + "/", item, compression)
+
+
+def get_device_reference(meta_data_acquisition: dict, meta_data_device: dict) -> str:
+    """
+    Returns the reference under which a device is stored in a device library. This is the
+    `photoacoustic_imaging_device_reference` of the acquisition metadata or, if that is not given,
+    the `unique_identifier` of the device.
+
+    Return
+    ------
+    str
+        The device reference. Can be None, if neither field is set.
+    """
+    reference = meta_data_acquisition.get(MetadataAcquisitionTags.PHOTOACOUSTIC_IMAGING_DEVICE_REFERENCE.tag)
+    if reference is None and MetadataDeviceTags.GENERAL.tag in meta_data_device:
+        reference = meta_data_device[MetadataDeviceTags.GENERAL.tag].get(MetadataDeviceTags.UNIQUE_IDENTIFIER.tag)
+    return reference
+
+
+def _hash_dictionary(data_dictionary: dict, digest):
+    for key in sorted(data_dictionary, key=str):
+        item = data_dictionary[key]
+        digest.update(b"\x00" + str(key).encode("utf-8") + b"\x00")
+        if isinstance(item, dict):
+            digest.update(b"{")
+            _hash_dictionary(item, digest)
+            digest.update(b"}")
+        elif isinstance(item, (np.ndarray, list)):
+            value = np.ascontiguousarray(item)
+            digest.update(f"{value.dtype.str}{value.shape}".encode("utf-8"))
+            if value.dtype.kind == "O":
+                digest.update(repr(value.tolist()).encode("utf-8"))
+            else:
+                # comparing the bytes treats NaN values as equal
+                digest.update(value.tobytes())
+        else:
+            if isinstance(item, np.generic):
+                item = item.item()
+            digest.update(f"{type(item).__name__}:{item!r}".encode("utf-8"))
+
+
+def compute_device_digest(meta_data_device: dict) -> str:
+    """
+    Computes a digest over the keys, data types, shapes and values of a device metadata dictionary, which
+    identifies a device description in a device library.
+
+    Return
+    ------
+    str
+        The hexadecimal SHA-256 digest.
+    """
+    digest = hashlib.new(DIGEST_ALGORITHM)
+    _hash_dictionary(meta_data_device, digest)
+    return digest.hexdigest()
+
+
+def add_device_to_library(library_path: str, reference: str, meta_data_device: dict, overwrite: bool = False):
+    """
+    Stores a device description in a device library file, so that IPASC files can refer to it instead of
+    embedding the full device description. The library is an HDF5 file with one group per device reference.
+    The digest of the device, see `compute_device_digest`, is stored as the `DEVICE_DIGEST_ATTRIBUTE` attribute
+    of its group, so that storing a device again only has to compare the digests. Devices that were stored
+    without a digest are kept as they are.
+
+    Parameters
+    ----------
+    library_path: str
+        Path of the device library file. It is created if it does not exist yet.
+    reference: str
+        The reference under which the device is stored.
+    meta_data_device: dict
+        The device metadata dictionary.
+    overwrite: bool
+        If True, a device that is already stored under the same reference is replaced.
+
+    Raises
+    ------
+    ValueError:
+        if the reference cannot be used as a key, or if a different device is already stored under the same
+        reference and `overwrite` is False.
+    """
+    if reference is None or "/" in reference:
+        raise ValueError(f"The device reference {reference} cannot be used as a device library key.")
+
+    device_digest = compute_device_digest(meta_data_device)
+    with h5py.File(library_path, "a") as library_file:
+        if reference in library_file:
+            if not overwrite:
+                stored_digest = library_file[reference].attrs.get(DEVICE_DIGEST_ATTRIBUTE)
+                if stored_digest is None or stored_digest == device_digest:
+                    return
+                raise ValueError(f"A different device is already stored under the reference {reference} in the "
+                                 f"device library {library_path}.")
+            del library_file[reference]
+        device_group = library_file.create_group(reference)
+        device_group.attrs[DEVICE_DIGEST_ATTRIBUTE] = device_digest
+        recursively_save_dictionaries(library_file, "/" + reference + "/", meta_data_device)
+
+
+def write_data(file_path: str, pa_data: PAData, file_compression: str = None, checksums: bool = False,
+               device_library: str = None, progress=None, cancellation=None):
     """
     Saves a PAData instance into an HDF5 file according to the IPASC consensus format.
 
+    Array-like time series data that is not a numpy array, such as lazily loaded data, is written chunk by
+    chunk of measurements, so it never has to be held in memory in full. The file is first written under a
+    temporary name in the same directory and only renamed to `file_path` when it is complete, so a failed or
+    cancelled write never leaves a partial file behind or destroys an existing file.
+
     Parameters
     ----------
 
@@ -21,6 +168,21 @@ def write_data(file_path: str, pa_data: PAData, file_compression: str = None):
         Instance of the PAData class containing all information
     file_compression: str
         possible file compression for the hdf5 output file. Possible values are: gzip, lzf and szip.
+    checksums: bool
+        If True, the time series data is stored in chunks protected by the fletcher32 filter and a digest of
+        every chunk and of the metadata is written, so that the file can be checked with `verify_file_integrity`.
+    device_library: str
+        Path of a device library file. If given, the device description is stored in the library and the
+        written file only contains the device reference, which `load_data` resolves from the same library.
+    progress: callable
+        If given, it is called with a `Progress` instance after every chunk of measurements that was written.
+    cancellation: CancellationToken
+        If given, it is checked before every chunk and the write is stopped if it was cancelled.
+
+    Raises
+    ------
+    OperationCancelled:
+        if the write was cancelled. The file at `file_path` is left unchanged.
 
     Return
     ------
@@ -28,22 +190,137 @@ def write_data(file_path: str, pa_data: PAData, file_compression: str = None):
         This method does not return anything
     """
 
-    def recursively_save_dictionaries(file, path, data_dictionary, compression: str = None):
-        for key, item in data_dictionary.items():
-            key = str(key)
-            if not isinstance(item, (list, dict, type(None))):
+    meta_data_acquisition = pa_data.meta_data_acquisition
+    meta_data_device = pa_data.meta_data_device
+    if device_library is not None:
+        reference = get_device_reference(meta_data_acquisition, meta_data_device)
+        add_device_to_library(device_library, reference, meta_data_device)
+        meta_data_acquisition = dict(meta_data_acquisition)
+        meta_data_acquisition[MetadataAcquisitionTags.PHOTOACOUSTIC_IMAGING_DEVICE_REFERENCE.tag] = reference
+        unique_identifier = meta_data_device.get(MetadataDeviceTags.GENERAL.tag, dict()).get(
+            MetadataDeviceTags.UNIQUE_IDENTIFIER.tag, reference)
+        meta_data_device = {MetadataDeviceTags.GENERAL.tag: {
+            MetadataDeviceTags.UNIQUE_IDENTIFIER.tag: unique_identifier}}
+
+    binary_time_series_data = pa_data.binary_time_series_data
+    dataset_options = dict(chunks=True, fletcher32=True) if checksums else dict()
+    shape = tuple(np.shape(binary_time_series_data)) if hasattr(binary_time_series_data, "shape") else ()
+    num_bytes = int(np.prod(shape)) * np.dtype(binary_time_series_data.dtype).itemsize if shape else 0
+    tracker = ProgressTracker("write_data", num_bytes, shape[3] if len(shape) == 4 else 1, progress, cancellation)
+    tracker.check_cancellation()
 
-                if isinstance(item, (bytes, int, np.int64, float, str, bool, np.bool_)):
-                        h5file[path + key] = item
+    temporary_path = f"{file_path}.{uuid.uuid4().hex[:12]}.tmp"
+    try:
+        with profile.span("write_data", file_path=str(file_path), compression=file_compression), \
+                h5py.File(temporary_path, "w-") as h5file:
+            with profile.span("write_data.write_binary_data"):
+                if (not tracker.is_active and isinstance(binary_time_series_data, np.ndarray)) or \
+                        not hasattr(binary_time_series_data, "shape"):
+                    dataset = h5file.create_dataset("binary_time_series_data", data=binary_time_series_data,
+                                                    **dataset_options)
+                    profile.count(profile.BYTES_WRITTEN, dataset.dtype.itemsize * dataset.size)
+                    tracker.update(num_bytes, tracker.frames_total)
                 else:
-                    if isinstance(item, np.ndarray):
-                        h5file.create_dataset(path + key, data=item, compression=compression)
-            elif item is None:
-                    h5file[path + key] = "None"
-            else:
-                recursively_save_dictionaries(file, path + key + "/", item, file_compression)
+                    _write_time_series_in_chunks(h5file, binary_time_series_data, dataset_options, tracker)
+            tracker.check_cancellation()
+            with profile.span("write_data.write_acquisition_meta_data"):
+                recursively_save_dictionaries(h5file, "/meta_data/", meta_data_acquisition, file_compression)
+            with profile.span("write_data.write_device_meta_data"):
+                recursively_save_dictionaries(h5file, "/meta_data_device/", meta_data_device, file_compression)
+            if checksums:
+                with profile.span("write_data.write_integrity_information"):
+                    write_integrity_information(h5file)
+        tracker.check_cancellation()
+        os.replace(temporary_path, file_path)
+    finally:
+        if os.path.exists(temporary_path):
+            os.remove(temporary_path)
+
 
-    with h5py.File(file_path, "w") as h5file:
-        h5file.create_dataset("binary_time_series_data", data=pa_data.binary_time_series_data)
-        recursively_save_dictionaries(h5file, "/meta_data/", pa_data.meta_data_acquisition)
-        recursively_save_dictionaries(h5file, "/meta_data_device/", pa_data.meta_data_device)
+def _write_time_series_in_chunks(h5file: h5py.File, binary_time_series_data, dataset_options: dict,
+                                 tracker: ProgressTracker):
+    shape = tuple(binary_time_series_data.shape)
+    dtype = np.dtype(binary_time_series_data.dtype)
+    dataset = h5file.create_dataset("binary_time_series_data", shape=shape, dtype=dtype, **dataset_options)
+    measurements_per_chunk = get_measurements_per_chunk(shape, dtype.itemsize)
+    for start, stop, chunk in iterate_measurement_chunks(binary_time_series_data, measurements_per_chunk,
+                                                         cancellation=tracker.cancellation):
+        if len(shape) == 4:
+            dataset[:, :, :, start:stop] = chunk
+        else:
+            dataset[()] = np.reshape(chunk, shape)
+        profile.count(profile.BYTES_WRITTEN, chunk.nbytes)
+        tracker.update(chunk.nbytes, stop - start)
+
+
+def _recursively_update_dictionaries(h5file: h5py.File, path: str, data_dictionary: dict) -> int:
+    bytes_written = 0
+    for key, item in data_dictionary.items():
+        key = str(key)
+        if isinstance(item, dict):
+            if path + key in h5file and not isinstance(h5file[path + key], h5py.Group):
+                del h5file[path + key]
+            h5file.require_group(path + key)
+            bytes_written += _recursively_update_dictionaries(h5file, path + key + "/", item)
+        else:
+            if path + key in h5file:
+                del h5file[path + key]
+            recursively_save_dictionaries(h5file, path, {key: item})
+            if path + key in h5file:
+                bytes_written += h5file[path + key].id.get_storage_size()
+    return bytes_written
+
+
+def update_metadata(file_path: str, acquisition: dict = None, device: dict = None) -> int:
+    """
+    Changes the metadata of an existing IPASC file in place, without rewriting the time series data.
+
+    Only the given entries are replaced or added. Nested dictionaries are merged into the existing groups,
+    so e.g. `device={"detectors": {"0000000003": {"detector_position": position}}}` changes the position of a
+    single detection element and leaves everything else untouched. If the file carries integrity information,
+    the metadata digest is updated as well.
+
+    Parameters
+    ----------
+    file_path: str
+        Path of the IPASC HDF5 file to update.
+    acquisition: dict
+        Acquisition metadata entries to replace or add.
+    device: dict
+        Device metadata entries to replace or add.
+
+    Return
+    ------
+    int
+        The number of bytes of metadata that were written.
+    """
+    bytes_written = 0
+    with h5py.File(file_path, "r+") as h5file:
+        if acquisition is not None:
+            bytes_written += _recursively_update_dictionaries(h5file, "/meta_data/", acquisition)
+        if device is not None:
+            bytes_written += _recursively_update_dictionaries(h5file, "/meta_data_device/", device)
+        update_meta_data_digest(h5file)
+    return bytes_written
+
+
+def update_metadata_of_files(file_paths: list, acquisition: dict = None, device: dict = None) -> dict:
+    """
+    Applies `update_metadata` with the same changes to many IPASC files.
+
+    Parameters
+    ----------
+    file_paths: list
+        Paths of the IPASC HDF5 files to update.
+    acquisition: dict
+        Acquisition metadata entries to replace or add.
+    device: dict
+        Device metadata entries to replace or add.
+
+    Return
+    ------
+    dict
+        A dictionary mapping every file path onto the number of bytes of metadata that were written.
+    """
+    return {file_path: update_metadata(file_path, acquisition=acquisition, device=device)
+            for file_path in file_paths}
@@ -0,0 +1,507 @@
+# SPDX-FileCopyrightText: 2026 International Photoacoustics Standardisation Consortium (IPASC)
+# SPDX-License-Identifier: BSD 3-Clause License
+
+"""
+A small HTTP server that serves the metadata and arbitrary hyperslabs of the time series data of IPASC files,
+and a matching client, so that review stations can look at a few frames without copying whole files::
+
+    # on the machine with the files
+    python -m pacfish.iohandler.frame_server /data/archive --host 0.0.0.0 --port 8123
+
+    # on the review station
+    client = FrameClient("http://archive-host:8123")
+    pa_data = client.load_data("acquisition.hdf5")
+    frame = pa_data.binary_time_series_data[..., 0, 10]
+
+The server provides the following endpoints:
+
+- `GET /files`: the JSON list of the served file names.
+- `GET /files/<name>/meta_data` and `GET /files/<name>/meta_data_device`: the acquisition and the device
+  metadata as JSON, in which numpy arrays are encoded as base64 strings with their dtype and shape.
+- `GET /files/<name>/info`: the shape and the dtype of the time series data as JSON.
+- `GET /files/<name>/data?selection=<selection>`: the raw bytes of a hyperslab of the time series data in
+  C order. The selection has one comma-separated entry per dimension, which is either an index or a slice
+  `start:stop:step`, e.g. `0:64,:,0,3`. The shape and the dtype of the result are sent in the `X-Shape`
+  and `X-Dtype` headers.
+
+Invalid selections are answered with status 400. Unknown names, files that were removed from disk and files
+without the requested metadata or time series data are answered with status 404, and files that cannot be read
+with status 500.
+
+The time series data is read and cached in whole measurements (frames), so repeated requests for different
+parts of the same frames are served from a least-recently-used cache of configurable size. Frames are read
+in batches that fit into the cache and are sliced before they are combined, so the memory of a request is
+bounded by the cache size and the size of the response. Frames that are larger than the cache are not cached
+and are read one at a time for every request that needs them.
+"""
+
+import argparse
+import base64
+import json
+import os
+import threading
+import urllib.parse
+import urllib.request
+from collections import OrderedDict
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import h5py
+import numpy as np
+from pacfish import PAData, profile
+from pacfish.iohandler.file_catalogue import IPASC_FILE_EXTENSIONS
+from pacfish.iohandler.file_reader import read_dictionary
+from pacfish.iohandler.lazy_data import TIME_SERIES_DATASET, normalise_selection
+
+
+def encode_value(value):
+    """
+    Converts a metadata value into a JSON-serialisable object. Numeric numpy arrays are encoded as base64
+    strings together with their dtype and shape, string arrays as nested lists.
+    """
+    if isinstance(value, dict):
+        return {str(key): encode_value(item) for key, item in value.items()}
+    if isinstance(value, np.ndarray):
+        if value.dtype.kind in "OSU":
+            strings = [item.decode("utf-8") if isinstance(item, bytes) else str(item) for item in value.ravel()]
+            return {"__strings__": strings, "shape": list(value.shape)}
+        value = np.ascontiguousarray(value)
+        return {"__ndarray__": base64.b64encode(value.tobytes()).decode("ascii"), "dtype": value.dtype.str,
+                "shape": list(value.shape)}
+    if isinstance(value, np.generic):
+        return value.item()
+    if isinstance(value, bytes):
+        return value.decode("utf-8")
+    if isinstance(value, (list, tuple)):
+        return [encode_value(item) for item in value]
+    return value
+
+
+def decode_value(value):
+    """
+    Reverses `encode_value`.
+    """
+    if isinstance(value, dict):
+        if "__ndarray__" in value:
+            data = np.frombuffer(base64.b64decode(value["__ndarray__"]), dtype=np.dtype(value["dtype"]))
+            return data.reshape(value["shape"]).copy()
+        if "__strings__" in value:
+            return np.asarray(value["__strings__"], dtype=object).reshape(value["shape"])
+        return {key: decode_value(item) for key, item in value.items()}
+    if isinstance(value, list):
+        return [decode_value(item) for item in value]
+    return value
+
+
+def format_selection(selection: tuple) -> str:
+    """
+    Formats a normalised selection of indices and slices as used in the `data` requests.
+    """
+    entries = []
+    for item in selection:
+        if isinstance(item, slice):
+            entries.append(":".join("" if value is None else str(int(value))
+                                    for value in (item.start, item.stop, item.step)))
+        elif isinstance(item, (int, np.integer)):
+            entries.append(str(int(item)))
+        else:
+            raise IndexError("Only integers and slices are supported to select remote time series data.")
+    return ",".join(entries)
+
+
+def parse_selection(text: str) -> tuple:
+    """
+    Parses a selection formatted with `format_selection`.
+    """
+    selection = []
+    for entry in text.split(","):
+        if ":" in entry:
+            parts = [int(part) if part.strip() else None for part in entry.split(":")]
+            selection.append(slice(*parts))
+        else:
+            selection.append(int(entry))
+    return tuple(selection)
+
+
+class FrameCache:
+    """
+    A thread-safe least-recently-used cache of frames, i.e. of the time series data of single measurements,
+    that is bounded by the total number of bytes.
+    """
+
+    def __init__(self, max_bytes: int):
+        self.max_bytes = max_bytes
+        self.num_bytes = 0
+        self.hits = 0
+        self.misses = 0
+        self._frames = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key) -> np.ndarray:
+        with self._lock:
+            frame = self._frames.get(key)
+            if frame is None:
+                self.misses += 1
+                profile.count(profile.CACHE_MISSES)
+                return None
+            self._frames.move_to_end(key)
+            self.hits += 1
+            profile.count(profile.CACHE_HITS)
+            return frame
+
+    def put(self, key, frame: np.ndarray):
+        if frame.nbytes > self.max_bytes:
+            return
+        with self._lock:
+            if key in self._frames:
+                self.num_bytes -= self._frames.pop(key).nbytes
+            self._frames[key] = frame
+            self.num_bytes += frame.nbytes
+            while self.num_bytes > self.max_bytes:
+                _, evicted = self._frames.popitem(last=False)
+                self.num_bytes -= evicted.nbytes
+
+    def clear(self):
+        with self._lock:
+            self._frames.clear()
+            self.num_bytes = 0
+
+
+class _ServedFile:
+    """
+    The state of one served file: its shape and dtype, and its metadata encoded as JSON. Everything is
+    re-read when the modification time of the file changes.
+    """
+
+    def __init__(self, file_path: str):
+        self.file_path = file_path
+        self.modification_time = os.stat(file_path).st_mtime_ns
+        with h5py.File(file_path, "r") as h5file:
+            dataset = h5file[TIME_SERIES_DATASET]
+            self.shape = dataset.shape
+            self.dtype = dataset.dtype
+            self.meta_data = json.dumps(encode_value(read_dictionary(h5file["/meta_data/"]))).encode("utf-8")
+            self.meta_data_device = json.dumps(encode_value(
+                read_dictionary(h5file["/meta_data_device/"]))).encode("utf-8")
+        self.info = json.dumps({"shape": list(self.shape), "dtype": self.dtype.str}).encode("utf-8")
+
+
+class FrameServer:
+    """
+    Serves IPASC files over HTTP. The server runs in a background thread and handles every request in its own
+    thread. By default, it only listens on the local machine.
+    """
+
+    def __init__(self, files, host: str = "127.0.0.1", port: int = 0, cache_bytes: int = 256 * 2 ** 20):
+        """
+        Parameters
+        ----------
+        files: str, list or dict
+            A directory, whose IPASC files are served by their file names, a list of file paths, which are
+            served by their file names, or a dictionary mapping names onto file paths.
+        host: str
+            The address to listen on.
+        port: int
+            The port to listen on. With 0, a free port is chosen.
+        cache_bytes: int
+            The maximum size of the frame cache in bytes.
+        """
+        if isinstance(files, (str, os.PathLike)):
+            directory = str(files)
+            files = [os.path.join(directory, name) for name in sorted(os.listdir(directory))
+                     if name.lower().endswith(IPASC_FILE_EXTENSIONS)]
+        if not isinstance(files, dict):
+            files = {os.path.basename(str(file_path)): str(file_path) for file_path in files}
+        self.file_paths = dict(files)
+        self.cache = FrameCache(cache_bytes)
+        self._served_files = dict()
+        self._lock = threading.Lock()
+        self._server = ThreadingHTTPServer((host, port), _create_request_handler(self))
+        self._server.daemon_threads = True
+        self._thread = None
+
+    @property
+    def url(self) -> str:
+        host, port = self._server.server_address[:2]
+        return f"http://{host}:{port}"
+
+    def start(self):
+        """
+        Starts serving in a background thread.
+        """
+        self._thread = threading.Thread(target=self._server.serve_forever, name="pacfish-frame-server",
+                                        daemon=True)
+        self._thread.start()
+        return self
+
+    def serve_forever(self):
+        self._server.serve_forever()
+
+    def stop(self):
+        """
+        Stops the server and closes its socket.
+        """
+        if self._thread is not None:
+            self._server.shutdown()
+            self._thread.join()
+            self._thread = None
+        self._server.server_close()
+
+    def __enter__(self):
+        return self.start()
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.stop()
+
+    def get_served_file(self, name: str) -> _ServedFile:
+        file_path = self.file_paths[name]
+        modification_time = os.stat(file_path).st_mtime_ns
+        with self._lock:
+            served_file = self._served_files.get(name)
+        if served_file is None or served_file.modification_time != modification_time:
+            served_file = _ServedFile(file_path)
+            with self._lock:
+                self._served_files[name] = served_file
+        return served_file
+
+    def read_selection(self, name: str, selection: tuple) -> np.ndarray:
+        """
+        Reads a hyperslab of the time series data of a served file through the frame cache.
+
+        Parameters
+        ----------
+        name: str
+            The name of the served file.
+        selection: tuple
+            The integers and slices that select the hyperslab.
+
+        Return
+        ------
+        np.ndarray
+            The selected time series data.
+        """
+        served_file = self.get_served_file(name)
+        shape = served_file.shape
+        if len(shape) != 4:
+            with h5py.File(served_file.file_path, "r") as h5file:
+                return h5file[TIME_SERIES_DATASET][selection]
+
+        selection = normalise_selection(selection, 4)
+        measurement_selection = selection[3]
+        if isinstance(measurement_selection, slice):
+            measurements = range(*measurement_selection.indices(shape[3]))
+        else:
+            measurement = measurement_selection + shape[3] if measurement_selection < 0 else measurement_selection
+            if not 0 <= measurement < shape[3]:
+                raise IndexError(f"Measurement {measurement_selection} is out of range for {shape[3]} "
+                                 f"measurements.")
+            measurements = [measurement]
+
+        spatial_selection = selection[:3]
+        version = served_file.modification_time
+        parts = [None] * len(measurements)
+        missing = []
+        for index, measurement in enumerate(measurements):
+            frame = self.cache.get((name, version, measurement))
+            if frame is None:
+                missing.append(index)
+            else:
+                parts[index] = frame[spatial_selection]
+        if missing:
+            # at most as many frames as fit into the cache are held in memory at once
+            frame_bytes = int(np.prod(shape[:3])) * served_file.dtype.itemsize
+            frames_per_read = max(1, self.cache.max_bytes // max(1, frame_bytes))
+            with h5py.File(served_file.file_path, "r") as h5file:
+                dataset = h5file[TIME_SERIES_DATASET]
+                start = 0
+                while start < len(missing):
+                    # consecutive missing measurements are read together
+                    stop = start + 1
+                    while stop < len(missing) and stop - start < frames_per_read and \
+                            measurements[missing[stop]] == measurements[missing[stop - 1]] + 1:
+                        stop += 1
+                    first, last = measurements[missing[start]], measurements[missing[stop - 1]]
+                    with profile.span("FrameServer.read_frames", file_name=name, first=first, last=last):
+                        block = dataset[:, :, :, first:last + 1]
+                        profile.count(profile.BYTES_READ, block.nbytes)
+                    for offset, index in enumerate(missing[start:stop]):
+                        frame = np.ascontiguousarray(block[..., offset])
+                        self.cache.put((name, version, measurements[index]), frame)
+                        parts[index] = np.array(frame[spatial_selection], copy=True)
+                    # release the batch before the next one is read
+                    del block
+                    start = stop
+
+        if parts:
+            result = np.stack(parts, axis=-1)
+        else:
+            result = np.empty(shape[:3] + (0, ), dtype=served_file.dtype)[spatial_selection + (slice(None), )]
+        if not isinstance(measurement_selection, slice):
+            result = result[..., 0]
+        return result
+
+
+def _create_request_handler(frame_server: FrameServer):
+
+    class FrameRequestHandler(BaseHTTPRequestHandler):
+
+        def log_message(self, format, *args):
+            pass
+
+        def _send(self, body: bytes, content_type: str, headers: dict = None, status: int = 200):
+            self.send_response(status)
+            self.send_header("Content-Type", content_type)
+            self.send_header("Content-Length", str(len(body)))
+            for key, value in (headers or dict()).items():
+                self.send_header(key, value)
+            self.end_headers()
+            self.wfile.write(body)
+
+        def do_GET(self):
+            url = urllib.parse.urlsplit(self.path)
+            parts = [urllib.parse.unquote(part) for part in url.path.strip("/").split("/")]
+            try:
+                if parts == ["files"]:
+                    self._send(json.dumps(list(frame_server.file_paths)).encode("utf-8"), "application/json")
+                elif len(parts) == 3 and parts[0] == "files" and parts[1] in frame_server.file_paths:
+                    self._handle_file_request(parts[1], parts[2], urllib.parse.parse_qs(url.query))
+                else:
+                    self.send_error(404, "Not found")
+            except (IndexError, ValueError, TypeError) as error:
+                self.send_error(400, str(error))
+            except (FileNotFoundError, KeyError) as error:
+                # the file was removed or lacks the requested metadata or time series data
+                self.send_error(404, "Not found: " + str(error))
+            except Exception as error:
+                self.send_error(500, f"{type(error).__name__}: {error}")
+
+        def _handle_file_request(self, name: str, endpoint: str, query: dict):
+            served_file = frame_server.get_served_file(name)
+            if endpoint == "meta_data":
+                self._send(served_file.meta_data, "application/json")
+            elif endpoint == "meta_data_device":
+                self._send(served_file.meta_data_device, "application/json")
+            elif endpoint == "info":
+                self._send(served_file.info, "application/json")
+            elif endpoint == "data":
+                selection = parse_selection(query["selection"][0]) if "selection" in query else ()
+                data = np.ascontiguousarray(frame_server.read_selection(name, selection))
+                self._send(data.tobytes(), "application/octet-stream",
+                           {"X-Shape": ",".join(str(size) for size in data.shape), "X-Dtype": data.dtype.str})
+            else:
+                self.send_error(404, "Not found")
+
+    return FrameRequestHandler
+
+
+class RemoteTimeSeriesData:
+    """
+    A read-only, array-like view of the time series data of a file served by a `FrameServer`. Every indexing
+    operation requests the selected hyperslab from the server. Only integers and slices are supported.
+    """
+
+    def __init__(self, client, name: str, shape: tuple, dtype: np.dtype):
+        self.client = client
+        self.name = name
+        self.shape = tuple(shape)
+        self.dtype = np.dtype(dtype)
+
+    @property
+    def ndim(self) -> int:
+        return len(self.shape)
+
+    @property
+    def size(self) -> int:
+        return int(np.prod(self.shape))
+
+    @property
+    def nbytes(self) -> int:
+        return self.size * self.dtype.itemsize
+
+    def __len__(self):
+        return self.shape[0]
+
+    def __getitem__(self, selection):
+        return self.client.read_selection(self.name, normalise_selection(selection, self.ndim))
+
+    def __array__(self, dtype=None, copy=None):
+        data = self[()]
+        return data if dtype is None else data.astype(dtype, copy=False)
+
+    def __repr__(self):
+        return f"RemoteTimeSeriesData({self.client.url!r}, {self.name!r}, shape={self.shape}, dtype={self.dtype})"
+
+
+class FrameClient:
+    """
+    The client of a `FrameServer`.
+    """
+
+    def __init__(self, url: str, timeout: float = 30):
+        """
+        Parameters
+        ----------
+        url: str
+            The URL of the server, e.g. "http://localhost:8123".
+        timeout: float
+            The timeout of every request in seconds.
+        """
+        self.url = url.rstrip("/")
+        self.timeout = timeout
+
+    def _request(self, path: str) -> tuple:
+        with urllib.request.urlopen(self.url + path, timeout=self.timeout) as response:
+            return response.read(), response.headers
+
+    def _request_json(self, path: str):
+        return json.loads(self._request(path)[0].decode("utf-8"))
+
+    def _file_path(self, name: str, endpoint: str) -> str:
+        return "/files/" + urllib.parse.quote(name) + "/" + endpoint
+
+    def list_files(self) -> list:
+        """
+        Returns the names of the files that the server provides.
+        """
+        return self._request_json("/files")
+
+    def read_selection(self, name: str, selection: tuple) -> np.ndarray:
+        """
+        Requests a hyperslab of the time series data of a served file.
+        """
+        query = urllib.parse.urlencode({"selection": format_selection(selection)})
+        body, headers = self._request(self._file_path(name, "data") + "?" + query)
+        shape = tuple(int(size) for size in headers["X-Shape"].split(",") if size)
+        return np.frombuffer(body, dtype=np.dtype(headers["X-Dtype"])).reshape(shape).copy()
+
+    def load_data(self, name: str) -> PAData:
+        """
+        Loads the metadata of a served file.
+
+        Return
+        ------
+        PAData
+            A PAData instance with the metadata of the file, whose `binary_time_series_data` is a
+            `RemoteTimeSeriesData` view that requests the time series data from the server when indexed.
+        """
+        info = self._request_json(self._file_path(name, "info"))
+        pa_data = PAData(RemoteTimeSeriesData(self, name, info["shape"], info["dtype"]))
+        pa_data.meta_data_acquisition = decode_value(self._request_json(self._file_path(name, "meta_data")))
+        pa_data.meta_data_device = decode_value(self._request_json(self._file_path(name, "meta_data_device")))
+        return pa_data
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Serve the metadata and the frames of IPASC files over HTTP.")
+    parser.add_argument("files", nargs="+", help="A directory with IPASC files or the paths of IPASC files.")
+    parser.add_argument("--host", default="127.0.0.1", help="The address to listen on.")
+    parser.add_argument("--port", type=int, default=8123, help="The port to listen on.")
+    parser.add_argument("--cache-megabytes", type=int, default=256, help="The size of the frame cache in MiB.")
+    arguments = parser.parse_args()
+    served_files = arguments.files[0] if len(arguments.files) == 1 and os.path.isdir(arguments.files[0]) \
+        else arguments.files
+    server = FrameServer(served_files, arguments.host, arguments.port, arguments.cache_megabytes * 2 ** 20)
+    print(f"Serving {len(server.file_paths)} files on {server.url}")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
@@ -0,0 +1,210 @@
+# SPDX-FileCopyrightText: 2026 International Photoacoustics Standardisation Consortium (IPASC)
+# SPDX-License-Identifier: BSD 3-Clause License
+
+"""
+A pool of open, read-only HDF5 file handles for workloads that repeatedly read small parts of many files, e.g.
+single frames drawn at random from a large set of acquisitions during training::
+
+    pool = FileHandlePool(max_open_files=128)
+    views = [pool.load_data(file_path) for file_path in file_paths]
+    frame = views[index].binary_time_series_data[..., measurement]
+
+Opening an HDF5 file and resolving the time series dataset costs far more than reading a frame, so the pool
+keeps up to `max_open_files` files open and closes the least recently used one when a further file is opened.
+A file that was changed on disk since it was opened is reopened. The pool can be used from several threads;
+a file that is evicted while another thread still reads from it is closed when that read has finished.
+
+Closing an HDF5 file gets slower the more files are open, so a pool that is much smaller than the set of files
+that is accessed at random evicts on nearly every access and is slower than opening each file per read. The
+pool should be sized to hold the working set; `benchmark_handle_pool` in the testing benchmarks compares both.
+"""
+
+import contextlib
+import os
+import threading
+from collections import OrderedDict
+
+import h5py
+from pacfish import PAData, MetadataDeviceTags, profile
+from pacfish.iohandler.file_reader import read_dictionary, load_device_from_library
+from pacfish.iohandler.file_writer import get_device_reference
+from pacfish.iohandler.lazy_data import LazyTimeSeriesData, TIME_SERIES_DATASET
+
+DEFAULT_MAX_OPEN_FILES = 64
+
+
+class _PooledFile:
+    __slots__ = ("h5file", "version", "datasets", "users", "evicted")
+
+    def __init__(self, h5file: h5py.File, version: tuple):
+        self.h5file = h5file
+        self.version = version
+        # resolved datasets by name, so repeated reads skip the lookup in the file
+        self.datasets = dict()
+        self.users = 0
+        self.evicted = False
+
+
+class FileHandlePool:
+    """
+    A thread-safe pool that keeps up to a maximum number of IPASC files open read-only, with least recently
+    used eviction.
+    """
+
+    def __init__(self, max_open_files: int = DEFAULT_MAX_OPEN_FILES):
+        """
+        Parameters
+        ----------
+        max_open_files: int
+            The maximum number of files that are kept open.
+        """
+        self.max_open_files = max(1, max_open_files)
+        self.hits = 0
+        self.misses = 0
+        self._files = OrderedDict()
+        self._lock = threading.Lock()
+
+    def __len__(self):
+        return len(self._files)
+
+    def __contains__(self, file_path) -> bool:
+        return os.path.abspath(file_path) in self._files
+
+    @staticmethod
+    def _close(pooled_file: _PooledFile):
+        pooled_file.datasets.clear()
+        pooled_file.h5file.close()
+
+    def _retire(self, pooled_file: _PooledFile):
+        # called with the lock held
+        pooled_file.evicted = True
+        if pooled_file.users == 0:
+            self._close(pooled_file)
+
+    def _acquire(self, file_path) -> _PooledFile:
+        key = os.path.abspath(file_path)
+        stat = os.stat(key)
+        version = (stat.st_mtime_ns, stat.st_size)
+        with self._lock:
+            pooled_file = self._files.get(key)
+            if pooled_file is not None and pooled_file.version == version:
+                self._files.move_to_end(key)
+                self.hits += 1
+                profile.count(profile.CACHE_HITS)
+            else:
+                if pooled_file is not None:
+                    self._retire(self._files.pop(key))
+                self.misses += 1
+                profile.count(profile.CACHE_MISSES)
+                pooled_file = self._files[key] = _PooledFile(h5py.File(key, "r"), version)
+                while len(self._files) > self.max_open_files:
+                    self._retire(self._files.popitem(last=False)[1])
+            pooled_file.users += 1
+            return pooled_file
+
+    def _release(self, pooled_file: _PooledFile):
+        with self._lock:
+            pooled_file.users -= 1
+            if pooled_file.evicted and pooled_file.users == 0:
+                self._close(pooled_file)
+
+    @contextlib.contextmanager
+    def open(self, file_path):
+        """
+        Returns a context manager that yields the pooled, read-only h5py.File of the file path. The file is not
+        closed at the end of the block and must not be closed by the caller.
+
+        Parameters
+        ----------
+        file_path: str
+            Path of the HDF5 file.
+
+        Raises
+        ------
+        FileNotFoundError:
+            if the file does not exist.
+        """
+        pooled_file = self._acquire(file_path)
+        try:
+            yield pooled_file.h5file
+        finally:
+            self._release(pooled_file)
+
+    @contextlib.contextmanager
+    def open_dataset(self, file_path, dataset_name: str = TIME_SERIES_DATASET):
+        """
+        Like `open`, but yields the dataset with the given name from the pooled file.
+        """
+        pooled_file = self._acquire(file_path)
+        try:
+            dataset = pooled_file.datasets.get(dataset_name)
+            if dataset is None:
+                dataset = pooled_file.datasets[dataset_name] = pooled_file.h5file[dataset_name]
+            yield dataset
+        finally:
+            self._release(pooled_file)
+
+    def load_data(self, file_path, device_library: str = None, lazy: bool = True) -> PAData:
+        """
+        Loads a PAData instance through the pooled file handle. See `load_data` for the parameters.
+
+        Return
+        ------
+        PAData
+            PAData instance with the metadata of the file. If `lazy` is True, `binary_time_series_data` is a
+            `PooledTimeSeriesData` view that reads through the pool.
+        """
+        with profile.span("FileHandlePool.load_data", file_path=str(file_path), lazy=lazy):
+            with self.open(file_path) as h5file:
+                if lazy:
+                    binary_data = PooledTimeSeriesData(self, file_path)
+                else:
+                    binary_data = h5file[TIME_SERIES_DATASET][()]
+                pa_data = PAData(binary_data)
+                pa_data.meta_data_acquisition = read_dictionary(h5file["/meta_data/"])
+                pa_data.meta_data_device = read_dictionary(h5file["/meta_data_device/"])
+
+            if device_library is not None and MetadataDeviceTags.DETECTORS.tag not in pa_data.meta_data_device:
+                reference = get_device_reference(pa_data.meta_data_acquisition, pa_data.meta_data_device)
+                pa_data.meta_data_device = load_device_from_library(device_library, reference)
+        return pa_data
+
+    def close(self):
+        """
+        Closes all files that are not in use and discards the pooled handles. Files that are in use are closed
+        once they are released.
+        """
+        with self._lock:
+            for pooled_file in self._files.values():
+                self._retire(pooled_file)
+            self._files.clear()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
+
+
+class PooledTimeSeriesData(LazyTimeSeriesData):
+    """
+    A `LazyTimeSeriesData` view that reads through a `FileHandlePool` instead of opening the file for every
+    read.
+    """
+
+    def __init__(self, pool: FileHandlePool, file_path: str, dataset_name: str = TIME_SERIES_DATASET):
+        """
+        Parameters
+        ----------
+        pool: FileHandlePool
+            The pool to read through.
+        file_path: str
+            Path of the IPASC HDF5 file.
+        dataset_name: str
+            The name of the time series dataset in the file.
+        """
+        self.pool = pool
+        super(PooledTimeSeriesData, self).__init__(file_path, dataset_name)
+
+    def _open_dataset(self):
+        return self.pool.open_dataset(self.file_path, self.dataset_name)
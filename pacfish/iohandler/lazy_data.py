@@ -0,0 +1,145 @@
+# SPDX-FileCopyrightText: 2026 International Photoacoustics Standardisation Consortium (IPASC)
+# SPDX-License-Identifier: BSD 3-Clause License
+
+import contextlib
+
+import numpy as np
+from pacfish import profile
+from pacfish.iohandler.block_cache import as_h5py_source, open_h5file
+from pacfish.iohandler.progress import ProgressTracker
+
+TIME_SERIES_DATASET = "binary_time_series_data"
+
+
+class LazyTimeSeriesData:
+    """
+    A read-only, array-like view of the time series data in an IPASC file that is only read from disk when
+    it is indexed. Each indexing operation opens the file, reads the selected hyperslab and closes it again,
+    so instances can be passed between threads and kept around without holding a file handle::
+
+        pa_data = load_data("acquisition.hdf5", lazy=True)
+        first_measurement = pa_data.binary_time_series_data[..., 0]
+
+    `np.asarray` loads the complete time series data. If the data is read from a file object, the object is
+    kept and read through a `BlockCachedFile`, so repeated reads of nearby frames are served from its cache.
+    """
+
+    def __init__(self, file_path, dataset_name: str = TIME_SERIES_DATASET):
+        """
+        Parameters
+        ----------
+        file_path: str or file-like
+            Path of the IPASC HDF5 file or a seekable binary file object.
+        dataset_name: str
+            The name of the time series dataset in the file.
+        """
+        self.file_path = as_h5py_source(file_path)
+        self.dataset_name = dataset_name
+        with self._open_dataset() as dataset:
+            self.shape = dataset.shape
+            self.dtype = dataset.dtype
+            self.chunks = dataset.chunks
+
+    @contextlib.contextmanager
+    def _open_dataset(self):
+        """
+        Returns a context manager that opens the file read-only and yields the time series dataset.
+        """
+        with open_h5file(self.file_path) as h5file:
+            yield h5file[self.dataset_name]
+
+    @property
+    def ndim(self) -> int:
+        return len(self.shape)
+
+    @property
+    def size(self) -> int:
+        return int(np.prod(self.shape))
+
+    @property
+    def nbytes(self) -> int:
+        return self.size * self.dtype.itemsize
+
+    def __len__(self):
+        return self.shape[0]
+
+    def __getitem__(self, selection):
+        with profile.span("LazyTimeSeriesData.read") as read_span:
+            with self._open_dataset() as dataset:
+                data = dataset[selection]
+            read_span.count(profile.BYTES_READ, np.asarray(data).nbytes)
+        return data
+
+    def __array__(self, dtype=None, copy=None):
+        data = self[()]
+        return data if dtype is None else data.astype(dtype, copy=False)
+
+    def read_direct(self, destination: np.ndarray, source_selection=None, destination_selection=None):
+        """
+        Reads a hyperslab of the time series data directly into an existing array, without any temporary copy.
+        """
+        with profile.span("LazyTimeSeriesData.read_direct") as read_span:
+            with self._open_dataset() as dataset:
+                dataset.read_direct(destination, source_selection, destination_selection)
+            selection = () if destination_selection is None else destination_selection
+            read_span.count(profile.BYTES_READ, destination[selection].nbytes)
+
+    def __repr__(self):
+        return f"{type(self).__name__}({self.file_path!r}, shape={self.shape}, dtype={self.dtype})"
+
+
+def normalise_selection(selection, ndim: int = 4) -> tuple:
+    """
+    Expands an index expression, e.g. `[..., 0]` or `[2]`, into a tuple with one entry per dimension.
+    """
+    selection = selection if isinstance(selection, tuple) else (selection, )
+    if any(item is Ellipsis for item in selection):
+        position = [item is Ellipsis for item in selection].index(True)
+        selection = selection[:position] + (slice(None), ) * (ndim + 1 - len(selection)) + selection[position + 1:]
+    if len(selection) > ndim:
+        raise IndexError(f"Too many indices for time series data with {ndim} dimensions.")
+    return selection + (slice(None), ) * (ndim - len(selection))
+
+
+def iterate_measurement_chunks(binary_time_series_data, measurements_per_chunk: int = 1, progress=None,
+                               cancellation=None):
+    """
+    Iterates over the time series data in chunks of measurements, i.e. along the last axis of the IPASC shape
+    [detectors, samples, wavelengths, measurements]. Works for numpy arrays, for which views are returned,
+    and for lazily loaded data, of which only one chunk is held in memory at any time.
+
+    Parameters
+    ----------
+    binary_time_series_data: np.ndarray or LazyTimeSeriesData
+        The time series data with up to four dimensions. Missing trailing dimensions are treated as singletons.
+    measurements_per_chunk: int
+        The number of measurements per chunk.
+    progress: callable
+        If given, it is called with a `Progress` instance after every chunk was read.
+    cancellation: CancellationToken
+        If given, it is checked before every chunk and `OperationCancelled` is raised if it was cancelled.
+
+    Return
+    ------
+    generator
+        Yields (start, stop, chunk) tuples, where chunk is a four-dimensional array with the measurements
+        start to stop.
+    """
+    shape = tuple(binary_time_series_data.shape)
+    if len(shape) > 4:
+        raise ValueError(f"The time series data must have at most four dimensions, but had the shape {shape}.")
+    num_bytes = int(np.prod(shape)) * np.dtype(binary_time_series_data.dtype).itemsize
+    tracker = ProgressTracker("iterate_measurement_chunks", num_bytes, shape[3] if len(shape) == 4 else 1,
+                              progress, cancellation)
+    if len(shape) < 4:
+        tracker.check_cancellation()
+        chunk = np.reshape(binary_time_series_data[()], shape + (1, ) * (4 - len(shape)))
+        tracker.update(chunk.nbytes, 1)
+        yield 0, 1, chunk
+        return
+    for start in range(0, shape[3], max(1, measurements_per_chunk)):
+        tracker.check_cancellation()
+        stop = min(start + max(1, measurements_per_chunk), shape[3])
+        chunk = binary_time_series_data[:, :, :, start:stop]
+        tracker.update(chunk.nbytes, stop - start)
+        yield start, stop, chunk
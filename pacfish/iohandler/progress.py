@@ -0,0 +1,147 @@
+# SPDX-FileCopyrightText: 2026 International Photoacoustics Standardisation Consortium (IPASC)
+# SPDX-License-Identifier: BSD 3-Clause License
+
+"""
+Progress reporting and cooperative cancellation of long-running reads, writes and conversions.
+
+A progress callback is called with a `Progress` instance after every chunk of measurements (frames) that was
+read or written. A `CancellationToken` can be cancelled from any thread; the operation then stops before its
+next chunk and raises `OperationCancelled`::
+
+    cancellation = CancellationToken()
+    scheduler.on_kill(cancellation.cancel)
+    write_data("output.hdf5", pa_data, progress=lambda progress: print(progress), cancellation=cancellation)
+"""
+
+import threading
+import time
+
+import numpy as np
+
+# The size of the chunks of measurements in which data is read or written when progress is reported.
+DEFAULT_CHUNK_BYTES = 64 * 2 ** 20
+
+
+class OperationCancelled(Exception):
+    """
+    Raised when an operation was stopped by its `CancellationToken`.
+    """
+    pass
+
+
+class CancellationToken:
+    """
+    A thread-safe flag to request the cancellation of one or more operations.
+    """
+
+    def __init__(self):
+        self._event = threading.Event()
+
+    def cancel(self):
+        """
+        Requests the cancellation. Operations stop before they process their next chunk.
+        """
+        self._event.set()
+
+    @property
+    def cancelled(self) -> bool:
+        return self._event.is_set()
+
+    def raise_if_cancelled(self):
+        """
+        Raises
+        ------
+        OperationCancelled:
+            if the cancellation was requested.
+        """
+        if self._event.is_set():
+            raise OperationCancelled("The operation was cancelled.")
+
+
+class Progress:
+    """
+    The progress of an operation, as passed to progress callbacks.
+    """
+
+    def __init__(self, operation: str, bytes_done: int, bytes_total: int, frames_done: int, frames_total: int,
+                 seconds: float):
+        self.operation = operation
+        self.bytes_done = bytes_done
+        self.bytes_total = bytes_total
+        self.frames_done = frames_done
+        self.frames_total = frames_total
+        self.seconds = seconds
+
+    @property
+    def fraction(self) -> float:
+        """The fraction of the bytes that are done, between 0 and 1."""
+        return self.bytes_done / self.bytes_total if self.bytes_total else 1.0
+
+    @property
+    def bytes_per_second(self) -> float:
+        return self.bytes_done / self.seconds if self.seconds > 0 else None
+
+    def __repr__(self):
+        return (f"Progress({self.operation!r}, {self.frames_done}/{self.frames_total} frames, "
+                f"{self.bytes_done}/{self.bytes_total} bytes, {self.seconds:.2f} s)")
+
+
+class ProgressTracker:
+    """
+    Accumulates the progress of an operation and forwards it to the progress callback. Both the callback and
+    the cancellation token are optional, so operations can use a tracker unconditionally.
+    """
+
+    def __init__(self, operation: str, bytes_total: int, frames_total: int, progress=None,
+                 cancellation: CancellationToken = None):
+        """
+        Parameters
+        ----------
+        operation: str
+            The name of the operation that is reported, e.g. "write_data".
+        bytes_total: int
+            The number of bytes that the operation processes.
+        frames_total: int
+            The number of measurements that the operation processes.
+        progress: callable
+            A function that is called with a `Progress` instance after every update.
+        cancellation: CancellationToken
+            A token that is checked before every chunk.
+        """
+        self.operation = operation
+        self.bytes_total = int(bytes_total)
+        self.frames_total = int(frames_total)
+        self.bytes_done = 0
+        self.frames_done = 0
+        self.progress = progress
+        self.cancellation = cancellation
+        self._start_time = time.perf_counter()
+
+    @property
+    def is_active(self) -> bool:
+        """True, if progress is reported or the operation can be cancelled."""
+        return self.progress is not None or self.cancellation is not None
+
+    def check_cancellation(self):
+        if self.cancellation is not None:
+            self.cancellation.raise_if_cancelled()
+
+    def update(self, bytes_done: int = 0, frames_done: int = 0):
+        """
+        Adds the given amounts to the progress and reports it.
+        """
+        self.bytes_done += int(bytes_done)
+        self.frames_done += int(frames_done)
+        if self.progress is not None:
+            self.progress(Progress(self.operation, self.bytes_done, self.bytes_total, self.frames_done,
+                                   self.frames_total, time.perf_counter() - self._start_time))
+
+
+def get_measurements_per_chunk(shape: tuple, itemsize: int, chunk_bytes: int = None) -> int:
+    """
+    Returns the number of measurements of time series data with the given shape that fit into a chunk of
+    `chunk_bytes`, or of `DEFAULT_CHUNK_BYTES` if not given.
+    """
+    chunk_bytes = DEFAULT_CHUNK_BYTES if chunk_bytes is None else chunk_bytes
+    bytes_per_measurement = int(np.prod(shape[:3])) * itemsize
+    return max(1, chunk_bytes // max(1, bytes_per_measurement))
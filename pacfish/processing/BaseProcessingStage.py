@@ -0,0 +1,116 @@
+# SPDX-FileCopyrightText: 2026 International Photoacoustics Standardisation Consortium (IPASC)
+# SPDX-License-Identifier: BSD 3-Clause License
+
+from abc import ABC, abstractmethod
+
+import numpy as np
+from pacfish import PAData
+from pacfish.iohandler.lazy_data import iterate_measurement_chunks
+
+
+class BaseProcessingStage(ABC):
+    """
+    The purpose of the BaseProcessingStage class is to provide the framework for processing stages that
+    transform the time series data sample-wise without changing its shape.
+
+    The stage is applied chunk by chunk of measurements. Numpy arrays with a supported data type are processed
+    in place unless an output array is given, and lazily loaded data is read one chunk at a time, so the time
+    series data is never duplicated in memory. To add a stage, one needs to inherit from BaseProcessingStage
+    and implement the abstract methods::
+
+        class CustomStage(BaseProcessingStage):
+
+            def prepare(self, pa_data, shape, dtype):
+                # TODO compute everything that is shared by all chunks
+
+            def process_chunk(self, chunk, out, context):
+                # TODO write the processed chunk into out, which can be the chunk itself
+    """
+
+    # numpy dtype kinds of time series data that can be processed in place
+    IN_PLACE_KINDS = "fc"
+
+    def __init__(self, measurements_per_chunk: int = 1):
+        """
+        Parameters
+        ----------
+        measurements_per_chunk: int
+            The number of measurements that are read and processed at once.
+        """
+        self.measurements_per_chunk = measurements_per_chunk
+
+    @abstractmethod
+    def prepare(self, pa_data: PAData, shape: tuple, dtype: np.dtype) -> object:
+        """
+        Computes everything that is shared by all chunks.
+
+        Parameters
+        ----------
+        pa_data: PAData
+            The PAData instance that is processed.
+        shape: tuple
+            The four-dimensional shape [detectors, samples, wavelengths, measurements] of the time series data.
+        dtype: np.dtype
+            The data type of the output array.
+
+        Return
+        ------
+        object
+            A context that is passed on to every call of `process_chunk`.
+        """
+        pass
+
+    @abstractmethod
+    def process_chunk(self, chunk: np.ndarray, out: np.ndarray, context: object):
+        """
+        Processes a four-dimensional chunk of measurements and writes the result into `out`.
+        `out` may be the chunk itself if the data is processed in place.
+        """
+        pass
+
+    def apply(self, pa_data: PAData, out: np.ndarray = None) -> np.ndarray:
+        """
+        Applies the processing stage to the time series data of the given PAData instance.
+
+        Parameters
+        ----------
+        pa_data: PAData
+            The PAData instance. Its `binary_time_series_data` can be a numpy array or lazily loaded data.
+        out: np.ndarray
+            An array with the shape of the time series data to store the result in. If None, numpy arrays are
+            processed in place and a new array is allocated for lazily loaded data.
+
+        Raises
+        ------
+        TypeError:
+            if numpy arrays with an unsupported data type should be processed in place.
+        ValueError:
+            if the output array does not have the shape of the time series data or is not contiguous.
+
+        Return
+        ------
+        np.ndarray
+            The processed time series data.
+        """
+        data = pa_data.binary_time_series_data
+        shape = tuple(data.shape)
+        shape_4d = shape + (1, ) * (4 - len(shape))
+
+        if out is None and isinstance(data, np.ndarray):
+            if data.dtype.kind not in self.IN_PLACE_KINDS:
+                raise TypeError(f"Time series data of type {data.dtype} cannot be processed in place by "
+                                f"{type(self).__name__}. Please provide an output array of a supported type.")
+            out = data
+        elif out is None:
+            out = np.empty(shape, dtype=np.result_type(data.dtype, np.float32))
+        elif tuple(out.shape) != shape:
+            raise ValueError(f"The output array must have the shape {shape}, but had the shape {out.shape}.")
+
+        out_4d = np.reshape(out, shape_4d)
+        if not np.shares_memory(out_4d, out):
+            raise ValueError("The output array must be contiguous.")
+
+        context = self.prepare(pa_data, shape_4d, out.dtype)
+        for start, stop, chunk in iterate_measurement_chunks(data, self.measurements_per_chunk):
+            self.process_chunk(chunk, out_4d[..., start:stop], context)
+        return out
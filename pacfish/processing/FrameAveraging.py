@@ -0,0 +1,221 @@
+# SPDX-FileCopyrightText: 2026 International Photoacoustics Standardisation Consortium (IPASC)
+# SPDX-License-Identifier: BSD 3-Clause License
+
+import numpy as np
+from pacfish import PAData, MetadataAcquisitionTags
+from pacfish.iohandler.file_writer import write_data
+from pacfish.iohandler.lazy_data import normalise_selection
+
+
+class AveragedTimeSeriesData:
+    """
+    An array-like view of time series data in which every image is the (pulse energy normalised) average of
+    `measurements_per_image` consecutive measurements. The averages are only computed when the view is indexed,
+    and every averaged image only reads its own measurements from the underlying data. If the underlying data
+    is lazily loaded, the measurements are therefore streamed from the file one image at a time.
+    """
+
+    def __init__(self, binary_time_series_data, measurements_per_image: int, pulse_energy: np.ndarray = None):
+        """
+        Parameters
+        ----------
+        binary_time_series_data: np.ndarray or LazyTimeSeriesData
+            The four-dimensional time series data [detectors, samples, wavelengths, measurements].
+        measurements_per_image: int
+            The number of consecutive measurements that are averaged into one image.
+        pulse_energy: np.ndarray
+            If given, every measurement is divided by its pulse energy before averaging. Either an array with
+            one value per measurement or a [detectors, measurements] array.
+        """
+        shape = tuple(binary_time_series_data.shape)
+        if len(shape) != 4:
+            raise ValueError(f"The time series data must have four dimensions, but had the shape {shape}.")
+        if measurements_per_image < 1 or shape[3] % measurements_per_image != 0:
+            raise ValueError(f"The {shape[3]} measurements cannot be averaged in groups of "
+                             f"{measurements_per_image} measurements.")
+        self.binary_time_series_data = binary_time_series_data
+        self.measurements_per_image = measurements_per_image
+        self.shape = shape[:3] + (shape[3] // measurements_per_image, )
+        self.dtype = np.result_type(binary_time_series_data.dtype, np.float32)
+        self.pulse_energy = None
+        if pulse_energy is not None:
+            pulse_energy = np.asarray(pulse_energy, dtype=np.float64)
+            if pulse_energy.ndim == 1 and len(pulse_energy) == shape[3]:
+                self.pulse_energy = pulse_energy[np.newaxis, np.newaxis, np.newaxis, :]
+            elif pulse_energy.shape == (shape[0], shape[3]):
+                self.pulse_energy = pulse_energy[:, np.newaxis, np.newaxis, :]
+            else:
+                raise ValueError(f"The pulse energy of the shape {pulse_energy.shape} does not match the "
+                                 f"time series data of the shape {shape}.")
+
+    @property
+    def ndim(self) -> int:
+        return 4
+
+    def average_image(self, index: int, out: np.ndarray = None) -> np.ndarray:
+        """
+        Computes a single averaged image.
+
+        Parameters
+        ----------
+        index: int
+            The index of the image.
+        out: np.ndarray
+            An optional [detectors, samples, wavelengths] array to store the image in.
+
+        Return
+        ------
+        np.ndarray
+            The averaged image with the shape [detectors, samples, wavelengths].
+        """
+        start = index * self.measurements_per_image
+        stop = start + self.measurements_per_image
+        measurements = self.binary_time_series_data[:, :, :, start:stop]
+        if self.pulse_energy is not None:
+            measurements = np.divide(measurements, self.pulse_energy[..., start:stop], dtype=self.dtype)
+        return np.mean(measurements, axis=3, dtype=self.dtype, out=out)
+
+    def __getitem__(self, selection):
+        selection = normalise_selection(selection)
+
+        images = np.arange(self.shape[3])[selection[3]]
+        result = np.empty(self.shape[:3] + (np.size(images), ), dtype=self.dtype)
+        for position, index in enumerate(np.reshape(images, (-1, ))):
+            self.average_image(int(index), out=result[..., position])
+        if np.ndim(images) == 0:
+            result = result[..., 0]
+        return result[selection[:3]]
+
+    def __array__(self, dtype=None, copy=None):
+        data = self[()]
+        return data if dtype is None else data.astype(dtype, copy=False)
+
+
+class FrameAveraging:
+    """
+    Normalises every measurement by its `pulse_energy` and averages groups of `measurements_per_image`
+    consecutive measurements into one image.
+
+    The result is either returned as a new PAData instance, or streamed into a new IPASC file image by image
+    with `write`, so that only the measurements of a single image are held in memory at any time::
+
+        pa_data = pf.load_data("acquisition.hdf5", lazy=True)
+        FrameAveraging().write(pa_data, "averaged.hdf5")
+
+    The acquisition metadata of the result is adjusted to match the averaged data: the `sizes`, the
+    `measurement_timestamps` and the `measurement_spatial_poses` refer to the averaged images,
+    `measurements_per_image` is set to 1, and the `pulse_energy` is set to [0] if it has been accounted for.
+    """
+
+    def __init__(self, normalise_pulse_energy: bool = True, measurements_per_image: int = None):
+        """
+        Parameters
+        ----------
+        normalise_pulse_energy: bool
+            Specifies if every measurement should be divided by its pulse energy before averaging.
+        measurements_per_image: int
+            Overrides the `measurements_per_image` of the acquisition metadata. If neither is given,
+            every measurement is its own image.
+        """
+        self.normalise_pulse_energy = normalise_pulse_energy
+        self.measurements_per_image = measurements_per_image
+
+    def _get_pulse_energy(self, pa_data: PAData) -> np.ndarray:
+        if not self.normalise_pulse_energy:
+            return None
+        pulse_energy = pa_data.get_pulse_energy()
+        if pulse_energy is None:
+            raise ValueError("The pulse energy must be given in the acquisition metadata to normalise the data.")
+        pulse_energy = np.asarray(pulse_energy)
+        if pulse_energy.size == 1 and float(np.reshape(pulse_energy, (-1, ))[0]) == 0:
+            # the pulse energy has already been accounted for
+            return None
+        return pulse_energy
+
+    def _get_measurements_per_image(self, pa_data: PAData) -> int:
+        if self.measurements_per_image is not None:
+            return self.measurements_per_image
+        measurements_per_image = pa_data.get_measurements_per_image()
+        return 1 if measurements_per_image is None else int(measurements_per_image)
+
+    def _adjust_acquisition_meta_data(self, meta_data_acquisition: dict, data: AveragedTimeSeriesData) -> dict:
+        group_size = data.measurements_per_image
+        num_measurements = data.shape[3] * group_size
+        meta_data_acquisition = dict(meta_data_acquisition)
+
+        sizes = meta_data_acquisition.get(MetadataAcquisitionTags.SIZES.tag)
+        if sizes is not None and np.size(sizes) == 4:
+            meta_data_acquisition[MetadataAcquisitionTags.SIZES.tag] = np.asarray(data.shape)
+
+        def average_groups(tag, axis):
+            value = meta_data_acquisition.get(tag)
+            if value is not None and np.ndim(value) > axis and np.shape(value)[axis] == num_measurements:
+                value = np.asarray(value, dtype=np.float64)
+                grouped = np.reshape(value, value.shape[:axis] + (-1, group_size) + value.shape[axis + 1:])
+                meta_data_acquisition[tag] = np.mean(grouped, axis=axis + 1)
+
+        average_groups(MetadataAcquisitionTags.MEASUREMENT_TIMESTAMPS.tag, 0)
+        if data.pulse_energy is not None:
+            meta_data_acquisition[MetadataAcquisitionTags.PULSE_ENERGY.tag] = np.asarray([0])
+        else:
+            average_groups(MetadataAcquisitionTags.PULSE_ENERGY.tag,
+                           np.ndim(meta_data_acquisition.get(MetadataAcquisitionTags.PULSE_ENERGY.tag)) - 1)
+
+        poses = meta_data_acquisition.get(MetadataAcquisitionTags.MEASUREMENT_SPATIAL_POSES.tag)
+        if poses is not None and np.ndim(poses) > 0 and np.shape(poses)[0] == num_measurements:
+            # the pose of an image is the pose of its first measurement
+            meta_data_acquisition[MetadataAcquisitionTags.MEASUREMENT_SPATIAL_POSES.tag] = \
+                np.asarray(poses)[::group_size]
+
+        if MetadataAcquisitionTags.MEASUREMENTS_PER_IMAGE.tag in meta_data_acquisition or group_size > 1:
+            meta_data_acquisition[MetadataAcquisitionTags.MEASUREMENTS_PER_IMAGE.tag] = 1
+        return meta_data_acquisition
+
+    def apply(self, pa_data: PAData, lazy: bool = False) -> PAData:
+        """
+        Normalises and averages the measurements of the given PAData instance.
+
+        Parameters
+        ----------
+        pa_data: PAData
+            The PAData instance with four-dimensional time series data. The data can be lazily loaded.
+        lazy: bool
+            If True, the averaged images are only computed when the time series data of the result is indexed.
+
+        Raises
+        ------
+        ValueError:
+            if the pulse energy is missing or does not match the data, or if the number of measurements is not
+            a multiple of the measurements per image.
+
+        Return
+        ------
+        PAData
+            A new PAData instance with the averaged time series data and the adjusted acquisition metadata.
+            The device metadata is shared with the given instance.
+        """
+        averaged_data = AveragedTimeSeriesData(pa_data.binary_time_series_data,
+                                               self._get_measurements_per_image(pa_data),
+                                               self._get_pulse_energy(pa_data))
+        meta_data_acquisition = self._adjust_acquisition_meta_data(pa_data.meta_data_acquisition, averaged_data)
+        binary_time_series_data = averaged_data if lazy else averaged_data[()]
+        return PAData(binary_time_series_data, meta_data_acquisition, pa_data.meta_data_device)
+
+    def write(self, pa_data: PAData, file_path: str, file_compression: str = None, checksums: bool = False):
+        """
+        Normalises and averages the measurements of the given PAData instance and streams the result into a
+        new IPASC file, one image at a time.
+
+        Parameters
+        ----------
+        pa_data: PAData
+            The PAData instance with four-dimensional time series data. The data can be lazily loaded.
+        file_path: str
+            Path of the file to write.
+        file_compression: str
+            possible file compression for the hdf5 output file. Possible values are: gzip, lzf and szip.
+        checksums: bool
+            If True, integrity information is written as described in `write_data`.
+        """
+        write_data(file_path, self.apply(pa_data, lazy=True), file_compression=file_compression,
+                   checksums=checksums)
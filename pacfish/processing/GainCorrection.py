@@ -0,0 +1,130 @@
+# SPDX-FileCopyrightText: 2026 International Photoacoustics Standardisation Consortium (IPASC)
+# SPDX-License-Identifier: BSD 3-Clause License
+
+import numpy as np
+from pacfish import PAData
+from pacfish.processing.BaseProcessingStage import BaseProcessingStage
+
+# Custom acquisition metadata that records whether the gains were applied (1) or undone (-1) in the time series
+# data, so that the correction is not applied twice.
+GAIN_CORRECTION_TAG = "applied_gain_correction"
+
+
+def compute_gain_factors(pa_data: PAData, num_detectors: int, num_samples: int, inverse: bool = False,
+                         dtype=np.float64) -> np.ndarray:
+    """
+    Combines the overall gain, the element-dependent gain and the time gain compensation of the acquisition
+    metadata into a single array of factors. Gains that are not given in the metadata are ignored.
+
+    Parameters
+    ----------
+    pa_data: PAData
+        The PAData instance with the acquisition metadata.
+    num_detectors: int
+        The number of detectors of the time series data.
+    num_samples: int
+        The number of samples of the time series data.
+    inverse: bool
+        If True, the reciprocal factors are returned, which undo the gains.
+    dtype: np.dtype
+        The data type of the returned factors.
+
+    Raises
+    ------
+    ValueError:
+        if the element-dependent gain or the time gain compensation do not match the time series data.
+
+    Return
+    ------
+    np.ndarray
+        A (num_detectors, num_samples, 1, 1) array that can be broadcast against the time series data.
+    """
+    factors = np.ones((num_detectors, num_samples), dtype=np.float64)
+
+    overall_gain = pa_data.get_overall_gain()
+    if overall_gain is not None:
+        factors *= float(overall_gain)
+
+    element_dependent_gain = pa_data.get_element_dependent_gain()
+    if element_dependent_gain is not None:
+        element_dependent_gain = np.reshape(element_dependent_gain, (-1, ))
+        if len(element_dependent_gain) != num_detectors:
+            raise ValueError(f"The element-dependent gain has {len(element_dependent_gain)} entries, "
+                             f"but the time series data has {num_detectors} detectors.")
+        factors *= element_dependent_gain[:, np.newaxis]
+
+    time_gain_compensation = pa_data.get_time_gain_compensation()
+    if time_gain_compensation is not None:
+        time_gain_compensation = np.reshape(time_gain_compensation, (-1, ))
+        if len(time_gain_compensation) != num_samples:
+            raise ValueError(f"The time gain compensation has {len(time_gain_compensation)} entries, "
+                             f"but the time series data has {num_samples} samples.")
+        factors *= time_gain_compensation[np.newaxis, :]
+
+    if inverse:
+        np.reciprocal(factors, out=factors)
+    return factors.astype(dtype, copy=False)[:, :, np.newaxis, np.newaxis]
+
+
+class GainCorrection(BaseProcessingStage):
+    """
+    Applies the `overall_gain`, `element_dependent_gain` and `time_gain_compensation` of the acquisition
+    metadata to the time series data.
+
+    The three gains are first combined into a single (detectors, samples) array of factors, which is then
+    broadcast against the [detectors, samples, wavelengths, measurements] data in one multiplication, so no
+    full-size temporaries are created. Numpy arrays with a floating-point data type are corrected in place
+    unless an output array is given. Lazily loaded data is read and corrected chunk by chunk of measurements::
+
+        pa_data = pf.load_data("acquisition.hdf5", lazy=True)
+        corrected = GainCorrection().apply(pa_data)
+
+    With `inverse=True`, the data is divided by the gains instead, which undoes gains that were applied
+    during the acquisition.
+
+    When the time series data of the PAData instance is corrected in place, this is recorded in its acquisition
+    metadata under `GAIN_CORRECTION_TAG`. Applying the same correction to it again raises an error, while the
+    inverse correction undoes it.
+    """
+
+    def __init__(self, inverse: bool = False, measurements_per_chunk: int = 1):
+        """
+        Parameters
+        ----------
+        inverse: bool
+            If True, the time series data is divided by the gains instead of multiplied with them.
+        measurements_per_chunk: int
+            The number of measurements that are read and corrected at once.
+        """
+        super(GainCorrection, self).__init__(measurements_per_chunk)
+        self.inverse = inverse
+
+    def apply(self, pa_data: PAData, out: np.ndarray = None) -> np.ndarray:
+        """
+        Applies the gain correction, see `BaseProcessingStage.apply`.
+
+        Raises
+        ------
+        ValueError:
+            if the acquisition metadata records that the same correction was already applied to the data.
+        """
+        state = pa_data.get_custom_meta_datum(GAIN_CORRECTION_TAG) or 0
+        new_state = state + (-1 if self.inverse else 1)
+        if abs(new_state) > 1:
+            raise ValueError(f"The gains were already {'undone' if self.inverse else 'applied'} in the time "
+                             f"series data and cannot be {'undone' if self.inverse else 'applied'} again.")
+        data = pa_data.binary_time_series_data
+        result = super(GainCorrection, self).apply(pa_data, out)
+        if result is data:
+            if new_state == 0:
+                pa_data.meta_data_acquisition.pop(GAIN_CORRECTION_TAG, None)
+            else:
+                pa_data.meta_data_acquisition[GAIN_CORRECTION_TAG] = new_state
+        return result
+
+    def prepare(self, pa_data: PAData, shape: tuple, dtype: np.dtype) -> np.ndarray:
+        factor_dtype = np.finfo(dtype).dtype if dtype.kind in "fc" else np.float64
+        return compute_gain_factors(pa_data, shape[0], shape[1], self.inverse, dtype=factor_dtype)
+
+    def process_chunk(self, chunk: np.ndarray, out: np.ndarray, context: np.ndarray):
+        np.multiply(chunk, context, out=out, casting="unsafe")
@@ -0,0 +1,195 @@
+# SPDX-FileCopyrightText: 2026 International Photoacoustics Standardisation Consortium (IPASC)
+# SPDX-License-Identifier: BSD 3-Clause License
+
+from fractions import Fraction
+
+import numpy as np
+import scipy.signal
+from pacfish import PAData, MetadataAcquisitionTags
+from pacfish.iohandler.file_writer import write_data
+from pacfish.iohandler.lazy_data import normalise_selection, iterate_measurement_chunks
+
+
+def get_resampling_factors(source_sampling_rate: float, target_sampling_rate: float,
+                           max_denominator: int = 1000) -> tuple:
+    """
+    Approximates the ratio of the target and source sampling rates by a fraction up / down.
+
+    Return
+    ------
+    tuple
+        The (up, down) factors of the polyphase filter.
+    """
+    ratio = Fraction(target_sampling_rate / source_sampling_rate).limit_denominator(max_denominator)
+    if ratio <= 0:
+        raise ValueError(f"Cannot resample from {source_sampling_rate} Hz to {target_sampling_rate} Hz.")
+    return ratio.numerator, ratio.denominator
+
+
+class ResampledTimeSeriesData:
+    """
+    An array-like view of time series data that is resampled along the sample axis by a rational factor with a
+    polyphase filter. The resampling is only computed when the view is indexed, and only the selected
+    measurements are read from the underlying data, so lazily loaded data is streamed one chunk at a time.
+    """
+
+    def __init__(self, binary_time_series_data, up: int, down: int, window=("kaiser", 5.0)):
+        """
+        Parameters
+        ----------
+        binary_time_series_data: np.ndarray or LazyTimeSeriesData
+            The four-dimensional time series data [detectors, samples, wavelengths, measurements].
+        up: int
+            The upsampling factor.
+        down: int
+            The downsampling factor.
+        window: object
+            The window of the anti-aliasing FIR filter, as accepted by `scipy.signal.resample_poly`.
+        """
+        shape = tuple(binary_time_series_data.shape)
+        if len(shape) != 4:
+            raise ValueError(f"The time series data must have four dimensions, but had the shape {shape}.")
+        self.binary_time_series_data = binary_time_series_data
+        self.up = up
+        self.down = down
+        self.window = window
+        self.shape = (shape[0], -(-shape[1] * up // down)) + shape[2:]
+        self.dtype = np.result_type(binary_time_series_data.dtype, np.float32)
+
+    @property
+    def ndim(self) -> int:
+        return 4
+
+    def resample(self, measurements: np.ndarray) -> np.ndarray:
+        """
+        Resamples a four-dimensional chunk of measurements along the sample axis.
+        """
+        return scipy.signal.resample_poly(np.asarray(measurements, dtype=self.dtype), self.up, self.down,
+                                          axis=1, window=self.window)
+
+    def __getitem__(self, selection):
+        selection = normalise_selection(selection)
+        measurement_selection = selection[3]
+        if isinstance(measurement_selection, (int, np.integer)):
+            index = int(measurement_selection) % self.shape[3]
+            measurement_selection = slice(index, index + 1)
+        resampled = self.resample(self.binary_time_series_data[:, :, :, measurement_selection])
+        if isinstance(selection[3], (int, np.integer)):
+            resampled = resampled[..., 0]
+        return resampled[selection[:3]]
+
+    def __array__(self, dtype=None, copy=None):
+        data = self[()]
+        return data if dtype is None else data.astype(dtype, copy=False)
+
+
+class Resampling:
+    """
+    Resamples the sample axis of the time series data to a target `ad_sampling_rate`.
+
+    The ratio of the sampling rates is approximated by a fraction up / down and the data is resampled with a
+    polyphase FIR filter, which only evaluates the output samples that are kept. The measurements are
+    processed chunk by chunk, so the result can be streamed from one IPASC file into another::
+
+        pa_data = pf.load_data("acquisition.hdf5", lazy=True)
+        Resampling(sampling_rate=20e6).write(pa_data, "resampled.hdf5")
+
+    The `ad_sampling_rate`, the number of samples in `sizes` and the `time_gain_compensation` of the
+    acquisition metadata are adjusted to match the resampled data.
+    """
+
+    def __init__(self, sampling_rate: float, max_denominator: int = 1000, window=("kaiser", 5.0),
+                 measurements_per_chunk: int = 1):
+        """
+        Parameters
+        ----------
+        sampling_rate: float
+            The target sampling rate in Hz.
+        max_denominator: int
+            The largest down factor that is used to approximate the ratio of the sampling rates.
+        window: object
+            The window of the anti-aliasing FIR filter, as accepted by `scipy.signal.resample_poly`.
+        measurements_per_chunk: int
+            The number of measurements that are resampled at once.
+        """
+        self.sampling_rate = sampling_rate
+        self.max_denominator = max_denominator
+        self.window = window
+        self.measurements_per_chunk = measurements_per_chunk
+
+    def _adjust_acquisition_meta_data(self, meta_data_acquisition: dict, data: ResampledTimeSeriesData,
+                                      source_sampling_rate: float, num_source_samples: int) -> dict:
+        meta_data_acquisition = dict(meta_data_acquisition)
+        meta_data_acquisition[MetadataAcquisitionTags.AD_SAMPLING_RATE.tag] = \
+            source_sampling_rate * data.up / data.down
+
+        sizes = meta_data_acquisition.get(MetadataAcquisitionTags.SIZES.tag)
+        if sizes is not None and np.size(sizes) > 1:
+            sizes = np.array(sizes, copy=True)
+            sizes[1] = data.shape[1]
+            meta_data_acquisition[MetadataAcquisitionTags.SIZES.tag] = sizes
+
+        time_gain_compensation = meta_data_acquisition.get(MetadataAcquisitionTags.TIME_GAIN_COMPENSATION.tag)
+        if time_gain_compensation is not None and np.size(time_gain_compensation) == num_source_samples:
+            # output sample k of the polyphase filter lies at the input sample k * down / up
+            sample_positions = np.arange(data.shape[1]) * data.down / data.up
+            meta_data_acquisition[MetadataAcquisitionTags.TIME_GAIN_COMPENSATION.tag] = np.interp(
+                sample_positions, np.arange(num_source_samples), np.reshape(time_gain_compensation, (-1, )))
+        return meta_data_acquisition
+
+    def apply(self, pa_data: PAData, lazy: bool = False) -> PAData:
+        """
+        Resamples the time series data of the given PAData instance.
+
+        Parameters
+        ----------
+        pa_data: PAData
+            The PAData instance with four-dimensional time series data. The data can be lazily loaded.
+        lazy: bool
+            If True, the measurements are only resampled when the time series data of the result is indexed.
+
+        Raises
+        ------
+        ValueError:
+            if the sampling rate of the data is not given in the acquisition metadata.
+
+        Return
+        ------
+        PAData
+            A new PAData instance with the resampled time series data and the adjusted acquisition metadata.
+            The device metadata is shared with the given instance.
+        """
+        source_sampling_rate = pa_data.get_sampling_rate()
+        if source_sampling_rate is None:
+            raise ValueError("The sampling rate must be given in the acquisition metadata.")
+        up, down = get_resampling_factors(source_sampling_rate, self.sampling_rate, self.max_denominator)
+        data = pa_data.binary_time_series_data
+        resampled_data = ResampledTimeSeriesData(data, up, down, self.window)
+        meta_data_acquisition = self._adjust_acquisition_meta_data(pa_data.meta_data_acquisition, resampled_data,
+                                                                   source_sampling_rate, data.shape[1])
+        if lazy:
+            binary_time_series_data = resampled_data
+        else:
+            binary_time_series_data = np.empty(resampled_data.shape, dtype=resampled_data.dtype)
+            for start, stop, chunk in iterate_measurement_chunks(data, self.measurements_per_chunk):
+                binary_time_series_data[..., start:stop] = resampled_data.resample(chunk)
+        return PAData(binary_time_series_data, meta_data_acquisition, pa_data.meta_data_device)
+
+    def write(self, pa_data: PAData, file_path: str, file_compression: str = None, checksums: bool = False):
+        """
+        Resamples the time series data of the given PAData instance and streams the result into a new IPASC file,
+        one measurement at a time.
+
+        Parameters
+        ----------
+        pa_data: PAData
+            The PAData instance with four-dimensional time series data. The data can be lazily loaded.
+        file_path: str
+            Path of the file to write.
+        file_compression: str
+            possible file compression for the hdf5 output file. Possible values are: gzip, lzf and szip.
+        checksums: bool
+            If True, integrity information is written as described in `write_data`.
+        """
+        write_data(file_path, self.apply(pa_data, lazy=True), file_compression=file_compression,
+                   checksums=checksums)
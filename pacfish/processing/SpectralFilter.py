@@ -0,0 +1,190 @@
+# SPDX-FileCopyrightText: 2026 International Photoacoustics Standardisation Consortium (IPASC)
+# SPDX-License-Identifier: BSD 3-Clause License
+
+import functools
+import hashlib
+
+import numpy as np
+import scipy.fft
+from pacfish import PAData
+from pacfish.processing.BaseProcessingStage import BaseProcessingStage
+
+
+@functools.lru_cache(maxsize=None)
+def get_fft_size(num_samples: int) -> int:
+    """
+    Return
+    ------
+    int
+        The smallest length of at least `num_samples` for which real FFTs are fast.
+    """
+    return scipy.fft.next_fast_len(num_samples, real=True)
+
+
+def compute_band_pass_response(frequencies: np.ndarray, band, order: int = 4) -> np.ndarray:
+    """
+    Computes the magnitude response of a zero-phase Butterworth band-pass filter.
+
+    Parameters
+    ----------
+    frequencies: np.ndarray
+        The frequencies in Hz.
+    band: np.ndarray
+        The [lower, higher] -3 dB points of the filter in Hz, following the definition of the
+        `frequency_domain_filter` acquisition metadatum. [lower, -1] denotes a high-pass filter and
+        [-1, higher] denotes a low-pass filter.
+    order: int
+        The order of the filter, which determines the steepness of the transition bands.
+
+    Return
+    ------
+    np.ndarray
+        The filter response at the given frequencies.
+    """
+    lower, higher = np.reshape(np.asarray(band, dtype=np.float64), (-1, ))
+    response = np.ones(np.shape(frequencies), dtype=np.float64)
+    if lower > 0:
+        with np.errstate(divide="ignore"):
+            response /= np.sqrt(1 + (lower / frequencies) ** (2 * order))
+    if higher > 0:
+        response /= np.sqrt(1 + (frequencies / higher) ** (2 * order))
+    return response
+
+
+def interpolate_frequency_response(frequency_response: np.ndarray, frequencies: np.ndarray) -> np.ndarray:
+    """
+    Evaluates the frequency response of a detection element at the given frequencies.
+
+    Parameters
+    ----------
+    frequency_response: np.ndarray
+        The IPASC [frequencies, response] array of the detection element, which is linearly interpolated. The
+        response is constant beyond the tabulated frequencies.
+    frequencies: np.ndarray
+        The frequencies in Hz.
+
+    Raises
+    ------
+    ValueError:
+        if the frequency response is not a two-dimensional array [frequencies, response].
+
+    Return
+    ------
+    np.ndarray
+        The response at the given frequencies.
+    """
+    frequency_response = np.asarray(frequency_response, dtype=np.float64)
+    if frequency_response.ndim != 2 or len(frequency_response) != 2:
+        raise ValueError(f"The frequency response must be an array [frequencies, response], but had the shape "
+                         f"{frequency_response.shape}.")
+    order = np.argsort(frequency_response[0])
+    return np.interp(frequencies, frequency_response[0][order], frequency_response[1][order])
+
+
+class SpectralFilter(BaseProcessingStage):
+    """
+    Band-pass filters the time series data along the sample axis and optionally deconvolves the frequency
+    response of every detection element.
+
+    The filter is applied as a single multiplication with a precomputed transfer function in the real-FFT
+    domain, batched over all detectors, wavelengths and measurements of a chunk. The FFT length of a given
+    number of samples and the transfer function of a given device are computed once and cached, so repeated
+    calls only pay for the FFTs themselves, which can run on several workers::
+
+        spectral_filter = SpectralFilter(band=[1e6, 8e6], deconvolve=True, workers=4)
+        filtered = spectral_filter.apply(pa_data)
+
+    The deconvolution is regularised in the Wiener sense with `response / (response^2 + regularisation)`,
+    where the regularisation is given relative to the maximum of the squared response.
+    """
+
+    IN_PLACE_KINDS = "f"
+
+    def __init__(self, band=None, deconvolve: bool = False, order: int = 4, regularisation: float = 1e-2,
+                 padding: int = 0, workers: int = None, measurements_per_chunk: int = 1):
+        """
+        Parameters
+        ----------
+        band: np.ndarray
+            The [lower, higher] -3 dB points of the band-pass filter in Hz. If None, the `frequency_domain_filter`
+            of the acquisition metadata is used. If neither is given, no band-pass filter is applied.
+        deconvolve: bool
+            If True, the `frequency_response` of every detection element is deconvolved.
+        order: int
+            The order of the Butterworth band-pass filter.
+        regularisation: float
+            The relative regularisation of the deconvolution.
+        padding: int
+            The number of zero samples that are appended before the FFT to limit the wrap-around of the filter.
+        workers: int
+            The number of workers that are used by `scipy.fft`. If None, a single worker is used.
+        measurements_per_chunk: int
+            The number of measurements that are read and filtered at once.
+        """
+        super(SpectralFilter, self).__init__(measurements_per_chunk)
+        self.band = band
+        self.deconvolve = deconvolve
+        self.order = order
+        self.regularisation = regularisation
+        self.padding = padding
+        self.workers = workers
+        self._transfer_functions = dict()
+
+    def get_transfer_function(self, pa_data: PAData, fft_size: int, dtype=np.float64) -> np.ndarray:
+        """
+        Returns the transfer function of the filter for the given PAData instance and FFT length.
+
+        Raises
+        ------
+        ValueError:
+            if the sampling rate is missing or the frequency response is missing for the deconvolution.
+
+        Return
+        ------
+        np.ndarray
+            A (num_detectors, fft_size // 2 + 1) array, or (1, fft_size // 2 + 1) without deconvolution.
+        """
+        sampling_rate = pa_data.get_sampling_rate()
+        if sampling_rate is None:
+            raise ValueError("The sampling rate must be given in the acquisition metadata.")
+        band = self.band if self.band is not None else pa_data.get_frequency_domain_filter()
+        frequency_response = pa_data.get_frequency_response() if self.deconvolve else None
+        if self.deconvolve and frequency_response is None:
+            raise ValueError("The frequency response of the detection elements must be given for deconvolution.")
+
+        digest = hashlib.sha256()
+        for value in (band, frequency_response):
+            digest.update(b"-" if value is None else np.asarray(value, dtype=np.float64).tobytes())
+        key = (fft_size, float(sampling_rate), np.dtype(dtype).str, digest.hexdigest())
+        if key in self._transfer_functions:
+            return self._transfer_functions[key]
+
+        frequencies = scipy.fft.rfftfreq(fft_size, 1 / sampling_rate)
+        transfer_function = np.ones((1, len(frequencies)), dtype=np.float64)
+        if band is not None:
+            transfer_function *= compute_band_pass_response(frequencies, band, self.order)
+        if self.deconvolve:
+            responses = np.stack([interpolate_frequency_response(response, frequencies)
+                                  for response in frequency_response])
+            epsilon = self.regularisation * np.max(responses ** 2)
+            transfer_function = transfer_function * (responses / (responses ** 2 + epsilon))
+
+        transfer_function = transfer_function.astype(dtype)
+        self._transfer_functions[key] = transfer_function
+        return transfer_function
+
+    def prepare(self, pa_data: PAData, shape: tuple, dtype: np.dtype) -> tuple:
+        num_detectors, num_samples = shape[0], shape[1]
+        fft_size = get_fft_size(num_samples + self.padding)
+        transfer_function = self.get_transfer_function(pa_data, fft_size, np.finfo(dtype).dtype)
+        if transfer_function.shape[0] not in (1, num_detectors):
+            raise ValueError(f"The frequency response is given for {transfer_function.shape[0]} detectors, "
+                             f"but the time series data has {num_detectors} detectors.")
+        return fft_size, transfer_function[:, :, np.newaxis, np.newaxis]
+
+    def process_chunk(self, chunk: np.ndarray, out: np.ndarray, context: tuple):
+        fft_size, transfer_function = context
+        spectrum = scipy.fft.rfft(chunk, n=fft_size, axis=1, workers=self.workers)
+        spectrum *= transfer_function
+        filtered = scipy.fft.irfft(spectrum, n=fft_size, axis=1, workers=self.workers, overwrite_x=True)
+        out[...] = filtered[:, :chunk.shape[1]]
@@ -0,0 +1,250 @@
+# SPDX-FileCopyrightText: 2026 International Photoacoustics Standardisation Consortium (IPASC)
+# SPDX-License-Identifier: BSD 3-Clause License
+
+import itertools
+
+import numpy as np
+from pacfish import PAData
+
+
+# The beam energy profiles are tabulated over the wavelength in nm, the acquisition wavelengths are given in m.
+METERS_TO_NANOMETERS = 1e9
+
+
+def get_relative_beam_energy(pa_data: PAData, wavelengths: np.ndarray = None) -> np.ndarray:
+    """
+    Sums the `beam_energy_profile` of all illuminators at the given wavelengths.
+
+    Parameters
+    ----------
+    pa_data: PAData
+        The PAData instance with the beam energy profiles of the illuminators.
+    wavelengths: np.ndarray
+        The wavelengths in meters. If not given, the acquisition wavelengths of the PAData instance are used.
+
+    Raises
+    ------
+    ValueError:
+        if no wavelengths are given and the acquisition wavelengths are missing, if no illuminator has a beam
+        energy profile or if a wavelength lies outside of the tabulated range of a beam energy profile.
+
+    Return
+    ------
+    np.ndarray
+        The total beam energy at every wavelength, normalised to a maximum of 1.
+    """
+    if wavelengths is None:
+        wavelengths = pa_data.get_acquisition_wavelengths()
+        if wavelengths is None:
+            raise ValueError("The acquisition wavelengths must be given for the beam energy correction.")
+    wavelengths = np.reshape(np.asarray(wavelengths, dtype=np.float64), (-1, )) * METERS_TO_NANOMETERS
+    beam_energy_profiles = pa_data.get_beam_energy_profile()
+    if beam_energy_profiles is None or len(beam_energy_profiles) == 0:
+        raise ValueError("The beam energy profile of the illuminators must be given for the beam energy correction.")
+    beam_energy = np.zeros(len(wavelengths), dtype=np.float64)
+    for profile in beam_energy_profiles:
+        profile = np.asarray(profile, dtype=np.float64)
+        order = np.argsort(profile[0])
+        profile_wavelengths, profile_energies = profile[0][order], profile[1][order]
+        # tolerate the rounding of the unit conversion
+        tolerance = 1e-6
+        outside = ((wavelengths < profile_wavelengths[0] - tolerance) |
+                   (wavelengths > profile_wavelengths[-1] + tolerance))
+        if np.any(outside):
+            raise ValueError(f"The wavelengths {wavelengths[outside]} nm lie outside of the beam energy profile, "
+                             f"which is tabulated from {profile_wavelengths[0]} nm to {profile_wavelengths[-1]} nm.")
+        beam_energy += np.interp(wavelengths, profile_wavelengths, profile_energies)
+    return beam_energy / np.max(beam_energy)
+
+
+class SpectralUnmixing:
+    """
+    Linear spectral unmixing of multi-wavelength data into the abundances of a set of endmembers,
+    e.g. oxy- and deoxyhaemoglobin.
+
+    For every detector and sample, or every reconstructed voxel, the measured spectrum b is modelled as
+    A x with the (wavelengths, endmembers) matrix A of the endmember spectra. All spectra are solved in one
+    batched operation: the data is only needed to accumulate A^T b and b^T b, one wavelength at a time, and
+    the abundances follow from the precomputed pseudo-inverse of the Gram matrix A^T A. Lazily loaded data is
+    therefore read one wavelength and a chunk of measurements at a time::
+
+        unmixing = SpectralUnmixing(spectra, endmember_wavelengths=spectra_wavelengths, non_negative=True)
+        abundances = unmixing.apply(pf.load_data("acquisition.hdf5", lazy=True))
+
+    With `non_negative=True`, the non-negative least squares problem is solved exactly by evaluating the
+    least squares solution on every subset of endmembers and keeping the feasible solution with the smallest
+    residual. The precomputation grows with 2^endmembers, which is cheap for the handful of endmembers
+    typically used in photoacoustics.
+    """
+
+    def __init__(self, endmember_spectra: np.ndarray, endmember_wavelengths: np.ndarray = None,
+                 non_negative: bool = False, beam_energy_correction: bool = False, measurements_per_chunk: int = 1):
+        """
+        Parameters
+        ----------
+        endmember_spectra: np.ndarray
+            An (endmembers, N) array with the spectrum of every endmember.
+        endmember_wavelengths: np.ndarray
+            The N wavelengths at which the spectra are given, in meters. If given, the spectra are interpolated
+            onto the acquisition wavelengths. Otherwise, the spectra must be given at the acquisition wavelengths.
+        non_negative: bool
+            If True, the abundances are constrained to be non-negative.
+        beam_energy_correction: bool
+            If True, the endmember spectra are scaled with the relative `beam_energy_profile` of the
+            illuminators at every acquisition wavelength, see `get_relative_beam_energy`.
+        measurements_per_chunk: int
+            The number of measurements that are read at once from lazily loaded time series data.
+        """
+        self.endmember_spectra = np.atleast_2d(np.asarray(endmember_spectra, dtype=np.float64))
+        self.endmember_wavelengths = endmember_wavelengths
+        self.non_negative = non_negative
+        self.beam_energy_correction = beam_energy_correction
+        self.measurements_per_chunk = measurements_per_chunk
+
+    @property
+    def num_endmembers(self) -> int:
+        return self.endmember_spectra.shape[0]
+
+    def get_endmember_matrix(self, wavelengths: np.ndarray = None) -> np.ndarray:
+        """
+        Returns the (wavelengths, endmembers) matrix of the endmember spectra at the given wavelengths.
+        """
+        if self.endmember_wavelengths is None:
+            if wavelengths is not None and len(wavelengths) != self.endmember_spectra.shape[1]:
+                raise ValueError(f"The endmember spectra are given at {self.endmember_spectra.shape[1]} wavelengths, "
+                                 f"but the data has {len(wavelengths)} wavelengths.")
+            return self.endmember_spectra.T.copy()
+        if wavelengths is None:
+            raise ValueError("The acquisition wavelengths must be known to interpolate the endmember spectra.")
+        return np.stack([np.interp(wavelengths, self.endmember_wavelengths, spectrum)
+                         for spectrum in self.endmember_spectra], axis=-1)
+
+    def _get_corrected_endmember_matrix(self, wavelengths: np.ndarray, pa_data: PAData) -> np.ndarray:
+        """
+        Returns the endmember matrix at the given wavelengths, scaled with the relative beam energy if the beam
+        energy correction is enabled.
+        """
+        endmember_matrix = self.get_endmember_matrix(wavelengths)
+        if self.beam_energy_correction:
+            if pa_data is None:
+                raise ValueError("The PAData instance with the beam energy profiles must be given for the beam "
+                                 "energy correction.")
+            if wavelengths is None:
+                raise ValueError("The acquisition wavelengths must be given for the beam energy correction.")
+            endmember_matrix *= get_relative_beam_energy(pa_data, wavelengths)[:, np.newaxis]
+        return endmember_matrix
+
+    def _get_solver(self, endmember_matrix: np.ndarray) -> list:
+        """
+        Precomputes the pseudo-inverse of the Gram matrix for every subset of endmembers that is considered.
+        """
+        gram_matrix = endmember_matrix.T @ endmember_matrix
+        if not self.non_negative:
+            subsets = [tuple(range(self.num_endmembers))]
+        else:
+            subsets = [subset for size in range(1, self.num_endmembers + 1)
+                       for subset in itertools.combinations(range(self.num_endmembers), size)]
+        return [(list(subset), np.linalg.pinv(gram_matrix[np.ix_(subset, subset)])) for subset in subsets]
+
+    def _solve(self, correlations: np.ndarray, energies: np.ndarray, solver: list) -> np.ndarray:
+        """
+        Solves all spectra given the correlations A^T b with the shape (..., endmembers) and the energies b^T b.
+        """
+        if not self.non_negative:
+            subset, inverse = solver[0]
+            return correlations @ inverse.T
+
+        abundances = np.zeros_like(correlations)
+        # a zero solution is always feasible and has the residual b^T b
+        best_residuals = np.array(energies, dtype=np.float64, copy=True)
+        for subset, inverse in solver:
+            solution = correlations[..., subset] @ inverse.T
+            residuals = energies - np.einsum("...i,...i->...", correlations[..., subset], solution)
+            better = np.all(solution >= 0, axis=-1) & (residuals < best_residuals)
+            best_residuals[better] = residuals[better]
+            selected = np.zeros((np.count_nonzero(better), self.num_endmembers), dtype=abundances.dtype)
+            selected[:, subset] = solution[better]
+            abundances[better] = selected
+        return abundances
+
+    def unmix(self, data: np.ndarray, wavelengths: np.ndarray = None, wavelength_axis: int = -1,
+              endmember_matrix: np.ndarray = None, pa_data: PAData = None) -> np.ndarray:
+        """
+        Unmixes an array, such as a reconstructed multi-wavelength image.
+
+        Parameters
+        ----------
+        data: np.ndarray
+            The data with a wavelength axis.
+        wavelengths: np.ndarray
+            The wavelengths of the data in meters. If not given, the acquisition wavelengths of `pa_data` are used.
+        wavelength_axis: int
+            The axis of the data that corresponds to the wavelengths.
+        endmember_matrix: np.ndarray
+            Overrides the (wavelengths, endmembers) matrix of the endmember spectra. It is used as it is, without
+            the beam energy correction.
+        pa_data: PAData
+            The PAData instance the data was reconstructed from. It is needed for the beam energy correction.
+
+        Raises
+        ------
+        ValueError:
+            if the beam energy correction is enabled and `pa_data` or the wavelengths are missing.
+
+        Return
+        ------
+        np.ndarray
+            The abundances, with the wavelength axis replaced by an axis over the endmembers.
+        """
+        if endmember_matrix is None:
+            if wavelengths is None and pa_data is not None:
+                wavelengths = pa_data.get_acquisition_wavelengths()
+            if wavelengths is not None:
+                wavelengths = np.reshape(wavelengths, (-1, ))
+            endmember_matrix = self._get_corrected_endmember_matrix(wavelengths, pa_data)
+        data = np.moveaxis(np.asarray(data), wavelength_axis, -1)
+        correlations = data @ endmember_matrix
+        energies = np.einsum("...w,...w->...", data, data)
+        abundances = self._solve(correlations, energies, self._get_solver(endmember_matrix))
+        return np.moveaxis(abundances, -1, wavelength_axis)
+
+    def apply(self, pa_data: PAData) -> np.ndarray:
+        """
+        Unmixes the time series data of the given PAData instance for every detector, sample and measurement.
+
+        Parameters
+        ----------
+        pa_data: PAData
+            The PAData instance with four-dimensional time series data. The data can be lazily loaded.
+
+        Return
+        ------
+        np.ndarray
+            The abundances with the shape [detectors, samples, endmembers, measurements].
+        """
+        data = pa_data.binary_time_series_data
+        shape = tuple(data.shape)
+        if len(shape) != 4:
+            raise ValueError(f"The time series data must have four dimensions, but had the shape {shape}.")
+
+        wavelengths = pa_data.get_acquisition_wavelengths()
+        endmember_matrix = self._get_corrected_endmember_matrix(
+            None if wavelengths is None else np.reshape(wavelengths, (-1, )), pa_data)
+        if len(endmember_matrix) != shape[2]:
+            raise ValueError(f"The endmember spectra are given at {len(endmember_matrix)} wavelengths, "
+                             f"but the time series data has {shape[2]} wavelengths.")
+        solver = self._get_solver(endmember_matrix)
+
+        dtype = np.result_type(data.dtype, np.float32)
+        abundances = np.empty((shape[0], shape[1], self.num_endmembers, shape[3]), dtype=dtype)
+        step = max(1, self.measurements_per_chunk)
+        for start in range(0, shape[3], step):
+            stop = min(start + step, shape[3])
+            correlations = np.zeros((shape[0], shape[1], stop - start, self.num_endmembers), dtype=np.float64)
+            energies = np.zeros((shape[0], shape[1], stop - start), dtype=np.float64)
+            for wavelength_index in range(shape[2]):
+                values = np.asarray(data[:, :, wavelength_index, start:stop], dtype=np.float64)
+                correlations += values[..., np.newaxis] * endmember_matrix[wavelength_index]
+                energies += values * values
+            abundances[..., start:stop] = np.moveaxis(self._solve(correlations, energies, solver), -1, 2)
+        return abundances
@@ -0,0 +1,12 @@
+"""
+The purpose of the processing package is to provide signal processing stages that work directly on
+the time series data of PAData instances, driven by the information contained in the IPASC metadata.
+All stages can process lazily loaded data chunk by chunk.
+"""
+
+from pacfish.processing.GainCorrection import GainCorrection
+from pacfish.processing.BaseProcessingStage import BaseProcessingStage
+from pacfish.processing.SpectralFilter import SpectralFilter
+from pacfish.processing.FrameAveraging import FrameAveraging
+from pacfish.processing.SpectralUnmixing import SpectralUnmixing
+from pacfish.processing.Resampling import Resampling
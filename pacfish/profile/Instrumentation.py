@@ -0,0 +1,351 @@
+# SPDX-FileCopyrightText: 2026 International Photoacoustics Standardisation Consortium (IPASC)
+# SPDX-License-Identifier: BSD 3-Clause License
+
+import functools
+import json
+import os
+import threading
+import time
+from collections import defaultdict
+from contextlib import contextmanager
+
+BYTES_READ = "bytes_read"
+BYTES_WRITTEN = "bytes_written"
+HDF5_OBJECTS_VISITED = "hdf5_objects_visited"
+HDF5_OBJECTS_WRITTEN = "hdf5_objects_written"
+CACHE_HITS = "cache_hits"
+CACHE_MISSES = "cache_misses"
+ELEMENTS_VALIDATED = "elements_validated"
+
+# The trace that spans and counters are recorded into. None while the instrumentation is switched off, which is
+# the only state that the instrumented code paths check, so that they cost a single global lookup by default.
+_active_trace = None
+_local = threading.local()
+
+
+class Span:
+    """
+    A timed section of code, e.g. the binary read of `load_data`, together with the counters that were
+    incremented while it was open. Spans are created with `span` and nest per thread.
+    """
+
+    __slots__ = ("name", "attributes", "counters", "parent", "thread_id", "start_ns", "duration_ns", "_trace")
+
+    def __init__(self, name: str, attributes: dict, trace):
+        self.name = name
+        self.attributes = attributes
+        self.counters = defaultdict(int)
+        self.parent = None
+        self.thread_id = threading.get_ident()
+        self.start_ns = None
+        self.duration_ns = None
+        self._trace = trace
+
+    def count(self, name: str, value: int = 1):
+        """
+        Increments a counter of this span and the totals of its trace.
+        """
+        self.counters[name] += value
+        self._trace.add_to_totals(name, value)
+
+    def set(self, **attributes):
+        """
+        Adds attributes to the span, e.g. the shape of the data once it is known.
+        """
+        self.attributes.update(attributes)
+
+    @property
+    def seconds(self) -> float:
+        return None if self.duration_ns is None else self.duration_ns * 1e-9
+
+    def __enter__(self):
+        stack = _get_stack()
+        self.parent = stack[-1].name if stack else None
+        stack.append(self)
+        self._trace.start_span(self)
+        self.start_ns = time.perf_counter_ns()
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.duration_ns = time.perf_counter_ns() - self.start_ns
+        stack = _get_stack()
+        if stack and stack[-1] is self:
+            stack.pop()
+        if exc_type is not None:
+            self.attributes["error"] = exc_type.__name__
+        self._trace.add_span(self)
+        return False
+
+    def to_dict(self) -> dict:
+        return {"name": self.name, "parent": self.parent, "thread_id": self.thread_id,
+                "start_ns": self.start_ns, "duration_ns": self.duration_ns,
+                "attributes": dict(self.attributes), "counters": dict(self.counters)}
+
+
+class _NoOpSpan:
+    """
+    The span that is returned while the instrumentation is switched off.
+    """
+
+    __slots__ = ()
+
+    def count(self, name: str, value: int = 1):
+        pass
+
+    def set(self, **attributes):
+        pass
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        return False
+
+
+_NO_OP_SPAN = _NoOpSpan()
+
+
+def _get_stack() -> list:
+    stack = getattr(_local, "stack", None)
+    if stack is None:
+        stack = _local.stack = []
+    return stack
+
+
+class Trace:
+    """
+    Collects the finished spans and the counter totals of one instrumented run.
+    """
+
+    def __init__(self, callback=None):
+        """
+        Parameters
+        ----------
+        callback: callable
+            If given, it is called with every finished `Span`, e.g. to forward the spans to a logging or
+            monitoring system. The callback is called on the thread that closed the span.
+        """
+        self.callback = callback
+        self.spans = []
+        self.totals = defaultdict(int)
+        self._lock = threading.Lock()
+        self._origin_ns = time.perf_counter_ns()
+
+    def start_span(self, started_span: Span):
+        """
+        Called when a span is entered, before its timer is started. Subclasses can override it to take
+        additional measurements, e.g. of the memory usage.
+        """
+        pass
+
+    def add_span(self, finished_span: Span):
+        with self._lock:
+            self.spans.append(finished_span)
+        if self.callback is not None:
+            self.callback(finished_span)
+
+    def add_to_totals(self, name: str, value: int):
+        with self._lock:
+            self.totals[name] += value
+
+    def summary(self) -> dict:
+        """
+        Aggregates the spans by their name.
+
+        Return
+        ------
+        dict
+            A dictionary mapping every span name onto the number of calls, the total time in seconds and the
+            summed counters of these spans.
+        """
+        summary = dict()
+        with self._lock:
+            spans = list(self.spans)
+        for finished_span in spans:
+            entry = summary.setdefault(finished_span.name, {"calls": 0, "seconds": 0.0, "counters": defaultdict(int)})
+            entry["calls"] += 1
+            entry["seconds"] += finished_span.seconds
+            for name, value in finished_span.counters.items():
+                entry["counters"][name] += value
+        for entry in summary.values():
+            entry["counters"] = dict(entry["counters"])
+        return summary
+
+    def to_trace_events(self) -> dict:
+        """
+        Converts the spans into the Trace Event Format, which can be opened in `chrome://tracing` or Perfetto.
+        Every span becomes a complete event with its attributes and counters as arguments.
+
+        Return
+        ------
+        dict
+            A JSON-serialisable dictionary with the `traceEvents` and the counter totals.
+        """
+        with self._lock:
+            spans = list(self.spans)
+            totals = dict(self.totals)
+        events = []
+        for finished_span in spans:
+            arguments = {name: _to_json_value(value) for name, value in finished_span.attributes.items()}
+            arguments.update(finished_span.counters)
+            events.append({"name": finished_span.name, "ph": "X", "pid": os.getpid(),
+                           "tid": finished_span.thread_id,
+                           "ts": (finished_span.start_ns - self._origin_ns) / 1000,
+                           "dur": finished_span.duration_ns / 1000, "args": arguments})
+        events.sort(key=lambda event: event["ts"])
+        return {"traceEvents": events, "displayTimeUnit": "ms", "otherData": {"totals": totals}}
+
+    def write_json(self, file_path: str):
+        """
+        Writes the spans in the Trace Event Format to a JSON file.
+        """
+        with open(file_path, "w") as trace_file:
+            json.dump(self.to_trace_events(), trace_file)
+
+
+def _to_json_value(value):
+    if isinstance(value, (str, int, float, bool, type(None))):
+        return value
+    return str(value)
+
+
+def is_enabled() -> bool:
+    return _active_trace is not None
+
+
+def enable(callback=None) -> Trace:
+    """
+    Switches the instrumentation on. All spans and counters are recorded into a new trace until `disable`
+    is called.
+
+    Parameters
+    ----------
+    callback: callable
+        A function that is called with every finished `Span`.
+
+    Return
+    ------
+    Trace
+        The trace that is recorded into.
+    """
+    global _active_trace
+    _active_trace = Trace(callback)
+    return _active_trace
+
+
+def disable() -> Trace:
+    """
+    Switches the instrumentation off.
+
+    Return
+    ------
+    Trace
+        The trace that was recorded into, or None if the instrumentation was not switched on.
+    """
+    global _active_trace
+    trace = _active_trace
+    _active_trace = None
+    return trace
+
+
+@contextmanager
+def tracing(callback=None, file_path: str = None):
+    """
+    Records all spans and counters within the context::
+
+        with pf.profile.tracing(file_path="load.json") as trace:
+            pa_data = pf.load_data("acquisition.hdf5")
+            pf.quality_check_pa_data(pa_data)
+        print(trace.summary())
+
+    Parameters
+    ----------
+    callback: callable
+        A function that is called with every finished `Span`.
+    file_path: str
+        If given, the trace is written to this JSON file in the Trace Event Format when the context is left.
+
+    Return
+    ------
+    Trace
+        The trace that is recorded into. The previously active trace, if any, is restored afterwards.
+    """
+    trace = Trace(callback)
+    with _activate(trace):
+        yield trace
+    if file_path is not None:
+        trace.write_json(file_path)
+
+
+@contextmanager
+def _activate(trace: Trace):
+    global _active_trace
+    previous_trace = _active_trace
+    _active_trace = trace
+    try:
+        yield trace
+    finally:
+        _active_trace = previous_trace
+
+
+def span(name: str, **attributes):
+    """
+    Returns a context manager that records the time spent in its body as a span of the active trace.
+    While the instrumentation is switched off, a shared no-op context manager is returned.
+
+    Parameters
+    ----------
+    name: str
+        The name of the span, e.g. "load_data.read_binary_data".
+    attributes:
+        Additional information that is stored with the span, e.g. the file path.
+
+    Return
+    ------
+    Span
+        The span, on which counters can be incremented with `count`.
+    """
+    trace = _active_trace
+    if trace is None:
+        return _NO_OP_SPAN
+    return Span(name, attributes, trace)
+
+
+def count(name: str, value: int = 1):
+    """
+    Increments a counter of the innermost open span of the current thread, or only of the totals of the active
+    trace if no span is open. Does nothing while the instrumentation is switched off.
+
+    Parameters
+    ----------
+    name: str
+        The name of the counter, e.g. `BYTES_READ`.
+    value: int
+        The increment.
+    """
+    trace = _active_trace
+    if trace is None:
+        return
+    stack = _get_stack()
+    if stack:
+        stack[-1].count(name, value)
+    else:
+        trace.add_to_totals(name, value)
+
+
+def traced(name: str = None):
+    """
+    Decorator that records every call of the decorated function as a span. Without a name, the qualified
+    name of the function is used.
+    """
+    def decorator(function):
+        span_name = name or function.__qualname__
+
+        @functools.wraps(function)
+        def wrapper(*args, **kwargs):
+            if _active_trace is None:
+                return function(*args, **kwargs)
+            with span(span_name):
+                return function(*args, **kwargs)
+        return wrapper
+    return decorator
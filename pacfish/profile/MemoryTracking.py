@@ -0,0 +1,283 @@
+# SPDX-FileCopyrightText: 2026 International Photoacoustics Standardisation Consortium (IPASC)
+# SPDX-License-Identifier: BSD 3-Clause License
+
+import threading
+import tracemalloc
+from contextlib import contextmanager
+
+from pacfish.profile.Instrumentation import Trace, Span, BYTES_READ, BYTES_WRITTEN, _activate
+
+try:
+    import resource
+except ImportError:
+    resource = None
+
+# The spans around which the memory is measured: load_data, write_data, and the __init__ and
+# generate_binary_data of every adapter.
+DEFAULT_STAGES = ("load_data", "write_data", ".__init__", ".generate_binary_data")
+
+
+def get_memory_usage() -> tuple:
+    """
+    Returns the current and the peak resident set size (RSS) of the process.
+
+    Return
+    ------
+    tuple
+        The current and the peak RSS in bytes. On Linux, both are read from `/proc/self/status`. Elsewhere,
+        only the peak RSS is available from the `resource` module and the current RSS is None. Both are None
+        on platforms without either.
+    """
+    try:
+        with open("/proc/self/status", "r") as status_file:
+            values = dict(line.split(":", 1) for line in status_file if ":" in line)
+        return int(values["VmRSS"].split()[0]) * 1024, int(values["VmHWM"].split()[0]) * 1024
+    except (OSError, KeyError, ValueError):
+        pass
+    if resource is None:
+        return None, None
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # ru_maxrss is given in bytes on macOS and in kilobytes elsewhere
+    return None, peak if peak > 2 ** 32 else peak * 1024
+
+
+def reset_peak_rss() -> bool:
+    """
+    Resets the peak RSS of the process to its current RSS. This is only possible on Linux.
+
+    Return
+    ------
+    bool
+        True, if the peak RSS was reset.
+    """
+    try:
+        with open("/proc/self/clear_refs", "w") as clear_refs_file:
+            clear_refs_file.write("5")
+        return True
+    except OSError:
+        return False
+
+
+class MemoryStage:
+    """
+    The memory usage of one stage of a pipeline, e.g. of one call of `load_data`.
+
+    The traced allocations are those of the Python memory allocators, including the data buffers of numpy
+    arrays, as recorded by `tracemalloc`. The `transient_bytes` are the bytes that were allocated on top of the
+    memory that is still in use at the end of the stage, i.e. the temporary copies. A stage is flagged as
+    `duplicated_data` if, at its peak, it had allocated at least `copy_fraction` of the time series data it
+    read or wrote in addition to one copy of that data, i.e. if it held a second full copy of the array at some
+    point. Nested stages are flagged together with the innermost stage that created the copy.
+    """
+
+    def __init__(self, name: str, attributes: dict):
+        self.name = name
+        self.attributes = attributes
+        self.rss_start = None
+        self.rss_end = None
+        self.peak_rss = None
+        self.traced_start = None
+        self.traced_end = None
+        self.traced_peak = None
+        self.data_bytes = 0
+        self.duplicated_data = False
+        self.top_allocations = []
+        self._snapshot = None
+
+    @property
+    def allocated_bytes(self) -> int:
+        """The bytes that were allocated during the stage and are still in use at its end."""
+        return self.traced_end - self.traced_start
+
+    @property
+    def peak_allocated_bytes(self) -> int:
+        """The maximum of the bytes that were allocated during the stage at any time."""
+        return self.traced_peak - self.traced_start
+
+    @property
+    def transient_bytes(self) -> int:
+        """The bytes that were allocated on top of the memory in use at the end of the stage."""
+        return self.traced_peak - self.traced_end
+
+    @property
+    def copies_of_data(self) -> float:
+        """The peak allocated bytes in multiples of the time series data that was read or written."""
+        return self.peak_allocated_bytes / self.data_bytes if self.data_bytes > 0 else None
+
+    def to_dict(self) -> dict:
+        return {"name": self.name, "rss_start": self.rss_start, "rss_end": self.rss_end, "peak_rss": self.peak_rss,
+                "allocated_bytes": self.allocated_bytes, "peak_allocated_bytes": self.peak_allocated_bytes,
+                "transient_bytes": self.transient_bytes, "data_bytes": self.data_bytes,
+                "duplicated_data": self.duplicated_data, "top_allocations": list(self.top_allocations)}
+
+    def __repr__(self):
+        flag = ", duplicated data" if self.duplicated_data else ""
+        return (f"MemoryStage({self.name!r}, peak allocated {self.peak_allocated_bytes / 2 ** 20:.1f} MiB, "
+                f"transient {self.transient_bytes / 2 ** 20:.1f} MiB, peak RSS "
+                f"{(self.peak_rss or 0) / 2 ** 20:.1f} MiB{flag})")
+
+
+class MemoryTrace(Trace):
+    """
+    A trace that, in addition to the timing of all spans, measures the memory usage around the spans of the
+    tracked stages. It is created by `track_memory`.
+
+    As the peak memory is a property of the process, it is reset at the start of every stage and propagated
+    to all enclosing stages that are still open. The measurements of stages that run concurrently in several
+    threads therefore include the allocations of each other.
+    """
+
+    def __init__(self, callback=None, stages: tuple = DEFAULT_STAGES, snapshots: bool = True,
+                 top_allocations: int = 10, copy_fraction: float = 0.9):
+        """
+        Parameters
+        ----------
+        callback: callable
+            If given, it is called with every finished `MemoryStage`.
+        stages: tuple
+            The names of the spans to measure. A name that starts with a dot matches all spans ending with it.
+        snapshots: bool
+            If True, a `tracemalloc` snapshot is taken at the start and the end of every stage and the source
+            lines with the largest growth are stored in `MemoryStage.top_allocations`.
+        top_allocations: int
+            The number of source lines to store per stage.
+        copy_fraction: float
+            The fraction of the time series data that a stage must have allocated in addition to one copy of
+            the data to be flagged as having duplicated the array.
+        """
+        super(MemoryTrace, self).__init__()
+        self.stage_callback = callback
+        self.stages = tuple(stages)
+        self.snapshots = snapshots
+        self.top_allocations = top_allocations
+        self.copy_fraction = copy_fraction
+        self.memory_stages = []
+        self._open_stages = dict()
+        self._memory_lock = threading.RLock()
+
+    def _is_tracked(self, name: str) -> bool:
+        return any(name.endswith(stage) if stage.startswith(".") else name == stage for stage in self.stages)
+
+    def _update_open_peaks(self):
+        """
+        Stores the peak memory since the last reset in all open stages and resets the peaks.
+        """
+        traced_peak = tracemalloc.get_traced_memory()[1]
+        peak_rss = get_memory_usage()[1]
+        for stage in self._open_stages.values():
+            stage.traced_peak = max(stage.traced_peak, traced_peak)
+            if peak_rss is not None:
+                stage.peak_rss = max(stage.peak_rss or 0, peak_rss)
+        # tracemalloc.reset_peak is only available from Python 3.9 on
+        if hasattr(tracemalloc, "reset_peak"):
+            tracemalloc.reset_peak()
+        reset_peak_rss()
+
+    def start_span(self, started_span: Span):
+        if not self._is_tracked(started_span.name):
+            return
+        stage = MemoryStage(started_span.name, started_span.attributes)
+        with self._memory_lock:
+            self._update_open_peaks()
+            if self.snapshots:
+                stage._snapshot = tracemalloc.take_snapshot()
+            stage.rss_start = get_memory_usage()[0]
+            stage.traced_start = stage.traced_peak = tracemalloc.get_traced_memory()[0]
+            self._open_stages[id(started_span)] = stage
+
+    def add_to_totals(self, name: str, value: int):
+        super(MemoryTrace, self).add_to_totals(name, value)
+        if name == BYTES_READ or name == BYTES_WRITTEN:
+            with self._memory_lock:
+                for stage in self._open_stages.values():
+                    stage.data_bytes += value
+
+    def add_span(self, finished_span: Span):
+        with self._memory_lock:
+            stage = self._open_stages.get(id(finished_span))
+            if stage is not None:
+                stage.traced_end = tracemalloc.get_traced_memory()[0]
+                stage.rss_end = get_memory_usage()[0]
+                self._update_open_peaks()
+                del self._open_stages[id(finished_span)]
+                if stage._snapshot is not None:
+                    statistics = tracemalloc.take_snapshot().compare_to(stage._snapshot, "lineno")
+                    stage.top_allocations = [
+                        {"location": f"{statistic.traceback[0].filename}:{statistic.traceback[0].lineno}",
+                         "size_diff": statistic.size_diff, "count_diff": statistic.count_diff}
+                        for statistic in statistics[:self.top_allocations]]
+                    stage._snapshot = None
+                stage.duplicated_data = stage.data_bytes > 0 and \
+                    stage.peak_allocated_bytes >= (1 + self.copy_fraction) * stage.data_bytes
+                finished_span.set(peak_rss_bytes=stage.peak_rss, peak_allocated_bytes=stage.peak_allocated_bytes,
+                                  transient_bytes=stage.transient_bytes, duplicated_data=stage.duplicated_data)
+                self.memory_stages.append(stage)
+        super(MemoryTrace, self).add_span(finished_span)
+        if stage is not None and self.stage_callback is not None:
+            self.stage_callback(stage)
+
+    @property
+    def duplicated_data_stages(self) -> list:
+        """The stages that created and dropped a full copy of the time series data."""
+        return [stage for stage in self.memory_stages if stage.duplicated_data]
+
+    def report(self) -> str:
+        """
+        Returns a text report with one line per measured stage.
+        """
+        return "\n".join(repr(stage) for stage in self.memory_stages)
+
+
+@contextmanager
+def track_memory(callback=None, stages: tuple = DEFAULT_STAGES, snapshots: bool = True,
+                 top_allocations: int = 10, copy_fraction: float = 0.9, frames: int = 1):
+    """
+    Measures the memory usage of the stages of a pipeline, e.g. to find out which stage of a conversion runs
+    out of memory::
+
+        with pf.profile.track_memory() as memory_trace:
+            pa_data = MyAdapter("raw_data.bin").generate_pa_data()
+            pf.write_data("converted.hdf5", pa_data)
+        print(memory_trace.report())
+        print(memory_trace.duplicated_data_stages)
+
+    For every call of `load_data`, `write_data` and the `__init__` and `generate_binary_data` of all adapters,
+    the peak RSS and the allocations traced by `tracemalloc` are recorded, and stages that temporarily
+    duplicated the time series data, e.g. with a chain of reshape, astype and swapaxes calls, are flagged.
+    All other instrumented spans are recorded as with `tracing`. Tracing the allocations slows down
+    allocation-heavy code, so this mode should only be switched on for diagnosis. Before Python 3.9, the traced
+    peak cannot be reset, so the peak of a stage is the highest traced memory since the tracking started and
+    the duplicated data detection may report false positives.
+
+    Parameters
+    ----------
+    callback: callable
+        If given, it is called with every finished `MemoryStage`.
+    stages: tuple
+        The names of the spans to measure. A name that starts with a dot matches all spans ending with it.
+    snapshots: bool
+        If True, `tracemalloc` snapshots are taken around every stage to find the source lines that allocated
+        the most memory.
+    top_allocations: int
+        The number of source lines to store per stage.
+    copy_fraction: float
+        The fraction of the time series data that a stage must have allocated in addition to one copy of the
+        data to be flagged as having duplicated the array.
+    frames: int
+        The number of frames that `tracemalloc` stores per allocation, if it is not already tracing.
+
+    Return
+    ------
+    MemoryTrace
+        The trace with the measured `memory_stages`.
+    """
+    trace = MemoryTrace(callback, stages, snapshots, top_allocations, copy_fraction)
+    started_tracing = not tracemalloc.is_tracing()
+    if started_tracing:
+        tracemalloc.start(frames)
+    try:
+        with _activate(trace):
+            yield trace
+    finally:
+        if started_tracing:
+            tracemalloc.stop()
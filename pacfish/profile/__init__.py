@@ -0,0 +1,9 @@
+"""
+The purpose of the profile package is to find out where the time and memory of the data handling is spent.
+The instrumentation is switched off by default and can be switched on with `pacfish.profile.tracing`.
+"""
+
+from pacfish.profile.Instrumentation import Span, Trace, span, count, traced, tracing, enable, disable, \
+    is_enabled, BYTES_READ, BYTES_WRITTEN, HDF5_OBJECTS_VISITED, HDF5_OBJECTS_WRITTEN, CACHE_HITS, CACHE_MISSES, \
+    ELEMENTS_VALIDATED
+from pacfish.profile.MemoryTracking import MemoryStage, MemoryTrace, track_memory, get_memory_usage
@@ -6,6 +6,7 @@
 from pacfish import MetadataAcquisitionTags
 from pacfish import MetadataDeviceTags
 from pacfish import MetaDatum
+from pacfish import profile
 
 
 class CompletenessChecker:
@@ -36,6 +37,7 @@ class CompletenessChecker:
         self.verbose = verbose
         self.log_file_path = log_file_path
 
+    @profile.traced("CompletenessChecker.check_acquisition_meta_data")
     def check_acquisition_meta_data(self, meta_data_dictionary: dict) -> bool:
         """
         This function will evaluate the completeness of the given acquisition metadata.
@@ -100,6 +102,7 @@ class CompletenessChecker:
 
         return incompletenes_count == 0
 
+    @profile.traced("CompletenessChecker.check_device_meta_data")
     def check_device_meta_data(self, device_meta_data: dict):
         """
         This function will evaluate the completeness of the given device metadata.
@@ -231,6 +234,7 @@ class CompletenessChecker:
             A tuple with the log string and an integer that is 0 if everything was fine and
             1 if there was an error.
         """
+        profile.count(profile.ELEMENTS_VALIDATED)
         log_string = ""
         count = 0
         if metadatum.tag not in dictionary:
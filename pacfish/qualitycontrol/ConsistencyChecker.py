@@ -5,7 +5,7 @@
 
 import numpy as np
 import numbers
-from pacfish import MetadataAcquisitionTags, MetadataDeviceTags
+from pacfish import MetadataAcquisitionTags, MetadataDeviceTags, profile
 
 
 class ConsistencyChecker:
@@ -30,6 +30,7 @@ class ConsistencyChecker:
         self.verbose = verbose
         self.log_file_path = log_file_path
 
+    @profile.traced("ConsistencyChecker.check_binary_data")
     def check_binary_data(self, binary_data) -> bool:
         """
         This method unit_tests if the given binary data has the correct data type and
@@ -44,11 +45,13 @@ class ConsistencyChecker:
         if not isinstance(binary_data, np.ndarray):
             is_consistent = False
 
+        profile.count(profile.ELEMENTS_VALIDATED, np.size(binary_data))
         for number in np.reshape(binary_data, (-1, )):
             if not isinstance(number, numbers.Number):
                 is_consistent = False
         return is_consistent
 
+    @profile.traced("ConsistencyChecker.check_acquisition_meta_data")
     def check_acquisition_meta_data(self, acquisition_meta_data: dict) -> bool:
         """
         Tests the given dictionary with acquisition metadata for consistency.
@@ -84,6 +87,7 @@ class ConsistencyChecker:
         for metadatum in MetadataAcquisitionTags.TAGS:
             if metadatum.tag in acquisition_meta_data:
                 value = acquisition_meta_data[metadatum.tag]
+                profile.count(profile.ELEMENTS_VALIDATED)
                 result = metadatum.evaluate_value_range(value)
                 if result is False:
                     is_consistent = False
@@ -105,6 +109,7 @@ class ConsistencyChecker:
 
         return is_consistent
 
+    @profile.traced("ConsistencyChecker.check_device_meta_data")
     def check_device_meta_data(self, device_meta_data: dict) -> bool:
         """
         Tests the given dictionary with device metadata for consistency.
@@ -141,6 +146,7 @@ class ConsistencyChecker:
         else:
             for metadatum in general_tags:
                 if metadatum.tag in device_meta_data[MetadataDeviceTags.GENERAL.tag]:
+                    profile.count(profile.ELEMENTS_VALIDATED)
                     try:
                         result = metadatum.evaluate_value_range(
                             device_meta_data[MetadataDeviceTags.GENERAL.tag][metadatum.tag])
@@ -163,6 +169,7 @@ class ConsistencyChecker:
             for metadatum in detection_tags:
                 for detector_dict in device_meta_data[MetadataDeviceTags.DETECTORS.tag]:
                     if metadatum.tag in device_meta_data[MetadataDeviceTags.DETECTORS.tag][detector_dict]:
+                        profile.count(profile.ELEMENTS_VALIDATED)
                         result = metadatum.evaluate_value_range(
                             device_meta_data[MetadataDeviceTags.DETECTORS.tag][detector_dict][metadatum.tag])
                         if result is False:
@@ -184,6 +191,7 @@ class ConsistencyChecker:
             for metadatum in illumination_tags:
                 for illumination_dict in device_meta_data[MetadataDeviceTags.ILLUMINATORS.tag]:
                     if metadatum.tag in device_meta_data[MetadataDeviceTags.ILLUMINATORS.tag][illumination_dict]:
+                        profile.count(profile.ELEMENTS_VALIDATED)
                         result = metadatum.evaluate_value_range(
                             device_meta_data[MetadataDeviceTags.ILLUMINATORS.tag][illumination_dict][metadatum.tag])
                         if result is False:
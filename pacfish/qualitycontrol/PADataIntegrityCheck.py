@@ -3,10 +3,11 @@
 # SPDX-FileCopyrightText: 2021 Lina Hacker
 # SPDX-License-Identifier: BSD 3-Clause License
 
-from pacfish import PAData
+from pacfish import PAData, profile
 from pacfish.qualitycontrol import CompletenessChecker, ConsistencyChecker
 
 
+@profile.traced("quality_check_pa_data")
 def quality_check_pa_data(pa_data: PAData, verbose: bool = False, log_file_path: str = None) -> bool:
     """
     This is a convenience method that instantiates both a completeness and a consistency checker
@@ -0,0 +1,122 @@
+# SPDX-FileCopyrightText: 2026 International Photoacoustics Standardisation Consortium (IPASC)
+# SPDX-License-Identifier: BSD 3-Clause License
+
+from concurrent.futures import ThreadPoolExecutor
+
+import numpy as np
+from pacfish import PAData
+from pacfish.iohandler.lazy_data import iterate_measurement_chunks
+from pacfish.reconstruction.ReconstructionGrid import ReconstructionGrid
+from pacfish.reconstruction.DelayAndSum import compute_sample_positions, get_speed_of_sound, sum_delayed_signals, \
+    SAMPLE_OFFSET_TAG
+from pacfish.reconstruction.SpatialPoses import get_posed_detector_positions
+
+
+class CompoundingReconstruction:
+    """
+    A delay-and-sum reconstruction for freehand and tomographic scans, which compounds all measurements into
+    one shared volume in the reference coordinate system of the first measurement.
+
+    The `measurement_spatial_poses` are applied to the detector positions of all measurements at once with
+    `get_posed_detector_positions`. The measurements are then streamed in chunks of `measurements_per_chunk`
+    and accumulated into the volume, so only one chunk of time series data is held in memory. Lazily loaded
+    data is therefore never read completely::
+
+        compounding = CompoundingReconstruction(spacing=0.0001, field_of_view=[-0.02, 0.02, 0, 0, 0, 0.03])
+        volume = compounding.reconstruct(pf.load_data("freehand_scan.hdf5", lazy=True))
+
+    The returned volume has the shape [x1, x2, x3, wavelengths] and holds the mean over all measurements.
+    """
+
+    def __init__(self, spacing: float, field_of_view: np.ndarray = None, tile_size: int = 4096,
+                 workers: int = None, speed_of_sound: float = None, measurements_per_chunk: int = 1):
+        """
+        Parameters
+        ----------
+        spacing: float
+            The voxel spacing of the reconstruction grid in meters.
+        field_of_view: np.ndarray
+            The field of view of the compounded volume in the reference coordinate system. If None, the field of
+            view of the device metadata is used.
+        tile_size: int
+            The number of voxels that are reconstructed at once by a worker.
+        workers: int
+            The number of threads. If None, the default of `concurrent.futures.ThreadPoolExecutor` is used.
+        speed_of_sound: float
+            Overrides the speed of sound given in the acquisition metadata.
+        measurements_per_chunk: int
+            The number of measurements that are read and accumulated at once.
+        """
+        self.spacing = spacing
+        self.field_of_view = field_of_view
+        self.tile_size = tile_size
+        self.workers = workers
+        self.speed_of_sound = speed_of_sound
+        self.measurements_per_chunk = measurements_per_chunk
+
+    def reconstruct(self, pa_data: PAData, volume: np.ndarray = None) -> np.ndarray:
+        """
+        Compounds all measurements of the given PAData instance into one volume.
+
+        Parameters
+        ----------
+        pa_data: PAData
+            The PAData instance with four-dimensional time series data. The data can be lazily loaded.
+        volume: np.ndarray
+            An optional array with the shape [x1, x2, x3, wavelengths] to which the sum over all measurements is
+            added instead of returning the mean. This allows to compound several acquisitions into one volume.
+
+        Raises
+        ------
+        ValueError:
+            if the sampling rate is missing, the number of spatial poses does not match the number of
+            measurements or the given volume does not match the grid.
+
+        Return
+        ------
+        np.ndarray
+            The compounded volume with the shape [x1, x2, x3, wavelengths].
+        """
+        field_of_view = self.field_of_view if self.field_of_view is not None else pa_data.get_field_of_view()
+        sampling_rate = pa_data.get_sampling_rate()
+        if sampling_rate is None:
+            raise ValueError("The sampling rate must be given in the acquisition metadata.")
+        speed_of_sound = self.speed_of_sound if self.speed_of_sound is not None else get_speed_of_sound(pa_data)
+        sample_offset = pa_data.get_custom_meta_datum(SAMPLE_OFFSET_TAG) or 0
+        posed_detector_positions = get_posed_detector_positions(pa_data)
+        num_measurements = len(posed_detector_positions)
+
+        grid = ReconstructionGrid(field_of_view, self.spacing)
+        shape = tuple(pa_data.binary_time_series_data.shape)
+        num_wavelengths = shape[2] if len(shape) > 2 else 1
+        dtype = np.result_type(pa_data.binary_time_series_data.dtype, np.float32)
+        accumulate_only = volume is not None
+        if volume is None:
+            volume = np.zeros(grid.shape + (num_wavelengths, ), dtype=dtype)
+        elif volume.shape != grid.shape + (num_wavelengths, ) or not volume.flags.c_contiguous:
+            raise ValueError(f"The volume must be a C-contiguous array with the shape "
+                             f"{grid.shape + (num_wavelengths, )}, but had the shape {volume.shape}.")
+        flat_volume = np.reshape(volume, (grid.num_voxels, num_wavelengths))
+
+        with ThreadPoolExecutor(max_workers=self.workers) as executor:
+            for start, stop, chunk in iterate_measurement_chunks(pa_data.binary_time_series_data,
+                                                                 self.measurements_per_chunk):
+                chunk = np.asarray(chunk, dtype=dtype)
+                for measurement in range(start, stop):
+                    signals = chunk[..., measurement - start]
+                    detector_positions = posed_detector_positions[measurement]
+
+                    # every tile only writes its own voxels, so the tiles can be accumulated concurrently
+                    def accumulate_tile(tile_start):
+                        tile_stop = min(tile_start + self.tile_size, grid.num_voxels)
+                        sample_positions = compute_sample_positions(detector_positions,
+                                                                    grid.get_voxel_positions(tile_start, tile_stop),
+                                                                    speed_of_sound, sampling_rate)
+                        sample_positions -= sample_offset
+                        flat_volume[tile_start:tile_stop] += sum_delayed_signals(signals, sample_positions)
+
+                    list(executor.map(accumulate_tile, range(0, grid.num_voxels, self.tile_size)))
+
+        if not accumulate_only:
+            volume /= num_measurements
+        return volume
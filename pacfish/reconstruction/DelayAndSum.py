@@ -0,0 +1,204 @@
+# SPDX-FileCopyrightText: 2026 International Photoacoustics Standardisation Consortium (IPASC)
+# SPDX-License-Identifier: BSD 3-Clause License
+
+from concurrent.futures import ThreadPoolExecutor
+
+import numpy as np
+from pacfish import PAData
+from pacfish.reconstruction.ReconstructionGrid import ReconstructionGrid
+
+# Custom acquisition metadata with the index of the first sample of gated time series data.
+SAMPLE_OFFSET_TAG = "gated_sample_offset"
+
+
+def as_four_dimensional(binary_time_series_data: np.ndarray) -> np.ndarray:
+    """
+    Returns a view of the time series data with the IPASC shape [detectors, samples, wavelengths, measurements].
+    Missing trailing dimensions are added as singleton dimensions.
+    """
+    shape = np.shape(binary_time_series_data)
+    if len(shape) > 4:
+        raise ValueError(f"The time series data must have at most four dimensions, but had the shape {shape}.")
+    return np.reshape(binary_time_series_data, shape + (1, ) * (4 - len(shape)))
+
+
+def get_speed_of_sound(pa_data: PAData) -> float:
+    """
+    Returns the global speed of sound of the given PAData instance as a float.
+
+    Raises
+    ------
+    ValueError:
+        if the speed of sound is missing or given as a heterogeneous map.
+    """
+    speed_of_sound = pa_data.get_speed_of_sound()
+    if speed_of_sound is None:
+        raise ValueError("The speed of sound must be given in the acquisition metadata.")
+    if np.size(speed_of_sound) != 1:
+        raise ValueError("Only a single global speed of sound value is supported.")
+    return float(np.reshape(speed_of_sound, (-1, ))[0])
+
+
+def compute_sample_positions(detector_positions: np.ndarray, voxel_positions: np.ndarray,
+                             speed_of_sound: float, sampling_rate: float) -> np.ndarray:
+    """
+    Computes the time of flight from every voxel to every detector in units of time series samples.
+
+    Parameters
+    ----------
+    detector_positions: np.ndarray
+        A (num_detectors, 3) array with the detector positions in meters.
+    voxel_positions: np.ndarray
+        A (num_voxels, 3) array with the voxel positions in meters.
+    speed_of_sound: float
+        The speed of sound in m/s.
+    sampling_rate: float
+        The sampling rate of the time series data in Hz.
+
+    Return
+    ------
+    np.ndarray
+        A (num_detectors, num_voxels) array with fractional sample indices.
+    """
+    # |d - v|^2 = |d|^2 + |v|^2 - 2 d.v turns the pairwise distances into a single matrix product
+    squared_distances = detector_positions @ voxel_positions.T
+    squared_distances *= -2
+    squared_distances += np.einsum("di,di->d", detector_positions, detector_positions)[:, np.newaxis]
+    squared_distances += np.einsum("vi,vi->v", voxel_positions, voxel_positions)[np.newaxis, :]
+    np.maximum(squared_distances, 0, out=squared_distances)
+    distances = np.sqrt(squared_distances, out=squared_distances)
+    distances *= sampling_rate / speed_of_sound
+    return distances
+
+
+def sum_delayed_signals(signals: np.ndarray, sample_positions: np.ndarray) -> np.ndarray:
+    """
+    Sums the linearly interpolated signal values of all detectors at the given fractional sample positions.
+
+    Parameters
+    ----------
+    signals: np.ndarray
+        A (num_detectors, num_samples, num_channels) array with the time series data.
+    sample_positions: np.ndarray
+        A (num_detectors, num_voxels) array with fractional sample indices.
+
+    Return
+    ------
+    np.ndarray
+        A (num_voxels, num_channels) array with the delay-and-sum values.
+    """
+    num_detectors, num_samples, num_channels = signals.shape
+    lower = sample_positions.astype(np.intp)
+    upper_weight = sample_positions - lower
+    valid = (sample_positions >= 0) & (lower < num_samples - 1)
+    lower_weight = np.where(valid, 1 - upper_weight, 0)
+    upper_weight[~valid] = 0
+
+    # index into the flattened detector and sample axes, so that a single gather suffices per neighbour
+    lower[~valid] = 0
+    lower += (np.arange(num_detectors) * num_samples)[:, np.newaxis]
+    flat_signals = np.reshape(signals, (num_detectors * num_samples, num_channels))
+    result = np.einsum("dv,dvc->vc", lower_weight, flat_signals[lower])
+    lower += 1
+    result += np.einsum("dv,dvc->vc", upper_weight, flat_signals[lower])
+    return result
+
+
+class DelayAndSum:
+    """
+    A reference delay-and-sum reconstruction that only relies on the metadata stored in a PAData instance:
+    the detector positions, the speed of sound, the sampling rate and the field of view.
+
+    The reconstruction is vectorised over detectors and voxels. The voxels are processed in tiles of
+    `tile_size` voxels, which bounds the memory needed for the intermediate arrays to approximately
+    `num_detectors * tile_size * num_wavelengths * num_measurements * 8` bytes per worker. The tiles are
+    distributed over a thread pool::
+
+        das = DelayAndSum(spacing=0.0001, workers=4)
+        image = das.reconstruct(pa_data)
+
+    The returned image has the shape [x1, x2, x3, wavelengths, measurements]. Time series data that was loaded
+    with `load_gated_data` starts at the recorded `gated_sample_offset`, which is taken into account.
+
+    If a `DelayTableCache` is given, the delays for a device geometry are computed once and reused for all
+    subsequent reconstructions with the same detector positions, grid, speed of sound and sampling rate.
+    Tables that the cache can neither hold in memory nor store on disk are computed on the fly instead.
+    """
+
+    def __init__(self, spacing: float, tile_size: int = 4096, workers: int = None, speed_of_sound: float = None,
+                 delay_table_cache=None):
+        """
+        Parameters
+        ----------
+        spacing: float
+            The voxel spacing of the reconstruction grid in meters.
+        tile_size: int
+            The number of voxels that are reconstructed at once by a worker.
+        workers: int
+            The number of threads. If None, the default of `concurrent.futures.ThreadPoolExecutor` is used.
+        speed_of_sound: float
+            Overrides the speed of sound given in the acquisition metadata.
+        delay_table_cache: DelayTableCache
+            An optional cache for the detector-to-voxel delay tables.
+        """
+        self.spacing = spacing
+        self.tile_size = tile_size
+        self.workers = workers
+        self.speed_of_sound = speed_of_sound
+        self.delay_table_cache = delay_table_cache
+
+    def reconstruct(self, pa_data: PAData, field_of_view: np.ndarray = None) -> np.ndarray:
+        """
+        Reconstructs all wavelengths and measurements of the given PAData instance.
+
+        Parameters
+        ----------
+        pa_data: PAData
+            The PAData instance to reconstruct.
+        field_of_view: np.ndarray
+            Overrides the field of view given in the device metadata.
+
+        Return
+        ------
+        np.ndarray
+            The reconstructed image with the shape [x1, x2, x3, wavelengths, measurements].
+        """
+        if field_of_view is None:
+            field_of_view = pa_data.get_field_of_view()
+        sampling_rate = pa_data.get_sampling_rate()
+        if sampling_rate is None:
+            raise ValueError("The sampling rate must be given in the acquisition metadata.")
+        speed_of_sound = self.speed_of_sound if self.speed_of_sound is not None else get_speed_of_sound(pa_data)
+        detector_positions = np.atleast_2d(pa_data.get_detector_position())
+        sample_offset = pa_data.get_custom_meta_datum(SAMPLE_OFFSET_TAG) or 0
+
+        time_series = as_four_dimensional(pa_data.binary_time_series_data)
+        num_detectors, num_samples, num_wavelengths, num_measurements = time_series.shape
+        signals = np.reshape(time_series, (num_detectors, num_samples, num_wavelengths * num_measurements))
+        if signals.dtype.kind != "f":
+            signals = signals.astype(np.float64)
+
+        grid = ReconstructionGrid(field_of_view, self.spacing)
+        image = np.zeros((grid.num_voxels, num_wavelengths * num_measurements), dtype=signals.dtype)
+        delay_table = None
+        if self.delay_table_cache is not None:
+            delay_table = self.delay_table_cache.get_delay_table(detector_positions, grid, speed_of_sound,
+                                                                 sampling_rate)
+
+        def reconstruct_tile(start):
+            stop = min(start + self.tile_size, grid.num_voxels)
+            if delay_table is not None:
+                sample_positions = delay_table[:, start:stop]
+                if sample_offset:
+                    sample_positions = sample_positions - sample_offset
+            else:
+                sample_positions = compute_sample_positions(detector_positions,
+                                                            grid.get_voxel_positions(start, stop),
+                                                            speed_of_sound, sampling_rate)
+                sample_positions -= sample_offset
+            image[start:stop] = sum_delayed_signals(signals, sample_positions)
+
+        with ThreadPoolExecutor(max_workers=self.workers) as executor:
+            list(executor.map(reconstruct_tile, range(0, grid.num_voxels, self.tile_size)))
+
+        return np.reshape(image, grid.shape + (num_wavelengths, num_measurements))
@@ -0,0 +1,199 @@
+# SPDX-FileCopyrightText: 2026 International Photoacoustics Standardisation Consortium (IPASC)
+# SPDX-License-Identifier: BSD 3-Clause License
+
+import hashlib
+import os
+import threading
+from collections import OrderedDict
+
+import numpy as np
+from pacfish.reconstruction.ReconstructionGrid import ReconstructionGrid
+from pacfish.reconstruction.DelayAndSum import compute_sample_positions
+
+
+class DelayTableCache:
+    """
+    Caches detector-to-voxel delay tables, which only depend on the detector positions, the reconstruction
+    grid, the speed of sound and the sampling rate. Repeated reconstructions of acquisitions from the same
+    device can then skip the geometry computations entirely::
+
+        cache = DelayTableCache(cache_directory="delay_tables")
+        das = DelayAndSum(spacing=0.0001, delay_table_cache=cache)
+
+    The tables are stored as float32 sample positions with the shape (num_detectors, num_voxels). They are kept
+    in an in-memory LRU cache and, if a cache directory is given, as `.npy` files that are memory-mapped when
+    they are loaded again. Both tiers evict their least recently used tables once their size limit is exceeded.
+
+    The size of a table is predicted before it is computed. Tables larger than `max_memory_bytes` are written
+    tile by tile straight into a memory-mapped file in the cache directory, so they are never held in memory in
+    full. If they do not fit on disk either, no table is returned and the delays are computed on the fly.
+    """
+
+    def __init__(self, cache_directory: str = None, max_memory_bytes: int = 2 ** 30, max_disk_bytes: int = 2 ** 34,
+                 tile_size: int = 4096):
+        """
+        Parameters
+        ----------
+        cache_directory: str
+            A directory to store the delay tables in. If None, the tables are only cached in memory.
+        max_memory_bytes: int
+            The maximum total size of the tables that are kept in memory.
+        max_disk_bytes: int
+            The maximum total size of the table files in the cache directory.
+        tile_size: int
+            The number of voxels for which the delays are computed at once when a table is created.
+        """
+        self.cache_directory = cache_directory
+        self.max_memory_bytes = max_memory_bytes
+        self.max_disk_bytes = max_disk_bytes
+        self.tile_size = tile_size
+        self.hits = 0
+        self.misses = 0
+        self._tables = OrderedDict()
+        self._memory_bytes = 0
+        self._lock = threading.Lock()
+        if cache_directory is not None:
+            os.makedirs(cache_directory, exist_ok=True)
+
+    @staticmethod
+    def get_key(detector_positions: np.ndarray, grid: ReconstructionGrid, speed_of_sound: float,
+                sampling_rate: float) -> str:
+        """
+        Return
+        ------
+        str
+            A hash that uniquely identifies the delay table for the given geometry.
+        """
+        digest = hashlib.sha256()
+        digest.update(np.ascontiguousarray(detector_positions, dtype=np.float64).tobytes())
+        digest.update(np.ascontiguousarray(grid.field_of_view, dtype=np.float64).tobytes())
+        digest.update(np.asarray([grid.spacing, speed_of_sound, sampling_rate], dtype=np.float64).tobytes())
+        return digest.hexdigest()
+
+    def get_delay_table(self, detector_positions: np.ndarray, grid: ReconstructionGrid, speed_of_sound: float,
+                        sampling_rate: float) -> np.ndarray:
+        """
+        Returns the delay table for the given geometry. It is loaded from the cache if possible
+        and computed and added to the cache otherwise.
+
+        Return
+        ------
+        np.ndarray
+            A (num_detectors, num_voxels) float32 array with fractional sample indices, which is memory-mapped
+            if it exceeds `max_memory_bytes`. None if the table exceeds `max_memory_bytes` and cannot be stored
+            in the cache directory.
+        """
+        key = self.get_key(detector_positions, grid, speed_of_sound, sampling_rate)
+
+        with self._lock:
+            if key in self._tables:
+                self._tables.move_to_end(key)
+                self.hits += 1
+                return self._tables[key]
+
+        table = self._load_from_disk(key)
+        if table is not None:
+            with self._lock:
+                self.hits += 1
+        else:
+            with self._lock:
+                self.misses += 1
+            table_bytes = np.dtype(np.float32).itemsize * len(detector_positions) * grid.num_voxels
+            if table_bytes <= self.max_memory_bytes:
+                table = self.compute_delay_table(detector_positions, grid, speed_of_sound, sampling_rate)
+                self._save_to_disk(key, table)
+            elif self.cache_directory is not None and table_bytes <= self.max_disk_bytes:
+                table = self._compute_to_disk(key, detector_positions, grid, speed_of_sound, sampling_rate)
+            else:
+                return None
+
+        self._add_to_memory(key, table)
+        return table
+
+    def compute_delay_table(self, detector_positions: np.ndarray, grid: ReconstructionGrid, speed_of_sound: float,
+                            sampling_rate: float, out: np.ndarray = None) -> np.ndarray:
+        """
+        Computes the delay table tile by tile, so that only the float32 result is held in full.
+
+        Parameters
+        ----------
+        out: np.ndarray
+            An optional (num_detectors, num_voxels) float32 array, e.g. a memory map, to write the table into.
+            If None, the table is allocated in memory.
+        """
+        table = out
+        if table is None:
+            table = np.empty((len(detector_positions), grid.num_voxels), dtype=np.float32)
+        for start in range(0, grid.num_voxels, self.tile_size):
+            stop = min(start + self.tile_size, grid.num_voxels)
+            table[:, start:stop] = compute_sample_positions(detector_positions, grid.get_voxel_positions(start, stop),
+                                                            speed_of_sound, sampling_rate)
+        return table
+
+    def clear(self):
+        """
+        Removes all tables from the in-memory cache. Files in the cache directory are kept.
+        """
+        with self._lock:
+            self._tables.clear()
+            self._memory_bytes = 0
+
+    def _add_to_memory(self, key, table):
+        with self._lock:
+            if key in self._tables or table.nbytes > self.max_memory_bytes:
+                return
+            self._tables[key] = table
+            self._memory_bytes += table.nbytes
+            while self._memory_bytes > self.max_memory_bytes:
+                _, evicted = self._tables.popitem(last=False)
+                self._memory_bytes -= evicted.nbytes
+
+    def _get_file_path(self, key):
+        return os.path.join(self.cache_directory, key + ".npy")
+
+    def _load_from_disk(self, key):
+        if self.cache_directory is None:
+            return None
+        file_path = self._get_file_path(key)
+        if not os.path.exists(file_path):
+            return None
+        # mark the file as recently used for the eviction of the disk cache
+        os.utime(file_path)
+        return np.load(file_path, mmap_mode="r")
+
+    def _get_temporary_file_path(self, key):
+        return self._get_file_path(key) + f".{os.getpid()}.{threading.get_ident()}.tmp"
+
+    def _save_to_disk(self, key, table):
+        if self.cache_directory is None or table.nbytes > self.max_disk_bytes:
+            return
+        temporary_file_path = self._get_temporary_file_path(key)
+        with open(temporary_file_path, "wb") as file_handle:
+            np.save(file_handle, table)
+        os.replace(temporary_file_path, self._get_file_path(key))
+        self._evict_from_disk()
+
+    def _compute_to_disk(self, key, detector_positions, grid, speed_of_sound, sampling_rate):
+        temporary_file_path = self._get_temporary_file_path(key)
+        table = np.lib.format.open_memmap(temporary_file_path, mode="w+", dtype=np.float32,
+                                          shape=(len(detector_positions), grid.num_voxels))
+        self.compute_delay_table(detector_positions, grid, speed_of_sound, sampling_rate, out=table)
+        table.flush()
+        del table
+        file_path = self._get_file_path(key)
+        os.replace(temporary_file_path, file_path)
+        self._evict_from_disk()
+        return np.load(file_path, mmap_mode="r")
+
+    def _evict_from_disk(self):
+        entries = []
+        for file_name in os.listdir(self.cache_directory):
+            if file_name.endswith(".npy"):
+                stat = os.stat(os.path.join(self.cache_directory, file_name))
+                entries.append((stat.st_mtime, stat.st_size, file_name))
+        total_bytes = sum(entry[1] for entry in entries)
+        for _, size, file_name in sorted(entries):
+            if total_bytes <= self.max_disk_bytes:
+                break
+            os.remove(os.path.join(self.cache_directory, file_name))
+            total_bytes -= size
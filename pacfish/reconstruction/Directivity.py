@@ -0,0 +1,96 @@
+# SPDX-FileCopyrightText: 2026 International Photoacoustics Standardisation Consortium (IPASC)
+# SPDX-License-Identifier: BSD 3-Clause License
+
+"""
+The directivity of the detection elements, shared by the forward model and the point absorber simulation.
+
+Conventions:
+
+- The `detector_orientation` is read as a vector in cartesian coordinates that points from the detection element
+  in the direction of its highest sensitivity, i.e. along the normal of its sensitive surface. It is not read as
+  rotation angles in radians, as `PAData.get_detector_orientation` describes it. Devices that store rotation
+  angles must not be used with the directivity enabled.
+- The `angular_response` is the IPASC two-dimensional array [angles, response]. The angles in radians are
+  measured between the orientation and the direction towards the source.
+"""
+
+import numpy as np
+from pacfish import MetadataDeviceTags
+
+
+def get_detector_directivity_parameters(meta_data_device: dict) -> tuple:
+    """
+    Reads the orientation and the angular response of every detector, in the order of the detector ids.
+
+    Raises
+    ------
+    ValueError:
+        if an angular response is not a two-dimensional array [angles, response].
+
+    Return
+    ------
+    tuple
+        A (num_detectors, 3) array with the orientations, where detectors without an orientation have a zero
+        vector, and a list with the angular response of every detector, or None if it has none.
+    """
+    detectors = meta_data_device[MetadataDeviceTags.DETECTORS.tag]
+    orientations = np.zeros((len(detectors), 3), dtype=np.float64)
+    angular_responses = []
+    for index, (detector_id, detector) in enumerate(detectors.items()):
+        orientation = detector.get(MetadataDeviceTags.DETECTOR_ORIENTATION.tag)
+        if orientation is not None:
+            orientations[index] = np.reshape(np.asarray(orientation, dtype=np.float64), (3, ))
+        angular_response = detector.get(MetadataDeviceTags.ANGULAR_RESPONSE.tag)
+        if angular_response is not None:
+            angular_response = np.asarray(angular_response, dtype=np.float64)
+            if angular_response.ndim != 2 or len(angular_response) != 2:
+                raise ValueError(f"The angular response of the detector {detector_id} must be an array "
+                                 f"[angles, response], but had the shape {angular_response.shape}.")
+            angular_response = angular_response[:, np.argsort(angular_response[0])]
+        angular_responses.append(angular_response)
+    return orientations, angular_responses
+
+
+def compute_directivity(detector_orientations: np.ndarray, angular_responses: list,
+                        directions: np.ndarray) -> np.ndarray:
+    """
+    Evaluates the angular response of every detector for the incident directions of the sources.
+
+    The incident angle is the angle between the detector orientation, the direction of highest sensitivity, and
+    the direction from the detector towards the source. The angular response [angles, response] is interpolated
+    linearly and is zero beyond the largest tabulated angle.
+
+    Parameters
+    ----------
+    detector_orientations: np.ndarray
+        A (num_detectors, 3) array with the vectors that point in the direction of highest sensitivity of the
+        detectors. Detectors with a zero orientation vector are omnidirectional.
+    angular_responses: list
+        The angular response [angles, response] of every detector with ascending angles, as returned by
+        `get_detector_directivity_parameters`, or None for omnidirectional detectors.
+    directions: np.ndarray
+        A (num_detectors, num_sources, 3) array with the unit vectors from the detectors towards the sources.
+
+    Return
+    ------
+    np.ndarray
+        A (num_detectors, num_sources) array with the directivity factors.
+    """
+    norms = np.linalg.norm(detector_orientations, axis=-1, keepdims=True)
+    orientations = detector_orientations / np.maximum(norms, np.finfo(np.float64).tiny)
+    angles = np.arccos(np.clip(np.einsum("di,dki->dk", orientations, directions), -1, 1))
+    directivity = np.ones_like(angles)
+    for index, angular_response in enumerate(angular_responses):
+        if angular_response is None or norms[index, 0] == 0:
+            continue
+        directivity[index] = np.interp(angles[index], angular_response[0], angular_response[1], right=0)
+    return directivity
+
+
+def has_directivity(detector_orientations: np.ndarray, angular_responses: list) -> bool:
+    """
+    Returns whether at least one detector has both an orientation and an angular response, i.e. whether
+    `compute_directivity` can return anything but ones.
+    """
+    norms = np.linalg.norm(detector_orientations, axis=-1)
+    return any(response is not None and norm > 0 for norm, response in zip(norms, angular_responses))
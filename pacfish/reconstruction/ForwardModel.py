@@ -0,0 +1,303 @@
+# SPDX-FileCopyrightText: 2026 International Photoacoustics Standardisation Consortium (IPASC)
+# SPDX-License-Identifier: BSD 3-Clause License
+
+import hashlib
+import os
+from concurrent.futures import ThreadPoolExecutor
+
+import numpy as np
+import scipy.sparse
+import scipy.sparse.linalg
+from pacfish import PAData
+from pacfish.reconstruction.ReconstructionGrid import ReconstructionGrid
+from pacfish.reconstruction.DelayAndSum import compute_sample_positions, get_speed_of_sound, SAMPLE_OFFSET_TAG
+from pacfish.reconstruction.Directivity import compute_directivity, get_detector_directivity_parameters, \
+    has_directivity
+
+
+def compute_interpolation_weights(detector_positions: np.ndarray, voxel_positions: np.ndarray, speed_of_sound: float,
+                                  sampling_rate: float, num_samples: int, distance_weighting: bool = False,
+                                  sample_offset: int = 0, detector_orientations: np.ndarray = None,
+                                  angular_responses: list = None) -> tuple:
+    """
+    Computes how every voxel contributes to the time series of every detector: a unit point source at a voxel
+    adds to the two samples enclosing its time of flight, linearly interpolated. The time series are assumed to
+    start at the sample `sample_offset`, as for gated data. If the detector orientations and angular responses
+    are given, the contributions are weighted with the directivity of the detectors, see `compute_directivity`.
+
+    Return
+    ------
+    tuple
+        The (num_detectors, num_voxels) arrays of the row indices of the lower samples in the flattened
+        [detectors, samples] time series, of the weights of the lower samples and of the weights of the upper
+        samples. The weights of times of flight outside the recorded samples are zero.
+    """
+    sample_positions = compute_sample_positions(detector_positions, voxel_positions, speed_of_sound, sampling_rate)
+    distances = sample_positions * (speed_of_sound / sampling_rate)
+    sample_positions -= sample_offset
+    lower = sample_positions.astype(np.intp)
+    upper_weight = sample_positions - lower
+    valid = (sample_positions >= 0) & (lower < num_samples - 1)
+    lower_weight = np.where(valid, 1 - upper_weight, 0)
+    upper_weight[~valid] = 0
+    if distance_weighting:
+        # spherical spreading of the pressure wave
+        spreading = 1 / np.maximum(distances, speed_of_sound / sampling_rate)
+        lower_weight *= spreading
+        upper_weight *= spreading
+    if detector_orientations is not None:
+        offsets = voxel_positions[np.newaxis] - detector_positions[:, np.newaxis]
+        directions = offsets / np.maximum(np.linalg.norm(offsets, axis=-1), np.finfo(np.float64).tiny)[..., np.newaxis]
+        directivity = compute_directivity(detector_orientations, angular_responses, directions)
+        lower_weight *= directivity
+        upper_weight *= directivity
+    lower[~valid] = 0
+    lower += (np.arange(len(detector_positions)) * num_samples)[:, np.newaxis]
+    return lower, lower_weight, upper_weight
+
+
+class ForwardModelOperator(scipy.sparse.linalg.LinearOperator):
+    """
+    A matrix-free version of the linear acoustic forward model, which maps an image of initial pressures on the
+    reconstruction grid onto the flattened [detectors, samples] time series. The interpolation weights are
+    recomputed tile by tile of voxels on every application, so the memory needed is bounded by
+    `num_detectors * tile_size` independently of the size of the grid. The adjoint is a delay-and-sum
+    back projection. The operator can be used with the iterative solvers of `scipy.sparse.linalg`::
+
+        operator = ForwardModelOperator(detector_positions, grid, 1540, 40e6, num_samples=2048)
+        image = scipy.sparse.linalg.lsqr(operator, time_series[:, :, 0, 0].reshape(-1), iter_lim=20)[0]
+    """
+
+    def __init__(self, detector_positions: np.ndarray, grid: ReconstructionGrid, speed_of_sound: float,
+                 sampling_rate: float, num_samples: int, distance_weighting: bool = False, tile_size: int = 4096,
+                 sample_offset: int = 0, detector_orientations: np.ndarray = None, angular_responses: list = None):
+        """
+        Parameters
+        ----------
+        detector_positions: np.ndarray
+            A (num_detectors, 3) array with the detector positions in meters.
+        grid: ReconstructionGrid
+            The reconstruction grid.
+        speed_of_sound: float
+            The speed of sound in m/s.
+        sampling_rate: float
+            The sampling rate of the time series data in Hz.
+        num_samples: int
+            The number of samples per detector.
+        distance_weighting: bool
+            If True, the contributions decay with the inverse distance between voxel and detector.
+        tile_size: int
+            The number of voxels for which the weights are computed at once.
+        sample_offset: int
+            The index of the first recorded sample, for gated time series data.
+        detector_orientations: np.ndarray
+            A (num_detectors, 3) array with the vectors that point in the directions of highest sensitivity of
+            the detectors. If given together with the angular responses, the contributions are weighted with
+            the directivity of the detectors.
+        angular_responses: list
+            The angular response [angles, response] of every detector, or None for omnidirectional detectors.
+        """
+        self.detector_positions = np.atleast_2d(detector_positions)
+        self.detector_orientations = detector_orientations
+        self.angular_responses = angular_responses
+        self.grid = grid
+        self.speed_of_sound = speed_of_sound
+        self.sampling_rate = sampling_rate
+        self.num_samples = num_samples
+        self.distance_weighting = distance_weighting
+        self.tile_size = tile_size
+        self.sample_offset = sample_offset
+        super(ForwardModelOperator, self).__init__(
+            dtype=np.float64, shape=(len(self.detector_positions) * num_samples, grid.num_voxels))
+
+    def _tiles(self):
+        for start in range(0, self.grid.num_voxels, self.tile_size):
+            stop = min(start + self.tile_size, self.grid.num_voxels)
+            yield start, stop, compute_interpolation_weights(
+                self.detector_positions, self.grid.get_voxel_positions(start, stop), self.speed_of_sound,
+                self.sampling_rate, self.num_samples, self.distance_weighting, self.sample_offset,
+                self.detector_orientations, self.angular_responses)
+
+    def _matvec(self, image):
+        image = np.reshape(image, (-1, ))
+        time_series = np.zeros(self.shape[0], dtype=np.float64)
+        for start, stop, (lower, lower_weight, upper_weight) in self._tiles():
+            values = image[start:stop][np.newaxis, :]
+            time_series += np.bincount(lower.ravel(), (lower_weight * values).ravel(), minlength=self.shape[0])
+            time_series += np.bincount(lower.ravel() + 1, (upper_weight * values).ravel(), minlength=self.shape[0])
+        return time_series
+
+    def _rmatvec(self, time_series):
+        time_series = np.reshape(time_series, (-1, ))
+        image = np.empty(self.shape[1], dtype=np.float64)
+        for start, stop, (lower, lower_weight, upper_weight) in self._tiles():
+            image[start:stop] = np.einsum("dv,dv->v", lower_weight, time_series[lower])
+            lower += 1
+            image[start:stop] += np.einsum("dv,dv->v", upper_weight, time_series[lower])
+        return image
+
+
+class ForwardModel:
+    """
+    Builds the linear acoustic forward model of a device as a sparse CSR matrix with the shape
+    (num_detectors * num_samples, num_voxels), using the detector positions, the speed of sound and the
+    sampling rate of a PAData instance. Every detector and voxel pair contributes two non-zero entries, so the
+    matrix needs about `24 * num_detectors * num_voxels` bytes.
+
+    The matrix is assembled in blocks of detectors, which are built in parallel, and can be cached to disk::
+
+        forward_model = ForwardModel(spacing=0.0001, cache_directory="forward_models")
+        matrix = forward_model.build(pa_data)
+        image = scipy.sparse.linalg.lsqr(matrix, time_series[:, :, 0, 0].reshape(-1), iter_lim=20)[0]
+
+    For grids that are too large for an explicit matrix, `get_operator` returns the matrix-free
+    `ForwardModelOperator` of the same model.
+
+    By default, the contributions are weighted with the angular responses of the detectors. The
+    `detector_orientation` is then read as a vector that points in the direction of highest sensitivity, not as
+    rotation angles in radians, see `pacfish.reconstruction.Directivity`. For devices that store rotation angles,
+    the directivity must be switched off with `directivity=False`.
+    """
+
+    def __init__(self, spacing: float, speed_of_sound: float = None, distance_weighting: bool = False,
+                 detectors_per_block: int = 16, workers: int = None, tile_size: int = 4096,
+                 cache_directory: str = None, directivity: bool = True):
+        """
+        Parameters
+        ----------
+        spacing: float
+            The voxel spacing of the reconstruction grid in meters.
+        speed_of_sound: float
+            Overrides the speed of sound given in the acquisition metadata.
+        distance_weighting: bool
+            If True, the contributions decay with the inverse distance between voxel and detector.
+        detectors_per_block: int
+            The number of detectors whose rows are built together by one worker.
+        workers: int
+            The number of threads. If None, the default of `concurrent.futures.ThreadPoolExecutor` is used.
+        tile_size: int
+            The number of voxels for which the weights are computed at once.
+        cache_directory: str
+            If given, built matrices are stored in and loaded from this directory.
+        directivity: bool
+            If True, the contributions are weighted with the angular responses of the detectors. The detector
+            orientations are read as vectors that point in the directions of highest sensitivity.
+        """
+        self.spacing = spacing
+        self.speed_of_sound = speed_of_sound
+        self.distance_weighting = distance_weighting
+        self.detectors_per_block = detectors_per_block
+        self.workers = workers
+        self.tile_size = tile_size
+        self.cache_directory = cache_directory
+        self.directivity = directivity
+        if cache_directory is not None:
+            os.makedirs(cache_directory, exist_ok=True)
+
+    def _get_geometry(self, pa_data: PAData, field_of_view: np.ndarray) -> tuple:
+        if field_of_view is None:
+            field_of_view = pa_data.get_field_of_view()
+        sampling_rate = pa_data.get_sampling_rate()
+        if sampling_rate is None:
+            raise ValueError("The sampling rate must be given in the acquisition metadata.")
+        speed_of_sound = self.speed_of_sound if self.speed_of_sound is not None else get_speed_of_sound(pa_data)
+        detector_positions = np.atleast_2d(pa_data.get_detector_position())
+        num_samples = pa_data.binary_time_series_data.shape[1]
+        sample_offset = pa_data.get_custom_meta_datum(SAMPLE_OFFSET_TAG) or 0
+        detector_orientations, angular_responses = None, None
+        if self.directivity:
+            detector_orientations, angular_responses = get_detector_directivity_parameters(pa_data.meta_data_device)
+            if not has_directivity(detector_orientations, angular_responses):
+                detector_orientations, angular_responses = None, None
+        return (detector_positions, detector_orientations, angular_responses,
+                ReconstructionGrid(field_of_view, self.spacing), speed_of_sound, sampling_rate, num_samples,
+                sample_offset)
+
+    def get_operator(self, pa_data: PAData, field_of_view: np.ndarray = None) -> ForwardModelOperator:
+        """
+        Return
+        ------
+        ForwardModelOperator
+            The matrix-free forward model for the given PAData instance.
+        """
+        detector_positions, detector_orientations, angular_responses, grid, speed_of_sound, sampling_rate, \
+            num_samples, sample_offset = self._get_geometry(pa_data, field_of_view)
+        return ForwardModelOperator(detector_positions, grid, speed_of_sound, sampling_rate, num_samples,
+                                    distance_weighting=self.distance_weighting, tile_size=self.tile_size,
+                                    sample_offset=sample_offset, detector_orientations=detector_orientations,
+                                    angular_responses=angular_responses)
+
+    def _get_cache_path(self, detector_positions, detector_orientations, angular_responses, grid, speed_of_sound,
+                        sampling_rate, num_samples, sample_offset) -> str:
+        digest = hashlib.sha256()
+        digest.update(np.ascontiguousarray(detector_positions, dtype=np.float64).tobytes())
+        if detector_orientations is not None:
+            digest.update(np.ascontiguousarray(detector_orientations, dtype=np.float64).tobytes())
+            for angular_response in angular_responses:
+                response = np.asarray([] if angular_response is None else angular_response, dtype=np.float64)
+                digest.update(np.asarray(response.shape, dtype=np.int64).tobytes() + response.tobytes())
+        digest.update(np.ascontiguousarray(grid.field_of_view, dtype=np.float64).tobytes())
+        digest.update(np.asarray([grid.spacing, speed_of_sound, sampling_rate, num_samples, sample_offset,
+                                  self.distance_weighting], dtype=np.float64).tobytes())
+        return os.path.join(self.cache_directory, digest.hexdigest() + ".npz")
+
+    def _build_block(self, detector_positions, detector_orientations, angular_responses, grid, speed_of_sound,
+                     sampling_rate, num_samples, sample_offset):
+        rows, columns, values = [], [], []
+        for start in range(0, grid.num_voxels, self.tile_size):
+            stop = min(start + self.tile_size, grid.num_voxels)
+            lower, lower_weight, upper_weight = compute_interpolation_weights(
+                detector_positions, grid.get_voxel_positions(start, stop), speed_of_sound, sampling_rate,
+                num_samples, self.distance_weighting, sample_offset, detector_orientations, angular_responses)
+            tile_columns = np.broadcast_to(np.arange(start, stop), lower.shape)
+            for row, weight in ((lower, lower_weight), (lower + 1, upper_weight)):
+                nonzero = weight != 0
+                rows.append(row[nonzero])
+                columns.append(tile_columns[nonzero])
+                values.append(weight[nonzero])
+        shape = (len(detector_positions) * num_samples, grid.num_voxels)
+        return scipy.sparse.csr_matrix((np.concatenate(values), (np.concatenate(rows), np.concatenate(columns))),
+                                       shape=shape)
+
+    def build(self, pa_data: PAData, field_of_view: np.ndarray = None) -> scipy.sparse.csr_matrix:
+        """
+        Builds the forward model for the given PAData instance, or loads it from the cache directory.
+
+        Parameters
+        ----------
+        pa_data: PAData
+            The PAData instance that describes the device and the acquisition.
+        field_of_view: np.ndarray
+            Overrides the field of view given in the device metadata.
+
+        Return
+        ------
+        scipy.sparse.csr_matrix
+            The forward model, whose rows correspond to the flattened [detectors, samples] time series.
+        """
+        detector_positions, detector_orientations, angular_responses, *geometry = \
+            self._get_geometry(pa_data, field_of_view)
+
+        cache_path = None
+        if self.cache_directory is not None:
+            cache_path = self._get_cache_path(detector_positions, detector_orientations, angular_responses,
+                                              *geometry)
+            if os.path.exists(cache_path):
+                return scipy.sparse.load_npz(cache_path).tocsr()
+
+        def build_block(start):
+            stop = start + self.detectors_per_block
+            if detector_orientations is None:
+                return self._build_block(detector_positions[start:stop], None, None, *geometry)
+            return self._build_block(detector_positions[start:stop], detector_orientations[start:stop],
+                                     angular_responses[start:stop], *geometry)
+
+        with ThreadPoolExecutor(max_workers=self.workers) as executor:
+            blocks = list(executor.map(build_block, range(0, len(detector_positions), self.detectors_per_block)))
+        matrix = scipy.sparse.vstack(blocks, format="csr")
+
+        if cache_path is not None:
+            temporary_path = cache_path + f".{os.getpid()}.tmp.npz"
+            scipy.sparse.save_npz(temporary_path, matrix)
+            os.replace(temporary_path, cache_path)
+        return matrix
@@ -0,0 +1,168 @@
+# SPDX-FileCopyrightText: 2026 International Photoacoustics Standardisation Consortium (IPASC)
+# SPDX-License-Identifier: BSD 3-Clause License
+
+import numpy as np
+from pacfish import PAData, MetadataAcquisitionTags, MetadataDeviceTags
+from pacfish.iohandler.file_reader import load_data
+from pacfish.reconstruction.DelayAndSum import get_speed_of_sound, SAMPLE_OFFSET_TAG
+
+# Custom acquisition metadata with the indices of the detectors of the original acquisition that were loaded.
+DETECTOR_INDICES_TAG = "gated_detector_indices"
+# Acquisition metadata with one entry per detector and one entry per sample, which are gated with the data.
+PER_DETECTOR_ACQUISITION_TAGS = [MetadataAcquisitionTags.ELEMENT_DEPENDENT_GAIN.tag]
+PER_SAMPLE_ACQUISITION_TAGS = [MetadataAcquisitionTags.TIME_GAIN_COMPENSATION.tag]
+
+
+def compute_acquisition_gate(detector_positions: np.ndarray, field_of_view: np.ndarray, speed_of_sound: float,
+                             sampling_rate: float, num_samples: int, max_distance: float = None,
+                             margin: int = 16) -> tuple:
+    """
+    Computes the detectors and the window of samples that can contribute to an image of the given field of view.
+
+    For every detector, the window reaches from the time of flight of the closest to the time of flight of the
+    farthest point of the field of view. Detectors whose window lies outside the recorded samples, or which are
+    farther than `max_distance` from the field of view, are excluded.
+
+    Parameters
+    ----------
+    detector_positions: np.ndarray
+        A (num_detectors, 3) array with the detector positions in meters.
+    field_of_view: np.ndarray
+        The field of view [x1_start, x1_end, x2_start, x2_end, x3_start, x3_end] in meters.
+    speed_of_sound: float
+        The speed of sound in m/s.
+    sampling_rate: float
+        The sampling rate of the time series data in Hz.
+    num_samples: int
+        The number of recorded samples.
+    max_distance: float
+        If given, only detectors within this distance of the field of view are kept, which limits the aperture.
+    margin: int
+        The number of samples that are added on both sides of the window.
+
+    Return
+    ------
+    tuple
+        The sorted indices of the contributing detectors and the (start, stop) sample window.
+    """
+    bounds = np.sort(np.reshape(np.asarray(field_of_view, dtype=np.float64), (3, 2)), axis=1)
+    detector_positions = np.atleast_2d(detector_positions)
+    closest_points = np.clip(detector_positions, bounds[:, 0], bounds[:, 1])
+    min_distances = np.linalg.norm(closest_points - detector_positions, axis=1)
+    farthest_offsets = np.maximum(np.abs(detector_positions - bounds[:, 0]), np.abs(detector_positions - bounds[:, 1]))
+    max_distances = np.linalg.norm(farthest_offsets, axis=1)
+
+    starts = np.floor(min_distances * sampling_rate / speed_of_sound).astype(np.int64) - margin
+    # one additional sample is needed for the linear interpolation between samples
+    stops = np.ceil(max_distances * sampling_rate / speed_of_sound).astype(np.int64) + margin + 2
+
+    contributing = (starts < num_samples) & (stops > 0)
+    if max_distance is not None:
+        contributing &= min_distances <= max_distance
+    detector_indices = np.flatnonzero(contributing)
+    if len(detector_indices) == 0:
+        return detector_indices, (0, 0)
+    start = int(max(0, np.min(starts[detector_indices])))
+    stop = int(min(num_samples, np.max(stops[detector_indices])))
+    return detector_indices, (start, stop)
+
+
+def _gate_acquisition_arrays(meta_data_acquisition: dict, tags: list, num_entries: int, selection):
+    for tag in tags:
+        value = meta_data_acquisition.get(tag)
+        if value is not None and np.size(value) == num_entries:
+            meta_data_acquisition[tag] = np.reshape(np.asarray(value), (-1, ))[selection]
+
+
+def _select_detectors(meta_data_device: dict, detector_indices: np.ndarray) -> dict:
+    meta_data_device = dict(meta_data_device)
+    detectors = meta_data_device.get(MetadataDeviceTags.DETECTORS.tag, dict())
+    detector_ids = list(detectors.keys())
+    meta_data_device[MetadataDeviceTags.DETECTORS.tag] = {detector_ids[index]: detectors[detector_ids[index]]
+                                                         for index in detector_indices}
+    general = dict(meta_data_device.get(MetadataDeviceTags.GENERAL.tag, dict()))
+    general[MetadataDeviceTags.NUMBER_OF_DETECTION_ELEMENTS.tag] = len(detector_indices)
+    meta_data_device[MetadataDeviceTags.GENERAL.tag] = general
+    return meta_data_device
+
+
+def load_gated_data(file_path: str, field_of_view: np.ndarray = None, speed_of_sound: float = None,
+                    max_distance: float = None, margin: int = 16, device_library: str = None) -> PAData:
+    """
+    Loads only the part of an IPASC file that can contribute to an image of the given field of view.
+
+    The contributing detectors and the sample window are computed with `compute_acquisition_gate` from the
+    device metadata, and only that hyperslab of the time series data is read from disk. The returned PAData
+    only describes the loaded detectors and samples, including the element-dependent gain and the time gain
+    compensation, and the offsets of the loaded hyperslab are recorded in the custom
+    acquisition metadata `gated_sample_offset` and `gated_detector_indices`. `DelayAndSum` takes the sample
+    offset into account, so gated data can be reconstructed directly::
+
+        pa_data = load_gated_data("acquisition.hdf5")
+        image = DelayAndSum(spacing=0.0001).reconstruct(pa_data)
+
+    Parameters
+    ----------
+    file_path: str
+        Path of the IPASC HDF5 file.
+    field_of_view: np.ndarray
+        Overrides the field of view given in the device metadata.
+    speed_of_sound: float
+        Overrides the speed of sound given in the acquisition metadata.
+    max_distance: float
+        If given, only detectors within this distance of the field of view are loaded.
+    margin: int
+        The number of samples that are added on both sides of the sample window.
+    device_library: str
+        Path of a device library file, as described in `load_data`.
+
+    Raises
+    ------
+    ValueError:
+        if the sampling rate or the detector positions are missing, or if no detector contributes to the image.
+
+    Return
+    ------
+    PAData
+        A PAData instance with the gated time series data.
+    """
+    pa_data = load_data(file_path, device_library=device_library, lazy=True)
+    if field_of_view is None:
+        field_of_view = pa_data.get_field_of_view()
+    if speed_of_sound is None:
+        speed_of_sound = get_speed_of_sound(pa_data)
+    sampling_rate = pa_data.get_sampling_rate()
+    if sampling_rate is None:
+        raise ValueError("The sampling rate must be given in the acquisition metadata.")
+    detector_positions = pa_data.get_detector_position()
+    if detector_positions is None:
+        raise ValueError("The detector positions must be given in the device metadata.")
+
+    lazy_data = pa_data.binary_time_series_data
+    detector_indices, (start, stop) = compute_acquisition_gate(detector_positions, field_of_view, speed_of_sound,
+                                                               sampling_rate, lazy_data.shape[1],
+                                                               max_distance, margin)
+    if len(detector_indices) == 0 or stop <= start:
+        raise ValueError(f"No detector of {file_path} records signals from the field of view.")
+
+    if detector_indices[-1] - detector_indices[0] + 1 == len(detector_indices):
+        detector_selection = slice(int(detector_indices[0]), int(detector_indices[-1]) + 1)
+    else:
+        detector_selection = detector_indices.tolist()
+    pa_data.binary_time_series_data = lazy_data[detector_selection, start:stop]
+
+    meta_data_acquisition = dict(pa_data.meta_data_acquisition)
+    meta_data_acquisition[SAMPLE_OFFSET_TAG] = start
+    meta_data_acquisition[DETECTOR_INDICES_TAG] = detector_indices
+    sizes = meta_data_acquisition.get(MetadataAcquisitionTags.SIZES.tag)
+    if sizes is not None and np.size(sizes) > 1:
+        sizes = np.array(sizes, copy=True)
+        sizes[0], sizes[1] = len(detector_indices), stop - start
+        meta_data_acquisition[MetadataAcquisitionTags.SIZES.tag] = sizes
+    _gate_acquisition_arrays(meta_data_acquisition, PER_DETECTOR_ACQUISITION_TAGS, lazy_data.shape[0],
+                             detector_indices)
+    _gate_acquisition_arrays(meta_data_acquisition, PER_SAMPLE_ACQUISITION_TAGS, lazy_data.shape[1],
+                             slice(start, stop))
+    pa_data.meta_data_acquisition = meta_data_acquisition
+    pa_data.meta_data_device = _select_detectors(pa_data.meta_data_device, detector_indices)
+    return pa_data
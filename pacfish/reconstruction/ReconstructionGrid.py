@@ -0,0 +1,60 @@
+# SPDX-FileCopyrightText: 2026 International Photoacoustics Standardisation Consortium (IPASC)
+# SPDX-License-Identifier: BSD 3-Clause License
+
+import numpy as np
+
+
+class ReconstructionGrid:
+    """
+    A regular voxel grid spanning a field of view [x1_start, x1_end, x2_start, x2_end, x3_start, x3_end].
+
+    Along every dimension, the extent of the field of view is divided into voxels of (approximately) the
+    requested spacing and the voxel centres are used as reconstruction points. A dimension with equal start
+    and end coordinates has a single voxel, so a 2D field of view yields a grid with a singleton dimension.
+    """
+
+    def __init__(self, field_of_view: np.ndarray, spacing: float):
+        """
+        Parameters
+        ----------
+        field_of_view: np.ndarray
+            An array of six values [x1_start, x1_end, x2_start, x2_end, x3_start, x3_end] in meters.
+        spacing: float
+            The desired voxel spacing in meters.
+        """
+        if spacing is None or spacing <= 0:
+            raise ValueError("The voxel spacing must be a positive number.")
+
+        self.field_of_view = np.asarray(field_of_view, dtype=np.float64).reshape((3, 2))
+        self.spacing = spacing
+        self.axes = []
+        for start, end in self.field_of_view:
+            num_voxels = max(1, int(round(abs(end - start) / spacing)))
+            if num_voxels == 1:
+                self.axes.append(np.asarray([(start + end) / 2]))
+            else:
+                self.axes.append(start + (np.arange(num_voxels) + 0.5) * (end - start) / num_voxels)
+        self.shape = tuple(len(axis) for axis in self.axes)
+        self.num_voxels = int(np.prod(self.shape))
+
+    def get_voxel_positions(self, start: int = 0, stop: int = None) -> np.ndarray:
+        """
+        Returns the positions of a contiguous range of voxels in C order, so that large grids can be
+        processed in tiles without ever holding all voxel positions in memory.
+
+        Parameters
+        ----------
+        start: int
+            Index of the first voxel.
+        stop: int
+            Index after the last voxel. If None, all voxels up to the end of the grid are returned.
+
+        Return
+        ------
+        np.ndarray
+            A (stop - start, 3) array with the cartesian voxel positions.
+        """
+        if stop is None:
+            stop = self.num_voxels
+        indices = np.unravel_index(np.arange(start, stop), self.shape)
+        return np.stack([axis[index] for axis, index in zip(self.axes, indices)], axis=-1)
@@ -0,0 +1,99 @@
+# SPDX-FileCopyrightText: 2026 International Photoacoustics Standardisation Consortium (IPASC)
+# SPDX-License-Identifier: BSD 3-Clause License
+
+import numpy as np
+from pacfish import PAData
+
+
+def compute_rotation_matrices(angles: np.ndarray) -> np.ndarray:
+    """
+    Computes the rotation matrices of a stack of rotation angles. Every rotation is the rotation about the x1
+    axis, followed by the rotation about the x2 axis and the rotation about the x3 axis of the fixed
+    reference coordinate system.
+
+    Parameters
+    ----------
+    angles: np.ndarray
+        An (M, 3) array with the rotation angles about the x1, x2 and x3 axes in radians.
+
+    Return
+    ------
+    np.ndarray
+        An (M, 3, 3) array with the rotation matrices.
+    """
+    angles = np.atleast_2d(np.asarray(angles, dtype=np.float64))
+    cos, sin = np.cos(angles), np.sin(angles)
+    rotations = np.zeros((3, len(angles), 3, 3), dtype=np.float64)
+    for axis in range(3):
+        # the two axes that span the plane of the rotation about `axis`
+        first, second = (axis + 1) % 3, (axis + 2) % 3
+        rotations[axis, :, axis, axis] = 1
+        rotations[axis, :, first, first] = cos[:, axis]
+        rotations[axis, :, first, second] = -sin[:, axis]
+        rotations[axis, :, second, first] = sin[:, axis]
+        rotations[axis, :, second, second] = cos[:, axis]
+    return rotations[2] @ rotations[1] @ rotations[0]
+
+
+def transform_detector_positions(detector_positions: np.ndarray, poses: np.ndarray) -> np.ndarray:
+    """
+    Applies the spatial poses of all measurements to all detector positions at once.
+
+    A pose [x1, x2, x3, r1, r2, r3] describes how the acquisition system moved relative to the reference
+    measurement: the detector positions are rotated by the angles r1, r2 and r3 (in radians, see
+    `compute_rotation_matrices`) about the origin of the device coordinate system and then translated by
+    [x1, x2, x3] meters. Poses with only three entries are pure translations.
+
+    Parameters
+    ----------
+    detector_positions: np.ndarray
+        A (N, 3) array with the detector positions in meters.
+    poses: np.ndarray
+        An (M, 6) or (M, 3) array with the spatial pose of every measurement.
+
+    Return
+    ------
+    np.ndarray
+        An (M, N, 3) array with the detector positions of every measurement in the reference coordinate system.
+    """
+    detector_positions = np.atleast_2d(np.asarray(detector_positions, dtype=np.float64))
+    poses = np.atleast_2d(np.asarray(poses, dtype=np.float64))
+    if poses.shape[1] not in (3, 6):
+        raise ValueError(f"The spatial poses must have the shape (M, 6) or (M, 3), but had the shape {poses.shape}.")
+    if poses.shape[1] == 6:
+        positions = np.einsum("mij,nj->mni", compute_rotation_matrices(poses[:, 3:]), detector_positions)
+    else:
+        positions = np.repeat(detector_positions[np.newaxis], len(poses), axis=0)
+    positions += poses[:, np.newaxis, :3]
+    return positions
+
+
+def get_posed_detector_positions(pa_data: PAData) -> np.ndarray:
+    """
+    Returns the detector positions of every measurement of the given PAData instance, taking the
+    `measurement_spatial_poses` of the acquisition metadata into account.
+
+    Raises
+    ------
+    ValueError:
+        if the detector positions are missing, or if the number of poses does not match the number of measurements.
+
+    Return
+    ------
+    np.ndarray
+        An (M, N, 3) array with the detector positions of every measurement. Without spatial poses, all
+        measurements share the detector positions of the device metadata.
+    """
+    detector_positions = pa_data.get_detector_position()
+    if detector_positions is None:
+        raise ValueError("The detector positions must be given in the device metadata.")
+    detector_positions = np.atleast_2d(detector_positions)
+    shape = np.shape(pa_data.binary_time_series_data)
+    num_measurements = shape[3] if len(shape) == 4 else 1
+    poses = pa_data.get_measurement_spatial_poses()
+    if poses is None or np.size(poses) == 0:
+        return np.broadcast_to(detector_positions, (num_measurements, ) + detector_positions.shape)
+    poses = np.atleast_2d(poses)
+    if len(poses) != num_measurements:
+        raise ValueError(f"{len(poses)} spatial poses were given for {num_measurements} measurements.")
+    return transform_detector_positions(detector_positions, poses)
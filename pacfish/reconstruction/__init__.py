@@ -0,0 +1,13 @@
+"""
+The purpose of the reconstruction package is to provide reference implementations of
+image reconstruction algorithms that work directly on PAData instances, using only
+the information contained in the IPASC metadata.
+"""
+
+from pacfish.reconstruction.ReconstructionGrid import ReconstructionGrid
+from pacfish.reconstruction.DelayAndSum import DelayAndSum
+from pacfish.reconstruction.DelayTableCache import DelayTableCache
+from pacfish.reconstruction.GatedLoading import load_gated_data
+from pacfish.reconstruction.ForwardModel import ForwardModel, ForwardModelOperator
+from pacfish.reconstruction.SpatialPoses import transform_detector_positions, get_posed_detector_positions
+from pacfish.reconstruction.Compounding import CompoundingReconstruction
@@ -0,0 +1,233 @@
+# SPDX-FileCopyrightText: 2026 International Photoacoustics Standardisation Consortium (IPASC)
+# SPDX-License-Identifier: BSD 3-Clause License
+
+from concurrent.futures import ThreadPoolExecutor
+
+import numpy as np
+from pacfish import PAData, MetadataAcquisitionTags
+from pacfish.reconstruction.DelayAndSum import get_speed_of_sound
+from pacfish.reconstruction.Directivity import compute_directivity, get_detector_directivity_parameters
+
+
+def compute_sphere_signals(distances: np.ndarray, radii: np.ndarray, speed_of_sound: float, sampling_rate: float,
+                           num_samples: int) -> tuple:
+    """
+    Computes the analytic pressure of uniformly heated spheres at the given distances.
+
+    The pressure of a sphere with the radius a and the unit initial pressure at the distance r is the
+    N-shaped wave p(r, t) = (r - c t) / (2 r) for |r - c t| < a. To avoid aliasing of small spheres, the pressure
+    is averaged analytically over the duration of every sample. Only the samples within the support of the
+    N-shaped wave are evaluated.
+
+    Parameters
+    ----------
+    distances: np.ndarray
+        A (num_detectors, num_sources) array with the distances between the detectors and the sources in meters.
+    radii: np.ndarray
+        The radii of the sources in meters.
+    speed_of_sound: float
+        The speed of sound in m/s.
+    sampling_rate: float
+        The sampling rate in Hz.
+    num_samples: int
+        The number of samples per detector.
+
+    Raises
+    ------
+    ValueError:
+        if a detector lies within a sphere, where the pressure is not described by the N-shaped wave and is
+        singular at the centre.
+
+    Return
+    ------
+    tuple
+        The (num_detectors, num_sources, window) arrays of the sample indices and of the pressure values.
+        Samples outside the recorded time have a pressure of zero.
+    """
+    overlapping = distances <= np.broadcast_to(radii, distances.shape)
+    if np.any(overlapping):
+        detector, source = np.argwhere(overlapping)[0]
+        raise ValueError(f"The absorber {source} overlaps the detector {detector}: the distance "
+                         f"{distances[detector, source]} m is not larger than the absorber radius.")
+    sample_length = speed_of_sound / sampling_rate
+    half_window = int(np.ceil(np.max(radii) / sample_length)) + 1
+    offsets = np.arange(-half_window, half_window + 1)
+    centres = np.round(distances / sample_length).astype(np.intp)
+    samples = centres[..., np.newaxis] + offsets
+
+    # the sample k covers the times [k - 1/2, k + 1/2] / fs, i.e. the range [u_low, u_high] of u = r - c t
+    radii = np.broadcast_to(radii, distances.shape)[..., np.newaxis]
+    u_high = distances[..., np.newaxis] - (samples - 0.5) * sample_length
+    u_low = u_high - sample_length
+    lower = np.clip(u_low, -radii, radii)
+    upper = np.clip(u_high, -radii, radii)
+    pressures = (upper ** 2 - lower ** 2) / (4 * sample_length * distances[..., np.newaxis])
+    pressures[(samples < 0) | (samples >= num_samples)] = 0
+    return np.clip(samples, 0, num_samples - 1), pressures
+
+
+class PointAbsorberSimulation:
+    """
+    A fast analytic forward simulation of the time series that a device records from a set of small spherical
+    absorbers, e.g. to create data with a known ground truth for reconstruction benchmarks without running a
+    full wave simulation::
+
+        simulation = PointAbsorberSimulation(absorber_positions, absorber_radii=0.0002)
+        pa_data = simulation.simulate_pa_data(meta_data_device, meta_data_acquisition, num_samples=2048)
+        pf.write_data("phantom.hdf5", pa_data)
+
+    The pressure of every absorber is the analytic solution for a uniformly heated sphere in a homogeneous
+    medium, weighted with the angular response of every detector. The detector positions, orientations and
+    angular responses are taken from the device metadata, and the speed of sound and the sampling rate from the
+    acquisition metadata. The detectors are processed in blocks on a thread pool and the sources in batches, so
+    the memory needed is bounded by the block sizes. The frequency response of the detectors is not applied.
+
+    The detector orientation is read as a vector that points in the direction of highest sensitivity of the
+    detector, and the angular response as the IPASC array [angles, response] over the angle between this
+    vector and the direction towards the absorber.
+    """
+
+    def __init__(self, absorber_positions: np.ndarray, absorber_radii=0.0001, initial_pressures=1.0,
+                 directivity: bool = True, detectors_per_block: int = 32, sources_per_batch: int = 64,
+                 workers: int = None):
+        """
+        Parameters
+        ----------
+        absorber_positions: np.ndarray
+            A (num_sources, 3) array with the absorber positions in meters.
+        absorber_radii: float or np.ndarray
+            The radius of all absorbers, or of every absorber, in meters.
+        initial_pressures: float or np.ndarray
+            The initial pressure of all absorbers, of every absorber with the shape (num_sources, ), or of
+            every absorber at every wavelength with the shape (num_sources, num_wavelengths).
+        directivity: bool
+            If True, the angular responses of the detectors are taken into account. The detector orientations
+            are then read as vectors that point in the directions of highest sensitivity, not as rotation
+            angles, see `pacfish.reconstruction.Directivity`.
+        detectors_per_block: int
+            The number of detectors that are simulated together by one worker.
+        sources_per_batch: int
+            The number of sources that are simulated at once.
+        workers: int
+            The number of threads. If None, the default of `concurrent.futures.ThreadPoolExecutor` is used.
+        """
+        self.absorber_positions = np.atleast_2d(np.asarray(absorber_positions, dtype=np.float64))
+        num_sources = len(self.absorber_positions)
+        self.absorber_radii = np.broadcast_to(np.asarray(absorber_radii, dtype=np.float64), (num_sources, ))
+        initial_pressures = np.asarray(initial_pressures, dtype=np.float64)
+        if initial_pressures.ndim < 2:
+            initial_pressures = np.broadcast_to(initial_pressures, (num_sources, ))[:, np.newaxis]
+        if len(initial_pressures) != num_sources:
+            raise ValueError(f"{len(initial_pressures)} initial pressures were given for {num_sources} absorbers.")
+        self.initial_pressures = initial_pressures
+        self.directivity = directivity
+        self.detectors_per_block = detectors_per_block
+        self.sources_per_batch = sources_per_batch
+        self.workers = workers
+
+    @property
+    def num_wavelengths(self) -> int:
+        return self.initial_pressures.shape[1]
+
+    def _simulate_block(self, detector_positions, detector_orientations, angular_responses, speed_of_sound,
+                        sampling_rate, num_samples) -> np.ndarray:
+        num_detectors = len(detector_positions)
+        time_series = np.zeros((num_detectors * num_samples, self.num_wavelengths), dtype=np.float64)
+        row_offsets = (np.arange(num_detectors) * num_samples)[:, np.newaxis, np.newaxis]
+        for start in range(0, len(self.absorber_positions), self.sources_per_batch):
+            stop = min(start + self.sources_per_batch, len(self.absorber_positions))
+            offsets = self.absorber_positions[np.newaxis, start:stop] - detector_positions[:, np.newaxis]
+            distances = np.linalg.norm(offsets, axis=-1)
+            samples, pressures = compute_sphere_signals(distances, self.absorber_radii[start:stop], speed_of_sound,
+                                                        sampling_rate, num_samples)
+            if detector_orientations is not None:
+                directions = offsets / np.maximum(distances, np.finfo(np.float64).tiny)[..., np.newaxis]
+                pressures *= compute_directivity(detector_orientations, angular_responses,
+                                                 directions)[..., np.newaxis]
+            indices = (samples + row_offsets).ravel()
+            for wavelength in range(self.num_wavelengths):
+                weights = pressures * self.initial_pressures[start:stop, wavelength][np.newaxis, :, np.newaxis]
+                time_series[:, wavelength] += np.bincount(indices, weights.ravel(), minlength=len(time_series))
+        return np.reshape(time_series, (num_detectors, num_samples, self.num_wavelengths))
+
+    def simulate(self, meta_data_device: dict, speed_of_sound: float, sampling_rate: float, num_samples: int,
+                 num_measurements: int = 1, dtype=np.float32) -> np.ndarray:
+        """
+        Simulates the time series of all detectors of a device.
+
+        Parameters
+        ----------
+        meta_data_device: dict
+            The device metadata with the detector positions and, optionally, orientations and angular responses.
+        speed_of_sound: float
+            The speed of sound in m/s.
+        sampling_rate: float
+            The sampling rate in Hz.
+        num_samples: int
+            The number of samples per detector.
+        num_measurements: int
+            The number of identical measurements.
+        dtype: np.dtype
+            The data type of the result.
+
+        Raises
+        ------
+        ValueError:
+            if the device metadata does not contain the detector positions, or if an absorber overlaps a
+            detector.
+
+        Return
+        ------
+        np.ndarray
+            The time series data with the shape [detectors, samples, wavelengths, measurements]. All measurements
+            are views of the same data.
+        """
+        device = PAData(None, dict(), meta_data_device)
+        detector_positions = device.get_detector_position()
+        if detector_positions is None:
+            raise ValueError("The detector positions must be given in the device metadata.")
+        detector_positions = np.atleast_2d(detector_positions).astype(np.float64)
+        detector_orientations, angular_responses = None, None
+        if self.directivity:
+            detector_orientations, angular_responses = get_detector_directivity_parameters(meta_data_device)
+
+        time_series = np.empty((len(detector_positions), num_samples, self.num_wavelengths), dtype=dtype)
+
+        def simulate_block(start):
+            stop = min(start + self.detectors_per_block, len(detector_positions))
+            time_series[start:stop] = self._simulate_block(
+                detector_positions[start:stop],
+                None if detector_orientations is None else detector_orientations[start:stop],
+                None if angular_responses is None else angular_responses[start:stop],
+                speed_of_sound, sampling_rate, num_samples)
+
+        with ThreadPoolExecutor(max_workers=self.workers) as executor:
+            list(executor.map(simulate_block, range(0, len(detector_positions), self.detectors_per_block)))
+        return np.broadcast_to(time_series[..., np.newaxis], time_series.shape + (num_measurements, ))
+
+    def simulate_pa_data(self, meta_data_device: dict, meta_data_acquisition: dict, num_samples: int,
+                         num_measurements: int = 1) -> PAData:
+        """
+        Simulates the time series data of a device with the speed of sound and the sampling rate of the given
+        acquisition metadata.
+
+        Raises
+        ------
+        ValueError:
+            if the sampling rate or a single global speed of sound are missing in the acquisition metadata.
+
+        Return
+        ------
+        PAData
+            A PAData instance with the simulated time series data, a copy of the acquisition metadata with
+            adjusted `sizes` and the given device metadata.
+        """
+        meta_data_acquisition = dict(meta_data_acquisition)
+        acquisition = PAData(None, meta_data_acquisition, meta_data_device)
+        sampling_rate = acquisition.get_sampling_rate()
+        if sampling_rate is None:
+            raise ValueError("The sampling rate must be given in the acquisition metadata.")
+        time_series = np.ascontiguousarray(self.simulate(meta_data_device, get_speed_of_sound(acquisition),
+                                                         sampling_rate, num_samples, num_measurements))
+        meta_data_acquisition[MetadataAcquisitionTags.SIZES.tag] = np.asarray(time_series.shape)
+        return PAData(time_series, meta_data_acquisition, meta_data_device)
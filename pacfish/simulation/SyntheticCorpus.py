@@ -0,0 +1,383 @@
+# SPDX-FileCopyrightText: 2026 International Photoacoustics Standardisation Consortium (IPASC)
+# SPDX-License-Identifier: BSD 3-Clause License
+
+import argparse
+import os
+import uuid
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+from pacfish import PAData, MetadataAcquisitionTags, MetadataDeviceTags
+from pacfish import DeviceMetaDataCreator, DetectionElementCreator, IlluminationElementCreator
+from pacfish.iohandler.file_writer import write_data
+from pacfish.iohandler.lazy_data import normalise_selection
+
+DEVICE_GEOMETRIES = ["linear", "ring", "matrix"]
+SAMPLING_RATE = 40e6
+SPEED_OF_SOUND = 1540.0
+# the standard deviation of the synthetic pressure pulses in samples
+PULSE_WIDTH_SAMPLES = 2.0
+
+
+def create_detector_positions(geometry: str, num_detectors: int) -> tuple:
+    """
+    Computes the detector positions and orientations of a linear array, a ring array or a square matrix array.
+
+    Parameters
+    ----------
+    geometry: str
+        One of "linear", "ring" or "matrix".
+    num_detectors: int
+        The number of detectors. For a matrix array, it is rounded to the next square number.
+
+    Return
+    ------
+    tuple
+        The (N, 3) detector positions, the (N, 3) detector orientations and the field of view of the device,
+        all in meters.
+    """
+    if geometry == "linear":
+        pitch = 0.0003
+        x1 = (np.arange(num_detectors) - (num_detectors - 1) / 2) * pitch
+        positions = np.stack([x1, np.zeros_like(x1), np.zeros_like(x1)], axis=-1)
+        orientations = np.repeat([[0.0, 0.0, 1.0]], num_detectors, axis=0)
+        half_width = max(num_detectors * pitch / 2, 0.005)
+        field_of_view = np.asarray([-half_width, half_width, 0, 0, 0.001, 0.001 + 2 * half_width])
+    elif geometry == "ring":
+        radius = 0.04
+        angles = np.linspace(0, 2 * np.pi, num_detectors, endpoint=False)
+        positions = np.stack([np.cos(angles) * radius, np.zeros_like(angles), np.sin(angles) * radius], axis=-1)
+        orientations = -positions / radius
+        half_width = radius / 2
+        field_of_view = np.asarray([-half_width, half_width, 0, 0, -half_width, half_width])
+    elif geometry == "matrix":
+        pitch = 0.0005
+        num_elements_per_side = int(np.ceil(np.sqrt(num_detectors)))
+        x1, x2 = np.meshgrid(*[(np.arange(num_elements_per_side) - (num_elements_per_side - 1) / 2) * pitch] * 2,
+                             indexing="ij")
+        positions = np.stack([x1.ravel(), x2.ravel(), np.zeros(x1.size)], axis=-1)
+        orientations = np.repeat([[0.0, 0.0, 1.0]], len(positions), axis=0)
+        half_width = max(num_elements_per_side * pitch / 2, 0.005)
+        field_of_view = np.asarray([-half_width, half_width, -half_width, half_width, 0.001, 0.001 + 2 * half_width])
+    else:
+        raise ValueError(f"Unsupported device geometry {geometry}. Choose one of {DEVICE_GEOMETRIES}.")
+    return positions, orientations, field_of_view
+
+
+def create_synthetic_device(geometry: str, num_detectors: int, wavelength_range: tuple = (700e-9, 900e-9),
+                            num_illuminators: int = 2) -> dict:
+    """
+    Creates the complete device metadata of a synthetic device with the given detector geometry.
+
+    Return
+    ------
+    dict
+        The device metadata dictionary.
+    """
+    positions, orientations, field_of_view = create_detector_positions(geometry, num_detectors)
+    device_creator = DeviceMetaDataCreator()
+    device_creator.set_general_information(uuid=f"synthetic-{geometry}-{len(positions)}", fov=field_of_view)
+
+    frequencies = np.linspace(0, SAMPLING_RATE / 2, 32)
+    frequency_response = np.asarray([frequencies, np.exp(-0.5 * ((frequencies - 5e6) / 3e6) ** 2)])
+    angles = np.linspace(-np.pi / 2, np.pi / 2, 32)
+    angular_response = np.asarray([angles, np.cos(angles)])
+    for position, orientation in zip(positions, orientations):
+        detection_element_creator = DetectionElementCreator()
+        detection_element_creator.set_detector_position(position)
+        detection_element_creator.set_detector_orientation(orientation)
+        detection_element_creator.set_detector_geometry_type("CUBOID")
+        detection_element_creator.set_detector_geometry(np.asarray([0.0003, 0.005, 0.0001]))
+        detection_element_creator.set_frequency_response(frequency_response)
+        detection_element_creator.set_angular_response(angular_response)
+        device_creator.add_detection_element(detection_element_creator.get_dictionary())
+
+    # the beam energy and stability profiles are tabulated over the wavelength in nm
+    wavelengths = np.linspace(wavelength_range[0], wavelength_range[1], 16) * 1e9
+    for angle in np.linspace(0, 2 * np.pi, num_illuminators, endpoint=False):
+        illumination_element_creator = IlluminationElementCreator()
+        illumination_element_creator.set_illuminator_position(np.asarray([np.cos(angle) * 0.01, 0, -0.005]))
+        illumination_element_creator.set_illuminator_orientation(np.asarray([-np.cos(angle) * 0.5, 0, 1]))
+        illumination_element_creator.set_illuminator_geometry_type("CUBOID")
+        illumination_element_creator.set_illuminator_geometry(np.asarray([0.001, 0.02, 0.0001]))
+        illumination_element_creator.set_wavelength_range(np.asarray([wavelength_range[0], wavelength_range[1],
+                                                                      1e-9]))
+        illumination_element_creator.set_beam_energy_profile(np.asarray([wavelengths, np.full(16, 0.01)]))
+        illumination_element_creator.set_beam_stability_profile(np.asarray([wavelengths, np.full(16, 0.0005)]))
+        illumination_element_creator.set_pulse_width(7e-9)
+        illumination_element_creator.set_beam_intensity_profile(np.ones((16, 4)))
+        illumination_element_creator.set_beam_divergence_angles(0.2)
+        illumination_element = illumination_element_creator.get_dictionary()
+        illumination_element[MetadataDeviceTags.INTENSITY_PROFILE_DISTANCE.tag] = 0.01
+        device_creator.add_illumination_element(illumination_element)
+    return device_creator.finalize_device_meta_data()
+
+
+class SyntheticTimeSeriesData:
+    """
+    An array-like source of synthetic time series data that is generated when it is indexed.
+
+    The data contains the pressure pulses of a few point absorbers in the field of view, with a random spectrum
+    per absorber, plus Gaussian noise. Every measurement is generated from its own random generator, seeded
+    with the seed and the index of the measurement, so the data is deterministic and independent of the order in
+    which the measurements are read. Passing an instance to `write_data` streams it into a file one measurement
+    at a time.
+    """
+
+    def __init__(self, detector_positions: np.ndarray, field_of_view: np.ndarray, num_samples: int,
+                 num_wavelengths: int, num_measurements: int, dtype: str = "float32", seed: int = 0,
+                 num_absorbers: int = 3, noise_level: float = 0.05):
+        """
+        Parameters
+        ----------
+        detector_positions: np.ndarray
+            A (N, 3) array with the detector positions in meters.
+        field_of_view: np.ndarray
+            The field of view in which the absorbers are placed.
+        num_samples: int
+            The number of samples per detector.
+        num_wavelengths: int
+            The number of wavelengths.
+        num_measurements: int
+            The number of measurements.
+        dtype: str
+            The data type of the time series data. Integer data is scaled to use a part of the value range.
+        seed: int
+            The seed of the random generators.
+        num_absorbers: int
+            The number of point absorbers.
+        noise_level: float
+            The standard deviation of the noise relative to the peak pulse amplitude.
+        """
+        self.detector_positions = np.atleast_2d(detector_positions)
+        self.shape = (len(self.detector_positions), num_samples, num_wavelengths, num_measurements)
+        self.dtype = np.dtype(dtype)
+        self.seed = seed
+        self.noise_level = noise_level
+
+        rng = np.random.default_rng([seed, 0])
+        bounds = np.reshape(np.asarray(field_of_view, dtype=np.float64), (3, 2))
+        self.absorber_positions = rng.uniform(bounds[:, 0], bounds[:, 1], size=(num_absorbers, 3))
+        self.absorber_spectra = rng.uniform(0.2, 1.0, size=(num_absorbers, num_wavelengths)).astype(np.float32)
+        distances = np.linalg.norm(self.detector_positions[:, np.newaxis] - self.absorber_positions[np.newaxis],
+                                   axis=-1)
+        self.arrival_samples = distances * SAMPLING_RATE / SPEED_OF_SOUND
+        self.scale = 0.1 * np.iinfo(self.dtype).max if self.dtype.kind in "iu" else 1.0
+
+    @property
+    def ndim(self) -> int:
+        return 4
+
+    @property
+    def nbytes(self) -> int:
+        return int(np.prod(self.shape)) * self.dtype.itemsize
+
+    def generate_measurement(self, measurement: int) -> np.ndarray:
+        """
+        Generates the [detectors, samples, wavelengths] data of a single measurement.
+        """
+        num_detectors, num_samples, num_wavelengths, _ = self.shape
+        rng = np.random.default_rng([self.seed, 1, measurement])
+        data = rng.standard_normal((num_detectors, num_samples, num_wavelengths), dtype=np.float32)
+        data *= self.noise_level
+
+        # the pulses are only evaluated within a window around the arrival time of every absorber
+        half_window = int(np.ceil(4 * PULSE_WIDTH_SAMPLES))
+        offsets = np.arange(-half_window, half_window + 1)
+        rows = np.arange(num_detectors)[:, np.newaxis]
+        for arrival_samples, spectrum in zip(self.arrival_samples.T, self.absorber_spectra):
+            columns = np.round(arrival_samples).astype(np.intp)[:, np.newaxis] + offsets
+            times = (columns - arrival_samples[:, np.newaxis]) / PULSE_WIDTH_SAMPLES
+            # the bipolar N-shaped pulse of a small spherical absorber
+            pulse = (-times * np.exp(-0.5 * times ** 2)).astype(np.float32)
+            pulse[(columns < 0) | (columns >= num_samples)] = 0
+            data[rows, np.clip(columns, 0, num_samples - 1)] += pulse[..., np.newaxis] * spectrum
+
+        if self.dtype.kind in "iu":
+            info = np.iinfo(self.dtype)
+            return np.clip(np.round(data * self.scale), info.min, info.max).astype(self.dtype)
+        return data.astype(self.dtype, copy=False)
+
+    def __getitem__(self, selection):
+        selection = normalise_selection(selection)
+        measurements = np.arange(self.shape[3])[selection[3]]
+        if np.ndim(measurements) == 0:
+            return self.generate_measurement(int(measurements))[selection[:3]]
+        data = np.stack([self.generate_measurement(int(measurement)) for measurement in measurements], axis=-1)
+        return data[selection[:3]]
+
+    def __array__(self, dtype=None, copy=None):
+        data = self[()]
+        return data if dtype is None else data.astype(dtype, copy=False)
+
+
+def create_synthetic_pa_data(geometry: str = "linear", num_detectors: int = 128, num_samples: int = 2048,
+                             num_wavelengths: int = 2, num_measurements: int = 4, dtype: str = "float32",
+                             seed: int = 0) -> PAData:
+    """
+    Creates a PAData instance with complete metadata and lazily generated synthetic time series data.
+
+    Parameters
+    ----------
+    geometry: str
+        The detector geometry of the device: "linear", "ring" or "matrix".
+    num_detectors: int
+        The number of detectors. For a matrix array, it is rounded to the next square number.
+    num_samples: int
+        The number of samples per detector.
+    num_wavelengths: int
+        The number of wavelengths.
+    num_measurements: int
+        The number of measurements.
+    dtype: str
+        The data type of the time series data.
+    seed: int
+        The seed that determines the absorbers, the noise and the acquisition metadata.
+
+    Return
+    ------
+    PAData
+        A PAData instance whose time series data is a `SyntheticTimeSeriesData`.
+    """
+    meta_data_device = create_synthetic_device(geometry, num_detectors)
+    positions, _, field_of_view = create_detector_positions(geometry, num_detectors)
+    binary_time_series_data = SyntheticTimeSeriesData(positions, field_of_view, num_samples, num_wavelengths,
+                                                      num_measurements, dtype, seed)
+
+    rng = np.random.default_rng([seed, 2])
+    wavelengths = np.linspace(700e-9, 900e-9, num_wavelengths)
+    meta_data_acquisition = {
+        MetadataAcquisitionTags.UUID.tag: str(uuid.UUID(bytes=rng.bytes(16), version=4)),
+        MetadataAcquisitionTags.DATA_TYPE.tag: np.dtype(dtype).name,
+        MetadataAcquisitionTags.DIMENSIONALITY.tag: "time",
+        MetadataAcquisitionTags.SIZES.tag: np.asarray(binary_time_series_data.shape),
+        MetadataAcquisitionTags.ENCODING.tag: "raw",
+        MetadataAcquisitionTags.COMPRESSION.tag: "none",
+        MetadataAcquisitionTags.PHOTOACOUSTIC_IMAGING_DEVICE_REFERENCE.tag: meta_data_device[
+            MetadataDeviceTags.GENERAL.tag][MetadataDeviceTags.UNIQUE_IDENTIFIER.tag],
+        MetadataAcquisitionTags.PULSE_ENERGY.tag: rng.normal(0.01, 0.0005, num_measurements),
+        MetadataAcquisitionTags.MEASUREMENT_TIMESTAMPS.tag: np.arange(num_measurements) / 10.0,
+        MetadataAcquisitionTags.ACQUISITION_WAVELENGTHS.tag: wavelengths,
+        MetadataAcquisitionTags.TIME_GAIN_COMPENSATION.tag: np.linspace(1, 2, num_samples),
+        MetadataAcquisitionTags.OVERALL_GAIN.tag: 1.0,
+        MetadataAcquisitionTags.ELEMENT_DEPENDENT_GAIN.tag: np.ones(binary_time_series_data.shape[0]),
+        MetadataAcquisitionTags.TEMPERATURE_CONTROL.tag: np.full(num_measurements, 310.15),
+        MetadataAcquisitionTags.ACOUSTIC_COUPLING_AGENT.tag: "water",
+        MetadataAcquisitionTags.SCANNING_METHOD.tag: "static",
+        MetadataAcquisitionTags.AD_SAMPLING_RATE.tag: SAMPLING_RATE,
+        MetadataAcquisitionTags.FREQUENCY_DOMAIN_FILTER.tag: np.asarray([0.5e6, 15e6]),
+        MetadataAcquisitionTags.SPEED_OF_SOUND.tag: SPEED_OF_SOUND,
+        MetadataAcquisitionTags.MEASUREMENTS_PER_IMAGE.tag: 1,
+        MetadataAcquisitionTags.MEASUREMENT_SPATIAL_POSES.tag: np.zeros((num_measurements, 6)),
+        # the bounding boxes of the absorbers
+        MetadataAcquisitionTags.REGIONS_OF_INTEREST.tag: {
+            f"absorber_{index}": np.asarray([position - 0.0005, position + 0.0005])
+            for index, position in enumerate(binary_time_series_data.absorber_positions)},
+    }
+    return PAData(binary_time_series_data, meta_data_acquisition, meta_data_device)
+
+
+def _write_synthetic_file(arguments: tuple) -> str:
+    file_path, file_compression, options = arguments
+    write_data(file_path, create_synthetic_pa_data(**options), file_compression=file_compression)
+    return file_path
+
+
+def generate_synthetic_corpus(directory: str, num_files: int = 10, geometry: str = "linear",
+                              num_detectors: int = 128, num_samples: int = 2048, num_wavelengths: int = 2,
+                              num_measurements: int = 4, dtype: str = "float32", seed: int = 0,
+                              file_compression: str = None, total_bytes: int = None, workers: int = None) -> list:
+    """
+    Writes a corpus of synthetic IPASC files, e.g. for load tests and benchmarks::
+
+        paths = generate_synthetic_corpus("corpus", geometry="ring", num_detectors=512, num_measurements=100,
+                                          total_bytes=100 * 2 ** 30, workers=8)
+
+    Every file is streamed to disk one measurement at a time, so the memory needed does not depend on the size
+    of the files. The files are written by a pool of processes, because HDF5 serialises all calls within one
+    process. File `i` is generated with the seed `seed + i`, so the same arguments always produce the same corpus.
+
+    Parameters
+    ----------
+    directory: str
+        The directory in which the files are written. It is created if it does not exist.
+    num_files: int
+        The number of files.
+    geometry: str
+        The detector geometry of the device: "linear", "ring" or "matrix".
+    num_detectors: int
+        The number of detectors.
+    num_samples: int
+        The number of samples per detector.
+    num_wavelengths: int
+        The number of wavelengths.
+    num_measurements: int
+        The number of measurements per file.
+    dtype: str
+        The data type of the time series data.
+    seed: int
+        The seed of the first file.
+    file_compression: str
+        possible file compression for the hdf5 output files. Possible values are: gzip, lzf and szip.
+    total_bytes: int
+        If given, overrides `num_files` with the number of files whose time series data adds up to at least this
+        many bytes.
+    workers: int
+        The number of processes. If 1, the files are written by the calling process.
+
+    Return
+    ------
+    list
+        The paths of the written files.
+    """
+    if geometry not in DEVICE_GEOMETRIES:
+        raise ValueError(f"Unsupported device geometry {geometry}. Choose one of {DEVICE_GEOMETRIES}.")
+    options = dict(geometry=geometry, num_detectors=num_detectors, num_samples=num_samples,
+                   num_wavelengths=num_wavelengths, num_measurements=num_measurements, dtype=dtype)
+    if total_bytes is not None:
+        num_detectors = len(create_detector_positions(geometry, num_detectors)[0])
+        bytes_per_file = num_detectors * num_samples * num_wavelengths * num_measurements * np.dtype(dtype).itemsize
+        num_files = max(1, int(np.ceil(total_bytes / bytes_per_file)))
+
+    os.makedirs(directory, exist_ok=True)
+    digits = len(str(max(num_files - 1, 1)))
+    tasks = [(os.path.join(directory, f"synthetic_{geometry}_{index:0{digits}d}.hdf5"), file_compression,
+              dict(options, seed=seed + index)) for index in range(num_files)]
+    if workers == 1:
+        return [_write_synthetic_file(task) for task in tasks]
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        return list(executor.map(_write_synthetic_file, tasks))
+
+
+def parse_size(size: str) -> int:
+    """
+    Parses a size such as "512M", "100G" or "1024" into a number of bytes.
+    """
+    units = {"K": 2 ** 10, "M": 2 ** 20, "G": 2 ** 30, "T": 2 ** 40}
+    size = size.strip().upper().rstrip("B")
+    if size and size[-1] in units:
+        return int(float(size[:-1]) * units[size[-1]])
+    return int(size)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Write a corpus of synthetic IPASC files.")
+    parser.add_argument("directory", help="Directory in which the files are written.")
+    parser.add_argument("--files", type=int, default=10, help="Number of files.")
+    parser.add_argument("--total-size", type=parse_size, default=None,
+                        help="Total size of the time series data, e.g. 100G. Overrides --files.")
+    parser.add_argument("--geometry", choices=DEVICE_GEOMETRIES, default="linear", help="Detector geometry.")
+    parser.add_argument("--detectors", type=int, default=128, help="Number of detectors.")
+    parser.add_argument("--samples", type=int, default=2048, help="Number of samples per detector.")
+    parser.add_argument("--wavelengths", type=int, default=2, help="Number of wavelengths.")
+    parser.add_argument("--measurements", type=int, default=4, help="Number of measurements per file.")
+    parser.add_argument("--dtype", default="float32", help="Data type of the time series data.")
+    parser.add_argument("--compression", default=None, help="HDF5 compression: gzip, lzf or szip.")
+    parser.add_argument("--seed", type=int, default=0, help="Seed of the first file.")
+    parser.add_argument("--workers", type=int, default=None, help="Number of processes that write files.")
+    arguments = parser.parse_args()
+    for path in generate_synthetic_corpus(arguments.directory, arguments.files, arguments.geometry,
+                                          arguments.detectors, arguments.samples, arguments.wavelengths,
+                                          arguments.measurements, arguments.dtype, arguments.seed,
+                                          arguments.compression, arguments.total_size, arguments.workers):
+        print(path)
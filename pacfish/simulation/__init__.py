@@ -0,0 +1,8 @@
+"""
+The purpose of the simulation package is to generate synthetic photoacoustic data with complete IPASC
+metadata, e.g. to test and benchmark the handling of large datasets.
+"""
+
+from pacfish.simulation.SyntheticCorpus import create_synthetic_device, create_synthetic_pa_data, \
+    generate_synthetic_corpus, SyntheticTimeSeriesData
+from pacfish.simulation.PointAbsorberSimulation import PointAbsorberSimulation
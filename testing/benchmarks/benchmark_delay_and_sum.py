@@ -0,0 +1,57 @@
+# SPDX-FileCopyrightText: 2026 International Photoacoustics Standardisation Consortium (IPASC)
+# SPDX-License-Identifier: BSD 3-Clause License
+
+"""
+Benchmark for the reference delay-and-sum reconstruction in 2D and 3D fields of view.
+
+Run it from the repository root with::
+
+    python -m testing.benchmarks.benchmark_delay_and_sum
+"""
+
+import time
+
+import numpy as np
+import pacfish as pf
+
+NUM_DETECTORS = 256
+NUM_SAMPLES = 2048
+SPACING = 0.0001
+
+
+def create_linear_array_pa_data(field_of_view, num_detectors=NUM_DETECTORS, num_samples=NUM_SAMPLES):
+    device_creator = pf.DeviceMetaDataCreator()
+    device_creator.set_general_information(uuid="benchmark-linear-array", fov=np.asarray(field_of_view))
+    for x_position in np.linspace(-0.0192, 0.0192, num_detectors):
+        detection_element_creator = pf.DetectionElementCreator()
+        detection_element_creator.set_detector_position(np.asarray([x_position, 0, 0]))
+        device_creator.add_detection_element(detection_element_creator.get_dictionary())
+
+    acquisition_dict = {pf.MetadataAcquisitionTags.SPEED_OF_SOUND.tag: 1540.0,
+                        pf.MetadataAcquisitionTags.AD_SAMPLING_RATE.tag: 40e6}
+    return pf.PAData(binary_time_series_data=np.random.random((num_detectors, num_samples, 1, 1)),
+                     meta_data_acquisition=acquisition_dict,
+                     meta_data_device=device_creator.finalize_device_meta_data())
+
+
+def run_benchmark(workers=None, tile_size=4096):
+    fields_of_view = {
+        "2D": [-0.0192, 0.0192, 0, 0, 0, 0.0384],
+        "3D": [-0.0048, 0.0048, -0.0048, 0.0048, 0, 0.0096],
+    }
+    results = {}
+    for name, field_of_view in fields_of_view.items():
+        pa_data = create_linear_array_pa_data(field_of_view)
+        das = pf.DelayAndSum(spacing=SPACING, tile_size=tile_size, workers=workers)
+        start_time = time.perf_counter()
+        image = das.reconstruct(pa_data)
+        seconds = time.perf_counter() - start_time
+        num_voxels = int(np.prod(image.shape[:3]))
+        results[name] = num_voxels / seconds
+        print(f"{name}: {image.shape[:3]} voxels, {NUM_DETECTORS} detectors, {seconds:.2f} s, "
+              f"{num_voxels / seconds:,.0f} voxels/s")
+    return results
+
+
+if __name__ == "__main__":
+    run_benchmark()
@@ -0,0 +1,81 @@
+# SPDX-FileCopyrightText: 2026 International Photoacoustics Standardisation Consortium (IPASC)
+# SPDX-License-Identifier: BSD 3-Clause License
+
+"""
+Benchmark of random single-frame reads across many IPASC files with and without a `FileHandlePool`.
+
+Run it from the repository root with::
+
+    python -m testing.benchmarks.benchmark_handle_pool --files 1000 --accesses 5000
+"""
+
+import argparse
+import os
+import tempfile
+import time
+
+import numpy as np
+import pacfish as pf
+
+NUM_FILES = 1000
+NUM_ACCESSES = 5000
+NUM_DETECTORS = 16
+NUM_SAMPLES = 256
+NUM_MEASUREMENTS = 8
+
+
+def write_files(directory: str, num_files: int) -> list:
+    pa_data = pf.create_synthetic_pa_data("linear", NUM_DETECTORS, NUM_SAMPLES, 1, NUM_MEASUREMENTS, seed=0)
+    pa_data.binary_time_series_data = np.asarray(pa_data.binary_time_series_data, dtype=np.float32)
+    file_paths = [os.path.join(directory, f"acquisition_{index:05d}.hdf5") for index in range(num_files)]
+    for file_path in file_paths:
+        pf.write_data(file_path, pa_data)
+    return file_paths
+
+
+def time_accesses(read_frame, accesses) -> float:
+    start_time = time.perf_counter()
+    for file_index, measurement in accesses:
+        read_frame(file_index, measurement)
+    return time.perf_counter() - start_time
+
+
+def run_benchmark(num_files: int = NUM_FILES, num_accesses: int = NUM_ACCESSES, max_open_files=(1000, 128)):
+    random_state = np.random.RandomState(0)
+    accesses = list(zip(random_state.randint(0, num_files, num_accesses),
+                        random_state.randint(0, NUM_MEASUREMENTS, num_accesses)))
+
+    with tempfile.TemporaryDirectory() as temp_dir:
+        file_paths = write_files(temp_dir, num_files)
+        results = {}
+
+        def load_and_read(file_index, measurement):
+            return pf.load_data(file_paths[file_index], lazy=True).binary_time_series_data[..., measurement]
+
+        results["load_data per access"] = time_accesses(load_and_read, accesses)
+
+        views = [pf.LazyTimeSeriesData(file_path) for file_path in file_paths]
+        results["LazyTimeSeriesData views"] = time_accesses(lambda index, measurement: views[index][..., measurement],
+                                                            accesses)
+
+        for max_open in max_open_files:
+            with pf.FileHandlePool(max_open_files=max_open) as pool:
+                pooled_views = [pool.load_data(file_path).binary_time_series_data for file_path in file_paths]
+                pool.hits = pool.misses = 0
+                results[f"FileHandlePool({max_open}) views"] = time_accesses(
+                    lambda index, measurement: pooled_views[index][..., measurement], accesses)
+                hit_rate = pool.hits / max(1, pool.hits + pool.misses)
+                print(f"FileHandlePool({max_open}): {hit_rate:.0%} of the accesses used an open handle")
+
+    print(f"{num_accesses} random frame reads across {num_files} files:")
+    for name, seconds in results.items():
+        print(f"  {name:<32s} {seconds:7.2f} s {num_accesses / seconds:10,.0f} frames/s")
+    return results
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0].strip())
+    parser.add_argument("--files", type=int, default=NUM_FILES)
+    parser.add_argument("--accesses", type=int, default=NUM_ACCESSES)
+    arguments = parser.parse_args()
+    run_benchmark(arguments.files, arguments.accesses)
@@ -0,0 +1,85 @@
+# SPDX-FileCopyrightText: 2021 International Photoacoustics Standardisation Consortium (IPASC)
+# SPDX-License-Identifier: BSD 3-Clause License
+
+"""
+Micro-benchmark for reading the metadata of an IPASC file with a 2048-element device.
+
+Run it from the repository root with::
+
+    python -m testing.benchmarks.benchmark_metadata_loading
+"""
+
+import os
+import tempfile
+import timeit
+
+import h5py
+import numpy as np
+import pacfish as pf
+from pacfish.iohandler.file_reader import read_dictionary, _normalise_value
+from testing.unit_tests.utils import create_complete_acquisition_meta_data_dictionary
+
+NUM_DETECTORS = 2048
+NUM_REPETITIONS = 10
+
+
+def create_device_with_n_elements(num_detectors: int = NUM_DETECTORS) -> dict:
+    device_creator = pf.DeviceMetaDataCreator()
+    device_creator.set_general_information(uuid="benchmark-device", fov=np.asarray([0, 0.05, 0, 0, 0, 0.05]))
+    for idx in range(num_detectors):
+        detection_element_creator = pf.DetectionElementCreator()
+        detection_element_creator.set_detector_position(np.asarray([idx * 0.0001, 0, 0]))
+        detection_element_creator.set_detector_orientation(np.asarray([0, 0, 1]))
+        detection_element_creator.set_detector_geometry_type("CUBOID")
+        detection_element_creator.set_detector_geometry(np.asarray([0.0001, 0.0001, 0.0001]))
+        detection_element_creator.set_frequency_response(np.asarray([np.linspace(1e6, 1e7, 16), np.ones(16)]))
+        detection_element_creator.set_angular_response(np.asarray([np.linspace(0, np.pi, 16), np.ones(16)]))
+        device_creator.add_detection_element(detection_element_creator.get_dictionary())
+    return device_creator.finalize_device_meta_data()
+
+
+def recursive_per_path_reader(h5file, path):
+    """
+    The metadata reader as it was implemented before the switch to a single `visititems` traversal.
+    Kept here as the reference for the comparison.
+    """
+    dictionary = {}
+    for key, item in h5file[path].items():
+        if isinstance(item, h5py.Dataset):
+            dictionary[key] = _normalise_value(item[()])
+        elif isinstance(item, h5py.Group):
+            dictionary[key] = recursive_per_path_reader(h5file, path + key + "/")
+    return dictionary
+
+
+def run_benchmark(num_detectors: int = NUM_DETECTORS, repetitions: int = NUM_REPETITIONS):
+    pa_data = pf.PAData(binary_time_series_data=np.zeros((num_detectors, 16)),
+                        meta_data_acquisition=create_complete_acquisition_meta_data_dictionary(),
+                        meta_data_device=create_device_with_n_elements(num_detectors))
+
+    with tempfile.TemporaryDirectory() as temp_dir:
+        file_path = os.path.join(temp_dir, "benchmark.hdf5")
+        pf.write_data(file_path, pa_data)
+
+        def load_recursive():
+            with h5py.File(file_path, "r") as h5file:
+                recursive_per_path_reader(h5file, "/meta_data_device/")
+
+        def load_visititems():
+            with h5py.File(file_path, "r") as h5file:
+                read_dictionary(h5file["/meta_data_device/"])
+
+        results = {
+            "recursive per-path indexing": min(timeit.repeat(load_recursive, number=1, repeat=repetitions)),
+            "single-pass object visitor": min(timeit.repeat(load_visititems, number=1, repeat=repetitions)),
+            "load_data": min(timeit.repeat(lambda: pf.load_data(file_path), number=1, repeat=repetitions)),
+        }
+
+    print(f"Device metadata of a {num_detectors}-element device (best of {repetitions}):")
+    for name, seconds in results.items():
+        print(f"  {name:<30s} {seconds * 1000:8.1f} ms")
+    return results
+
+
+if __name__ == "__main__":
+    run_benchmark()
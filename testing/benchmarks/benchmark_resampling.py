@@ -0,0 +1,64 @@
+# SPDX-FileCopyrightText: 2026 International Photoacoustics Standardisation Consortium (IPASC)
+# SPDX-License-Identifier: BSD 3-Clause License
+
+"""
+Benchmark of the chunked polyphase resampling against naive FFT resampling of the full time series data,
+comparing the run time and the peak memory allocated by numpy.
+
+Run it from the repository root with::
+
+    python -m testing.benchmarks.benchmark_resampling
+"""
+
+import time
+import tracemalloc
+
+import numpy as np
+import scipy.signal
+import pacfish as pf
+
+NUM_DETECTORS = 256
+NUM_SAMPLES = 2048
+NUM_WAVELENGTHS = 2
+NUM_MEASUREMENTS = 16
+SOURCE_SAMPLING_RATE = 40e6
+TARGET_SAMPLING_RATE = 25e6
+
+
+def create_pa_data():
+    acquisition_dict = {pf.MetadataAcquisitionTags.AD_SAMPLING_RATE.tag: SOURCE_SAMPLING_RATE}
+    time_series = np.random.random((NUM_DETECTORS, NUM_SAMPLES, NUM_WAVELENGTHS, NUM_MEASUREMENTS))
+    return pf.PAData(time_series.astype(np.float32), acquisition_dict, dict())
+
+
+def measure(function):
+    tracemalloc.start()
+    start_time = time.perf_counter()
+    result = function()
+    seconds = time.perf_counter() - start_time
+    _, peak_bytes = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return result, seconds, peak_bytes
+
+
+def run_benchmark():
+    pa_data = create_pa_data()
+    input_bytes = pa_data.binary_time_series_data.nbytes
+    num_output_samples = int(np.ceil(NUM_SAMPLES * TARGET_SAMPLING_RATE / SOURCE_SAMPLING_RATE))
+
+    candidates = {
+        "polyphase (chunked)": lambda: pf.Resampling(TARGET_SAMPLING_RATE).apply(pa_data).binary_time_series_data,
+        "FFT (full array)": lambda: scipy.signal.resample(pa_data.binary_time_series_data, num_output_samples,
+                                                          axis=1),
+    }
+    results = {}
+    for name, function in candidates.items():
+        resampled, seconds, peak_bytes = measure(function)
+        results[name] = (seconds, peak_bytes)
+        print(f"{name}: {resampled.shape}, {seconds:.2f} s, peak memory {peak_bytes / 2 ** 20:,.0f} MiB "
+              f"({peak_bytes / input_bytes:.1f}x the input)")
+    return results
+
+
+if __name__ == "__main__":
+    run_benchmark()
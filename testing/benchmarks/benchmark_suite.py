@@ -0,0 +1,230 @@
+# SPDX-FileCopyrightText: 2026 International Photoacoustics Standardisation Consortium (IPASC)
+# SPDX-License-Identifier: BSD 3-Clause License
+
+"""
+Scaling benchmarks of `load_data`, `write_data`, `quality_check_pa_data` and the `DeviceMetaDataCreator`.
+
+Every operation is run for a set of parameter combinations of the detector count, the number of samples,
+wavelengths and measurements, the data type and the file compression. Starting from a baseline configuration,
+one parameter is varied at a time; `--full` runs the full cartesian product instead. For every case, the best
+wall time of `--repeat` runs, the throughput of the time series data and the peak memory allocated during the
+operation (as traced by `tracemalloc`, in a separate run) are recorded.
+
+The results are written to a JSON file together with the current git commit, so that runs on different commits
+can be compared::
+
+    python -m testing.benchmarks.benchmark_suite --output baseline.json
+    git checkout feature-branch
+    python -m testing.benchmarks.benchmark_suite --output feature.json --compare baseline.json
+"""
+
+import argparse
+import itertools
+import json
+import os
+import platform
+import subprocess
+import tempfile
+import time
+import tracemalloc
+
+import numpy as np
+import pacfish as pf
+from testing.benchmarks.benchmark_metadata_loading import create_device_with_n_elements
+
+BASELINE_PARAMETERS = {
+    "detectors": 256,
+    "samples": 2048,
+    "wavelengths": 2,
+    "measurements": 4,
+    "dtype": "float32",
+    "compression": None,
+}
+
+PARAMETER_VALUES = {
+    "detectors": [64, 256, 1024],
+    "samples": [1024, 2048, 4096],
+    "wavelengths": [1, 2, 8],
+    "measurements": [1, 4, 16],
+    "dtype": ["float32", "int16", "float64"],
+    "compression": [None, "gzip", "lzf"],
+}
+
+# the parameters that an operation depends on; cases that only differ in other parameters are not repeated
+OPERATION_PARAMETERS = {
+    "device_creation": ["detectors"],
+    "write_data": list(PARAMETER_VALUES),
+    "load_data": list(PARAMETER_VALUES),
+    "quality_check_pa_data": ["detectors", "samples", "wavelengths", "measurements", "dtype"],
+}
+
+
+def get_parameter_combinations(full: bool = False) -> list:
+    if full:
+        return [dict(zip(PARAMETER_VALUES, values)) for values in itertools.product(*PARAMETER_VALUES.values())]
+    combinations = [dict(BASELINE_PARAMETERS)]
+    for name, values in PARAMETER_VALUES.items():
+        for value in values:
+            if value != BASELINE_PARAMETERS[name]:
+                combinations.append(dict(BASELINE_PARAMETERS, **{name: value}))
+    return combinations
+
+
+def create_pa_data(parameters: dict) -> pf.PAData:
+    shape = (parameters["detectors"], parameters["samples"], parameters["wavelengths"], parameters["measurements"])
+    rng = np.random.default_rng(0)
+    time_series = (rng.standard_normal(shape, dtype=np.float32) * 1000).astype(parameters["dtype"])
+    acquisition_dict = {
+        pf.MetadataAcquisitionTags.UUID.tag: "benchmark",
+        pf.MetadataAcquisitionTags.DATA_TYPE.tag: parameters["dtype"],
+        pf.MetadataAcquisitionTags.DIMENSIONALITY.tag: "time",
+        pf.MetadataAcquisitionTags.SIZES.tag: np.asarray(shape),
+        pf.MetadataAcquisitionTags.ENCODING.tag: "raw",
+        pf.MetadataAcquisitionTags.COMPRESSION.tag: str(parameters["compression"]),
+        pf.MetadataAcquisitionTags.PHOTOACOUSTIC_IMAGING_DEVICE_REFERENCE.tag: "benchmark-device",
+        pf.MetadataAcquisitionTags.AD_SAMPLING_RATE.tag: 40e6,
+        pf.MetadataAcquisitionTags.SPEED_OF_SOUND.tag: 1540.0,
+        pf.MetadataAcquisitionTags.ACQUISITION_WAVELENGTHS.tag: np.linspace(700e-9, 900e-9, shape[2]),
+        pf.MetadataAcquisitionTags.PULSE_ENERGY.tag: np.full(shape[3], 0.01),
+        pf.MetadataAcquisitionTags.MEASUREMENT_TIMESTAMPS.tag: np.arange(shape[3]) * 0.1,
+        pf.MetadataAcquisitionTags.TIME_GAIN_COMPENSATION.tag: np.ones(shape[1]),
+    }
+    return pf.PAData(time_series, acquisition_dict, create_device_with_n_elements(shape[0]))
+
+
+def measure(function, repeat: int) -> dict:
+    """
+    Returns the best wall time of `repeat` runs of the function and the peak memory traced during one additional
+    run. The memory is traced separately, because `tracemalloc` slows down allocation-heavy code considerably.
+    """
+    seconds = []
+    for _ in range(repeat):
+        start_time = time.perf_counter()
+        function()
+        seconds.append(time.perf_counter() - start_time)
+    tracemalloc.start()
+    try:
+        function()
+        peak_bytes = tracemalloc.get_traced_memory()[1]
+    finally:
+        tracemalloc.stop()
+    return {"seconds": min(seconds), "peak_memory_bytes": peak_bytes}
+
+
+def run_case(operation: str, parameters: dict, directory: str, repeat: int) -> dict:
+    pa_data = None if operation == "device_creation" else create_pa_data(parameters)
+    file_path = os.path.join(directory, "benchmark.hdf5")
+    if operation == "device_creation":
+        function = lambda: create_device_with_n_elements(parameters["detectors"])
+    elif operation == "write_data":
+        function = lambda: pf.write_data(file_path, pa_data, file_compression=parameters["compression"])
+    elif operation == "load_data":
+        pf.write_data(file_path, pa_data, file_compression=parameters["compression"])
+        function = lambda: pf.load_data(file_path)
+    elif operation == "quality_check_pa_data":
+        function = lambda: pf.quality_check_pa_data(pa_data)
+    else:
+        raise ValueError(f"Unknown operation: {operation}")
+
+    result = measure(function, repeat)
+    if operation == "device_creation":
+        # the throughput of the device construction is measured in detection elements per second
+        data_bytes = None
+        result["throughput_elements_per_second"] = parameters["detectors"] / result["seconds"]
+    else:
+        data_bytes = pa_data.binary_time_series_data.nbytes
+        result["throughput_bytes_per_second"] = data_bytes / result["seconds"]
+    if os.path.exists(file_path):
+        result["file_bytes"] = os.path.getsize(file_path)
+        os.remove(file_path)
+    relevant_parameters = {name: parameters[name] for name in OPERATION_PARAMETERS[operation]}
+    return dict(operation=operation, parameters=relevant_parameters, data_bytes=data_bytes, **result)
+
+
+def get_case_key(case: dict) -> str:
+    return case["operation"] + json.dumps(case["parameters"], sort_keys=True)
+
+
+def get_git_commit() -> str:
+    try:
+        return subprocess.run(["git", "rev-parse", "HEAD"], capture_output=True, text=True,
+                              check=True).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def run_benchmarks(operations: list = None, full: bool = False, repeat: int = 3) -> dict:
+    operations = operations or list(OPERATION_PARAMETERS)
+    cases = []
+    with tempfile.TemporaryDirectory() as directory:
+        for operation in operations:
+            seen = set()
+            for parameters in get_parameter_combinations(full):
+                relevant = {name: parameters[name] for name in OPERATION_PARAMETERS[operation]}
+                key = json.dumps(relevant, sort_keys=True)
+                if key in seen:
+                    continue
+                seen.add(key)
+                case = run_case(operation, parameters, directory, repeat)
+                cases.append(case)
+                print(format_case(case))
+    return {"commit": get_git_commit(), "python": platform.python_version(), "numpy": np.__version__,
+            "repeat": repeat, "cases": cases}
+
+
+def format_case(case: dict) -> str:
+    parameters = " ".join(f"{name}={value}" for name, value in case["parameters"].items())
+    if "throughput_bytes_per_second" in case:
+        throughput = f"{case['throughput_bytes_per_second'] / 2 ** 20:9.1f} MiB/s"
+    else:
+        throughput = f"{case['throughput_elements_per_second']:7.0f} elements/s"
+    return (f"{case['operation']:<22s} {parameters:<90s} {case['seconds'] * 1000:9.1f} ms {throughput} "
+            f"peak {case['peak_memory_bytes'] / 2 ** 20:8.1f} MiB")
+
+
+def compare_results(results: dict, baseline: dict, threshold: float = 1.2) -> list:
+    """
+    Compares two benchmark results and returns the keys of the cases whose wall time or peak memory grew by more
+    than the given factor.
+    """
+    baseline_cases = {get_case_key(case): case for case in baseline["cases"]}
+    regressions = []
+    print(f"\nComparison with commit {baseline.get('commit')} (ratios > {threshold} are marked with *):")
+    for case in results["cases"]:
+        key = get_case_key(case)
+        if key not in baseline_cases:
+            continue
+        reference = baseline_cases[key]
+        time_ratio = case["seconds"] / max(reference["seconds"], 1e-9)
+        memory_ratio = case["peak_memory_bytes"] / max(reference["peak_memory_bytes"], 1)
+        regressed = time_ratio > threshold or memory_ratio > threshold
+        if regressed:
+            regressions.append(key)
+        print(f"{'*' if regressed else ' '} {key:<110s} time {time_ratio:5.2f}x memory {memory_ratio:5.2f}x")
+    return regressions
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--output", help="path of the JSON file to write the results to")
+    parser.add_argument("--compare", help="path of a JSON file with the results of a previous run")
+    parser.add_argument("--operations", nargs="+", choices=list(OPERATION_PARAMETERS),
+                        help="the operations to benchmark; all by default")
+    parser.add_argument("--full", action="store_true", help="run the full cartesian product of the parameters")
+    parser.add_argument("--repeat", type=int, default=3, help="number of runs per case; the best time is kept")
+    parser.add_argument("--threshold", type=float, default=1.2, help="ratio above which a case is a regression")
+    arguments = parser.parse_args()
+
+    results = run_benchmarks(arguments.operations, arguments.full, arguments.repeat)
+    if arguments.output is not None:
+        with open(arguments.output, "w") as output_file:
+            json.dump(results, output_file, indent=2)
+    if arguments.compare is not None:
+        with open(arguments.compare, "r") as baseline_file:
+            regressions = compare_results(results, json.load(baseline_file), arguments.threshold)
+        if regressions:
+            raise SystemExit(f"{len(regressions)} benchmark cases regressed.")
+
+
+if __name__ == "__main__":
+    main()
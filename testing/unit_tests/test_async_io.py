@@ -0,0 +1,119 @@
+# SPDX-FileCopyrightText: 2026 International Photoacoustics Standardisation Consortium (IPASC)
+# SPDX-License-Identifier: BSD 3-Clause License
+
+import asyncio
+import os
+import shutil
+import tempfile
+import threading
+import time
+
+import numpy as np
+from unittest.case import TestCase
+import pacfish as pf
+from testing.unit_tests.utils import create_materialised_synthetic_pa_data
+
+
+class AsyncIOTest(TestCase):
+
+    def setUp(self):
+        self.directory = tempfile.mkdtemp()
+        self.pa_data = create_materialised_synthetic_pa_data("ring", 16, 128, 2, 5, seed=6)
+        self.executor = pf.AsyncExecutor(max_workers=2, max_pending=3)
+        print("setUp")
+
+    def tearDown(self):
+        self.executor.shutdown()
+        shutil.rmtree(self.directory)
+        print("tearDown")
+
+    def test_many_files_are_written_and_loaded_concurrently(self):
+        file_paths = [os.path.join(self.directory, f"file_{index}.hdf5") for index in range(6)]
+
+        async def round_trip():
+            await asyncio.gather(*[pf.awrite_data(file_path, self.pa_data, checksums=True, executor=self.executor)
+                                   for file_path in file_paths])
+            return await asyncio.gather(*[pf.aload_data(file_path, executor=self.executor)
+                                          for file_path in file_paths])
+
+        for pa_data in asyncio.run(round_trip()):
+            self.assertTrue((pa_data.binary_time_series_data == self.pa_data.binary_time_series_data).all())
+        self.assertTrue(all(pf.verify_file_integrity(file_path) for file_path in file_paths))
+        # the executor can be used from another event loop
+        pa_data = asyncio.run(pf.aload_data(file_paths[0], lazy=True, executor=self.executor))
+        self.assertIsInstance(pa_data.binary_time_series_data, pf.LazyTimeSeriesData)
+
+    def test_pending_calls_are_bounded(self):
+        lock = threading.Lock()
+        state = {"running": 0, "max_running": 0, "submitted": 0}
+
+        def blocking_call():
+            with lock:
+                state["running"] += 1
+                state["max_running"] = max(state["max_running"], state["running"])
+            time.sleep(0.02)
+            with lock:
+                state["running"] -= 1
+            return threading.get_ident()
+
+        async def submit_all():
+            async def submit():
+                state["submitted"] += 1
+                return await self.executor.run(blocking_call)
+
+            tasks = [asyncio.ensure_future(submit()) for _ in range(8)]
+            await asyncio.sleep(0)
+            # the event loop is not blocked, and only three calls were admitted to the executor
+            self.assertEqual(self.executor._get_semaphore(asyncio.get_running_loop())._value, 0)
+            return await asyncio.gather(*tasks)
+
+        thread_ids = asyncio.run(submit_all())
+        self.assertEqual(state["submitted"], 8)
+        self.assertLessEqual(state["max_running"], 2)
+        self.assertNotIn(threading.get_ident(), thread_ids)
+
+    def test_frames_are_iterated_with_bounded_read_ahead(self):
+        file_path = os.path.join(self.directory, "frames.hdf5")
+        pf.write_data(file_path, self.pa_data)
+
+        async def collect(prefetch):
+            pa_data = await pf.aload_data(file_path, lazy=True, executor=self.executor)
+            return [chunk async for chunk in pf.aiter_measurement_chunks(pa_data.binary_time_series_data, 2,
+                                                                         prefetch=prefetch, executor=self.executor)]
+
+        for prefetch in (1, 3):
+            chunks = asyncio.run(collect(prefetch))
+            self.assertEqual([(start, stop) for start, stop, _ in chunks], [(0, 2), (2, 4), (4, 5)])
+            self.assertTrue((np.concatenate([chunk for _, _, chunk in chunks], axis=3) ==
+                             self.pa_data.binary_time_series_data).all())
+
+        async def first_chunk_of_three_dimensional_data():
+            async for chunk in pf.aiter_measurement_chunks(self.pa_data.binary_time_series_data[..., 0],
+                                                           executor=self.executor):
+                return chunk
+
+        start, stop, chunk = asyncio.run(first_chunk_of_three_dimensional_data())
+        self.assertEqual(chunk.shape, (16, 128, 2, 1))
+
+    def test_cancelled_write_leaves_no_file(self):
+        file_path = os.path.join(self.directory, "cancelled.hdf5")
+        cancellation = pf.CancellationToken()
+        started = threading.Event()
+
+        def slow_progress(progress):
+            started.set()
+            time.sleep(0.05)
+
+        async def cancel_write():
+            task = asyncio.ensure_future(pf.awrite_data(file_path, self.pa_data, progress=slow_progress,
+                                                        cancellation=cancellation, executor=self.executor))
+            while not started.is_set():
+                await asyncio.sleep(0.005)
+            task.cancel()
+            with self.assertRaises(asyncio.CancelledError):
+                await task
+
+        asyncio.run(cancel_write())
+        self.assertTrue(cancellation.cancelled)
+        self.executor.shutdown(wait=True)
+        self.assertEqual(os.listdir(self.directory), [])
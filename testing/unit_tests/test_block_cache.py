@@ -0,0 +1,106 @@
+# SPDX-FileCopyrightText: 2026 International Photoacoustics Standardisation Consortium (IPASC)
+# SPDX-License-Identifier: BSD 3-Clause License
+
+import io
+import os
+import shutil
+import tarfile
+import tempfile
+
+from unittest.case import TestCase
+import pacfish as pf
+from testing.unit_tests.utils import create_materialised_synthetic_pa_data
+
+
+class CountingFile(io.BytesIO):
+    """
+    An in-memory stand-in for a remote file that counts the reads that reach it.
+    """
+
+    def __init__(self, data: bytes):
+        super(CountingFile, self).__init__(data)
+        self.num_reads = 0
+
+    def read(self, size=-1):
+        self.num_reads += 1
+        return super(CountingFile, self).read(size)
+
+    def readinto(self, buffer):
+        self.num_reads += 1
+        return super(CountingFile, self).readinto(buffer)
+
+
+class BlockCacheTest(TestCase):
+
+    def setUp(self):
+        self.directory = tempfile.mkdtemp()
+        self.pa_data = create_materialised_synthetic_pa_data("matrix", 32, 256, 2, 8, seed=10)
+        print("setUp")
+
+    def tearDown(self):
+        shutil.rmtree(self.directory)
+        print("tearDown")
+
+    def write_bytes(self, checksums: bool = False) -> bytes:
+        file_path = os.path.join(self.directory, "block_cache.hdf5")
+        pf.write_data(file_path, self.pa_data, checksums=checksums)
+        with open(file_path, "rb") as file:
+            return file.read()
+
+    def test_blocks_are_cached_and_read_ahead(self):
+        data = bytes(range(256)) * 40
+        file_object = CountingFile(data)
+        cached_file = pf.BlockCachedFile(file_object, block_size=1024, cache_bytes=4096, read_ahead=1)
+        self.assertEqual(cached_file.size, len(data))
+
+        cached_file.seek(1000)
+        self.assertEqual(cached_file.read(100), data[1000:1100])
+        self.assertEqual((cached_file.num_reads, cached_file.bytes_fetched), (1, 3072))
+        # the read-ahead block is served from the cache
+        self.assertEqual(cached_file.read(2000), data[1100:3100])
+        self.assertEqual(cached_file.num_reads, 2)
+        self.assertEqual(cached_file.seek(-10, os.SEEK_END), len(data) - 10)
+        self.assertEqual(cached_file.read(), data[-10:])
+        self.assertEqual(cached_file.read(1), b"")
+        self.assertLessEqual(len(cached_file._blocks), cached_file.max_blocks)
+        self.assertEqual(cached_file.num_reads, file_object.num_reads)
+
+        cached_file.seek(0)
+        self.assertEqual(cached_file.read(), data)
+        with self.assertRaises(ValueError):
+            cached_file.seek(-1)
+
+    def test_frames_are_read_from_file_objects_with_few_reads(self):
+        expected = self.pa_data.binary_time_series_data
+        for checksums in (False, True):
+            file_object = CountingFile(self.write_bytes(checksums))
+            pa_data = pf.load_data(file_object, lazy=True)
+            lazy_data = pa_data.binary_time_series_data
+            self.assertTrue((lazy_data[..., 3] == expected[..., 3]).all())
+            self.assertTrue((lazy_data[4:20:2, 10:, 1, 2:5] == expected[4:20:2, 10:, 1, 2:5]).all())
+            # a frame of contiguous data would otherwise be read with one read per element
+            self.assertLess(file_object.num_reads, 50)
+            self.assertEqual(lazy_data.file_path.block_size,
+                             pf.iohandler.block_cache.MAX_BLOCK_SIZE if not checksums else
+                             pf.iohandler.block_cache.MIN_BLOCK_SIZE)
+            self.assertEqual(pa_data.get_sampling_rate(), self.pa_data.get_sampling_rate())
+
+        cached_file = pf.BlockCachedFile(CountingFile(self.write_bytes()), block_size=2 ** 14, read_ahead=0)
+        pa_data = pf.load_data(cached_file)
+        self.assertEqual(cached_file.block_size, 2 ** 14)
+        self.assertTrue((pa_data.binary_time_series_data == expected).all())
+        self.assertTrue((pa_data.get_detector_position() ==
+                         pf.load_data(io.BytesIO(self.write_bytes())).get_detector_position()).all())
+
+    def test_files_are_read_from_tar_bundles(self):
+        self.write_bytes(checksums=True)
+        bundle_path = os.path.join(self.directory, "bundle.tar")
+        with tarfile.open(bundle_path, "w") as bundle:
+            bundle.add(os.path.join(self.directory, "block_cache.hdf5"), arcname="acquisition.hdf5")
+
+        with tarfile.open(bundle_path) as bundle:
+            pa_data = pf.load_data(bundle.extractfile("acquisition.hdf5"))
+        self.assertTrue((pa_data.binary_time_series_data == self.pa_data.binary_time_series_data).all())
+
+        with self.assertRaises(ValueError):
+            pf.load_data(object())
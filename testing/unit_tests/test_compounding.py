@@ -0,0 +1,104 @@
+# SPDX-FileCopyrightText: 2026 International Photoacoustics Standardisation Consortium (IPASC)
+# SPDX-License-Identifier: BSD 3-Clause License
+
+import os
+import shutil
+import tempfile
+
+import numpy as np
+from scipy.spatial.transform import Rotation
+from unittest.case import TestCase
+import pacfish as pf
+from testing.unit_tests.test_delay_and_sum import create_point_source_pa_data, SAMPLING_RATE, SPEED_OF_SOUND
+
+FIELD_OF_VIEW = [-0.003, 0.003, 0, 0, -0.003, 0.003]
+SOURCE_POSITION = np.asarray([0.001, 0, -0.0015])
+
+
+def create_posed_scan(poses):
+    pa_data = create_point_source_pa_data([0, 0, 0], FIELD_OF_VIEW)
+    detector_positions = pf.transform_detector_positions(pa_data.get_detector_position(), poses)
+    distances = np.linalg.norm(detector_positions - SOURCE_POSITION, axis=-1)
+    samples = np.arange(1024)[np.newaxis, np.newaxis, :]
+    arrival_samples = (distances * SAMPLING_RATE / SPEED_OF_SOUND)[:, :, np.newaxis]
+    time_series = np.exp(-0.5 * (samples - arrival_samples) ** 2)
+    pa_data.binary_time_series_data = np.moveaxis(time_series, 0, -1)[:, :, np.newaxis, :]
+    pa_data.meta_data_acquisition[pf.MetadataAcquisitionTags.MEASUREMENT_SPATIAL_POSES.tag] = poses
+    return pa_data
+
+
+class CompoundingTest(TestCase):
+
+    def setUp(self):
+        self.directory = tempfile.mkdtemp()
+        print("setUp")
+
+    def tearDown(self):
+        shutil.rmtree(self.directory)
+        print("tearDown")
+
+    def test_pose_transforms_match_per_detector_loop(self):
+        rng = np.random.default_rng(0)
+        detector_positions = rng.normal(size=(7, 3))
+        poses = np.concatenate([rng.normal(size=(5, 3)), rng.uniform(-np.pi, np.pi, size=(5, 3))], axis=-1)
+
+        positions = pf.transform_detector_positions(detector_positions, poses)
+
+        self.assertEqual(positions.shape, (5, 7, 3))
+        for measurement, pose in enumerate(poses):
+            rotation = Rotation.from_euler("xyz", pose[3:])
+            for detector, position in enumerate(detector_positions):
+                self.assertTrue(np.allclose(positions[measurement, detector], rotation.apply(position) + pose[:3]))
+
+        translated = pf.transform_detector_positions(detector_positions, poses[:, :3])
+        self.assertTrue(np.allclose(translated, detector_positions[np.newaxis] + poses[:, np.newaxis, :3]))
+        with self.assertRaises(ValueError):
+            pf.transform_detector_positions(detector_positions, poses[:, :4])
+
+    def test_compounding_without_poses_is_the_mean_reconstruction(self):
+        pa_data = create_point_source_pa_data(SOURCE_POSITION, FIELD_OF_VIEW)
+        pa_data.binary_time_series_data = np.concatenate([pa_data.binary_time_series_data,
+                                                          2 * pa_data.binary_time_series_data], axis=-1)
+
+        volume = pf.CompoundingReconstruction(spacing=0.0003, tile_size=50).reconstruct(pa_data)
+        image = pf.DelayAndSum(spacing=0.0003).reconstruct(pa_data)
+
+        self.assertEqual(volume.shape, image.shape[:4])
+        self.assertTrue(np.allclose(volume, np.mean(image, axis=-1)))
+
+    def test_posed_measurements_are_compounded_at_the_source_position(self):
+        angles = np.linspace(0, np.pi / 2, 4)
+        poses = np.stack([np.full(4, 0.0005), np.zeros(4), np.linspace(0, 0.001, 4),
+                          np.zeros(4), angles, np.zeros(4)], axis=-1)
+        pa_data = create_posed_scan(poses)
+
+        compounding = pf.CompoundingReconstruction(spacing=0.0002, workers=2, measurements_per_chunk=3)
+        volume = compounding.reconstruct(pa_data)
+
+        grid = pf.ReconstructionGrid(FIELD_OF_VIEW, 0.0002)
+        peak = grid.get_voxel_positions()[np.argmax(volume)]
+        self.assertTrue(np.allclose(peak, SOURCE_POSITION, atol=0.0002))
+
+        # ignoring the poses smears the source over several positions
+        pa_data.meta_data_acquisition.pop(pf.MetadataAcquisitionTags.MEASUREMENT_SPATIAL_POSES.tag)
+        self.assertLess(np.max(compounding.reconstruct(pa_data)), 0.9 * np.max(volume))
+
+    def test_lazily_loaded_scan_is_streamed_into_a_shared_volume(self):
+        poses = np.stack([np.linspace(-0.001, 0.001, 3), np.zeros(3), np.zeros(3)], axis=-1)
+        pa_data = create_posed_scan(np.concatenate([poses, np.zeros((3, 3))], axis=-1))
+        file_path = os.path.join(self.directory, "scan.hdf5")
+        pf.write_data(file_path, pa_data)
+        lazy_pa_data = pf.load_data(file_path, lazy=True)
+
+        compounding = pf.CompoundingReconstruction(spacing=0.0003)
+        expected = compounding.reconstruct(pa_data)
+        volume = np.zeros_like(expected)
+        compounding.reconstruct(lazy_pa_data, volume=volume)
+        compounding.reconstruct(lazy_pa_data, volume=volume)
+        self.assertTrue(np.allclose(volume, 6 * expected))
+
+        with self.assertRaises(ValueError):
+            compounding.reconstruct(lazy_pa_data, volume=np.zeros((2, 2, 2, 1)))
+        pa_data.meta_data_acquisition[pf.MetadataAcquisitionTags.MEASUREMENT_SPATIAL_POSES.tag] = poses[:2]
+        with self.assertRaises(ValueError):
+            compounding.reconstruct(pa_data)
@@ -0,0 +1,69 @@
+# SPDX-FileCopyrightText: 2026 International Photoacoustics Standardisation Consortium (IPASC)
+# SPDX-License-Identifier: BSD 3-Clause License
+
+import numpy as np
+from unittest.case import TestCase
+import pacfish as pf
+
+SPEED_OF_SOUND = 1500.0
+SAMPLING_RATE = 40e6
+
+
+def create_point_source_pa_data(source_position, field_of_view, num_samples=1024):
+    device_creator = pf.DeviceMetaDataCreator()
+    device_creator.set_general_information(uuid="ring", fov=np.asarray(field_of_view))
+    angles = np.linspace(0, 2 * np.pi, 64, endpoint=False)
+    detector_positions = np.stack([np.cos(angles) * 0.01, np.zeros_like(angles), np.sin(angles) * 0.01], axis=-1)
+    for position in detector_positions:
+        detection_element_creator = pf.DetectionElementCreator()
+        detection_element_creator.set_detector_position(position)
+        device_creator.add_detection_element(detection_element_creator.get_dictionary())
+
+    distances = np.linalg.norm(detector_positions - np.asarray(source_position), axis=-1)
+    samples = np.arange(num_samples)[np.newaxis, :]
+    arrival_samples = (distances * SAMPLING_RATE / SPEED_OF_SOUND)[:, np.newaxis]
+    time_series = np.exp(-0.5 * (samples - arrival_samples) ** 2)
+
+    acquisition_dict = {pf.MetadataAcquisitionTags.SPEED_OF_SOUND.tag: SPEED_OF_SOUND,
+                        pf.MetadataAcquisitionTags.AD_SAMPLING_RATE.tag: SAMPLING_RATE}
+    return pf.PAData(binary_time_series_data=time_series[:, :, np.newaxis, np.newaxis],
+                     meta_data_acquisition=acquisition_dict,
+                     meta_data_device=device_creator.finalize_device_meta_data())
+
+
+class DelayAndSumTest(TestCase):
+
+    def setUp(self):
+        print("setUp")
+
+    def tearDown(self):
+        print("tearDown")
+
+    def test_reconstruction_grid(self):
+        grid = pf.ReconstructionGrid(np.asarray([-0.005, 0.005, 0, 0, 0, 0.002]), 0.001)
+        self.assertEqual(grid.shape, (10, 1, 2))
+        positions = grid.get_voxel_positions()
+        self.assertEqual(positions.shape, (20, 3))
+        self.assertTrue(np.allclose(positions[0], [-0.0045, 0, 0.0005]))
+        self.assertTrue(np.allclose(grid.get_voxel_positions(3, 5), positions[3:5]))
+
+    def test_point_source_is_reconstructed_at_its_position_in_2d(self):
+        field_of_view = [-0.005, 0.005, 0, 0, -0.005, 0.005]
+        pa_data = create_point_source_pa_data([0.002, 0, -0.001], field_of_view)
+
+        image = pf.DelayAndSum(spacing=0.0002, tile_size=500, workers=4).reconstruct(pa_data)
+
+        self.assertEqual(image.shape, (50, 1, 50, 1, 1))
+        grid = pf.ReconstructionGrid(field_of_view, 0.0002)
+        peak = grid.get_voxel_positions()[np.argmax(image)]
+        self.assertTrue(np.allclose(peak, [0.002, 0, -0.001], atol=0.0002))
+
+    def test_tiling_and_workers_do_not_change_the_result(self):
+        field_of_view = [-0.002, 0.002, -0.002, 0.002, -0.002, 0.002]
+        pa_data = create_point_source_pa_data([0, 0, 0], field_of_view)
+
+        image_1 = pf.DelayAndSum(spacing=0.0005, tile_size=7, workers=3).reconstruct(pa_data)
+        image_2 = pf.DelayAndSum(spacing=0.0005, tile_size=10000, workers=1).reconstruct(pa_data)
+
+        self.assertEqual(image_1.shape, (8, 8, 8, 1, 1))
+        self.assertTrue(np.allclose(image_1, image_2))
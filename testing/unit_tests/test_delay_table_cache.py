@@ -0,0 +1,90 @@
+# SPDX-FileCopyrightText: 2026 International Photoacoustics Standardisation Consortium (IPASC)
+# SPDX-License-Identifier: BSD 3-Clause License
+
+import os
+import shutil
+import tempfile
+
+import numpy as np
+from unittest.case import TestCase
+import pacfish as pf
+from testing.unit_tests.test_delay_and_sum import create_point_source_pa_data
+
+FIELD_OF_VIEW = [-0.003, 0.003, 0, 0, -0.003, 0.003]
+
+
+class DelayTableCacheTest(TestCase):
+
+    def setUp(self):
+        self.directory = tempfile.mkdtemp()
+        self.pa_data = create_point_source_pa_data([0.001, 0, 0.001], FIELD_OF_VIEW)
+        self.detector_positions = self.pa_data.get_detector_position()
+        self.grid = pf.ReconstructionGrid(FIELD_OF_VIEW, 0.0002)
+        print("setUp")
+
+    def tearDown(self):
+        shutil.rmtree(self.directory)
+        print("tearDown")
+
+    def test_tables_are_reused_from_memory_and_disk(self):
+        cache = pf.DelayTableCache(cache_directory=self.directory)
+        table = cache.get_delay_table(self.detector_positions, self.grid, 1500.0, 40e6)
+        self.assertEqual(table.shape, (64, self.grid.num_voxels))
+        self.assertIs(cache.get_delay_table(self.detector_positions, self.grid, 1500.0, 40e6), table)
+        self.assertEqual((cache.hits, cache.misses), (1, 1))
+
+        other_cache = pf.DelayTableCache(cache_directory=self.directory)
+        loaded_table = other_cache.get_delay_table(self.detector_positions, self.grid, 1500.0, 40e6)
+        self.assertIsInstance(loaded_table, np.memmap)
+        self.assertTrue((loaded_table == table).all())
+        self.assertEqual((other_cache.hits, other_cache.misses), (1, 0))
+
+        other_cache.get_delay_table(self.detector_positions, self.grid, 1480.0, 40e6)
+        self.assertEqual(other_cache.misses, 1)
+
+    def test_size_based_eviction(self):
+        table_bytes = 64 * self.grid.num_voxels * 4
+        cache = pf.DelayTableCache(cache_directory=self.directory, max_memory_bytes=table_bytes,
+                                   max_disk_bytes=2 * table_bytes + 1024)
+        for speed_of_sound in [1480.0, 1500.0, 1520.0]:
+            cache.get_delay_table(self.detector_positions, self.grid, speed_of_sound, 40e6)
+        self.assertEqual(len(os.listdir(self.directory)), 2)
+        self.assertEqual(len(cache._tables), 1)
+
+        cache.clear()
+        cache.get_delay_table(self.detector_positions, self.grid, 1480.0, 40e6)
+        self.assertEqual(cache.misses, 4)
+
+    def test_tables_exceeding_the_memory_limit_are_computed_into_the_cache_directory(self):
+        table_bytes = 64 * self.grid.num_voxels * 4
+        expected_table = pf.DelayTableCache().compute_delay_table(self.detector_positions, self.grid, 1500.0, 40e6)
+
+        cache = pf.DelayTableCache(cache_directory=self.directory, max_memory_bytes=table_bytes - 1, tile_size=64)
+        table = cache.get_delay_table(self.detector_positions, self.grid, 1500.0, 40e6)
+        self.assertIsInstance(table, np.memmap)
+        self.assertTrue((table == expected_table).all())
+        self.assertEqual(os.listdir(self.directory), [cache.get_key(self.detector_positions, self.grid,
+                                                                    1500.0, 40e6) + ".npy"])
+        self.assertEqual(len(cache._tables), 0)
+        cache.get_delay_table(self.detector_positions, self.grid, 1500.0, 40e6)
+        self.assertEqual((cache.hits, cache.misses), (1, 1))
+
+        cache = pf.DelayTableCache(max_memory_bytes=table_bytes - 1)
+        self.assertIsNone(cache.get_delay_table(self.detector_positions, self.grid, 1500.0, 40e6))
+        cache = pf.DelayTableCache(cache_directory=self.directory, max_memory_bytes=table_bytes - 1,
+                                   max_disk_bytes=table_bytes - 1)
+        self.assertIsNone(cache.get_delay_table(self.detector_positions, self.grid, 1480.0, 40e6))
+
+        cache = pf.DelayTableCache(max_memory_bytes=table_bytes - 1)
+        image = pf.DelayAndSum(spacing=0.0002).reconstruct(self.pa_data)
+        uncached_image = pf.DelayAndSum(spacing=0.0002, delay_table_cache=cache).reconstruct(self.pa_data)
+        self.assertTrue((image == uncached_image).all())
+
+    def test_reconstruction_with_cache_matches_reconstruction_without_cache(self):
+        cache = pf.DelayTableCache()
+        image = pf.DelayAndSum(spacing=0.0002).reconstruct(self.pa_data)
+        cached_image_1 = pf.DelayAndSum(spacing=0.0002, delay_table_cache=cache).reconstruct(self.pa_data)
+        cached_image_2 = pf.DelayAndSum(spacing=0.0002, delay_table_cache=cache).reconstruct(self.pa_data)
+        self.assertTrue(np.allclose(image, cached_image_1, atol=1e-3 * np.max(image)))
+        self.assertTrue((cached_image_1 == cached_image_2).all())
+        self.assertEqual(cache.hits, 1)
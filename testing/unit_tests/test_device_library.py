@@ -0,0 +1,101 @@
+# SPDX-FileCopyrightText: 2026 International Photoacoustics Standardisation Consortium (IPASC)
+# SPDX-License-Identifier: BSD 3-Clause License
+
+import copy
+import os
+import shutil
+import tempfile
+
+import h5py
+import numpy as np
+from unittest.case import TestCase
+import pacfish as pf
+from pacfish.iohandler.file_reader import clear_device_cache
+from pacfish.iohandler.file_writer import DEVICE_DIGEST_ATTRIBUTE, compute_device_digest
+from testing.unit_tests.utils import create_complete_device_metadata_dictionary, \
+    create_complete_acquisition_meta_data_dictionary, assert_equal_dicts
+
+
+class DeviceLibraryTest(TestCase):
+
+    def setUp(self):
+        self.directory = tempfile.mkdtemp()
+        self.library_path = os.path.join(self.directory, "devices.hdf5")
+        self.device_dict = create_complete_device_metadata_dictionary()
+        clear_device_cache()
+        print("setUp")
+
+    def tearDown(self):
+        clear_device_cache()
+        shutil.rmtree(self.directory)
+        print("tearDown")
+
+    def test_write_and_read_with_device_library(self):
+        acquisition_dict = create_complete_acquisition_meta_data_dictionary()
+        pa_data = pf.PAData(binary_time_series_data=np.random.random((4, 100, 2)),
+                            meta_data_acquisition=acquisition_dict,
+                            meta_data_device=self.device_dict)
+        reference = acquisition_dict[pf.MetadataAcquisitionTags.PHOTOACOUSTIC_IMAGING_DEVICE_REFERENCE.tag]
+
+        file_paths = [os.path.join(self.directory, f"file_{idx}.hdf5") for idx in range(2)]
+        for file_path in file_paths:
+            pf.write_data(file_path, pa_data, device_library=self.library_path)
+
+        with h5py.File(file_paths[0], "r") as h5file:
+            self.assertNotIn("meta_data_device/detectors", h5file)
+        with h5py.File(self.library_path, "r") as library_file:
+            self.assertEqual(list(library_file.keys()), [reference])
+
+        test_data_1 = pf.load_data(file_paths[0], device_library=self.library_path)
+        test_data_2 = pf.load_data(file_paths[1], device_library=self.library_path)
+
+        assert_equal_dicts(pa_data.meta_data_acquisition, test_data_1.meta_data_acquisition)
+        assert_equal_dicts(pa_data.meta_data_device, test_data_1.meta_data_device)
+        # the cached device is copied, so changes to one instance do not leak into the others
+        self.assertIsNot(test_data_1.meta_data_device, test_data_2.meta_data_device)
+        test_data_1.meta_data_device[pf.MetadataDeviceTags.GENERAL.tag][pf.MetadataDeviceTags.UNIQUE_IDENTIFIER.tag] = \
+            "modified"
+        assert_equal_dicts(pa_data.meta_data_device,
+                           pf.load_device_from_library(self.library_path, reference))
+        self.assertTrue(pf.quality_check_pa_data(test_data_1))
+
+    def test_reference_falls_back_to_device_uuid(self):
+        acquisition_dict = create_complete_acquisition_meta_data_dictionary()
+        del acquisition_dict[pf.MetadataAcquisitionTags.PHOTOACOUSTIC_IMAGING_DEVICE_REFERENCE.tag]
+        pa_data = pf.PAData(binary_time_series_data=np.zeros((4, 100)),
+                            meta_data_acquisition=acquisition_dict,
+                            meta_data_device=self.device_dict)
+        file_path = os.path.join(self.directory, "file.hdf5")
+        pf.write_data(file_path, pa_data, device_library=self.library_path)
+
+        test_data = pf.load_data(file_path, device_library=self.library_path)
+        self.assertEqual(test_data.get_photoacoustic_imaging_device_reference(), pa_data.get_device_uuid())
+        assert_equal_dicts(pa_data.meta_data_device, test_data.meta_data_device)
+
+    def test_missing_device_raises_error(self):
+        pf.add_device_to_library(self.library_path, "other_device", self.device_dict)
+        with self.assertRaises(KeyError):
+            pf.load_device_from_library(self.library_path, "unknown_device")
+        assert_equal_dicts(self.device_dict, pf.load_device_from_library(self.library_path, "other_device"))
+
+    def test_conflicting_devices_are_not_overwritten_silently(self):
+        detector = list(self.device_dict[pf.MetadataDeviceTags.DETECTORS.tag].values())[0]
+        detector[pf.MetadataDeviceTags.ANGULAR_RESPONSE.tag][1, 0] = np.nan
+        pf.add_device_to_library(self.library_path, "device", self.device_dict)
+        with h5py.File(self.library_path, "r") as library_file:
+            self.assertEqual(library_file["device"].attrs[DEVICE_DIGEST_ATTRIBUTE],
+                             compute_device_digest(self.device_dict))
+        # storing the same device again is a no-op, also if it contains NaN values
+        pf.add_device_to_library(self.library_path, "device", copy.deepcopy(self.device_dict))
+
+        other_device = copy.deepcopy(self.device_dict)
+        other_device[pf.MetadataDeviceTags.GENERAL.tag][pf.MetadataDeviceTags.UNIQUE_IDENTIFIER.tag] = "other"
+        with self.assertRaises(ValueError):
+            pf.add_device_to_library(self.library_path, "device", other_device)
+        self.assertEqual(pf.load_device_from_library(self.library_path, "device")[
+            pf.MetadataDeviceTags.GENERAL.tag][pf.MetadataDeviceTags.UNIQUE_IDENTIFIER.tag],
+            self.device_dict[pf.MetadataDeviceTags.GENERAL.tag][pf.MetadataDeviceTags.UNIQUE_IDENTIFIER.tag])
+
+        pf.add_device_to_library(self.library_path, "device", other_device, overwrite=True)
+        with h5py.File(self.library_path, "r") as library_file:
+            self.assertEqual(library_file["device"].attrs[DEVICE_DIGEST_ATTRIBUTE], compute_device_digest(other_device))
@@ -0,0 +1,98 @@
+# SPDX-FileCopyrightText: 2026 International Photoacoustics Standardisation Consortium (IPASC)
+# SPDX-License-Identifier: BSD 3-Clause License
+
+import os
+import shutil
+import tempfile
+
+import h5py
+import numpy as np
+from unittest.case import TestCase
+import pacfish as pf
+from testing.unit_tests.utils import create_complete_device_metadata_dictionary, \
+    create_complete_acquisition_meta_data_dictionary
+
+
+class FileCatalogueTest(TestCase):
+
+    def setUp(self):
+        self.directory = tempfile.mkdtemp()
+        self.file_paths = []
+        settings = [("scanner_a", 40e6, [700, 800]),
+                    ("scanner_a", 20e6, [700, 850]),
+                    ("scanner_b", 40e6, [700, 800, 850])]
+        for idx, (reference, sampling_rate, wavelengths) in enumerate(settings):
+            self.file_paths.append(os.path.join(self.directory, f"file_{idx}.hdf5"))
+            self.write_file(self.file_paths[-1], reference, sampling_rate, wavelengths)
+        print("setUp")
+
+    def tearDown(self):
+        shutil.rmtree(self.directory)
+        print("tearDown")
+
+    @staticmethod
+    def write_file(file_path, reference, sampling_rate, wavelengths):
+        acquisition_dict = create_complete_acquisition_meta_data_dictionary()
+        acquisition_dict[pf.MetadataAcquisitionTags.PHOTOACOUSTIC_IMAGING_DEVICE_REFERENCE.tag] = reference
+        acquisition_dict[pf.MetadataAcquisitionTags.AD_SAMPLING_RATE.tag] = sampling_rate
+        acquisition_dict[pf.MetadataAcquisitionTags.ACQUISITION_WAVELENGTHS.tag] = np.asarray(wavelengths)
+        pa_data = pf.PAData(binary_time_series_data=np.zeros((4, 10, len(wavelengths))),
+                            meta_data_acquisition=acquisition_dict,
+                            meta_data_device=create_complete_device_metadata_dictionary())
+        pf.write_data(file_path, pa_data)
+
+    def test_query_catalogue(self):
+        with pf.FileCatalogue() as catalogue:
+            self.assertEqual(catalogue.update([self.directory]), 3)
+
+            self.assertEqual(catalogue.query(photoacoustic_imaging_device_reference="scanner_a"),
+                             self.file_paths[:2])
+            self.assertEqual(catalogue.query(ad_sampling_rate=(30e6, None)),
+                             [self.file_paths[0], self.file_paths[2]])
+            self.assertEqual(catalogue.query(acquisition_wavelengths=[700, 850]), self.file_paths[1:])
+            self.assertEqual(catalogue.query(photoacoustic_imaging_device_reference="scanner_b",
+                                             ad_sampling_rate=(None, 30e6)), [])
+            self.assertEqual(catalogue.query(num_detectors=4), self.file_paths)
+            self.assertEqual(catalogue.query(), self.file_paths)
+
+    def test_incremental_update(self):
+        database_path = os.path.join(self.directory, "catalogue.sqlite")
+        with pf.FileCatalogue(database_path) as catalogue:
+            catalogue.update([self.directory])
+
+        self.write_file(self.file_paths[0], "scanner_c", 40e6, [700])
+        os.utime(self.file_paths[0], (0, 0))
+        os.remove(self.file_paths[1])
+
+        with pf.FileCatalogue(database_path) as catalogue:
+            self.assertEqual(catalogue.update([self.directory]), 1)
+            self.assertEqual(catalogue.update([self.directory]), 0)
+            self.assertEqual(catalogue.query(photoacoustic_imaging_device_reference="scanner_c"),
+                             [self.file_paths[0]])
+            self.assertEqual(catalogue.query(photoacoustic_imaging_device_reference="scanner_a"), [])
+            self.assertEqual(catalogue.query(), [self.file_paths[0], self.file_paths[2]])
+
+    def test_unreadable_files_are_recorded(self):
+        garbage_path = os.path.join(self.directory, "garbage.hdf5")
+        with open(garbage_path, "wb") as file:
+            file.write(b"not an HDF5 file")
+        foreign_path = os.path.join(self.directory, "foreign.h5")
+        with h5py.File(foreign_path, "w") as h5file:
+            h5file["data"] = np.zeros(3)
+
+        with self.assertLogs("pacfish.iohandler.file_catalogue", level="WARNING"):
+            with pf.FileCatalogue() as catalogue:
+                self.assertEqual(catalogue.update([self.directory]), 5)
+                self.assertEqual(catalogue.query(), self.file_paths)
+                errors = catalogue.get_errors()
+                self.assertEqual(sorted(errors), [os.path.abspath(foreign_path), os.path.abspath(garbage_path)])
+                self.assertIn("OSError", errors[os.path.abspath(garbage_path)])
+                self.assertEqual(catalogue.update([self.directory]), 0)
+
+                # a repaired file is indexed again
+                self.write_file(garbage_path, "scanner_c", 40e6, [700])
+                os.utime(garbage_path, (0, 0))
+                self.assertEqual(catalogue.update([self.directory]), 1)
+                self.assertEqual(catalogue.query(photoacoustic_imaging_device_reference="scanner_c"),
+                                 [os.path.abspath(garbage_path)])
+                self.assertEqual(list(catalogue.get_errors()), [os.path.abspath(foreign_path)])
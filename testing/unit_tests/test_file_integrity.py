@@ -0,0 +1,58 @@
+# SPDX-FileCopyrightText: 2026 International Photoacoustics Standardisation Consortium (IPASC)
+# SPDX-License-Identifier: BSD 3-Clause License
+
+import os
+
+import h5py
+import numpy as np
+from unittest.case import TestCase
+import pacfish as pf
+from testing.unit_tests.utils import create_complete_device_metadata_dictionary, \
+    create_complete_acquisition_meta_data_dictionary
+
+FILE_PATH = "ipasc_integrity_test.hdf5"
+
+
+class FileIntegrityTest(TestCase):
+
+    def setUp(self):
+        pa_data = pf.PAData(binary_time_series_data=np.random.random((64, 1024, 2, 4)),
+                            meta_data_acquisition=create_complete_acquisition_meta_data_dictionary(),
+                            meta_data_device=create_complete_device_metadata_dictionary())
+        pf.write_data(FILE_PATH, pa_data, checksums=True)
+        self.pa_data = pa_data
+        print("setUp")
+
+    def tearDown(self):
+        if os.path.exists(FILE_PATH):
+            os.remove(FILE_PATH)
+        print("tearDown")
+
+    def test_intact_file_is_verified(self):
+        self.assertTrue(pf.verify_file_integrity(FILE_PATH))
+        self.assertTrue(pf.verify_file_integrity(FILE_PATH, workers=4))
+        test_data = pf.load_data(FILE_PATH)
+        self.assertTrue((self.pa_data.binary_time_series_data == test_data.binary_time_series_data).all())
+
+    def test_corrupt_chunk_is_detected(self):
+        with h5py.File(FILE_PATH, "r") as h5file:
+            info = h5file["binary_time_series_data"].id.get_chunk_info(1)
+        with open(FILE_PATH, "r+b") as file_handle:
+            file_handle.seek(info.byte_offset + 16)
+            value = file_handle.read(1)
+            file_handle.seek(info.byte_offset + 16)
+            file_handle.write(bytes([value[0] ^ 0xFF]))
+
+        self.assertFalse(pf.verify_file_integrity(FILE_PATH, workers=4))
+
+    def test_changed_meta_data_is_detected(self):
+        with h5py.File(FILE_PATH, "r+") as h5file:
+            del h5file["meta_data/overall_gain"]
+            h5file["meta_data/overall_gain"] = 3.3
+
+        self.assertFalse(pf.verify_file_integrity(FILE_PATH))
+
+    def test_file_without_checksums_raises_error(self):
+        pf.write_data(FILE_PATH, self.pa_data)
+        with self.assertRaises(ValueError):
+            pf.verify_file_integrity(FILE_PATH)
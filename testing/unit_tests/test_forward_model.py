@@ -0,0 +1,89 @@
+# SPDX-FileCopyrightText: 2026 International Photoacoustics Standardisation Consortium (IPASC)
+# SPDX-License-Identifier: BSD 3-Clause License
+
+import os
+import shutil
+import tempfile
+
+import numpy as np
+import scipy.sparse.linalg
+from unittest.case import TestCase
+import pacfish as pf
+from testing.unit_tests.test_delay_and_sum import create_point_source_pa_data
+
+FIELD_OF_VIEW = [-0.002, 0.002, 0, 0, -0.002, 0.002]
+ANGLES = np.linspace(0, np.pi / 3, 16)
+
+
+class ForwardModelTest(TestCase):
+
+    def setUp(self):
+        self.directory = tempfile.mkdtemp()
+        self.pa_data = create_point_source_pa_data([0.001, 0, 0.001], FIELD_OF_VIEW, num_samples=512)
+        print("setUp")
+
+    def tearDown(self):
+        shutil.rmtree(self.directory)
+        print("tearDown")
+
+    def test_matrix_and_operator_agree(self):
+        forward_model = pf.ForwardModel(spacing=0.0002, detectors_per_block=10, tile_size=100,
+                                        distance_weighting=True)
+        matrix = forward_model.build(self.pa_data)
+        operator = forward_model.get_operator(self.pa_data)
+        self.assertEqual(matrix.shape, (64 * 512, 400))
+        self.assertEqual(operator.shape, matrix.shape)
+        self.assertEqual(matrix.nnz, 2 * 64 * 400)
+
+        image = np.random.random(400)
+        time_series = np.random.random(64 * 512)
+        self.assertTrue(np.allclose(operator.matvec(image), matrix @ image))
+        self.assertTrue(np.allclose(operator.rmatvec(time_series), matrix.T @ time_series))
+
+    def test_adjoint_is_delay_and_sum(self):
+        matrix = pf.ForwardModel(spacing=0.0002).build(self.pa_data)
+        back_projection = matrix.T @ self.pa_data.binary_time_series_data[:, :, 0, 0].reshape(-1)
+        image = pf.DelayAndSum(spacing=0.0002).reconstruct(self.pa_data)
+        self.assertTrue(np.allclose(back_projection, image.reshape(-1)))
+
+    def test_iterative_reconstruction_of_a_point_source(self):
+        operator = pf.ForwardModel(spacing=0.0002).get_operator(self.pa_data)
+        true_image = np.zeros(operator.shape[1])
+        true_image[137] = 1
+        time_series = operator.matvec(true_image)
+        image = scipy.sparse.linalg.lsqr(operator, time_series, iter_lim=50)[0]
+        self.assertEqual(np.argmax(image), 137)
+        self.assertLess(np.linalg.norm(operator.matvec(image) - time_series), 0.1 * np.linalg.norm(time_series))
+
+    def test_built_matrices_are_cached(self):
+        forward_model = pf.ForwardModel(spacing=0.0002, cache_directory=self.directory)
+        matrix = forward_model.build(self.pa_data)
+        self.assertEqual(len(os.listdir(self.directory)), 1)
+        cached_matrix = pf.ForwardModel(spacing=0.0002, cache_directory=self.directory).build(self.pa_data)
+        self.assertEqual((matrix != cached_matrix).nnz, 0)
+        pf.ForwardModel(spacing=0.0002, cache_directory=self.directory, distance_weighting=True).build(self.pa_data)
+        self.assertEqual(len(os.listdir(self.directory)), 2)
+
+    def test_contributions_are_weighted_with_the_angular_response(self):
+        forward_model = pf.ForwardModel(spacing=0.0002, cache_directory=self.directory)
+        omnidirectional = forward_model.build(self.pa_data)
+        detectors = self.pa_data.meta_data_device[pf.MetadataDeviceTags.DETECTORS.tag]
+        for detector in list(detectors.values())[::2]:
+            detector[pf.MetadataDeviceTags.DETECTOR_ORIENTATION.tag] = np.asarray([0, 0, 1.0])
+            detector[pf.MetadataDeviceTags.ANGULAR_RESPONSE.tag] = np.asarray([ANGLES, np.cos(ANGLES)])
+        matrix = forward_model.build(self.pa_data)
+        self.assertEqual(len(os.listdir(self.directory)), 2)
+        self.assertTrue(np.allclose(forward_model.get_operator(self.pa_data).matvec(np.ones(400)),
+                                    matrix @ np.ones(400)))
+
+        positions = np.atleast_2d(self.pa_data.get_detector_position())
+        grid = pf.ReconstructionGrid(FIELD_OF_VIEW, 0.0002)
+        offsets = grid.get_voxel_positions(0, grid.num_voxels)[np.newaxis] - positions[:, np.newaxis]
+        angles = np.arccos(offsets[..., 2] / np.linalg.norm(offsets, axis=-1))
+        directivity = np.ones_like(angles)
+        directivity[::2] = np.interp(angles[::2], ANGLES, np.cos(ANGLES), right=0)
+        expected = omnidirectional.multiply(np.repeat(directivity, 512, axis=0))
+        self.assertTrue(np.allclose(matrix.toarray(), expected.toarray()))
+
+        opted_out = pf.ForwardModel(spacing=0.0002, directivity=False).build(self.pa_data)
+        self.assertEqual((opted_out != omnidirectional).nnz, 0)
@@ -0,0 +1,78 @@
+# SPDX-FileCopyrightText: 2026 International Photoacoustics Standardisation Consortium (IPASC)
+# SPDX-License-Identifier: BSD 3-Clause License
+
+import os
+import shutil
+import tempfile
+
+import numpy as np
+from unittest.case import TestCase
+import pacfish as pf
+from testing.unit_tests.utils import create_complete_device_metadata_dictionary
+
+
+class FrameAveragingTest(TestCase):
+
+    def setUp(self):
+        self.directory = tempfile.mkdtemp()
+        self.time_series = np.random.random((4, 100, 2, 6))
+        self.pulse_energy = np.asarray([1.0, 2.0, 4.0, 1.0, 2.0, 4.0])
+        self.acquisition_dict = {
+            pf.MetadataAcquisitionTags.SIZES.tag: np.asarray([4, 100, 2, 6]),
+            pf.MetadataAcquisitionTags.PULSE_ENERGY.tag: self.pulse_energy,
+            pf.MetadataAcquisitionTags.MEASUREMENT_TIMESTAMPS.tag: np.arange(6, dtype=float),
+            pf.MetadataAcquisitionTags.MEASUREMENTS_PER_IMAGE.tag: 3,
+            pf.MetadataAcquisitionTags.AD_SAMPLING_RATE.tag: 40e6}
+        self.pa_data = pf.PAData(self.time_series, self.acquisition_dict, create_complete_device_metadata_dictionary())
+        normalised = self.time_series / self.pulse_energy
+        self.expected = np.stack([np.mean(normalised[..., 0:3], axis=-1),
+                                  np.mean(normalised[..., 3:6], axis=-1)], axis=-1)
+        print("setUp")
+
+    def tearDown(self):
+        shutil.rmtree(self.directory)
+        print("tearDown")
+
+    def test_averaging_in_memory(self):
+        time_series = self.time_series.copy()
+        averaged = pf.FrameAveraging().apply(self.pa_data)
+        self.assertTrue((self.time_series == time_series).all())
+        self.assertTrue(np.allclose(averaged.binary_time_series_data, self.expected))
+        self.assertTrue((averaged.get_sizes() == [4, 100, 2, 2]).all())
+        self.assertTrue((averaged.get_measurement_time_stamps() == [1, 4]).all())
+        self.assertTrue((averaged.get_pulse_energy() == [0]).all())
+        self.assertEqual(averaged.get_measurements_per_image(), 1)
+        self.assertEqual(averaged.get_sampling_rate(), 40e6)
+
+        # the pulse energy has been accounted for, so the data is only averaged again
+        self.assertTrue(np.allclose(pf.FrameAveraging(measurements_per_image=2).apply(averaged)
+                                    .binary_time_series_data[..., 0], np.mean(self.expected, axis=-1)))
+
+    def test_averaging_without_normalisation(self):
+        averaged = pf.FrameAveraging(normalise_pulse_energy=False, measurements_per_image=2).apply(self.pa_data)
+        self.assertEqual(averaged.binary_time_series_data.shape, (4, 100, 2, 3))
+        self.assertTrue(np.allclose(averaged.binary_time_series_data[..., 1],
+                                    np.mean(self.time_series[..., 2:4], axis=-1)))
+        self.assertTrue(np.allclose(averaged.get_pulse_energy(), [1.5, 2.5, 3]))
+
+        lazy_averaged = pf.FrameAveraging(normalise_pulse_energy=False, measurements_per_image=2).apply(
+            self.pa_data, lazy=True)
+        self.assertTrue(np.allclose(lazy_averaged.binary_time_series_data[1, ..., 2],
+                                    averaged.binary_time_series_data[1, ..., 2]))
+
+    def test_streaming_from_and_to_files(self):
+        source_path = os.path.join(self.directory, "source.hdf5")
+        target_path = os.path.join(self.directory, "averaged.hdf5")
+        pf.write_data(source_path, self.pa_data)
+        pf.FrameAveraging().write(pf.load_data(source_path, lazy=True), target_path, checksums=True)
+        averaged = pf.load_data(target_path)
+        self.assertTrue(np.allclose(averaged.binary_time_series_data, self.expected))
+        self.assertTrue((averaged.get_sizes() == [4, 100, 2, 2]).all())
+        self.assertTrue(pf.verify_file_integrity(target_path))
+
+    def test_invalid_configurations(self):
+        with self.assertRaises(ValueError):
+            pf.FrameAveraging(measurements_per_image=4).apply(self.pa_data)
+        del self.acquisition_dict[pf.MetadataAcquisitionTags.PULSE_ENERGY.tag]
+        with self.assertRaises(ValueError):
+            pf.FrameAveraging().apply(self.pa_data)
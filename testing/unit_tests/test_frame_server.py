@@ -0,0 +1,144 @@
+# SPDX-FileCopyrightText: 2026 International Photoacoustics Standardisation Consortium (IPASC)
+# SPDX-License-Identifier: BSD 3-Clause License
+
+import os
+import shutil
+import tempfile
+import urllib.error
+import urllib.request
+
+import h5py
+import numpy as np
+from unittest.case import TestCase
+import pacfish as pf
+from testing.unit_tests.utils import create_materialised_synthetic_pa_data
+from pacfish import profile
+from pacfish.iohandler.frame_server import encode_value, decode_value
+
+
+class FrameServerTest(TestCase):
+
+    def setUp(self):
+        self.directory = tempfile.mkdtemp()
+        self.pa_data = create_materialised_synthetic_pa_data("matrix", 16, 256, 2, 6, seed=8)
+        pf.write_data(os.path.join(self.directory, "first.hdf5"), self.pa_data)
+        pf.write_data(os.path.join(self.directory, "second file.hdf5"), self.pa_data)
+        frame_bytes = self.pa_data.binary_time_series_data[..., 0].nbytes
+        self.server = pf.FrameServer(self.directory, cache_bytes=4 * frame_bytes).start()
+        self.client = pf.FrameClient(self.server.url)
+        print("setUp")
+
+    def tearDown(self):
+        self.server.stop()
+        shutil.rmtree(self.directory)
+        print("tearDown")
+
+    def test_metadata_is_served_as_json(self):
+        self.assertEqual(self.client.list_files(), ["first.hdf5", "second file.hdf5"])
+        remote_pa_data = self.client.load_data("second file.hdf5")
+        local_pa_data = pf.load_data(os.path.join(self.directory, "second file.hdf5"))
+
+        self.assertEqual(remote_pa_data.get_detector_ids(), local_pa_data.get_detector_ids())
+        self.assertTrue((remote_pa_data.get_detector_position() == local_pa_data.get_detector_position()).all())
+        self.assertEqual(remote_pa_data.get_sampling_rate(), local_pa_data.get_sampling_rate())
+        self.assertTrue((remote_pa_data.get_acquisition_wavelengths() ==
+                         local_pa_data.get_acquisition_wavelengths()).all())
+        self.assertEqual(remote_pa_data.meta_data_acquisition[pf.MetadataAcquisitionTags.UUID.tag],
+                         local_pa_data.meta_data_acquisition[pf.MetadataAcquisitionTags.UUID.tag])
+        self.assertTrue(pf.quality_check_pa_data(pf.PAData(local_pa_data.binary_time_series_data,
+                                                           remote_pa_data.meta_data_acquisition,
+                                                           remote_pa_data.meta_data_device)))
+
+        value = {"numbers": np.arange(6, dtype=np.int16).reshape(2, 3), "scalar": np.float32(2.5),
+                 "strings": np.asarray([b"a", b"b"]), "none": None, "nested": {"text": "value"}}
+        decoded = decode_value(encode_value(value))
+        self.assertEqual(decoded["numbers"].dtype, np.int16)
+        self.assertTrue((decoded["numbers"] == value["numbers"]).all())
+        self.assertEqual(list(decoded["strings"]), ["a", "b"])
+        self.assertEqual((decoded["scalar"], decoded["none"], decoded["nested"]), (2.5, None, {"text": "value"}))
+
+    def test_hyperslabs_are_served_through_the_frame_cache(self):
+        data = self.pa_data.binary_time_series_data
+        remote_data = self.client.load_data("first.hdf5").binary_time_series_data
+        self.assertEqual((remote_data.shape, remote_data.dtype), (data.shape, data.dtype))
+
+        for selection in [np.s_[..., 0], np.s_[2:10:3, 100:, 1, 1:4], np.s_[-1, :, :, ::-2], np.s_[5],
+                          np.s_[:, 0, 0, 4:2], np.s_[..., -1]]:
+            expected = data[selection]
+            result = remote_data[selection]
+            self.assertEqual(result.shape, expected.shape)
+            self.assertTrue((result == expected).all())
+        self.assertTrue((np.asarray(remote_data) == data).all())
+
+        cache = self.server.cache
+        self.assertLessEqual(cache.num_bytes, cache.max_bytes)
+        hits = cache.hits
+        remote_data[0, :, :, 5]
+        self.assertEqual(cache.hits, hits + 1)
+        with self.assertRaises(IndexError):
+            remote_data[[0, 1]]
+
+    def test_single_trace_requests_read_bounded_batches(self):
+        data = self.pa_data.binary_time_series_data
+        frame_bytes = data[..., 0].nbytes
+        remote_data = self.client.load_data("first.hdf5").binary_time_series_data
+        with profile.tracing() as trace:
+            trace_data = remote_data[3, 10, 1, :]
+        self.assertTrue((trace_data == data[3, 10, 1, :]).all())
+        reads = [finished_span.counters[profile.BYTES_READ] for finished_span in trace.spans
+                 if finished_span.name == "FrameServer.read_frames"]
+        # six frames are read in batches that fit into the cache of four frames
+        self.assertEqual(reads, [4 * frame_bytes, 2 * frame_bytes])
+
+        # frames that do not fit into the cache are read one at a time and not cached
+        with pf.FrameServer(self.directory, cache_bytes=frame_bytes // 2) as server:
+            remote_data = pf.FrameClient(server.url).load_data("first.hdf5").binary_time_series_data
+            with profile.tracing() as trace:
+                trace_data = remote_data[3, 10, 1, ::-1]
+            self.assertTrue((trace_data == data[3, 10, 1, ::-1]).all())
+            reads = [finished_span.counters[profile.BYTES_READ] for finished_span in trace.spans
+                     if finished_span.name == "FrameServer.read_frames"]
+            self.assertEqual(reads, [frame_bytes] * 6)
+            self.assertEqual(server.cache.num_bytes, 0)
+
+    def test_invalid_requests_are_rejected(self):
+        for path, status in [("/files/missing.hdf5/info", 404), ("/other", 404),
+                             ("/files/first.hdf5/data?selection=0,0,0,99", 400),
+                             ("/files/first.hdf5/data?selection=a:b", 400)]:
+            with self.assertRaises(urllib.error.HTTPError) as context:
+                urllib.request.urlopen(self.server.url + path, timeout=10)
+            self.assertEqual(context.exception.code, status)
+            context.exception.close()
+
+        # a changed file is re-read
+        other_pa_data = create_materialised_synthetic_pa_data("matrix", 16, 256, 2, 3, seed=9)
+        file_path = os.path.join(self.directory, "first.hdf5")
+        self.client.load_data("first.hdf5").binary_time_series_data[..., 0]
+        pf.write_data(file_path, other_pa_data)
+        os.utime(file_path, ns=(0, os.stat(file_path).st_mtime_ns + 10 ** 9))
+        remote_data = self.client.load_data("first.hdf5").binary_time_series_data
+        self.assertEqual(remote_data.shape, other_pa_data.binary_time_series_data.shape)
+        self.assertTrue((remote_data[..., 0] == other_pa_data.binary_time_series_data[..., 0]).all())
+
+    def test_unreadable_files_are_reported_as_errors(self):
+        file_paths = {name: os.path.join(self.directory, name) for name in ["deleted.hdf5", "no_data.hdf5",
+                                                                              "corrupt.hdf5"]}
+        pf.write_data(file_paths["deleted.hdf5"], self.pa_data)
+        pf.write_data(file_paths["no_data.hdf5"], self.pa_data)
+        with h5py.File(file_paths["no_data.hdf5"], "a") as h5file:
+            del h5file["binary_time_series_data"]
+        with open(file_paths["corrupt.hdf5"], "wb") as file:
+            file.write(b"not an HDF5 file")
+
+        with pf.FrameServer(file_paths) as server:
+            client = pf.FrameClient(server.url)
+            client.load_data("deleted.hdf5")
+            os.remove(file_paths["deleted.hdf5"])
+            for path, status in [("/files/deleted.hdf5/info", 404), ("/files/deleted.hdf5/data?selection=0", 404),
+                                 ("/files/no_data.hdf5/info", 404), ("/files/corrupt.hdf5/meta_data", 500)]:
+                with self.assertRaises(urllib.error.HTTPError) as context:
+                    urllib.request.urlopen(server.url + path, timeout=10)
+                self.assertEqual(context.exception.code, status)
+                context.exception.close()
+            # the server keeps serving the other files
+            self.assertEqual(client.list_files(), list(file_paths))
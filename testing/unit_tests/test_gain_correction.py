@@ -0,0 +1,98 @@
+# SPDX-FileCopyrightText: 2026 International Photoacoustics Standardisation Consortium (IPASC)
+# SPDX-License-Identifier: BSD 3-Clause License
+
+import os
+import shutil
+import tempfile
+
+import numpy as np
+from unittest.case import TestCase
+import pacfish as pf
+from pacfish.processing.GainCorrection import GAIN_CORRECTION_TAG
+from testing.unit_tests.utils import create_complete_device_metadata_dictionary
+
+
+class GainCorrectionTest(TestCase):
+
+    def setUp(self):
+        self.directory = tempfile.mkdtemp()
+        self.time_series = np.random.random((4, 200, 2, 3))
+        self.element_dependent_gain = np.asarray([1.0, 2.0, 3.0, 4.0])
+        self.time_gain_compensation = np.linspace(1, 10, 200)
+        self.acquisition_dict = {pf.MetadataAcquisitionTags.OVERALL_GAIN.tag: 2.5,
+                                 pf.MetadataAcquisitionTags.ELEMENT_DEPENDENT_GAIN.tag: self.element_dependent_gain,
+                                 pf.MetadataAcquisitionTags.TIME_GAIN_COMPENSATION.tag: self.time_gain_compensation}
+        self.expected = (self.time_series * 2.5 * self.element_dependent_gain[:, None, None, None] *
+                         self.time_gain_compensation[None, :, None, None])
+        print("setUp")
+
+    def tearDown(self):
+        shutil.rmtree(self.directory)
+        print("tearDown")
+
+    def test_in_place_correction(self):
+        time_series = self.time_series.copy()
+        pa_data = pf.PAData(time_series, self.acquisition_dict, create_complete_device_metadata_dictionary())
+        result = pf.GainCorrection().apply(pa_data)
+        self.assertIs(result, time_series)
+        self.assertTrue(np.allclose(result, self.expected))
+
+        pf.GainCorrection(inverse=True).apply(pa_data)
+        self.assertTrue(np.allclose(time_series, self.time_series))
+
+    def test_gains_are_not_applied_twice(self):
+        pa_data = pf.PAData(self.time_series.copy(), self.acquisition_dict,
+                            create_complete_device_metadata_dictionary())
+        # correcting into an output array leaves the data of the PAData instance unchanged
+        pf.GainCorrection().apply(pa_data, out=np.empty_like(self.time_series))
+        self.assertIsNone(pa_data.get_custom_meta_datum(GAIN_CORRECTION_TAG))
+
+        pf.GainCorrection().apply(pa_data)
+        self.assertEqual(pa_data.get_custom_meta_datum(GAIN_CORRECTION_TAG), 1)
+        with self.assertRaises(ValueError):
+            pf.GainCorrection().apply(pa_data)
+        with self.assertRaises(ValueError):
+            pf.GainCorrection().apply(pa_data, out=np.empty_like(self.time_series))
+        self.assertTrue(np.allclose(pa_data.binary_time_series_data, self.expected))
+
+        pf.GainCorrection(inverse=True).apply(pa_data)
+        pf.GainCorrection(inverse=True).apply(pa_data)
+        self.assertEqual(pa_data.get_custom_meta_datum(GAIN_CORRECTION_TAG), -1)
+        with self.assertRaises(ValueError):
+            pf.GainCorrection(inverse=True).apply(pa_data)
+
+    def test_correction_into_output_array(self):
+        integer_time_series = (self.time_series * 1000).astype(np.int16)
+        pa_data = pf.PAData(integer_time_series, self.acquisition_dict, create_complete_device_metadata_dictionary())
+        with self.assertRaises(TypeError):
+            pf.GainCorrection().apply(pa_data)
+
+        out = np.empty(integer_time_series.shape, dtype=np.float32)
+        result = pf.GainCorrection(measurements_per_chunk=2).apply(pa_data, out=out)
+        self.assertIs(result, out)
+        expected = integer_time_series * 2.5 * self.element_dependent_gain[:, None, None, None] * \
+            self.time_gain_compensation[None, :, None, None]
+        self.assertTrue(np.allclose(result, expected, rtol=1e-5))
+
+        with self.assertRaises(ValueError):
+            pf.GainCorrection().apply(pa_data, out=np.empty((4, 200), dtype=np.float32))
+
+    def test_correction_of_lazily_loaded_data(self):
+        file_path = os.path.join(self.directory, "gain.hdf5")
+        pf.write_data(file_path, pf.PAData(self.time_series, self.acquisition_dict,
+                                           create_complete_device_metadata_dictionary()))
+        pa_data = pf.load_data(file_path, lazy=True)
+        self.assertIsInstance(pa_data.binary_time_series_data, pf.LazyTimeSeriesData)
+        self.assertEqual(pa_data.binary_time_series_data.shape, self.time_series.shape)
+        result = pf.GainCorrection().apply(pa_data)
+        self.assertTrue(np.allclose(result, self.expected))
+
+    def test_mismatching_gains_raise_an_error(self):
+        acquisition_dict = {pf.MetadataAcquisitionTags.TIME_GAIN_COMPENSATION.tag: np.ones(100)}
+        pa_data = pf.PAData(self.time_series.copy(), acquisition_dict, create_complete_device_metadata_dictionary())
+        with self.assertRaises(ValueError):
+            pf.GainCorrection().apply(pa_data)
+
+    def test_missing_gains_are_ignored(self):
+        pa_data = pf.PAData(self.time_series.copy(), {}, create_complete_device_metadata_dictionary())
+        self.assertTrue(np.allclose(pf.GainCorrection().apply(pa_data), self.time_series))
@@ -0,0 +1,94 @@
+# SPDX-FileCopyrightText: 2026 International Photoacoustics Standardisation Consortium (IPASC)
+# SPDX-License-Identifier: BSD 3-Clause License
+
+import os
+import shutil
+import tempfile
+
+import numpy as np
+from unittest.case import TestCase
+import pacfish as pf
+from pacfish.reconstruction.GatedLoading import compute_acquisition_gate
+from testing.unit_tests.test_delay_and_sum import create_point_source_pa_data, SAMPLING_RATE, SPEED_OF_SOUND
+
+FIELD_OF_VIEW = [-0.002, 0.002, 0, 0, -0.002, 0.002]
+
+
+class GatedLoadingTest(TestCase):
+
+    def setUp(self):
+        self.directory = tempfile.mkdtemp()
+        self.file_path = os.path.join(self.directory, "point_source.hdf5")
+        self.pa_data = create_point_source_pa_data([0.001, 0, 0.0005], FIELD_OF_VIEW, num_samples=2048)
+        pf.write_data(self.file_path, self.pa_data)
+        print("setUp")
+
+    def tearDown(self):
+        shutil.rmtree(self.directory)
+        print("tearDown")
+
+    def test_gate_covers_all_times_of_flight(self):
+        detector_positions = self.pa_data.get_detector_position()
+        detector_indices, (start, stop) = compute_acquisition_gate(detector_positions, FIELD_OF_VIEW,
+                                                                   SPEED_OF_SOUND, SAMPLING_RATE, 2048, margin=0)
+        self.assertEqual(len(detector_indices), 64)
+        corners = np.asarray([[x, 0, z] for x in (-0.002, 0.002) for z in (-0.002, 0.002)])
+        distances = np.linalg.norm(detector_positions[:, np.newaxis] - corners[np.newaxis], axis=-1)
+        self.assertLessEqual(start, np.min(distances) * SAMPLING_RATE / SPEED_OF_SOUND)
+        self.assertGreaterEqual(stop, np.max(distances) * SAMPLING_RATE / SPEED_OF_SOUND + 1)
+        self.assertLess(stop - start, 2048 / 3)
+
+        detector_indices, _ = compute_acquisition_gate(detector_positions, FIELD_OF_VIEW, SPEED_OF_SOUND,
+                                                       SAMPLING_RATE, 2048, max_distance=0.0075)
+        self.assertGreater(len(detector_indices), 0)
+        self.assertLess(len(detector_indices), 64)
+
+    def test_gated_reconstruction_matches_full_reconstruction(self):
+        gated_pa_data = pf.load_gated_data(self.file_path)
+        offset = gated_pa_data.get_custom_meta_datum("gated_sample_offset")
+        num_samples = gated_pa_data.binary_time_series_data.shape[1]
+        self.assertGreater(offset, 0)
+        self.assertLess(num_samples, 2048 / 3)
+        self.assertTrue((gated_pa_data.binary_time_series_data ==
+                         self.pa_data.binary_time_series_data[:, offset:offset + num_samples]).all())
+
+        das = pf.DelayAndSum(spacing=0.0002)
+        self.assertTrue(np.allclose(das.reconstruct(gated_pa_data), das.reconstruct(self.pa_data)))
+        image = das.reconstruct(self.pa_data)
+        cached_das = pf.DelayAndSum(spacing=0.0002, delay_table_cache=pf.DelayTableCache())
+        self.assertTrue(np.allclose(cached_das.reconstruct(gated_pa_data), image, atol=1e-3 * np.max(image)))
+
+    def test_detector_subset_is_described_by_the_device_metadata(self):
+        gated_pa_data = pf.load_gated_data(self.file_path, max_distance=0.0075)
+        detector_indices = gated_pa_data.get_custom_meta_datum("gated_detector_indices")
+        self.assertEqual(gated_pa_data.binary_time_series_data.shape[0], len(detector_indices))
+        self.assertEqual(gated_pa_data.get_number_of_detectors(), len(detector_indices))
+        self.assertTrue((gated_pa_data.get_detector_position() ==
+                         self.pa_data.get_detector_position()[detector_indices]).all())
+
+        with self.assertRaises(ValueError):
+            pf.load_gated_data(self.file_path, max_distance=0.001)
+
+    def test_gains_are_gated_with_the_data(self):
+        element_dependent_gain = np.linspace(1, 2, 64)
+        time_gain_compensation = np.linspace(1, 5, 2048)
+        self.pa_data.meta_data_acquisition[pf.MetadataAcquisitionTags.ELEMENT_DEPENDENT_GAIN.tag] = \
+            element_dependent_gain
+        self.pa_data.meta_data_acquisition[pf.MetadataAcquisitionTags.TIME_GAIN_COMPENSATION.tag] = \
+            time_gain_compensation
+        pf.write_data(self.file_path, self.pa_data)
+
+        gated_pa_data = pf.load_gated_data(self.file_path, max_distance=0.0075)
+        detector_indices = gated_pa_data.get_custom_meta_datum("gated_detector_indices")
+        offset = gated_pa_data.get_custom_meta_datum("gated_sample_offset")
+        num_samples = gated_pa_data.binary_time_series_data.shape[1]
+        self.assertTrue((gated_pa_data.get_element_dependent_gain() ==
+                         element_dependent_gain[detector_indices]).all())
+        self.assertTrue((gated_pa_data.get_time_gain_compensation() ==
+                         time_gain_compensation[offset:offset + num_samples]).all())
+
+        corrected = pf.GainCorrection().apply(gated_pa_data)
+        expected = (self.pa_data.binary_time_series_data[detector_indices, offset:offset + num_samples] *
+                    element_dependent_gain[detector_indices, np.newaxis, np.newaxis, np.newaxis] *
+                    time_gain_compensation[np.newaxis, offset:offset + num_samples, np.newaxis, np.newaxis])
+        self.assertTrue(np.allclose(corrected, expected))
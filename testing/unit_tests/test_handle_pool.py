@@ -0,0 +1,99 @@
+# SPDX-FileCopyrightText: 2026 International Photoacoustics Standardisation Consortium (IPASC)
+# SPDX-License-Identifier: BSD 3-Clause License
+
+import os
+import shutil
+import tempfile
+import threading
+
+import numpy as np
+from unittest.case import TestCase
+import pacfish as pf
+from testing.unit_tests.utils import create_materialised_synthetic_pa_data
+
+
+class HandlePoolTest(TestCase):
+
+    def setUp(self):
+        self.directory = tempfile.mkdtemp()
+        self.pa_data = create_materialised_synthetic_pa_data("linear", 8, 64, 1, 4, seed=11)
+        self.file_paths = [os.path.join(self.directory, f"file_{index}.hdf5") for index in range(5)]
+        for index, file_path in enumerate(self.file_paths):
+            pa_data = pf.PAData(self.pa_data.binary_time_series_data + index, self.pa_data.meta_data_acquisition,
+                                self.pa_data.meta_data_device)
+            pf.write_data(file_path, pa_data)
+        self.pool = pf.FileHandlePool(max_open_files=3)
+        print("setUp")
+
+    def tearDown(self):
+        self.pool.close()
+        shutil.rmtree(self.directory)
+        print("tearDown")
+
+    def test_views_read_through_pooled_handles(self):
+        views = [self.pool.load_data(file_path) for file_path in self.file_paths]
+        self.assertEqual(len(self.pool), 3)
+        self.assertNotIn(self.file_paths[0], self.pool)
+
+        for index, pa_data in enumerate(views):
+            self.assertIsInstance(pa_data.binary_time_series_data, pf.PooledTimeSeriesData)
+            self.assertEqual(pa_data.get_sampling_rate(), self.pa_data.get_sampling_rate())
+            self.assertTrue((pa_data.binary_time_series_data[..., 2] ==
+                             self.pa_data.binary_time_series_data[..., 2] + index).all())
+        hits = self.pool.hits
+        views[4].binary_time_series_data[0, 0]
+        self.assertEqual(self.pool.hits, hits + 1)
+
+        # a file that was rewritten is reopened
+        pf.write_data(self.file_paths[4], self.pa_data)
+        os.utime(self.file_paths[4], ns=(0, os.stat(self.file_paths[4]).st_mtime_ns + 10 ** 9))
+        self.assertTrue((np.asarray(views[4].binary_time_series_data) == self.pa_data.binary_time_series_data).all())
+
+        pa_data = self.pool.load_data(self.file_paths[1], lazy=False)
+        self.assertTrue((pa_data.binary_time_series_data == self.pa_data.binary_time_series_data + 1).all())
+        self.pool.close()
+        self.assertEqual(len(self.pool), 0)
+        # closed handles are reopened on demand
+        self.assertEqual(views[0].binary_time_series_data[0, 0, 0, 0], self.pa_data.binary_time_series_data[0, 0, 0, 0])
+
+    def test_evicted_files_stay_open_while_in_use(self):
+        with self.pool.open(self.file_paths[0]) as h5file:
+            for file_path in self.file_paths[1:]:
+                with self.pool.open(file_path):
+                    pass
+            self.assertNotIn(self.file_paths[0], self.pool)
+            self.assertTrue(h5file.id.valid)
+            # the file is opened again while the evicted handle is still in use
+            with self.pool.open_dataset(self.file_paths[0]) as dataset:
+                self.assertIsNot(dataset.file, h5file)
+            self.assertEqual(h5file["binary_time_series_data"].shape, self.pa_data.binary_time_series_data.shape)
+        self.assertFalse(h5file.id.valid)
+        self.assertTrue(dataset.id.valid)
+        with self.pool.open_dataset(self.file_paths[0]) as pooled_dataset:
+            self.assertIs(pooled_dataset, dataset)
+            self.assertEqual(dataset[0, 0, 0, 0], self.pa_data.binary_time_series_data[0, 0, 0, 0])
+
+        views = [pf.PooledTimeSeriesData(self.pool, file_path) for file_path in self.file_paths]
+        errors = []
+
+        def read_frames(seed):
+            random_state = np.random.RandomState(seed)
+            accesses = zip(random_state.randint(0, 5, 50).tolist(), random_state.randint(0, 4, 50).tolist())
+            try:
+                for index, measurement in accesses:
+                    frame = views[index][..., measurement]
+                    if not (frame == self.pa_data.binary_time_series_data[..., measurement] + index).all():
+                        errors.append((index, measurement))
+            except Exception as exception:
+                errors.append(exception)
+
+        threads = [threading.Thread(target=read_frames, args=(seed, )) for seed in range(4)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        self.assertEqual(errors, [])
+        self.assertLessEqual(len(self.pool), 3)
+
+        with self.assertRaises(FileNotFoundError):
+            self.pool.load_data(os.path.join(self.directory, "missing.hdf5"))
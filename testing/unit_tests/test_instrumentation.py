@@ -0,0 +1,117 @@
+# SPDX-FileCopyrightText: 2026 International Photoacoustics Standardisation Consortium (IPASC)
+# SPDX-License-Identifier: BSD 3-Clause License
+
+import json
+import os
+import shutil
+import tempfile
+import threading
+
+from unittest.case import TestCase
+import pacfish as pf
+from pacfish import profile
+from pacfish.iohandler.file_reader import clear_device_cache
+from testing.unit_tests.utils import PassThroughAdapter, create_materialised_synthetic_pa_data
+
+
+class InstrumentationTest(TestCase):
+
+    def setUp(self):
+        self.directory = tempfile.mkdtemp()
+        self.file_path = os.path.join(self.directory, "instrumented.hdf5")
+        self.pa_data = create_materialised_synthetic_pa_data("linear", 16, 128, 2, 3, seed=2)
+        print("setUp")
+
+    def tearDown(self):
+        shutil.rmtree(self.directory)
+        profile.disable()
+        print("tearDown")
+
+    def test_instrumentation_is_switched_off_by_default(self):
+        self.assertFalse(profile.is_enabled())
+        with profile.span("unused") as unused_span:
+            unused_span.count(profile.BYTES_READ, 10)
+            profile.count(profile.BYTES_READ, 10)
+        self.assertIs(profile.span("other"), unused_span)
+        pf.write_data(self.file_path, self.pa_data)
+        self.assertTrue((pf.load_data(self.file_path).binary_time_series_data ==
+                         self.pa_data.binary_time_series_data).all())
+
+    def test_load_and_write_record_stages_and_byte_counts(self):
+        num_bytes = self.pa_data.binary_time_series_data.nbytes
+        with profile.tracing() as trace:
+            pf.write_data(self.file_path, self.pa_data, checksums=True)
+            pa_data = pf.load_data(self.file_path)
+        self.assertFalse(profile.is_enabled())
+
+        spans = {finished_span.name: finished_span for finished_span in trace.spans}
+        for name in ["write_data", "write_data.write_binary_data", "write_data.write_acquisition_meta_data",
+                     "write_data.write_device_meta_data", "write_data.write_integrity_information", "load_data",
+                     "load_data.read_binary_data", "load_data.read_acquisition_meta_data",
+                     "load_data.read_device_meta_data"]:
+            self.assertIn(name, spans)
+            self.assertGreaterEqual(spans[name].duration_ns, 0)
+        self.assertEqual(spans["load_data.read_binary_data"].parent, "load_data")
+        self.assertEqual(spans["write_data.write_binary_data"].counters[profile.BYTES_WRITTEN], num_bytes)
+        self.assertEqual(spans["load_data.read_binary_data"].counters[profile.BYTES_READ], num_bytes)
+        self.assertGreater(spans["load_data.read_device_meta_data"].counters[profile.HDF5_OBJECTS_VISITED],
+                           len(pa_data.get_detector_ids()))
+        self.assertEqual(trace.totals[profile.BYTES_READ], num_bytes)
+
+        summary = trace.summary()
+        self.assertEqual(summary["load_data"]["calls"], 1)
+        self.assertGreater(summary["write_data.write_device_meta_data"]["counters"][profile.HDF5_OBJECTS_WRITTEN], 0)
+
+    def test_checkers_adapters_and_caches_are_counted(self):
+        library_path = os.path.join(self.directory, "library.hdf5")
+        pf.write_data(self.file_path, self.pa_data, device_library=library_path)
+        clear_device_cache()
+
+        finished_spans = []
+        with profile.tracing(callback=finished_spans.append) as trace:
+            pf.load_data(self.file_path, device_library=library_path)
+            pf.load_data(self.file_path, device_library=library_path)
+            self.assertTrue(pf.quality_check_pa_data(self.pa_data))
+            PassThroughAdapter(self.pa_data)
+
+        self.assertEqual(len(finished_spans), len(trace.spans))
+        self.assertEqual(trace.totals[profile.CACHE_MISSES], 1)
+        self.assertEqual(trace.totals[profile.CACHE_HITS], 1)
+        summary = trace.summary()
+        self.assertEqual(summary["ConsistencyChecker.check_binary_data"]["counters"][profile.ELEMENTS_VALIDATED],
+                         self.pa_data.binary_time_series_data.size)
+        self.assertEqual(summary["CompletenessChecker.check_acquisition_meta_data"]["counters"][
+                             profile.ELEMENTS_VALIDATED], len(pf.MetadataAcquisitionTags.TAGS))
+        self.assertEqual(summary["quality_check_pa_data"]["calls"], 1)
+        self.assertEqual([finished_span.parent for finished_span in trace.spans
+                          if finished_span.name.startswith("CompletenessChecker")], ["quality_check_pa_data"] * 2)
+        self.assertIn("PassThroughAdapter.generate_binary_data", summary)
+        self.assertIn("PassThroughAdapter.generate_acquisition_meta_data", summary)
+        self.assertIn("PassThroughAdapter.generate_device_meta_data", summary)
+
+    def test_trace_is_exported_in_the_trace_event_format(self):
+        trace_path = os.path.join(self.directory, "trace.json")
+        pf.write_data(self.file_path, self.pa_data)
+        with profile.tracing(file_path=trace_path):
+            lazy_data = pf.load_data(self.file_path, lazy=True).binary_time_series_data
+            threads = [threading.Thread(target=lambda index=index: lazy_data[..., index]) for index in range(3)]
+            for thread in threads:
+                thread.start()
+            for thread in threads:
+                thread.join()
+            with self.assertRaises(RuntimeError):
+                with profile.span("failing", step=1):
+                    raise RuntimeError("failure")
+
+        with open(trace_path, "r") as trace_file:
+            trace = json.load(trace_file)
+        events = trace["traceEvents"]
+        reads = [event for event in events if event["name"] == "LazyTimeSeriesData.read"]
+        self.assertEqual(len(reads), 3)
+        self.assertEqual(sum(event["args"][profile.BYTES_READ] for event in reads),
+                         self.pa_data.binary_time_series_data.nbytes)
+        self.assertTrue(all(event["ph"] == "X" and event["dur"] >= 0 for event in events))
+        failing = [event for event in events if event["name"] == "failing"][0]
+        self.assertEqual(failing["args"], {"step": 1, "error": "RuntimeError"})
+        self.assertEqual(trace["otherData"]["totals"][profile.BYTES_READ],
+                         self.pa_data.binary_time_series_data.nbytes)
@@ -0,0 +1,130 @@
+# SPDX-FileCopyrightText: 2026 International Photoacoustics Standardisation Consortium (IPASC)
+# SPDX-License-Identifier: BSD 3-Clause License
+
+import os
+import shutil
+import tempfile
+import tracemalloc
+
+import numpy as np
+from unittest.case import TestCase
+import pacfish as pf
+from pacfish import profile
+
+RAW_SHAPE = (2048, 64)
+
+
+class ViewAdapter(pf.BaseAdapter):
+    """Returns the raw [samples, detectors] data as a transposed view without copying it."""
+
+    def __init__(self, raw_data):
+        self.raw_data = raw_data
+        super(ViewAdapter, self).__init__()
+
+    def generate_binary_data(self) -> np.ndarray:
+        return np.swapaxes(self.raw_data, 0, 1)[:, :, np.newaxis, np.newaxis]
+
+    def generate_device_meta_data(self) -> dict:
+        return pf.create_synthetic_device("linear", RAW_SHAPE[1])
+
+    def set_metadata_value(self, metadatum: pf.MetaDatum) -> object:
+        if metadatum == pf.MetadataAcquisitionTags.AD_SAMPLING_RATE:
+            return 40e6
+        return None
+
+
+class CopyingAdapter(ViewAdapter):
+    """Converts the raw data with a chain of full copies, of which only the last one is kept."""
+
+    def generate_binary_data(self) -> np.ndarray:
+        data = self.raw_data.astype(np.float64)
+        return np.reshape(np.ascontiguousarray(np.swapaxes(data, 0, 1)), (RAW_SHAPE[1], RAW_SHAPE[0], 1, 1))
+
+
+class ConvertingInInitAdapter(ViewAdapter):
+    """Converts the raw data in its constructor before calling BaseAdapter.__init__, as most adapters do."""
+
+    def __init__(self, raw_data):
+        data = raw_data.astype(np.float64)
+        converted = np.ascontiguousarray(np.swapaxes(data, 0, 1))
+        del data
+        super(ConvertingInInitAdapter, self).__init__(converted)
+
+    def generate_binary_data(self) -> np.ndarray:
+        return self.raw_data[:, :, np.newaxis, np.newaxis]
+
+
+class MemoryTrackingTest(TestCase):
+
+    def setUp(self):
+        self.directory = tempfile.mkdtemp()
+        self.raw_data = np.random.default_rng(0).standard_normal(RAW_SHAPE)
+        print("setUp")
+
+    def tearDown(self):
+        shutil.rmtree(self.directory)
+        print("tearDown")
+
+    def test_memory_usage_is_reported(self):
+        rss, peak_rss = profile.get_memory_usage()
+        self.assertGreater(peak_rss, 0)
+        if rss is not None:
+            self.assertGreaterEqual(peak_rss, rss)
+
+    def test_duplicating_stages_are_flagged(self):
+        stages = []
+        with profile.track_memory(callback=stages.append) as memory_trace:
+            ViewAdapter(self.raw_data)
+            CopyingAdapter(self.raw_data)
+        self.assertFalse(tracemalloc.is_tracing())
+        self.assertFalse(profile.is_enabled())
+
+        names = [stage.name for stage in memory_trace.memory_stages]
+        self.assertEqual(names, ["ViewAdapter.generate_binary_data", "ViewAdapter.__init__",
+                                 "CopyingAdapter.generate_binary_data", "CopyingAdapter.__init__"])
+        self.assertEqual(stages, memory_trace.memory_stages)
+        view_stage, _, copy_stage, copy_init_stage = memory_trace.memory_stages
+
+        self.assertFalse(view_stage.duplicated_data)
+        self.assertLess(view_stage.peak_allocated_bytes, self.raw_data.nbytes / 10)
+        self.assertTrue(copy_stage.duplicated_data)
+        self.assertEqual(copy_stage.data_bytes, self.raw_data.nbytes)
+        self.assertGreaterEqual(copy_stage.peak_allocated_bytes, 2 * self.raw_data.nbytes)
+        self.assertGreaterEqual(copy_stage.allocated_bytes, self.raw_data.nbytes)
+        self.assertGreaterEqual(copy_init_stage.peak_allocated_bytes, copy_stage.peak_allocated_bytes)
+        self.assertGreater(copy_stage.peak_rss, 0)
+        self.assertEqual(memory_trace.duplicated_data_stages, [copy_stage, copy_init_stage])
+        self.assertTrue(any(__file__.endswith(os.path.basename(allocation["location"].split(":")[0]))
+                            for allocation in copy_stage.top_allocations))
+        self.assertIn("duplicated data", memory_trace.report())
+
+    def test_copies_in_adapter_constructors_are_flagged(self):
+        with profile.track_memory() as memory_trace:
+            adapter = ConvertingInInitAdapter(self.raw_data)
+        names = [stage.name for stage in memory_trace.memory_stages]
+        self.assertEqual(names, ["ConvertingInInitAdapter.generate_binary_data", "ConvertingInInitAdapter.__init__"])
+        binary_data_stage, init_stage = memory_trace.memory_stages
+        self.assertFalse(binary_data_stage.duplicated_data)
+        self.assertTrue(init_stage.duplicated_data)
+        self.assertEqual(init_stage.data_bytes, self.raw_data.nbytes)
+        self.assertGreaterEqual(init_stage.peak_allocated_bytes, 2 * self.raw_data.nbytes)
+        self.assertNotIn("_init_span_open", adapter.__dict__)
+
+    def test_load_and_write_are_measured(self):
+        file_path = os.path.join(self.directory, "tracked.hdf5")
+        pa_data = ViewAdapter(self.raw_data).generate_pa_data()
+        pa_data.binary_time_series_data = np.ascontiguousarray(pa_data.binary_time_series_data)
+        with profile.track_memory(snapshots=False) as memory_trace:
+            pf.write_data(file_path, pa_data)
+            loaded_pa_data = pf.load_data(file_path)
+
+        write_stage, load_stage = memory_trace.memory_stages
+        self.assertEqual((write_stage.name, load_stage.name), ("write_data", "load_data"))
+        self.assertEqual(load_stage.data_bytes, self.raw_data.nbytes)
+        self.assertGreaterEqual(load_stage.allocated_bytes, loaded_pa_data.binary_time_series_data.nbytes)
+        self.assertFalse(load_stage.duplicated_data)
+        self.assertFalse(write_stage.duplicated_data)
+        self.assertEqual(load_stage.top_allocations, [])
+        load_span = [finished_span for finished_span in memory_trace.spans if finished_span.name == "load_data"][0]
+        self.assertEqual(load_span.attributes["peak_allocated_bytes"], load_stage.peak_allocated_bytes)
+        self.assertIn("load_data.read_binary_data", memory_trace.summary())
@@ -0,0 +1,76 @@
+# SPDX-FileCopyrightText: 2026 International Photoacoustics Standardisation Consortium (IPASC)
+# SPDX-License-Identifier: BSD 3-Clause License
+
+import os
+
+import h5py
+import numpy as np
+from unittest.case import TestCase
+import pacfish as pf
+from testing.unit_tests.utils import create_complete_device_metadata_dictionary, \
+    create_complete_acquisition_meta_data_dictionary, assert_equal_dicts
+
+FILE_PATHS = ["ipasc_update_test_0.hdf5", "ipasc_update_test_1.hdf5"]
+
+
+def read_raw_binary_data(file_path):
+    with h5py.File(file_path, "r") as h5file:
+        dataset = h5file["binary_time_series_data"]
+        offset = dataset.id.get_offset()
+        size = dataset.id.get_storage_size()
+    with open(file_path, "rb") as file_handle:
+        file_handle.seek(offset)
+        return offset, file_handle.read(size)
+
+
+class MetadataUpdateTest(TestCase):
+
+    def setUp(self):
+        self.pa_data = pf.PAData(binary_time_series_data=np.random.random((4, 200, 2)),
+                                 meta_data_acquisition=create_complete_acquisition_meta_data_dictionary(),
+                                 meta_data_device=create_complete_device_metadata_dictionary())
+        for file_path in FILE_PATHS:
+            pf.write_data(file_path, self.pa_data)
+        print("setUp")
+
+    def tearDown(self):
+        for file_path in FILE_PATHS:
+            if os.path.exists(file_path):
+                os.remove(file_path)
+        print("tearDown")
+
+    def test_update_metadata_in_place(self):
+        raw_data_before = read_raw_binary_data(FILE_PATHS[0])
+        detector_id = list(self.pa_data.get_detector_ids())[1]
+        new_position = np.asarray([0.1, 0.2, 0.3])
+
+        bytes_written = pf.update_metadata(FILE_PATHS[0],
+                                           acquisition={pf.MetadataAcquisitionTags.SPEED_OF_SOUND.tag: 1480.0,
+                                                        "custom_tag": "custom_value"},
+                                           device={pf.MetadataDeviceTags.DETECTORS.tag: {detector_id: {
+                                               pf.MetadataDeviceTags.DETECTOR_POSITION.tag: new_position}}})
+
+        self.assertGreater(bytes_written, 0)
+        self.assertEqual(raw_data_before, read_raw_binary_data(FILE_PATHS[0]))
+
+        test_data = pf.load_data(FILE_PATHS[0])
+        self.assertEqual(test_data.get_speed_of_sound(), 1480.0)
+        self.assertEqual(test_data.get_custom_meta_datum("custom_tag"), "custom_value")
+        self.assertTrue((test_data.get_detector_position(detector_id) == new_position).all())
+        self.assertTrue((test_data.get_detector_orientation(detector_id) ==
+                         self.pa_data.get_detector_orientation(detector_id)).all())
+        assert_equal_dicts(self.pa_data.meta_data_device[pf.MetadataDeviceTags.ILLUMINATORS.tag],
+                           test_data.meta_data_device[pf.MetadataDeviceTags.ILLUMINATORS.tag])
+        self.assertTrue((self.pa_data.binary_time_series_data == test_data.binary_time_series_data).all())
+
+    def test_update_keeps_integrity_information_valid(self):
+        pf.write_data(FILE_PATHS[0], self.pa_data, checksums=True)
+        pf.update_metadata(FILE_PATHS[0], acquisition={pf.MetadataAcquisitionTags.OVERALL_GAIN.tag: 1.5})
+        self.assertTrue(pf.verify_file_integrity(FILE_PATHS[0]))
+
+    def test_update_metadata_of_files(self):
+        result = pf.update_metadata_of_files(FILE_PATHS,
+                                             acquisition={pf.MetadataAcquisitionTags.SCANNING_METHOD.tag: None})
+        self.assertEqual(list(result.keys()), FILE_PATHS)
+        for file_path in FILE_PATHS:
+            self.assertIsNone(pf.load_data(file_path).get_scanning_method())
@@ -0,0 +1,137 @@
+# SPDX-FileCopyrightText: 2026 International Photoacoustics Standardisation Consortium (IPASC)
+# SPDX-License-Identifier: BSD 3-Clause License
+
+import numpy as np
+from unittest.case import TestCase
+import pacfish as pf
+from pacfish.simulation.PointAbsorberSimulation import compute_sphere_signals
+
+SPEED_OF_SOUND = 1500.0
+SAMPLING_RATE = 40e6
+
+
+def create_acquisition_meta_data():
+    return {pf.MetadataAcquisitionTags.SPEED_OF_SOUND.tag: SPEED_OF_SOUND,
+            pf.MetadataAcquisitionTags.AD_SAMPLING_RATE.tag: SAMPLING_RATE}
+
+
+class PointAbsorberSimulationTest(TestCase):
+
+    def setUp(self):
+        print("setUp")
+
+    def tearDown(self):
+        print("tearDown")
+
+    def test_sphere_signals_are_sample_averages_of_the_analytic_pressure(self):
+        distance, radius = 0.01, 0.0002
+        samples, pressures = compute_sphere_signals(np.asarray([[distance]]), np.asarray([radius]), SPEED_OF_SOUND,
+                                                    SAMPLING_RATE, 1024)
+        samples, pressures = samples[0, 0], pressures[0, 0]
+
+        oversampling = 1000
+        times = (samples[:, np.newaxis] + (np.arange(oversampling) + 0.5) / oversampling - 0.5) / SAMPLING_RATE
+        u = distance - SPEED_OF_SOUND * times
+        expected = np.mean(np.where(np.abs(u) < radius, u / (2 * distance), 0), axis=-1)
+        self.assertTrue(np.allclose(pressures, expected, atol=1e-3 * np.max(expected)))
+        self.assertAlmostEqual(np.sum(pressures), 0)
+        # the compression arrives before the rarefaction
+        self.assertLess(np.argmax(pressures), np.argmin(pressures))
+
+    def test_absorbers_overlapping_a_detector_are_rejected(self):
+        meta_data_device = pf.create_synthetic_device("linear", 8)
+        detector_position = list(meta_data_device[pf.MetadataDeviceTags.DETECTORS.tag].values())[0][
+            pf.MetadataDeviceTags.DETECTOR_POSITION.tag]
+        for offset in [0, 0.00005]:
+            simulation = pf.PointAbsorberSimulation([[0, 0, 0.01], detector_position + [0, 0, offset]],
+                                                    absorber_radii=0.0001)
+            with self.assertRaises(ValueError):
+                simulation.simulate(meta_data_device, SPEED_OF_SOUND, SAMPLING_RATE, 1024)
+        time_series = pf.PointAbsorberSimulation([detector_position + [0, 0, 0.0002]], absorber_radii=0.0001) \
+            .simulate(meta_data_device, SPEED_OF_SOUND, SAMPLING_RATE, 1024)
+        self.assertTrue(np.all(np.isfinite(time_series)))
+
+    def test_ring_device_records_the_time_of_flight(self):
+        meta_data_device = pf.create_synthetic_device("ring", 32)
+        simulation = pf.PointAbsorberSimulation([[0, 0, 0]], absorber_radii=0.0003, initial_pressures=[[1.0, 2.0]])
+        pa_data = simulation.simulate_pa_data(meta_data_device, create_acquisition_meta_data(), 2048,
+                                              num_measurements=3)
+
+        time_series = pa_data.binary_time_series_data
+        self.assertEqual(time_series.shape, (32, 2048, 2, 3))
+        self.assertTrue((pa_data.meta_data_acquisition[pf.MetadataAcquisitionTags.SIZES.tag] ==
+                         [32, 2048, 2, 3]).all())
+        self.assertTrue(np.allclose(time_series, time_series[:1]))
+        self.assertTrue(np.allclose(time_series[..., 1, :], 2 * time_series[..., 0, :]))
+        arrival_sample = 0.04 * SAMPLING_RATE / SPEED_OF_SOUND
+        self.assertLess(np.argmax(time_series[0, :, 0, 0]), arrival_sample)
+        self.assertGreater(np.argmin(time_series[0, :, 0, 0]), arrival_sample)
+
+    def test_directivity_follows_the_angular_response(self):
+        meta_data_device = pf.create_synthetic_device("linear", 1)
+        detector = list(meta_data_device[pf.MetadataDeviceTags.DETECTORS.tag].values())[0]
+        angles = np.linspace(0, np.pi / 2, 64)
+        detector[pf.MetadataDeviceTags.ANGULAR_RESPONSE.tag] = np.asarray([angles, np.cos(angles)])
+        angle = np.pi / 3
+        sources = [[0, 0, 0.01], [np.sin(angle) * 0.01, 0, np.cos(angle) * 0.01]]
+
+        time_series = pf.PointAbsorberSimulation(sources).simulate(meta_data_device, SPEED_OF_SOUND,
+                                                                   SAMPLING_RATE, 1024)
+        omnidirectional = pf.PointAbsorberSimulation(sources, directivity=False).simulate(
+            meta_data_device, SPEED_OF_SOUND, SAMPLING_RATE, 1024)
+        # both sources have the same distance, so the detector records the sum of both pulses
+        self.assertTrue(np.allclose(time_series, omnidirectional * (1 + np.cos(angle)) / 2, atol=1e-6))
+
+        # the response is zero beyond the largest tabulated angle
+        detector[pf.MetadataDeviceTags.ANGULAR_RESPONSE.tag] = np.asarray([[np.pi / 4, 0], [0.5, 1]])
+        limited = pf.PointAbsorberSimulation(sources).simulate(meta_data_device, SPEED_OF_SOUND,
+                                                               SAMPLING_RATE, 1024)
+        self.assertTrue(np.allclose(limited, omnidirectional / 2, atol=1e-6))
+
+        # a single value is not an IPASC angular response
+        detector[pf.MetadataDeviceTags.ANGULAR_RESPONSE.tag] = np.asarray([angle])
+        with self.assertRaises(ValueError):
+            pf.PointAbsorberSimulation(sources).simulate(meta_data_device, SPEED_OF_SOUND, SAMPLING_RATE, 1024)
+
+    def test_detectors_without_angular_response_or_orientation_are_omnidirectional(self):
+        meta_data_device = pf.create_synthetic_device("linear", 4)
+        detectors = list(meta_data_device[pf.MetadataDeviceTags.DETECTORS.tag].values())
+        for detector in detectors:
+            detector.pop(pf.MetadataDeviceTags.ANGULAR_RESPONSE.tag, None)
+            detector[pf.MetadataDeviceTags.DETECTOR_ORIENTATION.tag] = np.asarray([0, 0, 1.0])
+        sources = [[0.005, 0, 0.005]]
+        omnidirectional = pf.PointAbsorberSimulation(sources, directivity=False).simulate(
+            meta_data_device, SPEED_OF_SOUND, SAMPLING_RATE, 1024)
+        time_series = pf.PointAbsorberSimulation(sources).simulate(meta_data_device, SPEED_OF_SOUND,
+                                                                   SAMPLING_RATE, 1024)
+        self.assertTrue(np.allclose(time_series, omnidirectional))
+
+        # only some detectors have an orientation and an angular response
+        detectors[0].pop(pf.MetadataDeviceTags.DETECTOR_ORIENTATION.tag)
+        detectors[1][pf.MetadataDeviceTags.ANGULAR_RESPONSE.tag] = np.asarray([[0, np.pi / 8], [1, 0]])
+        detectors[2][pf.MetadataDeviceTags.ANGULAR_RESPONSE.tag] = np.asarray([[0, np.pi / 8], [1, 0]])
+        detectors[2].pop(pf.MetadataDeviceTags.DETECTOR_ORIENTATION.tag)
+        time_series = pf.PointAbsorberSimulation(sources, detectors_per_block=1).simulate(
+            meta_data_device, SPEED_OF_SOUND, SAMPLING_RATE, 1024)
+        self.assertTrue(np.allclose(time_series[[0, 2, 3]], omnidirectional[[0, 2, 3]]))
+        self.assertLess(np.max(np.abs(time_series[1])), 0.5 * np.max(np.abs(omnidirectional[1])))
+
+    def test_reconstruction_of_simulated_absorbers(self):
+        meta_data_device = pf.create_synthetic_device("ring", 128)
+        absorber_positions = np.asarray([[0.004, 0, -0.002], [-0.003, 0, 0.005]])
+        simulation = pf.PointAbsorberSimulation(absorber_positions, absorber_radii=0.0002,
+                                                detectors_per_block=7, sources_per_batch=1, workers=3)
+        pa_data = simulation.simulate_pa_data(meta_data_device, create_acquisition_meta_data(), 2048)
+        reference = pf.PointAbsorberSimulation(absorber_positions, absorber_radii=0.0002).simulate_pa_data(
+            meta_data_device, create_acquisition_meta_data(), 2048)
+        self.assertTrue(np.allclose(pa_data.binary_time_series_data, reference.binary_time_series_data))
+
+        # the back projection of the negative time derivative of the N-shaped waves peaks at the sphere centres
+        pa_data.binary_time_series_data = -np.gradient(pa_data.binary_time_series_data, axis=1)
+        for absorber_position in absorber_positions:
+            field_of_view = np.stack([absorber_position - 0.001, absorber_position + 0.001], axis=-1).ravel()
+            field_of_view[2:4] = 0
+            image = pf.DelayAndSum(spacing=0.0001).reconstruct(pa_data, field_of_view)
+            grid = pf.ReconstructionGrid(field_of_view, 0.0001)
+            peak = grid.get_voxel_positions()[np.argmax(image)]
+            self.assertTrue(np.allclose(peak, absorber_position, atol=0.0001))
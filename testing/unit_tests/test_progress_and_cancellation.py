@@ -0,0 +1,98 @@
+# SPDX-FileCopyrightText: 2026 International Photoacoustics Standardisation Consortium (IPASC)
+# SPDX-License-Identifier: BSD 3-Clause License
+
+import os
+import shutil
+import tempfile
+from unittest import mock
+
+from unittest.case import TestCase
+import pacfish as pf
+from testing.unit_tests.utils import PassThroughAdapter, create_materialised_synthetic_pa_data
+
+# 16 detectors * 128 samples * 2 wavelengths * 4 bytes, i.e. one measurement per chunk
+CHUNK_BYTES = 16 * 128 * 2 * 4
+
+
+class ProgressAndCancellationTest(TestCase):
+
+    def setUp(self):
+        self.directory = tempfile.mkdtemp()
+        self.file_path = os.path.join(self.directory, "progress.hdf5")
+        self.pa_data = create_materialised_synthetic_pa_data("linear", 16, 128, 2, 5, seed=4)
+        self.patch = mock.patch("pacfish.iohandler.progress.DEFAULT_CHUNK_BYTES", CHUNK_BYTES)
+        self.patch.start()
+        print("setUp")
+
+    def tearDown(self):
+        self.patch.stop()
+        shutil.rmtree(self.directory)
+        print("tearDown")
+
+    def test_reads_and_writes_report_bytes_and_frames(self):
+        num_bytes = self.pa_data.binary_time_series_data.nbytes
+        reports = []
+        pf.write_data(self.file_path, self.pa_data, checksums=True, progress=reports.append)
+        self.assertEqual([report.frames_done for report in reports], [1, 2, 3, 4, 5])
+        self.assertEqual(reports[-1].bytes_done, num_bytes)
+        self.assertEqual(reports[-1].fraction, 1.0)
+        self.assertTrue(all(report.operation == "write_data" and report.frames_total == 5 for report in reports))
+        self.assertEqual(os.listdir(self.directory), ["progress.hdf5"])
+        self.assertTrue(pf.verify_file_integrity(self.file_path))
+
+        reports = []
+        pa_data = pf.load_data(self.file_path, progress=reports.append, cancellation=pf.CancellationToken())
+        self.assertTrue((pa_data.binary_time_series_data == self.pa_data.binary_time_series_data).all())
+        self.assertEqual([report.bytes_done for report in reports], [num_bytes // 5 * (i + 1) for i in range(5)])
+        self.assertGreaterEqual(reports[-1].seconds, 0)
+
+        reports = []
+        lazy_data = pf.load_data(self.file_path, lazy=True, progress=reports.append).binary_time_series_data
+        self.assertEqual([(report.frames_done, report.frames_total, report.bytes_done) for report in reports],
+                         [(1, 1, 0)])
+        self.assertEqual(reports[0].fraction, 1.0)
+
+        reports = []
+        chunks = list(pf.iterate_measurement_chunks(lazy_data, 2, progress=reports.append))
+        self.assertEqual(len(chunks), 3)
+        self.assertEqual([report.frames_done for report in reports], [2, 4, 5])
+
+    def test_cancelled_write_keeps_the_existing_file(self):
+        pf.write_data(self.file_path, self.pa_data)
+        other_pa_data = create_materialised_synthetic_pa_data("linear", 16, 128, 2, 5, seed=5)
+
+        cancellation = pf.CancellationToken()
+
+        def cancel_after_two_frames(report):
+            if report.frames_done == 2:
+                cancellation.cancel()
+
+        with self.assertRaises(pf.OperationCancelled):
+            pf.write_data(self.file_path, other_pa_data, progress=cancel_after_two_frames,
+                          cancellation=cancellation)
+        self.assertTrue(cancellation.cancelled)
+        self.assertEqual(os.listdir(self.directory), ["progress.hdf5"])
+        self.assertTrue((pf.load_data(self.file_path).binary_time_series_data ==
+                         self.pa_data.binary_time_series_data).all())
+
+        with self.assertRaises(pf.OperationCancelled):
+            pf.load_data(self.file_path, cancellation=cancellation)
+        with self.assertRaises(pf.OperationCancelled):
+            pf.load_data(self.file_path, lazy=True, cancellation=cancellation)
+        with self.assertRaises(pf.OperationCancelled):
+            pf.write_data(os.path.join(self.directory, "new.hdf5"), self.pa_data, cancellation=cancellation)
+        self.assertEqual(os.listdir(self.directory), ["progress.hdf5"])
+
+    def test_adapter_conversion_reports_progress_and_can_be_cancelled(self):
+        reports = []
+        pa_data = PassThroughAdapter(self.pa_data, progress=reports.append).generate_pa_data()
+        self.assertEqual(len(reports), 1)
+        self.assertEqual(reports[0].operation, "PassThroughAdapter")
+        self.assertEqual(reports[0].bytes_done, self.pa_data.binary_time_series_data.nbytes)
+        self.assertEqual(reports[0].frames_done, 5)
+        self.assertIs(pa_data.binary_time_series_data, self.pa_data.binary_time_series_data)
+
+        cancellation = pf.CancellationToken()
+        with self.assertRaises(pf.OperationCancelled):
+            PassThroughAdapter(self.pa_data, progress=lambda report: cancellation.cancel(),
+                              cancellation=cancellation)
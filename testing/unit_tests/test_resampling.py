@@ -0,0 +1,75 @@
+# SPDX-FileCopyrightText: 2026 International Photoacoustics Standardisation Consortium (IPASC)
+# SPDX-License-Identifier: BSD 3-Clause License
+
+import os
+import shutil
+import tempfile
+
+import numpy as np
+from unittest.case import TestCase
+import pacfish as pf
+from testing.unit_tests.utils import create_complete_device_metadata_dictionary
+
+SAMPLING_RATE = 40e6
+NUM_SAMPLES = 800
+
+
+def sine(sampling_rate, num_samples, frequency=1e6):
+    return np.sin(2 * np.pi * frequency * np.arange(num_samples) / sampling_rate)
+
+
+class ResamplingTest(TestCase):
+
+    def setUp(self):
+        self.directory = tempfile.mkdtemp()
+        signal = sine(SAMPLING_RATE, NUM_SAMPLES)
+        time_series = signal[np.newaxis, :, np.newaxis, np.newaxis] * np.asarray([1.0, 2.0])[:, np.newaxis]
+        time_series = np.tile(time_series, (4, 1, 1, 3))
+        acquisition_dict = {
+            pf.MetadataAcquisitionTags.AD_SAMPLING_RATE.tag: SAMPLING_RATE,
+            pf.MetadataAcquisitionTags.SIZES.tag: np.asarray(time_series.shape),
+            pf.MetadataAcquisitionTags.TIME_GAIN_COMPENSATION.tag: np.linspace(1, 2, NUM_SAMPLES)}
+        self.pa_data = pf.PAData(time_series, acquisition_dict, create_complete_device_metadata_dictionary())
+        print("setUp")
+
+    def tearDown(self):
+        shutil.rmtree(self.directory)
+        print("tearDown")
+
+    def test_resampling_by_a_rational_factor(self):
+        resampled = pf.Resampling(sampling_rate=25e6, measurements_per_chunk=2).apply(self.pa_data)
+        self.assertEqual(resampled.binary_time_series_data.shape, (4, 500, 2, 3))
+        self.assertEqual(resampled.get_sampling_rate(), 25e6)
+        self.assertTrue((resampled.get_sizes() == [4, 500, 2, 3]).all())
+        self.assertEqual(len(resampled.get_time_gain_compensation()), 500)
+        self.assertAlmostEqual(resampled.get_time_gain_compensation()[-1], 1 + 798.4 / 799)
+        self.assertEqual(self.pa_data.get_sampling_rate(), SAMPLING_RATE)
+
+        expected = sine(25e6, 500)
+        interior = slice(50, 450)
+        self.assertTrue(np.allclose(resampled.binary_time_series_data[2, interior, 1, 2], 2 * expected[interior],
+                                    atol=1e-2))
+
+    def test_lazy_resampling_matches_resampling_in_memory(self):
+        resampled = pf.Resampling(sampling_rate=60e6).apply(self.pa_data)
+        lazy_resampled = pf.Resampling(sampling_rate=60e6).apply(self.pa_data, lazy=True)
+        self.assertEqual(lazy_resampled.binary_time_series_data.shape, resampled.binary_time_series_data.shape)
+        self.assertTrue(np.allclose(lazy_resampled.binary_time_series_data[..., 1],
+                                    resampled.binary_time_series_data[..., 1]))
+        self.assertTrue(np.allclose(lazy_resampled.binary_time_series_data[1, 10:20],
+                                    resampled.binary_time_series_data[1, 10:20]))
+
+    def test_streaming_from_and_to_files(self):
+        source_path = os.path.join(self.directory, "source.hdf5")
+        target_path = os.path.join(self.directory, "resampled.hdf5")
+        pf.write_data(source_path, self.pa_data)
+        pf.Resampling(sampling_rate=20e6).write(pf.load_data(source_path, lazy=True), target_path)
+        resampled = pf.load_data(target_path)
+        expected = pf.Resampling(sampling_rate=20e6).apply(self.pa_data)
+        self.assertEqual(resampled.get_sampling_rate(), 20e6)
+        self.assertTrue(np.allclose(resampled.binary_time_series_data, expected.binary_time_series_data))
+
+    def test_missing_sampling_rate_raises_an_error(self):
+        del self.pa_data.meta_data_acquisition[pf.MetadataAcquisitionTags.AD_SAMPLING_RATE.tag]
+        with self.assertRaises(ValueError):
+            pf.Resampling(sampling_rate=20e6).apply(self.pa_data)
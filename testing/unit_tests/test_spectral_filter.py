@@ -0,0 +1,96 @@
+# SPDX-FileCopyrightText: 2026 International Photoacoustics Standardisation Consortium (IPASC)
+# SPDX-License-Identifier: BSD 3-Clause License
+
+import os
+import shutil
+import tempfile
+
+import numpy as np
+import scipy.fft
+from unittest.case import TestCase
+import pacfish as pf
+
+SAMPLING_RATE = 40e6
+NUM_SAMPLES = 1000
+
+
+def create_pa_data(time_series, frequency_response=None):
+    device_creator = pf.DeviceMetaDataCreator()
+    device_creator.set_general_information(uuid="linear", fov=np.asarray([0, 0.01, 0, 0, 0, 0.01]))
+    for index in range(time_series.shape[0]):
+        detection_element_creator = pf.DetectionElementCreator()
+        detection_element_creator.set_detector_position(np.asarray([index * 0.001, 0, 0]))
+        if frequency_response is not None:
+            detection_element_creator.set_frequency_response(frequency_response)
+        device_creator.add_detection_element(detection_element_creator.get_dictionary())
+    acquisition_dict = {pf.MetadataAcquisitionTags.AD_SAMPLING_RATE.tag: SAMPLING_RATE}
+    return pf.PAData(time_series, acquisition_dict, device_creator.finalize_device_meta_data())
+
+
+def get_amplitude(signal, frequency):
+    spectrum = np.abs(np.fft.rfft(signal)) * 2 / len(signal)
+    return spectrum[int(round(frequency * len(signal) / SAMPLING_RATE))]
+
+
+class SpectralFilterTest(TestCase):
+
+    def setUp(self):
+        self.directory = tempfile.mkdtemp()
+        self.time = np.arange(NUM_SAMPLES) / SAMPLING_RATE
+        self.frequencies = [0.4e6, 4e6, 16e6]
+        signal = sum(np.sin(2 * np.pi * frequency * self.time) for frequency in self.frequencies)
+        self.time_series = np.tile(signal, (3, 1))[:, :, np.newaxis, np.newaxis] * np.ones((1, 1, 2, 2))
+        print("setUp")
+
+    def tearDown(self):
+        shutil.rmtree(self.directory)
+        print("tearDown")
+
+    def test_band_pass_filter(self):
+        pa_data = create_pa_data(self.time_series.copy())
+        pa_data.meta_data_acquisition[pf.MetadataAcquisitionTags.FREQUENCY_DOMAIN_FILTER.tag] = np.asarray([1e6, 8e6])
+        filtered = pf.SpectralFilter().apply(pa_data)
+        self.assertIs(filtered, pa_data.binary_time_series_data)
+        signal = filtered[1, :, 1, 1]
+        self.assertLess(get_amplitude(signal, 0.4e6), 0.05)
+        self.assertGreater(get_amplitude(signal, 4e6), 0.95)
+        self.assertLess(get_amplitude(signal, 16e6), 0.1)
+        self.assertTrue(np.allclose(filtered[0], filtered[2]))
+
+    def test_high_pass_filter_keeps_single_precision(self):
+        pa_data = create_pa_data(self.time_series.astype(np.float32))
+        filtered = pf.SpectralFilter(band=[10e6, -1], measurements_per_chunk=2).apply(pa_data)
+        self.assertEqual(filtered.dtype, np.float32)
+        self.assertLess(get_amplitude(filtered[0, :, 0, 0], 4e6), 0.05)
+        self.assertGreater(get_amplitude(filtered[0, :, 0, 0], 16e6), 0.95)
+
+    def test_deconvolution_of_the_frequency_response(self):
+        frequencies = scipy.fft.rfftfreq(NUM_SAMPLES, 1 / SAMPLING_RATE)
+        frequency_response = np.asarray([frequencies, np.exp(-((frequencies - 5e6) / 4e6) ** 2)])
+        impulse = np.zeros(NUM_SAMPLES)
+        impulse[NUM_SAMPLES // 2] = 1
+        recorded = np.fft.irfft(np.fft.rfft(impulse) * frequency_response[1], n=NUM_SAMPLES)
+        pa_data = create_pa_data(np.tile(recorded, (3, 1)), frequency_response)
+
+        spectral_filter = pf.SpectralFilter(band=[1e6, 9e6], deconvolve=True, regularisation=1e-3)
+        deconvolved = spectral_filter.apply(pa_data)
+        self.assertEqual(np.argmax(deconvolved[0]), NUM_SAMPLES // 2)
+        self.assertGreater(np.max(deconvolved[0]) / np.max(recorded), 1.2)
+        self.assertEqual(len(spectral_filter._transfer_functions), 1)
+
+        spectral_filter.apply(pa_data)
+        self.assertEqual(len(spectral_filter._transfer_functions), 1)
+
+        with self.assertRaises(ValueError):
+            pf.SpectralFilter(deconvolve=True).apply(create_pa_data(self.time_series.copy()))
+        # a [centre frequency, bandwidth] pair is not an IPASC frequency response
+        with self.assertRaises(ValueError):
+            pf.SpectralFilter(deconvolve=True).apply(create_pa_data(self.time_series.copy(),
+                                                                    np.asarray([5e6, 4e6])))
+
+    def test_filtering_of_lazily_loaded_data(self):
+        file_path = os.path.join(self.directory, "spectral.hdf5")
+        pf.write_data(file_path, create_pa_data(self.time_series))
+        expected = pf.SpectralFilter(band=[1e6, 8e6]).apply(create_pa_data(self.time_series.copy()))
+        filtered = pf.SpectralFilter(band=[1e6, 8e6]).apply(pf.load_data(file_path, lazy=True))
+        self.assertTrue(np.allclose(filtered, expected))
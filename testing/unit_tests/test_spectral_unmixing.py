@@ -0,0 +1,91 @@
+# SPDX-FileCopyrightText: 2026 International Photoacoustics Standardisation Consortium (IPASC)
+# SPDX-License-Identifier: BSD 3-Clause License
+
+import os
+import shutil
+import tempfile
+
+import numpy as np
+from scipy.optimize import nnls
+from unittest.case import TestCase
+import pacfish as pf
+from pacfish.processing.SpectralUnmixing import get_relative_beam_energy
+from testing.unit_tests.utils import create_complete_device_metadata_dictionary
+
+WAVELENGTHS = np.asarray([700e-9, 750e-9, 800e-9, 850e-9, 900e-9])
+SPECTRA_WAVELENGTHS = np.linspace(650e-9, 950e-9, 31)
+
+
+class SpectralUnmixingTest(TestCase):
+
+    def setUp(self):
+        self.directory = tempfile.mkdtemp()
+        self.spectra = np.stack([np.linspace(2.0, 0.5, 31), np.linspace(0.5, 1.5, 31),
+                                 np.exp(-((SPECTRA_WAVELENGTHS - 800e-9) / 50e-9) ** 2)])
+        self.endmember_matrix = np.stack([np.interp(WAVELENGTHS, SPECTRA_WAVELENGTHS, spectrum)
+                                          for spectrum in self.spectra], axis=-1)
+        self.abundances = np.random.random((3, 50, 3, 4))
+        self.time_series = np.einsum("we,dsem->dswm", self.endmember_matrix, self.abundances)
+        self.acquisition_dict = {pf.MetadataAcquisitionTags.ACQUISITION_WAVELENGTHS.tag: WAVELENGTHS}
+        print("setUp")
+
+    def tearDown(self):
+        shutil.rmtree(self.directory)
+        print("tearDown")
+
+    def test_least_squares_unmixing(self):
+        pa_data = pf.PAData(self.time_series, self.acquisition_dict, create_complete_device_metadata_dictionary())
+        unmixing = pf.SpectralUnmixing(self.spectra, endmember_wavelengths=SPECTRA_WAVELENGTHS,
+                                       measurements_per_chunk=3)
+        abundances = unmixing.apply(pa_data)
+        self.assertEqual(abundances.shape, (3, 50, 3, 4))
+        self.assertTrue(np.allclose(abundances, self.abundances))
+
+        image = np.moveaxis(self.time_series, 2, -1)
+        self.assertTrue(np.allclose(unmixing.unmix(image, WAVELENGTHS), np.moveaxis(self.abundances, 2, -1)))
+
+    def test_non_negative_unmixing_matches_scipy(self):
+        noisy_time_series = self.time_series + np.random.normal(0, 0.3, self.time_series.shape)
+        unmixing = pf.SpectralUnmixing(self.endmember_matrix.T, non_negative=True)
+        abundances = unmixing.unmix(noisy_time_series, WAVELENGTHS, wavelength_axis=2)
+        self.assertTrue(np.all(abundances >= 0))
+        for detector, sample, measurement in [(0, 0, 0), (1, 20, 3), (2, 49, 1), (2, 10, 2)]:
+            expected, _ = nnls(self.endmember_matrix, noisy_time_series[detector, sample, :, measurement])
+            self.assertTrue(np.allclose(abundances[detector, sample, :, measurement], expected, atol=1e-8))
+
+    def test_unmixing_of_lazily_loaded_data(self):
+        file_path = os.path.join(self.directory, "unmixing.hdf5")
+        pf.write_data(file_path, pf.PAData(self.time_series, self.acquisition_dict,
+                                           create_complete_device_metadata_dictionary()))
+        unmixing = pf.SpectralUnmixing(self.spectra, endmember_wavelengths=SPECTRA_WAVELENGTHS, non_negative=True)
+        abundances = unmixing.apply(pf.load_data(file_path, lazy=True))
+        self.assertTrue(np.allclose(abundances, self.abundances))
+
+    def test_mismatching_spectra_raise_an_error(self):
+        pa_data = pf.PAData(self.time_series, self.acquisition_dict, create_complete_device_metadata_dictionary())
+        with self.assertRaises(ValueError):
+            pf.SpectralUnmixing(self.spectra).apply(pa_data)
+
+    def test_beam_energy_correction_with_a_known_profile(self):
+        device_dict = create_complete_device_metadata_dictionary()
+        illuminators = list(device_dict[pf.MetadataDeviceTags.ILLUMINATORS.tag].values())
+        # the profiles are tabulated in nm and sum to 1, 1.5, 2, 2.5 and 3 at the acquisition wavelengths
+        illuminators[0][pf.MetadataDeviceTags.BEAM_ENERGY_PROFILE.tag] = np.asarray([[700, 900], [0.0, 2.0]])
+        illuminators[1][pf.MetadataDeviceTags.BEAM_ENERGY_PROFILE.tag] = np.asarray([[950, 600], [1.0, 1.0]])
+        beam_energy = np.asarray([1, 1.5, 2, 2.5, 3]) / 3
+        pa_data = pf.PAData(self.time_series * beam_energy[:, np.newaxis], self.acquisition_dict, device_dict)
+        self.assertTrue(np.allclose(get_relative_beam_energy(pa_data), beam_energy))
+
+        unmixing = pf.SpectralUnmixing(self.spectra, endmember_wavelengths=SPECTRA_WAVELENGTHS,
+                                       beam_energy_correction=True)
+        self.assertTrue(np.allclose(unmixing.apply(pa_data), self.abundances))
+        image = np.moveaxis(pa_data.binary_time_series_data, 2, -1)
+        self.assertTrue(np.allclose(unmixing.unmix(image, pa_data=pa_data), np.moveaxis(self.abundances, 2, -1)))
+        with self.assertRaises(ValueError):
+            unmixing.unmix(image, WAVELENGTHS)
+
+        illuminators[0][pf.MetadataDeviceTags.BEAM_ENERGY_PROFILE.tag] = np.asarray([[750, 900], [0.0, 2.0]])
+        with self.assertRaises(ValueError):
+            unmixing.apply(pa_data)
+        with self.assertRaises(ValueError):
+            unmixing.apply(pf.PAData(pa_data.binary_time_series_data, {}, device_dict))
@@ -0,0 +1,79 @@
+# SPDX-FileCopyrightText: 2026 International Photoacoustics Standardisation Consortium (IPASC)
+# SPDX-License-Identifier: BSD 3-Clause License
+
+import os
+import shutil
+import tempfile
+
+import numpy as np
+from unittest.case import TestCase
+import pacfish as pf
+
+
+class SyntheticCorpusTest(TestCase):
+
+    def setUp(self):
+        self.directory = tempfile.mkdtemp()
+        print("setUp")
+
+    def tearDown(self):
+        shutil.rmtree(self.directory)
+        print("tearDown")
+
+    def test_synthetic_data_is_deterministic(self):
+        pa_data = pf.create_synthetic_pa_data("linear", 32, 512, 2, 4, seed=3)
+        data = np.asarray(pa_data.binary_time_series_data)
+        self.assertEqual(data.shape, (32, 512, 2, 4))
+        self.assertEqual(data.dtype, np.float32)
+
+        same_pa_data = pf.create_synthetic_pa_data("linear", 32, 512, 2, 4, seed=3)
+        self.assertTrue((same_pa_data.binary_time_series_data[..., 2] == data[..., 2]).all())
+        self.assertTrue((same_pa_data.binary_time_series_data[1:3, :, 0, ::2] == data[1:3, :, 0, ::2]).all())
+        self.assertEqual(same_pa_data.meta_data_acquisition[pf.MetadataAcquisitionTags.UUID.tag],
+                         pa_data.meta_data_acquisition[pf.MetadataAcquisitionTags.UUID.tag])
+        other_data = np.asarray(pf.create_synthetic_pa_data("linear", 32, 512, 2, 4, seed=4).binary_time_series_data)
+        self.assertFalse(np.allclose(other_data, data))
+
+    def test_device_geometries_have_complete_metadata(self):
+        for geometry, num_detectors, expected_detectors in (("linear", 20, 20), ("ring", 20, 20),
+                                                            ("matrix", 20, 25)):
+            pa_data = pf.create_synthetic_pa_data(geometry, num_detectors, 256, 2, 2, dtype="int16")
+            pa_data.binary_time_series_data = np.asarray(pa_data.binary_time_series_data)
+            self.assertEqual(pa_data.binary_time_series_data.shape, (expected_detectors, 256, 2, 2))
+            self.assertEqual(pa_data.binary_time_series_data.dtype, np.int16)
+            self.assertEqual(len(pa_data.get_detector_position()), expected_detectors)
+            self.assertTrue(pf.quality_check_pa_data(pa_data))
+        with self.assertRaises(ValueError):
+            pf.create_synthetic_device("spiral", 16)
+
+    def test_absorbers_are_reconstructed_at_their_positions(self):
+        pa_data = pf.create_synthetic_pa_data("ring", 128, 2048, 1, 1, seed=1)
+        absorber_position = pa_data.binary_time_series_data.absorber_positions[0]
+        pa_data.binary_time_series_data = np.asarray(pa_data.binary_time_series_data)
+
+        field_of_view = np.stack([absorber_position - 0.001, absorber_position + 0.001], axis=-1).ravel()
+        field_of_view[2:4] = 0
+        image = np.abs(pf.DelayAndSum(spacing=0.00005).reconstruct(pa_data, field_of_view))
+        grid = pf.ReconstructionGrid(field_of_view, 0.00005)
+        peak = grid.get_voxel_positions()[np.argmax(image)]
+        self.assertTrue(np.allclose(peak, absorber_position, atol=0.0002))
+
+    def test_corpus_is_streamed_to_files_in_parallel(self):
+        paths = pf.generate_synthetic_corpus(os.path.join(self.directory, "parallel"), 3, "matrix", 16, 256, 2, 3,
+                                             dtype="int16", seed=5, workers=2)
+        serial_paths = pf.generate_synthetic_corpus(os.path.join(self.directory, "serial"), 3, "matrix", 16, 256,
+                                                    2, 3, dtype="int16", seed=5, workers=1)
+        self.assertEqual(len(paths), 3)
+        for index, (path, serial_path) in enumerate(zip(paths, serial_paths)):
+            pa_data = pf.load_data(path)
+            expected = pf.create_synthetic_pa_data("matrix", 16, 256, 2, 3, dtype="int16", seed=5 + index)
+            self.assertTrue((pa_data.binary_time_series_data == np.asarray(expected.binary_time_series_data)).all())
+            self.assertTrue((pf.load_data(serial_path).binary_time_series_data ==
+                             pa_data.binary_time_series_data).all())
+            self.assertTrue(pf.quality_check_pa_data(pa_data))
+
+        paths = pf.generate_synthetic_corpus(os.path.join(self.directory, "sized"), geometry="linear",
+                                             num_detectors=16, num_samples=256, num_wavelengths=1,
+                                             num_measurements=2, total_bytes=100000, workers=1)
+        # every file holds 16 * 256 * 2 * 4 = 32768 bytes of time series data
+        self.assertEqual(len(paths), 4)
@@ -2,7 +2,8 @@
 # SPDX-License-Identifier: BSD 3-Clause License
 
 import numpy as np
-from pacfish import MetadataDeviceTags, MetadataAcquisitionTags
+from pacfish import MetadataDeviceTags, MetadataAcquisitionTags, BaseAdapter, MetaDatum, PAData, \
+    create_synthetic_pa_data
 
 
 def create_complete_acquisition_meta_data_dictionary():
@@ -33,6 +34,35 @@ def create_complete_acquisition_meta_data_dictionary():
     return dictionary
 
 
+def create_materialised_synthetic_pa_data(*args, **kwargs) -> PAData:
+    """
+    Creates a synthetic PAData instance with `create_synthetic_pa_data` and reads its time series data into a
+    numpy array, so that it can be written and compared directly.
+    """
+    pa_data = create_synthetic_pa_data(*args, **kwargs)
+    pa_data.binary_time_series_data = np.asarray(pa_data.binary_time_series_data)
+    return pa_data
+
+
+class PassThroughAdapter(BaseAdapter):
+    """
+    An adapter that converts an existing PAData instance, e.g. to test the conversion machinery.
+    """
+
+    def __init__(self, pa_data, progress=None, cancellation=None):
+        self.source = pa_data
+        super(PassThroughAdapter, self).__init__(progress=progress, cancellation=cancellation)
+
+    def generate_binary_data(self) -> np.ndarray:
+        return self.source.binary_time_series_data
+
+    def generate_device_meta_data(self) -> dict:
+        return self.source.meta_data_device
+
+    def set_metadata_value(self, metadatum: MetaDatum) -> object:
+        return self.source.meta_data_acquisition.get(metadatum.tag)
+
+
 def create_random_testing_parameters():
 
     test_float = np.random.random()